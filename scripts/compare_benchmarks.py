@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Compare two offline benchmark result files and flag median regressions."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_THRESHOLD_PERCENT = 10.0
+# Sub-millisecond medians are mostly timer noise; ignore their relative change.
+DEFAULT_MIN_DELTA_MS = 1.0
+
+
+@dataclass(frozen=True)
+class BenchmarkDelta:
+    """Median timing change for one benchmark name + params combination."""
+
+    key: str
+    base_ms: float | None
+    head_ms: float | None
+
+    @property
+    def change_percent(self) -> float | None:
+        if self.base_ms is None or self.head_ms is None or self.base_ms <= 0:
+            return None
+        return (self.head_ms - self.base_ms) / self.base_ms * 100.0
+
+    def is_regression(self, threshold_percent: float, min_delta_ms: float) -> bool:
+        change = self.change_percent
+        if change is None or self.base_ms is None or self.head_ms is None:
+            return False
+        return change > threshold_percent and (self.head_ms - self.base_ms) >= min_delta_ms
+
+
+def _result_key(entry: dict[str, Any]) -> str:
+    params = entry.get("params") or {}
+    if not params:
+        return str(entry["name"])
+    rendered = ",".join(f"{key}={params[key]}" for key in sorted(params))
+    return f"{entry['name']}[{rendered}]"
+
+
+def load_medians(path: Path) -> dict[str, float]:
+    """Load `{name[params]: median_ms}` from a benchmark result file."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        _result_key(entry): float(entry["median_ms"])
+        for entry in payload.get("results", [])
+    }
+
+
+def compare_results(base: dict[str, float], head: dict[str, float]) -> list[BenchmarkDelta]:
+    """Pair medians by key; benchmarks present on only one side keep a None side."""
+    keys = sorted(set(base) | set(head))
+    return [BenchmarkDelta(key=key, base_ms=base.get(key), head_ms=head.get(key)) for key in keys]
+
+
+def _format_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def _format_row(delta: BenchmarkDelta, regressed: bool) -> str:
+    change = delta.change_percent
+    change_text = "-" if change is None else f"{change:+.1f}%"
+    marker = "  REGRESSION" if regressed else ""
+    return (
+        f"{delta.key:<72} {_format_ms(delta.base_ms):>10} "
+        f"{_format_ms(delta.head_ms):>10} {change_text:>9}{marker}"
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compare median timings between two benchmark result files.",
+    )
+    parser.add_argument("base", type=Path, help="Baseline result JSON.")
+    parser.add_argument("head", type=Path, help="Candidate result JSON.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD_PERCENT,
+        help="Median slowdown (percent) that counts as a regression.",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=DEFAULT_MIN_DELTA_MS,
+        help="Ignore slowdowns smaller than this many milliseconds.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point; exits 1 when any benchmark regressed."""
+    args = _build_parser().parse_args(argv)
+    deltas = compare_results(load_medians(args.base), load_medians(args.head))
+
+    print(f"{'benchmark':<72} {'base ms':>10} {'head ms':>10} {'change':>9}")
+    regressions = 0
+    for delta in deltas:
+        regressed = delta.is_regression(args.threshold, args.min_delta_ms)
+        regressions += int(regressed)
+        print(_format_row(delta, regressed))
+
+    if regressions:
+        print(f"\n{regressions} benchmark(s) regressed by more than {args.threshold:g}%.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
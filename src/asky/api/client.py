@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import copy
+import functools
 import logging
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, TYPE_CHECKING
 
+from asky import model_overrides, tracing
 from asky.config import MODELS, USER_MEMORY_GLOBAL_TRIGGERS
 from asky.core import (
     ConversationEngine,
@@ -67,6 +69,21 @@ RESEARCH_BOOTSTRAP_MAX_TEXT_CHARS = 420
 logger = logging.getLogger(__name__)
 
 
+def _with_model_overrides(method):
+    """Scope the client's helper-model aliases to one call (see `model_overrides`)."""
+
+    @functools.wraps(method)
+    def wrapper(self: "AskyClient", *args: Any, **kwargs: Any) -> Any:
+        config = getattr(self, "config", None)
+        with model_overrides.model_overrides(
+            summarization_model=getattr(config, "summarization_model_alias", None),
+            interface_model=getattr(config, "interface_model_alias", None),
+        ):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class AskyClient:
     """Library entry point for running asky chats without CLI coupling."""
 
@@ -77,11 +94,22 @@ class AskyClient:
         usage_tracker: Optional[UsageTracker] = None,
         summarization_tracker: Optional[UsageTracker] = None,
         plugin_runtime: Optional["PluginRuntime"] = None,
+        model_config: Optional[Dict[str, Any]] = None,
     ) -> None:
+        """Create a client for one configuration.
+
+        ``model_config`` lets a long-lived host pass an already resolved
+        (and never mutated) copy of ``MODELS[config.model_alias]`` instead of
+        deep-copying the model table for every client.
+        """
         if config.model_alias not in MODELS:
             raise ValueError(f"Unknown model alias: {config.model_alias}")
         self.config = config
-        base_model_config = copy.deepcopy(MODELS[config.model_alias])
+        base_model_config = (
+            dict(model_config)
+            if model_config is not None
+            else copy.deepcopy(MODELS[config.model_alias])
+        )
         merged_parameters = {
             **(base_model_config.get("parameters") or {}),
             **dict(config.model_parameters_override or {}),
@@ -409,6 +437,8 @@ class AskyClient:
             source_handle_map=dict(preload.preloaded_source_handles or {}),
         )
 
+    @tracing.traced("engine.run_messages", category="engine")
+    @_with_model_overrides
     def run_messages(
         self,
         messages: List[Dict[str, Any]],
@@ -503,6 +533,7 @@ class AskyClient:
         )
         return engine.run(messages, display_callback=display_callback)
 
+    @_with_model_overrides
     def chat(
         self,
         *,
@@ -554,6 +585,8 @@ class AskyClient:
             ),
         )
 
+    @tracing.traced("turn", category="turn")
+    @_with_model_overrides
     def run_turn(
         self,
         request: AskyTurnRequest,
@@ -685,6 +718,7 @@ class AskyClient:
             PLAIN_QUERY_INTERFACE_SYSTEM_PROMPT,
         )
 
+        interface_model_alias = model_overrides.interface_model(INTERFACE_MODEL)
         helper_enabled = self.config.plain_query_interface_enabled
         if helper_enabled is None:
             helper_enabled = INTERFACE_MODEL_PLAIN_QUERY_ENABLED
@@ -697,12 +731,12 @@ class AskyClient:
             not effective_research_mode
             and not request.lean
             and helper_enabled
-            and INTERFACE_MODEL
+            and interface_model_alias
         ):
             from asky.api.interface_query_policy import InterfaceQueryPolicyEngine
 
             engine = InterfaceQueryPolicyEngine(
-                model_alias=INTERFACE_MODEL,
+                model_alias=interface_model_alias,
                 system_prompt=PLAIN_QUERY_INTERFACE_SYSTEM_PROMPT,
                 double_verbose=self.config.double_verbose,
             )
@@ -1203,6 +1237,7 @@ class AskyClient:
             )
         )
 
+    @_with_model_overrides
     def finalize_turn_history(
         self,
         request: "AskyTurnRequest",
@@ -31,6 +31,7 @@ from asky.config import (
     INTERFACE_MODEL,
     INTERFACE_PRELOAD_POLICY_SYSTEM_PROMPT,
 )
+from asky import model_overrides, tracing
 from asky.lazy_imports import call_attr
 from .preload_policy import PreloadPolicyEngine, SOURCE_DETERMINISTIC
 from .interface_query_policy import InterfaceQueryPolicyDecision
@@ -190,7 +191,9 @@ def shortlist_enabled_for_request(
         return False, "request_override_off", SOURCE_GLOBAL, "", None
 
     resolved_interface_model_alias = (
-        INTERFACE_MODEL if interface_model_alias is None else interface_model_alias
+        model_overrides.interface_model(INTERFACE_MODEL)
+        if interface_model_alias is None
+        else interface_model_alias
     )
     resolved_interface_model_prompt = (
         INTERFACE_PRELOAD_POLICY_SYSTEM_PROMPT
@@ -492,6 +495,7 @@ def seed_url_context_allows_direct_answer(
     return raw_total_chars <= combined_budget_chars
 
 
+@tracing.traced("preload.pipeline", category="preload")
 def run_preload_pipeline(
     *,
     query_text: str,
@@ -542,11 +546,12 @@ def run_preload_pipeline(
 
     # Memory recall — runs in all modes except lean
     if USER_MEMORY_ENABLED and not lean:
-        preload.memory_context = recall_memories(
-            query_text=query_text,
-            top_k=USER_MEMORY_RECALL_TOP_K,
-            min_similarity=USER_MEMORY_RECALL_MIN_SIMILARITY,
-        )
+        with tracing.span("preload.memory_recall", "preload"):
+            preload.memory_context = recall_memories(
+                query_text=query_text,
+                top_k=USER_MEMORY_RECALL_TOP_K,
+                min_similarity=USER_MEMORY_RECALL_MIN_SIMILARITY,
+            )
 
     # Decompose query if expansion is enabled
     sub_queries = [query_text]
@@ -565,7 +570,10 @@ def run_preload_pipeline(
                 "model", ""
             )  # Use current model for expansion if not specified
 
-        sub_queries = expansion_executor(**expansion_kwargs)
+        with tracing.span(
+            "preload.query_expansion", "preload", mode=QUERY_EXPANSION_MODE
+        ):
+            sub_queries = expansion_executor(**expansion_kwargs)
         preload.sub_queries = sub_queries
         if status_callback and len(sub_queries) > 1:
             status_callback(f"Query expanded into {len(sub_queries)} sub-queries")
@@ -574,10 +582,14 @@ def run_preload_pipeline(
         if status_callback:
             status_callback("Local corpus: starting pre-LLM ingestion")
         local_start = time.perf_counter()
-        local_payload = local_ingestion_executor(
-            user_prompt=query_text,
-            explicit_targets=local_corpus_paths,
-        )
+        with tracing.span("preload.local_ingestion", "preload") as local_span:
+            local_payload = local_ingestion_executor(
+                user_prompt=query_text,
+                explicit_targets=local_corpus_paths,
+            )
+            local_stats = local_payload.get("stats")
+            if isinstance(local_stats, dict):
+                local_span.set(**local_stats)
         local_elapsed_ms = (time.perf_counter() - local_start) * 1000
         preload.local_payload = local_payload
         preload.local_elapsed_ms = local_elapsed_ms
@@ -596,14 +608,15 @@ def run_preload_pipeline(
 
         corpus_doc_count = len(preload.local_payload.get("ingested", []) or [])
 
-        preload.query_classification = classify_query(
-            query_text=query_text,
-            corpus_document_count=corpus_doc_count,
-            document_threshold=QUERY_CLASSIFICATION_DOCUMENT_THRESHOLD,
-            aggressive_threshold=QUERY_CLASSIFICATION_AGGRESSIVE_THRESHOLD,
-            aggressive_mode=QUERY_CLASSIFICATION_AGGRESSIVE_MODE,
-            force_research_mode=QUERY_CLASSIFICATION_FORCE_RESEARCH_MODE,
-        )
+        with tracing.span("preload.query_classification", "preload"):
+            preload.query_classification = classify_query(
+                query_text=query_text,
+                corpus_document_count=corpus_doc_count,
+                document_threshold=QUERY_CLASSIFICATION_DOCUMENT_THRESHOLD,
+                aggressive_threshold=QUERY_CLASSIFICATION_AGGRESSIVE_THRESHOLD,
+                aggressive_mode=QUERY_CLASSIFICATION_AGGRESSIVE_MODE,
+                force_research_mode=QUERY_CLASSIFICATION_FORCE_RESEARCH_MODE,
+            )
 
         if status_callback:
             status_callback(
@@ -698,7 +711,11 @@ def run_preload_pipeline(
         if corpus_context is not None:
             shortlist_kwargs["corpus_context"] = corpus_context
             shortlist_kwargs["skip_web_search"] = skip_web_search
-        shortlist_payload = shortlist_executor(**shortlist_kwargs)
+        with tracing.span("preload.shortlist", "preload") as shortlist_span:
+            shortlist_payload = shortlist_executor(**shortlist_kwargs)
+            shortlist_span.set(
+                candidates=len(shortlist_payload.get("candidates", []) or [])
+            )
         shortlist_elapsed_ms = (time.perf_counter() - shortlist_start) * 1000
         if shortlist_payload.get("enabled"):
             shortlist_context = shortlist_formatter(shortlist_payload)
@@ -765,11 +782,14 @@ def run_preload_pipeline(
 
         if all_urls:
             unique_urls = list(dict.fromkeys(all_urls))
-            for sq in sub_queries:
-                rag_results = get_relevant_content({"urls": unique_urls, "query": sq})
-                for url, res in rag_results.items():
-                    if isinstance(res, dict) and "chunks" in res:
-                        all_candidate_chunks.extend(res["chunks"])
+            with tracing.span("preload.evidence_retrieval", "preload"):
+                for sq in sub_queries:
+                    rag_results = get_relevant_content(
+                        {"urls": unique_urls, "query": sq}
+                    )
+                    for url, res in rag_results.items():
+                        if isinstance(res, dict) and "chunks" in res:
+                            all_candidate_chunks.extend(res["chunks"])
 
         # 2. Extract structured evidence facts
         if all_candidate_chunks:
@@ -781,13 +801,14 @@ def run_preload_pipeline(
                     seen_texts.add(chunk["text"])
                     unique_chunks.append(chunk)
 
-            evidence_list = extract_evidence(
-                chunks=unique_chunks,
-                query=query_text,
-                llm_client=llm_client,
-                model=model_config.get("model", ""),
-                max_chunks=RESEARCH_EVIDENCE_EXTRACTION_MAX_CHUNKS,
-            )
+            with tracing.span("preload.evidence_extraction", "preload"):
+                evidence_list = extract_evidence(
+                    chunks=unique_chunks,
+                    query=query_text,
+                    llm_client=llm_client,
+                    model=model_config.get("model", ""),
+                    max_chunks=RESEARCH_EVIDENCE_EXTRACTION_MAX_CHUNKS,
+                )
 
             # extract_evidence always returns List[EvidenceFact] dataclasses
             preload.evidence_payload = {"facts": [asdict(f) for f in evidence_list]}
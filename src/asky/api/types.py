@@ -23,6 +23,9 @@ class AskyConfig:
     system_prompt_override: Optional[str] = None
     plain_query_interface_enabled: Optional[bool] = None
     plain_query_prompt_enrichment_enabled: Optional[bool] = None
+    # Per-client helper-model aliases; None/blank keeps the configured globals.
+    summarization_model_alias: Optional[str] = None
+    interface_model_alias: Optional[str] = None
 
 
 @dataclass
@@ -0,0 +1,203 @@
+"""Append-only store for the HTML archive sidebar index.
+
+Entries live in a small SQLite database next to the archive. Each saved
+report inserts one row and rewrites only the fixed-size page shard it lands
+in (plus the shards of any superseded rows), so saving stays constant-time
+as the archive grows. The browser never touches SQLite: `index.html` loads
+the shards as plain `<script>` files (works over `file://`), newest first,
+and fetches older pages on demand.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+ARCHIVE_INDEX_DB_NAME = "index.db"
+ARCHIVE_INDEX_PAGES_DIRNAME = "index_pages"
+ARCHIVE_INDEX_MANIFEST_NAME = "manifest.js"
+ARCHIVE_INDEX_PAGE_SIZE = 200
+
+_ENTRY_FIELDS = (
+    "filename",
+    "title",
+    "timestamp",
+    "iso_timestamp",
+    "session_name",
+    "prefix",
+    "message_id",
+    "session_id",
+)
+
+
+def page_filename(page: int) -> str:
+    return f"page_{page:06d}.js"
+
+
+def _entry_row(entry: Dict[str, Any]) -> tuple[Any, ...]:
+    row = {name: entry.get(name) for name in _ENTRY_FIELDS}
+    row["title"] = row["title"] or row["filename"]
+    return tuple(row[name] for name in _ENTRY_FIELDS)
+
+
+_INSERT_SQL = (
+    f"INSERT OR IGNORE INTO entries ({', '.join(_ENTRY_FIELDS)}) "
+    f"VALUES ({', '.join('?' for _ in _ENTRY_FIELDS)})"
+)
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class ArchiveIndex:
+    """SQLite-backed sidebar index with pre-rendered page shards."""
+
+    def __init__(self, archive_dir: Path, *, page_size: int = ARCHIVE_INDEX_PAGE_SIZE):
+        self.archive_dir = archive_dir
+        self.page_size = max(1, int(page_size))
+        self.db_path = archive_dir / ARCHIVE_INDEX_DB_NAME
+        self.pages_dir = archive_dir / ARCHIVE_INDEX_PAGES_DIRNAME
+
+    def exists(self) -> bool:
+        return self.db_path.exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=30.0)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                seq           INTEGER PRIMARY KEY AUTOINCREMENT,
+                filename      TEXT NOT NULL UNIQUE,
+                title         TEXT NOT NULL,
+                timestamp     TEXT,
+                iso_timestamp TEXT,
+                session_name  TEXT,
+                prefix        TEXT,
+                message_id    INTEGER,
+                session_id    INTEGER
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_session ON entries(session_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_message ON entries(message_id)")
+        return conn
+
+    def add_entry(
+        self,
+        entry: Dict[str, Any],
+        *,
+        session_id: Optional[int] = None,
+        converted_message_id: Optional[int] = None,
+    ) -> List[str]:
+        """Insert an entry, drop the ones it supersedes, and return their filenames.
+
+        A session report supersedes earlier reports of the same session and,
+        when a single-turn message was converted into that session, the
+        message's report.
+        """
+        conn = self._connect()
+        try:
+            # The write lock is held while shards are rewritten so concurrent
+            # saves cannot publish a stale copy of the same page.
+            conn.execute("BEGIN IMMEDIATE")
+            superseded: List[tuple[int, str]] = []
+            if session_id is not None:
+                superseded.extend(
+                    conn.execute(
+                        "SELECT seq, filename FROM entries WHERE session_id = ?",
+                        (session_id,),
+                    ).fetchall()
+                )
+                if converted_message_id is not None:
+                    superseded.extend(
+                        conn.execute(
+                            "SELECT seq, filename FROM entries WHERE message_id = ?",
+                            (converted_message_id,),
+                        ).fetchall()
+                    )
+            touched_pages = set()
+            for seq, _filename in superseded:
+                conn.execute("DELETE FROM entries WHERE seq = ?", (seq,))
+                touched_pages.add(self._page_of(seq))
+            cursor = conn.execute(_INSERT_SQL, _entry_row(entry))
+            if cursor.rowcount:
+                touched_pages.add(self._page_of(cursor.lastrowid))
+            self._publish(conn, touched_pages)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return [filename for _seq, filename in superseded]
+
+    def import_entries(self, entries_newest_first: Iterable[Dict[str, Any]]) -> int:
+        """Bulk-load entries (e.g. from a legacy index.html) and publish all pages."""
+        rows = [
+            _entry_row(entry)
+            for entry in reversed(list(entries_newest_first))
+            if entry.get("filename")
+        ]
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(_INSERT_SQL, rows)
+            max_seq = conn.execute("SELECT MAX(seq) FROM entries").fetchone()[0] or 0
+            self._publish(conn, set(range(self._page_of(max_seq) + 1)) if max_seq else set())
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return len(rows)
+
+    def list_entries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return entries newest first."""
+        if not self.exists():
+            return []
+        conn = self._connect()
+        try:
+            sql = f"SELECT {', '.join(_ENTRY_FIELDS)} FROM entries ORDER BY seq DESC"
+            params: tuple[Any, ...] = ()
+            if limit is not None:
+                sql += " LIMIT ?"
+                params = (int(limit),)
+            return [dict(zip(_ENTRY_FIELDS, row)) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
+
+    def _page_of(self, seq: int) -> int:
+        return max(0, int(seq) - 1) // self.page_size
+
+    def _publish(self, conn: sqlite3.Connection, pages: Iterable[int]) -> None:
+        self.pages_dir.mkdir(parents=True, exist_ok=True)
+        for page in sorted(pages):
+            start = page * self.page_size + 1
+            rows = conn.execute(
+                f"SELECT {', '.join(_ENTRY_FIELDS)} FROM entries "
+                "WHERE seq BETWEEN ? AND ? ORDER BY seq DESC",
+                (start, start + self.page_size - 1),
+            ).fetchall()
+            entries = [dict(zip(_ENTRY_FIELDS, row)) for row in rows]
+            _atomic_write_text(
+                self.pages_dir / page_filename(page),
+                f"askyIndexPage({page}, {json.dumps(entries, indent=2)});\n",
+            )
+        max_seq = conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'entries'"
+        ).fetchone()
+        last_page = self._page_of(max_seq[0]) if max_seq and max_seq[0] else -1
+        manifest = {"last_page": last_page, "page_size": self.page_size}
+        _atomic_write_text(
+            self.pages_dir / ARCHIVE_INDEX_MANIFEST_NAME,
+            f"askyIndexManifest({json.dumps(manifest)});\n",
+        )
@@ -100,6 +100,7 @@ TOP_LEVEL_GROUPED_COMMANDS = (
     HelpItem("memory clear", "Delete all memories."),
     HelpItem("corpus query <text>", "Deterministic corpus query (no main model call)."),
     HelpItem("corpus summarize [query]", "Deterministic section summary flow."),
+    HelpItem("corpus compact", "Compress cached corpus storage and VACUUM."),
     HelpItem("prompts list", "List configured user prompts."),
 )
 
@@ -129,6 +130,7 @@ TOP_LEVEL_QUERY_OPTIONS = (
     HelpItem("--tools [off [a,b,c]|reset]", "List tools, disable all/some tools, or clear tool override.", ("--tools",)),
     HelpItem("--session <query...>", "Create a new session named from query text and run the query.", ("--session",)),
     HelpItem("-v, --verbose", "Verbose output (-vv for double-verbose).", ("-v", "--verbose")),
+    HelpItem("--trace-out FILE", "Write a Chrome/Perfetto span trace of this run to FILE.", ("--trace-out",)),
 )
 
 TOP_LEVEL_PROCESS_OPTIONS = (
@@ -289,6 +291,7 @@ GROUPED_MEMORY_ITEMS = (
 GROUPED_CORPUS_ITEMS = (
     HelpItem("asky corpus query <text>", ""),
     HelpItem("asky corpus summarize [query]", ""),
+    HelpItem("asky corpus compact", ""),
 )
 
 GROUPED_PROMPTS_ITEMS = (
@@ -337,11 +340,12 @@ def render_memory_help() -> str:
 def render_corpus_help() -> str:
     """Render grouped help for corpus operations."""
     lines = [
-        "usage: asky corpus <query|summarize> ...",
+        "usage: asky corpus <query|summarize|compact> ...",
         "",
         "Corpus commands:",
         "  asky corpus query <text>",
         "  asky corpus summarize [query]",
+        "  asky corpus compact",
         "",
         "Run:",
         "  asky corpus query --help",
@@ -5,7 +5,6 @@ import importlib
 import logging
 import platform
 import re
-import threading
 import os
 import subprocess
 import sys
@@ -66,7 +65,6 @@ sessions = _LazyModuleProxy("asky.cli.sessions")
 research_commands = _LazyModuleProxy("asky.cli.research_commands")
 section_commands = _LazyModuleProxy("asky.cli.section_commands")
 
-CACHE_CLEANUP_JOIN_TIMEOUT_SECONDS = 0.05
 DEFAULT_MANUAL_QUERY_MAX_SOURCES = 20
 DEFAULT_MANUAL_QUERY_MAX_CHUNKS = 3
 DEFAULT_SECTION_DETAIL = "balanced"
@@ -97,7 +95,7 @@ GROUPED_DOMAIN_ACTIONS: dict[str, frozenset[str]] = {
         }
     ),
     "memory": frozenset({"list", "delete", "clear"}),
-    "corpus": frozenset({"query", "summarize", "summarize-section"}),
+    "corpus": frozenset({"query", "summarize", "summarize-section", "compact"}),
     "prompts": frozenset({"list"}),
 }
 
@@ -295,6 +293,8 @@ def _grouped_command_issue(raw_tokens: list[str]) -> tuple[str, str, str] | None
             text, _options = _consume_text_until_flag(rest)
             if not text:
                 return noun, "missing_args", "corpus query requires query text."
+        if action == "compact" and rest:
+            return noun, "invalid_args", "corpus compact does not accept arguments."
 
     if noun == "prompts":
         if action == "list" and rest:
@@ -483,6 +483,8 @@ def _translate_grouped_command_tokens(tokens: list[str]) -> list[str]:
             if text:
                 return ["--summarize-section", text, *options]
             return ["--summarize-section", *options]
+        if action == "compact":
+            return ["--compact-corpus"]
         return tokens
 
     if noun == "prompts" and action == "list":
@@ -787,6 +789,11 @@ def parse_args(
         dest="verbose_level",
         help="Enable verbose output. Use -vv for double-verbose request payload tracing.",
     )
+    parser.add_argument(
+        "--trace-out",
+        metavar="FILE",
+        help="Write a Chrome/Perfetto trace (JSON) of this run to FILE.",
+    )
     from asky.plugins.base import CATEGORY_LABELS, CapabilityCategory
 
     output_delivery_group = parser.add_argument_group(
@@ -943,6 +950,11 @@ def parse_args(
         metavar="QUERY",
         help="Query cached/ingested research corpus directly without invoking any model.",
     )
+    parser.add_argument(
+        "--compact-corpus",
+        action="store_true",
+        help="Compress cached research corpus rows, drop expired entries, and VACUUM.",
+    )
     parser.add_argument(
         "--query-corpus-max-sources",
         type=int,
@@ -1213,30 +1225,22 @@ def _recover_history_show_as_query(args: argparse.Namespace) -> bool:
     return True
 
 
-def ResearchCache(*args, **kwargs):
-    """Lazy constructor proxy used for startup cleanup and tests."""
-    from asky.research.cache import ResearchCache as research_cache_cls
-
-    return research_cache_cls(*args, **kwargs)
+def _run_research_cache_maintenance() -> None:
+    """Best-effort, throttled research-cache maintenance after a query.
 
-
-def _run_research_cache_cleanup() -> None:
-    """Best-effort cleanup of expired research cache entries."""
+    At most once per `research.cache_maintenance_interval_minutes`, starts a
+    detached process for the pass so the CLI exits without waiting on it; the
+    daemon runs passes on its job queue, which also keeps this one from coming
+    due.
+    """
     try:
-        ResearchCache().cleanup_expired()
-    except Exception as e:
-        logging.getLogger(__name__).warning(f"Failed to cleanup research cache: {e}")
-
+        from asky.research.cache_maintenance import (
+            spawn_research_cache_maintenance_if_due,
+        )
 
-def _start_research_cache_cleanup_thread() -> threading.Thread:
-    """Start expired-cache cleanup in background."""
-    thread = threading.Thread(
-        target=_run_research_cache_cleanup,
-        name="asky-cache-cleanup",
-        daemon=True,
-    )
-    thread.start()
-    return thread
+        spawn_research_cache_maintenance_if_due()
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Failed to maintain research cache: {e}")
 
 
 def _research_roots() -> list[Path]:
@@ -1593,8 +1597,46 @@ def _ensure_defaults_session(args: argparse.Namespace) -> tuple[int, bool]:
     return int(session_id), True
 
 
+_trace_output: Optional[tuple[Any, Path]] = None
+
+
+def _start_trace_output(trace_path: str) -> None:
+    """Record spans for the rest of this process and write them on exit."""
+    global _trace_output
+    from asky import tracing
+
+    recorder = tracing.TraceRecorder(label="cli")
+    tracing.install_process_recorder(recorder)
+    _trace_output = (recorder, Path(trace_path))
+
+
+def _finish_trace_output() -> None:
+    global _trace_output
+    if _trace_output is None:
+        return
+    from asky import tracing
+
+    recorder, trace_path = _trace_output
+    _trace_output = None
+    tracing.install_process_recorder(None)
+    recorder.finish()
+    try:
+        written = recorder.write(trace_path)
+    except OSError as exc:
+        print(f"Failed to write trace to {trace_path}: {exc}", file=sys.stderr)
+        return
+    print(f"Trace written to {written}", file=sys.stderr)
+
+
 def main() -> None:
     """Main entry point."""
+    try:
+        _run_main()
+    finally:
+        _finish_trace_output()
+
+
+def _run_main() -> None:
     # Solution 1: Check for "persona" subcommand before parse_args()
     # This maintains clean UX without breaking existing functionality
     if len(sys.argv) > 1 and sys.argv[1] == "persona":
@@ -2125,6 +2167,9 @@ def main() -> None:
         # Default: Standard file, Configured level
         setup_logging(LOG_LEVEL, LOG_FILE)
 
+    if getattr(args, "trace_out", None):
+        _start_trace_output(args.trace_out)
+
     if args.completion_script:
         from asky.cli.completion import build_completion_script
 
@@ -2282,6 +2327,10 @@ def main() -> None:
         handle_clear_memories()
         return
 
+    if getattr(args, "compact_corpus", False):
+        research_commands.run_corpus_compact_command()
+        return
+
     needs_db = any(
         [
             args.history is not None,
@@ -2490,9 +2539,6 @@ def main() -> None:
     # in engine.run() would immediately clear it anyway.
 
     # Run Chat
-    cleanup_thread = _start_research_cache_cleanup_thread()
-    # Give the cleanup worker a brief head-start without blocking startup.
-    cleanup_thread.join(timeout=CACHE_CLEANUP_JOIN_TIMEOUT_SECONDS)
     from asky.plugins.runtime import get_or_create_plugin_runtime
 
     plugin_runtime = get_or_create_plugin_runtime()
@@ -2522,6 +2568,7 @@ def main() -> None:
         return
 
     chat.run_chat(args, query_text, plugin_runtime=plugin_runtime)
+    _run_research_cache_maintenance()
 
 
 if __name__ == "__main__":
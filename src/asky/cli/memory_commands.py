@@ -20,7 +20,9 @@ from asky.memory.store import (
 )
 from asky.memory.vector_ops import (
     clear_all_memory_embeddings,
+    clear_memory_index,
     delete_memory_from_chroma,
+    delete_memory_from_index,
 )
 
 console = Console()
@@ -65,6 +67,7 @@ def handle_delete_memory(memory_id: int) -> None:
         memory_id,
         USER_MEMORY_CHROMA_COLLECTION,
     )
+    delete_memory_from_index(DB_PATH, memory_id)
     console.print(f"Deleted memory {memory_id}.")
 
 
@@ -82,6 +85,7 @@ def handle_clear_memories() -> None:
 
     count = delete_all_memories_from_db(DB_PATH)
     clear_all_memory_embeddings(RESEARCH_CHROMA_PERSIST_DIRECTORY, USER_MEMORY_CHROMA_COLLECTION)
+    clear_memory_index(DB_PATH)
     console.print(f"Deleted {count} memories.")
 
 
@@ -92,5 +96,6 @@ def clear_memories_non_interactive() -> int:
         RESEARCH_CHROMA_PERSIST_DIRECTORY,
         USER_MEMORY_CHROMA_COLLECTION,
     )
+    clear_memory_index(DB_PATH)
     logger.info("Deleted %s memories via non-interactive cleanup.", count)
     return int(count)
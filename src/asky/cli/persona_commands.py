@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import logging
 from pathlib import Path
 from typing import Optional
 
@@ -39,6 +40,7 @@ from asky.plugins.manual_persona_creator.storage import (
 )
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 
 def handle_persona_docs(args: argparse.Namespace) -> None:
@@ -79,6 +81,23 @@ def _get_data_dir() -> Path:
     return _get_config_dir() / "plugins"
 
 
+def _web_crawl_limits() -> dict:
+    """Read web crawler limits from the manual persona creator plugin config."""
+    try:
+        from asky.plugins.runtime import get_or_create_plugin_runtime
+
+        runtime = get_or_create_plugin_runtime()
+        plugin = runtime.manager.get_plugin("manual_persona_creator") if runtime else None
+        if plugin is not None and hasattr(plugin, "web_crawl_limits"):
+            return plugin.web_crawl_limits()
+    except Exception:
+        logger.debug(
+            "Failed to read web crawl limits from plugin config; using defaults",
+            exc_info=True,
+        )
+    return {}
+
+
 def handle_persona_ingest_book(args: argparse.Namespace) -> None:
     """Ingest an authored book into a persona."""
     persona_name = str(args.name).strip()
@@ -707,7 +726,7 @@ def handle_persona_rebuild_index(args: argparse.Namespace) -> None:
         with console.status(
             f"[cyan]Rebuilding runtime index for '{persona_name}'...[/cyan]"
         ):
-            result = rebuild_runtime_index(paths.root_dir)
+            result = rebuild_runtime_index(paths.root_dir, full=True)
 
         if result.get("rebuilt"):
             console.print(f"[green]✓[/green] Runtime index rebuilt successfully.")
@@ -1146,6 +1165,7 @@ def handle_persona_web_collect(args: argparse.Namespace) -> None:
                 target_results=target_results,
                 urls=urls,
                 url_file=url_file,
+                **_web_crawl_limits(),
             )
         console.print(f"[green]✓ Web collection '{collection_id}' started successfully.[/green]")
         console.print(f"Use 'asky persona web-review {persona_name} {collection_id}' to check progress.")
@@ -1175,6 +1195,7 @@ def handle_persona_web_expand(args: argparse.Namespace) -> None:
                 query=query,
                 urls=urls,
                 url_file=url_file,
+                **_web_crawl_limits(),
             )
         console.print(f"[green]✓ Broad web expansion '{collection_id}' started successfully.[/green]")
         console.print(f"Use 'asky persona web-review {persona_name} {collection_id}' to check progress.")
@@ -1349,6 +1370,7 @@ def handle_persona_web_continue(args: argparse.Namespace) -> None:
                 data_dir=data_dir,
                 persona_name=persona_name,
                 collection_id=collection_id,
+                **_web_crawl_limits(),
             )
         console.print(f"[green]✓ Web collection '{collection_id}' resumed and finished batch.[/green]")
     except Exception as e:
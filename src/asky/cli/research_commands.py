@@ -143,3 +143,23 @@ def run_manual_corpus_query_command(
         results=results,
     )
     return 0
+
+
+def run_corpus_compact_command(console: Optional[Console] = None) -> int:
+    """Compress legacy research-cache rows and VACUUM the database."""
+    active_console = console or Console()
+    stats = ResearchCache().compact()
+    saved = max(0, stats["bytes_before"] - stats["bytes_after"])
+    active_console.print(
+        "Corpus compacted: "
+        f"{stats['expired_removed']} expired entries removed, "
+        f"{stats['documents_compressed']} documents compressed, "
+        f"{stats['chunks_offset']} chunks converted to offsets, "
+        f"{stats['chunks_compressed']} chunks compressed."
+    )
+    active_console.print(
+        f"Database size: {stats['bytes_before'] / 1_048_576:.1f} MiB -> "
+        f"{stats['bytes_after'] / 1_048_576:.1f} MiB "
+        f"({saved / 1_048_576:.1f} MiB reclaimed)"
+    )
+    return 0
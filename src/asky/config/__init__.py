@@ -77,6 +77,12 @@ DEFAULT_CONTEXT_SIZE = _gen.get("default_context_size", 4096)
 LOG_LEVEL = _gen.get("log_level", "INFO")
 LOG_FILE = _gen.get("log_file", "~/.config/asky/logs/asky.log")
 TRUNCATE_MESSAGES_IN_LOGS = _gen.get("truncate_messages_in_logs", False)
+PAYLOAD_CAPTURE_FILE = str(_gen.get("payload_capture_file", "") or "").strip()
+PAYLOAD_CAPTURE_SAMPLE_RATE = float(_gen.get("payload_capture_sample_rate", 1.0))
+PAYLOAD_CAPTURE_MAX_BYTES = int(
+    _gen.get("payload_capture_max_bytes", 20 * 1024 * 1024)
+)
+PAYLOAD_CAPTURE_BACKUP_COUNT = int(_gen.get("payload_capture_backup_count", 3))
 LIVE_BANNER = True
 COMPACT_BANNER = _gen.get("compact_banner", False)
 LIVE_SCREEN_MODE = _gen.get("live_screen_mode", False)
@@ -95,6 +101,18 @@ INITIAL_BACKOFF = _limits.get("initial_backoff", 2)
 MAX_BACKOFF = _limits.get("max_backoff", 60)
 SEARCH_TIMEOUT = _limits.get("search_timeout", 20)
 FETCH_TIMEOUT = _limits.get("fetch_timeout", 20)
+SEARCH_MAX_CONCURRENCY = max(1, int(_limits.get("search_max_concurrency", 4)))
+FETCH_MAX_CONCURRENCY = max(1, int(_limits.get("fetch_max_concurrency", 4)))
+SEARCH_RATE_LIMITS = {
+    str(provider).lower(): float(rate or 0)
+    for provider, rate in (_limits.get("search_rate_limits") or {}).items()
+}
+
+# Web Search Cache
+_search_cache = _CONFIG.get("search_cache", {})
+SEARCH_CACHE_ENABLED = bool(_search_cache.get("enabled", True))
+SEARCH_CACHE_TTL_SECONDS = float(_search_cache.get("ttl_hours", 6)) * 3600.0
+SEARCH_CACHE_MAX_ENTRIES = int(_search_cache.get("max_entries", 1000))
 
 # Summarization Settings
 _summarizer_section = _CONFIG.get("summarizer", {})
@@ -253,6 +271,10 @@ QUERY_EXPANSION_ENABLED = _research.get("query_expansion_enabled", True)
 QUERY_EXPANSION_MODE = _research.get("query_expansion_mode", "deterministic")
 QUERY_EXPANSION_MAX_SUB_QUERIES = _research.get("max_sub_queries", 4)
 RESEARCH_CACHE_TTL_HOURS = _research.get("cache_ttl_hours", 24)
+RESEARCH_CACHE_MAX_BYTES = int(float(_research.get("cache_max_mb", 512)) * 1024 * 1024)
+RESEARCH_CACHE_MAINTENANCE_INTERVAL_MINUTES = max(
+    1, int(_research.get("cache_maintenance_interval_minutes", 60))
+)
 RESEARCH_MAX_LINKS_PER_URL = _research.get("max_links_per_url", 50)
 RESEARCH_MAX_RELEVANT_LINKS = _research.get("max_relevant_links", 20)
 RESEARCH_CHUNK_SIZE = _research.get("chunk_size", 256)
@@ -308,6 +330,13 @@ RESEARCH_CHROMA_FINDINGS_COLLECTION = _research_chromadb.get(
     "findings_collection", "asky_research_findings"
 )
 
+_research_vector_index = _research.get("vector_index", {})
+RESEARCH_VECTOR_INDEX_ENABLED = _research_vector_index.get("enabled", True)
+RESEARCH_VECTOR_INDEX_EXACT_SCAN_ROWS = int(
+    _research_vector_index.get("exact_scan_rows", 20000)
+)
+RESEARCH_VECTOR_INDEX_PROBE_LISTS = int(_research_vector_index.get("probe_lists", 16))
+
 # Query Classification Settings
 _query_classification = _research.get("query_classification", {})
 QUERY_CLASSIFICATION_ENABLED = _query_classification.get("enabled", True)
@@ -381,6 +410,18 @@ RESEARCH_EMBEDDING_BATCH_SIZE = _research_embedding.get("batch_size", 32)
 RESEARCH_EMBEDDING_DEVICE = _research_embedding.get("device", "cpu")
 RESEARCH_EMBEDDING_NORMALIZE = _research_embedding.get("normalize", True)
 RESEARCH_EMBEDDING_LOCAL_FILES_ONLY = _research_embedding.get("local_files_only", False)
+RESEARCH_EMBEDDING_BACKEND = str(_research_embedding.get("backend", "torch")).lower()
+RESEARCH_EMBEDDING_SERVER_ENABLED = _research_embedding.get("server_enabled", False)
+RESEARCH_EMBEDDING_SERVER_AUTOSTART = _research_embedding.get("server_autostart", True)
+RESEARCH_EMBEDDING_SERVER_SOCKET = Path(
+    _research_embedding.get("server_socket", "~/.config/asky/run/embedding.sock")
+).expanduser()
+RESEARCH_EMBEDDING_SERVER_IDLE_TIMEOUT_SECONDS = (
+    float(_research_embedding.get("server_idle_timeout_minutes", 30)) * 60
+)
+RESEARCH_EMBEDDING_SERVER_BATCH_WINDOW_MS = float(
+    _research_embedding.get("server_batch_window_ms", 5)
+)
 
 # Research Prompts
 RESEARCH_SYSTEM_PROMPT = _prompts.get("research_system", "")
@@ -450,3 +491,9 @@ XMPP_RESPONSE_CHUNK_CHARS = int(_xmpp.get("response_chunk_chars", 3000) or 3000)
 XMPP_TRANSCRIPT_MAX_PER_SESSION = int(
     _xmpp.get("transcript_max_per_session", 200) or 200
 )
+XMPP_WORKER_COUNT = max(1, int(_xmpp.get("worker_count", 4) or 4))
+XMPP_MAX_QUEUE_DEPTH_PER_JID = max(1, int(_xmpp.get("max_queue_depth_per_jid", 10) or 10))
+XMPP_IDLE_JID_TTL_SECONDS = float(_xmpp.get("idle_jid_ttl_seconds", 300) or 300)
+XMPP_WARM_RUNTIME = bool(_xmpp.get("warm_runtime", True))
+XMPP_TRACE_TURNS = bool(_xmpp.get("trace_turns", False))
+XMPP_TRACE_HISTORY = max(1, int(_xmpp.get("trace_history", 20) or 20))
@@ -1,14 +1,34 @@
 """Configuration loading and hydration logic."""
 
 import copy
+import marshal
 import os
 import shutil
-import tomllib
+import sys
 from importlib import resources
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 ASKY_HOME_ENV_VAR = "ASKY_HOME"
+CONFIG_SNAPSHOT_FILENAME = ".config_snapshot.marshal"
+CONFIG_SNAPSHOT_DISABLE_ENV_VAR = "ASKY_CONFIG_SNAPSHOT_DISABLE"
+CONFIG_SNAPSHOT_FORMAT_VERSION = 1
+LEGACY_CONFIG_FILENAME = "config.toml"
+
+CONFIG_FILES = (
+    "general.toml",
+    "api.toml",
+    "prompts.toml",
+    "user.toml",
+    "plugins.toml",
+    "xmpp.toml",
+    "voice_transcriber.toml",
+    "image_transcriber.toml",
+    "push_data.toml",
+    "research.toml",
+    "models.toml",
+    "memory.toml",
+)
 
 
 def _get_config_dir() -> Path:
@@ -42,28 +62,115 @@ def _hydrate_models(config: Dict[str, Any]) -> Dict[str, Any]:
     return config
 
 
+def _stat_key(path: Any) -> Tuple[Optional[int], Optional[int]]:
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return (None, None)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _config_sources_key(config_dir: Path) -> List[Any]:
+    """Fingerprint every input of `load_config` (mtime and size per file).
+
+    The package version and interpreter version are included so upgrades and
+    marshal format changes invalidate the snapshot as well.
+    """
+    from asky import __version__
+
+    bundled_root = resources.files("asky.data.config")
+    key: List[Any] = [
+        CONFIG_SNAPSHOT_FORMAT_VERSION,
+        __version__,
+        list(sys.version_info[:2]),
+        str(config_dir),
+    ]
+    for filename in CONFIG_FILES:
+        key.append(
+            [
+                filename,
+                list(_stat_key(bundled_root.joinpath(filename))),
+                list(_stat_key(config_dir / filename)),
+            ]
+        )
+    key.append([LEGACY_CONFIG_FILENAME, list(_stat_key(config_dir / LEGACY_CONFIG_FILENAME))])
+    return key
+
+
+def _sources_changed_during_build(before: List[Any], after: List[Any]) -> bool:
+    """True when a pre-existing source file changed while the config was built."""
+    for pre, post in zip(before, after):
+        if pre == post:
+            continue
+        # User files absent before the build were just copied from defaults.
+        if isinstance(pre, list) and len(pre) == 3 and pre[2] == [None, None]:
+            continue
+        return True
+    return False
+
+
+def _read_config_snapshot(snapshot_path: Path, sources_key: List[Any]) -> Optional[Dict[str, Any]]:
+    try:
+        payload = marshal.loads(snapshot_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("key") != sources_key:
+        return None
+    config = payload.get("config")
+    return config if isinstance(config, dict) else None
+
+
+def _write_config_snapshot(snapshot_path: Path, sources_key: List[Any], config: Dict[str, Any]) -> None:
+    try:
+        data = marshal.dumps({"key": sources_key, "config": config})
+    except ValueError:
+        # TOML datetimes and similar values are not marshallable; skip the
+        # snapshot and keep parsing on every start.
+        return
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
 def load_config() -> Dict[str, Any]:
-    """Load configuration from TOML files, falling back to defaults."""
+    """Load configuration, reusing the compiled snapshot when sources are unchanged.
+
+    The merged and hydrated config is cached in `CONFIG_SNAPSHOT_FILENAME`
+    under the config dir, keyed on the mtime and size of every bundled and
+    user TOML file. Any edit rebuilds it on the next start.
+    """
     config_dir = _get_config_dir()
+    if os.environ.get(CONFIG_SNAPSHOT_DISABLE_ENV_VAR, "").strip():
+        return _build_config(config_dir)
+
+    snapshot_path = config_dir / CONFIG_SNAPSHOT_FILENAME
+    sources_key = _config_sources_key(config_dir)
+    config = _read_config_snapshot(snapshot_path, sources_key)
+    if config is not None:
+        if (config_dir / LEGACY_CONFIG_FILENAME).exists():
+            print(f"Loaded legacy config from {config_dir / LEGACY_CONFIG_FILENAME}")
+        return config
+
+    config = _build_config(config_dir)
+    # Default files may have been copied into the config dir just now, so
+    # fingerprint again after the build.
+    built_key = _config_sources_key(config_dir)
+    if not _sources_changed_during_build(sources_key, built_key):
+        _write_config_snapshot(snapshot_path, built_key, config)
+    return config
+
+
+def _build_config(config_dir: Path) -> Dict[str, Any]:
+    """Load configuration from TOML files, falling back to defaults."""
+    import tomllib
 
     # Ensure config directory exists
     config_dir.mkdir(parents=True, exist_ok=True)
 
-    # Define the list of config files to load
-    config_files = [
-        "general.toml",
-        "api.toml",
-        "prompts.toml",
-        "user.toml",
-        "plugins.toml",
-        "xmpp.toml",
-        "voice_transcriber.toml",
-        "image_transcriber.toml",
-        "push_data.toml",
-        "research.toml",
-        "models.toml",
-        "memory.toml",
-    ]
+    config_files = CONFIG_FILES
 
     final_config: Dict[str, Any] = {
         "general": {},
@@ -139,7 +246,7 @@ def load_config() -> Dict[str, Any]:
                 print(f"Warning: Failed to load config from {user_file_path}: {e}")
 
     # 3. Load legacy config.toml for backward compatibility (overrides split files)
-    legacy_config_path = config_dir / "config.toml"
+    legacy_config_path = config_dir / LEGACY_CONFIG_FILENAME
     if legacy_config_path.exists():
         try:
             with open(legacy_config_path, "rb") as f:
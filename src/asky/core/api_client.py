@@ -7,10 +7,27 @@ import requests
 import time
 from typing import Any, Callable, Dict, List, Optional
 
+from asky import tracing
+from asky.core.payload_capture import PayloadCapture, get_payload_capture
+from asky.core.token_counter import get_token_counter
 
 logger = logging.getLogger(__name__)
 TraceCallback = Callable[[Dict[str, Any]], None]
 
+# Optional callable invoked before every LLM HTTP attempt; blocks to pace
+# requests (e.g. a limiter shared by parallel evaluation workers).
+_llm_request_gate: Optional[Callable[[], None]] = None
+
+
+def set_llm_request_gate(
+    gate: Optional[Callable[[], None]],
+) -> Optional[Callable[[], None]]:
+    """Install a pacing hook for LLM requests and return the previous one."""
+    global _llm_request_gate
+    previous = _llm_request_gate
+    _llm_request_gate = gate
+    return previous
+
 
 def _get_response_log_data(response: requests.Response) -> Dict[str, Any]:
     """Extract diagnostic response fields for structured logging."""
@@ -77,6 +94,33 @@ def _emit_trace_event(
         logger.debug("Trace callback failed for event kind=%s", event.get("kind"))
 
 
+def _capture_exchange(
+    capture: Optional[PayloadCapture],
+    payload: Dict[str, Any],
+    model_alias: str,
+    attempt: int,
+    elapsed_ms: float,
+    response: Any = None,
+    status_code: Optional[int] = None,
+    error: Optional[str] = None,
+) -> None:
+    """Write one request/response pair to the payload capture file, if sampled."""
+    if capture is None:
+        return
+    capture.write(
+        {
+            "model_id": payload.get("model"),
+            "model_alias": model_alias,
+            "attempt": attempt,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "status_code": status_code,
+            "error": error,
+            "request": payload,
+            "response": response,
+        }
+    )
+
+
 def _classify_response_type(response_message: Dict[str, Any]) -> str:
     """Classify LLM response shape for verbose transport traces."""
     if response_message.get("tool_calls"):
@@ -118,22 +162,15 @@ class UsageTracker:
         return getattr(self, "tools", {})
 
 
-def count_tokens(messages: List[Dict[str, Any]]) -> int:
-    """Naive token counting: chars / 4."""
-    total_chars = 0
-    for m in messages:
-        content = m.get("content")
-        if isinstance(content, str):
-            total_chars += len(content)
-        elif content is not None:
-            total_chars += len(json.dumps(content))
-        # Also count tool calls and results
-        tc = m.get("tool_calls")
-        if tc:
-            total_chars += len(json.dumps(tc))
-    return total_chars // 4
+def count_tokens(
+    messages: List[Dict[str, Any]],
+    model_config: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Count prompt tokens with the model's tokenizer, or estimate chars / 4."""
+    return get_token_counter(model_config).count_messages(messages)
 
 
+@tracing.traced("llm.request", category="llm")
 def get_llm_msg(
     model_id: str,
     messages: List[Dict[str, Any]],
@@ -211,16 +248,27 @@ def get_llm_msg(
 
     logger.info(f"Sending request to LLM: {model_id} as {LLM_USER_AGENT}")
 
-    log_payload = {
-        **payload,
-        "messages": [
-            {**m, "content": format_log_content(m, verbose)} for m in messages
-        ],
-    }
-    logger.debug(f"Payload: {json.dumps(log_payload)}")
+    # Building the log copy serializes the whole context; skip it unless DEBUG is on.
+    if logger.isEnabledFor(logging.DEBUG):
+        log_payload = {
+            **payload,
+            "messages": [
+                {**m, "content": format_log_content(m, verbose)} for m in messages
+            ],
+        }
+        logger.debug("Payload: %s", json.dumps(log_payload))
+
+    capture = get_payload_capture()
+    if capture is not None and not capture.should_sample():
+        capture = None
 
-    tokens_sent = count_tokens(messages)
+    tokens_sent = count_tokens(messages, model_config)
     logger.info(f"[{model_alias or model_id}] Sent: {tokens_sent} tokens")
+    tracing.annotate(
+        model=model_alias or model_id,
+        messages=len(messages),
+        use_tools=use_tools,
+    )
 
     for attempt in range(MAX_RETRIES):
         request_started = time.perf_counter()
@@ -240,7 +288,9 @@ def get_llm_msg(
             trace_payload.update(trace_context)
         _emit_trace_event(trace_callback, trace_payload)
         try:
-            logger.debug(f"URL: {url}, Headers: {headers}")
+            if _llm_request_gate is not None:
+                _llm_request_gate()
+            logger.debug("URL: %s, Headers: %s", url, headers)
             resp = requests.post(
                 url, json=payload, headers=headers, timeout=REQUEST_TIMEOUT
             )
@@ -253,12 +303,13 @@ def get_llm_msg(
             completion_tokens = usage.get("completion_tokens", 0)
             response_message = resp_json["choices"][0]["message"]
 
-            log_resp = dict(response_message)
-            if TRUNCATE_MESSAGES_IN_LOGS:
-                log_resp["content"] = _middle_truncate_words(
-                    log_resp.get("content", "")
-                )
-            logger.debug(f"Response message: {log_resp}")
+            if logger.isEnabledFor(logging.DEBUG):
+                log_resp = dict(response_message)
+                if TRUNCATE_MESSAGES_IN_LOGS:
+                    log_resp["content"] = _middle_truncate_words(
+                        log_resp.get("content", "")
+                    )
+                logger.debug("Response message: %s", log_resp)
 
             if "completion_tokens" not in usage:
                 completion_tokens = len(json.dumps(response_message)) // 4
@@ -283,9 +334,23 @@ def get_llm_msg(
             if trace_context:
                 response_trace.update(trace_context)
             _emit_trace_event(trace_callback, response_trace)
+            _capture_exchange(
+                capture,
+                payload,
+                model_alias or model_id,
+                attempt + 1,
+                elapsed_ms,
+                response=resp_json,
+                status_code=resp.status_code,
+            )
 
             if usage_tracker and model_alias:
                 usage_tracker.add_usage(model_alias, prompt_tokens, completion_tokens)
+            tracing.annotate(
+                attempts=attempt + 1,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
 
             # Clear any status message if we succeeded
             if status_callback:
@@ -312,6 +377,17 @@ def get_llm_msg(
             if trace_context:
                 error_trace.update(trace_context)
             _emit_trace_event(trace_callback, error_trace)
+            if capture is not None:
+                _capture_exchange(
+                    capture,
+                    payload,
+                    model_alias or model_id,
+                    attempt + 1,
+                    elapsed_ms,
+                    response=response.text if response is not None else None,
+                    status_code=error_trace["status_code"],
+                    error=str(e),
+                )
             if e.response is not None and e.response.status_code == 429:
                 if attempt < MAX_RETRIES - 1:
                     retry_after = e.response.headers.get("Retry-After")
@@ -330,7 +406,8 @@ def get_llm_msg(
                         f"Rate limit exceeded (429). Retrying in {wait_time} seconds..."
                     )
                     logger.info(msg)
-                    logger.debug(_get_response_log_data(e.response))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(_get_response_log_data(e.response))
                     if status_callback:
                         status_callback(msg)
 
@@ -355,6 +432,14 @@ def get_llm_msg(
             if trace_context:
                 error_trace.update(trace_context)
             _emit_trace_event(trace_callback, error_trace)
+            _capture_exchange(
+                capture,
+                payload,
+                model_alias or model_id,
+                attempt + 1,
+                elapsed_ms,
+                error=str(e),
+            )
             if attempt < MAX_RETRIES - 1:
                 logger.info(
                     f"Request error: {e}. Retrying in {current_backoff} seconds..."
@@ -21,6 +21,7 @@ from asky.html import strip_think_tags
 from asky.lazy_imports import call_attr
 from asky.rendering import render_to_browser
 from asky.core.api_client import get_llm_msg, count_tokens, UsageTracker
+from asky.core.token_counter import get_token_counter
 from asky.core.exceptions import ContextOverflowError
 from asky.core.prompts import extract_calls
 from asky.core.registry import ToolRegistry
@@ -133,7 +134,7 @@ class ConversationEngine:
                 self._emit_event("turn_start", turn=turn, max_turns=self.max_turns)
 
                 # Token & Turn Tracking
-                total_tokens = count_tokens(messages)
+                total_tokens = count_tokens(messages, self.model_config)
                 context_size = self.model_config.get(
                     "context_size", DEFAULT_CONTEXT_SIZE
                 )
@@ -361,14 +362,21 @@ class ConversationEngine:
                                 f"Executing tool {call_index}/{len(calls)}: {tool_name}"
                             ),
                         )
-                    logger.debug(f"Tool call [{len(str(call))} chrs]: {str(call)}")
+                    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                    if debug_enabled:
+                        call_text = str(call)
+                        logger.debug(
+                            "Tool call [%d chrs]: %s", len(call_text), call_text
+                        )
                     result = self.tool_registry.dispatch(
                         call,
                         self.summarize,
                     )
-                    logger.debug(
-                        f"Tool result [{len(str(result))} chrs]: {str(result)}"
-                    )
+                    if debug_enabled:
+                        result_text = str(result)
+                        logger.debug(
+                            "Tool result [%d chrs]: %s", len(result_text), result_text
+                        )
                     self._emit_event(
                         "tool_end",
                         turn=turn,
@@ -678,7 +686,8 @@ class ConversationEngine:
         """Check if message history exceeds threshold and compact if needed."""
         context_size = self.model_config.get("context_size", DEFAULT_CONTEXT_SIZE)
         threshold_tokens = int(context_size * (SESSION_COMPACTION_THRESHOLD / 100))
-        current_tokens = count_tokens(messages)
+        counter = get_token_counter(self.model_config)
+        current_tokens = counter.count_messages(messages)
 
         if current_tokens < threshold_tokens:
             return messages
@@ -701,8 +710,8 @@ class ConversationEngine:
             else:
                 smart_compacted_messages.append(m)
 
-        # Re-check tokens
-        new_tokens = count_tokens(smart_compacted_messages)
+        # Re-check tokens (unchanged messages hit the per-message count cache)
+        new_tokens = counter.count_messages(smart_compacted_messages)
         if new_tokens < threshold_tokens:
             logger.info(
                 f"Smart compaction successful. Reduced from {current_tokens} to {new_tokens}"
@@ -730,28 +739,37 @@ class ConversationEngine:
         last_msg = other_msgs[-1]
         history = other_msgs[:-1]
 
-        while history:
-            history.pop(0)
-            candidate = system_msgs + history + [last_msg]
-            if count_tokens(candidate) < threshold_tokens:
-                logger.info(f"Compacted to {count_tokens(candidate)} tokens.")
+        # Drop the oldest history first: one running total replaces re-counting
+        # every candidate list.
+        history_units = counter.units_for(history)
+        kept_units = (
+            sum(counter.units_for(system_msgs))
+            + sum(history_units)
+            + counter.message_units(last_msg)
+        )
+        for dropped, units in enumerate(history_units, start=1):
+            kept_units -= units
+            candidate_tokens = counter.tokens_from_units(kept_units)
+            if candidate_tokens < threshold_tokens:
+                logger.info(f"Compacted to {candidate_tokens} tokens.")
                 self._emit_event(
                     "context_compaction_success",
                     strategy="drop_history",
                     previous_tokens=current_tokens,
-                    new_tokens=count_tokens(candidate),
+                    new_tokens=candidate_tokens,
                 )
-                return candidate
+                return system_msgs + history[dropped:] + [last_msg]
 
         final_attempt = system_msgs + [last_msg]
+        final_tokens = counter.tokens_from_units(kept_units)
         self._emit_event(
             "context_compaction_success",
             strategy="minimal_context",
             previous_tokens=current_tokens,
-            new_tokens=count_tokens(final_attempt),
+            new_tokens=final_tokens,
         )
         logger.info(
-            f"Compaction failed to preserve history. Returning minimal context: {count_tokens(final_attempt)} tokens."
+            f"Compaction failed to preserve history. Returning minimal context: {final_tokens} tokens."
         )
         return final_attempt
 
@@ -0,0 +1,112 @@
+"""Sampled capture of full LLM request/response bodies to a rotating file.
+
+Capture is off unless `payload_capture_file` is set in `[general]`. Each
+sampled `get_llm_msg` attempt writes one JSON line holding the untruncated
+request payload and the response body (or error). Request headers are never
+written, so API keys stay out of the file. Serialization only happens for
+sampled requests, so the disabled path costs one attribute check.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_LOGGER_NAME = "asky.payload_capture"
+
+
+class PayloadCapture:
+    """Writes sampled request/response records as JSON lines."""
+
+    def __init__(
+        self,
+        path: Path,
+        sample_rate: float = 1.0,
+        max_bytes: int = 20 * 1024 * 1024,
+        backup_count: int = 3,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self._rng = rng
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handler = RotatingFileHandler(
+            self.path,
+            mode="a",
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+        self._logger = logging.Logger(CAPTURE_LOGGER_NAME, level=logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(self._handler)
+
+    def should_sample(self) -> bool:
+        if self.sample_rate >= 1.0:
+            return True
+        return self.sample_rate > 0.0 and self._rng() < self.sample_rate
+
+    def write(self, record: Dict[str, Any]) -> None:
+        entry = {"ts": time.time(), **record}
+        try:
+            self._logger.info(json.dumps(entry, ensure_ascii=False, default=str))
+        except Exception:
+            logger.warning("Payload capture write failed", exc_info=True)
+
+    def close(self) -> None:
+        self._logger.removeHandler(self._handler)
+        self._handler.close()
+
+
+_capture: Optional[PayloadCapture] = None
+_capture_key: Optional[tuple] = None
+_capture_lock = threading.Lock()
+
+
+def get_payload_capture() -> Optional[PayloadCapture]:
+    """Return the configured capture sink, or None when capture is disabled."""
+    global _capture, _capture_key
+    from asky.config import (
+        PAYLOAD_CAPTURE_BACKUP_COUNT,
+        PAYLOAD_CAPTURE_FILE,
+        PAYLOAD_CAPTURE_MAX_BYTES,
+        PAYLOAD_CAPTURE_SAMPLE_RATE,
+    )
+
+    if not PAYLOAD_CAPTURE_FILE or PAYLOAD_CAPTURE_SAMPLE_RATE <= 0:
+        return None
+    key = (
+        PAYLOAD_CAPTURE_FILE,
+        PAYLOAD_CAPTURE_SAMPLE_RATE,
+        PAYLOAD_CAPTURE_MAX_BYTES,
+        PAYLOAD_CAPTURE_BACKUP_COUNT,
+    )
+    with _capture_lock:
+        if _capture_key != key:
+            if _capture is not None:
+                _capture.close()
+            try:
+                _capture = PayloadCapture(
+                    Path(PAYLOAD_CAPTURE_FILE),
+                    sample_rate=PAYLOAD_CAPTURE_SAMPLE_RATE,
+                    max_bytes=PAYLOAD_CAPTURE_MAX_BYTES,
+                    backup_count=PAYLOAD_CAPTURE_BACKUP_COUNT,
+                )
+            except OSError as exc:
+                logger.warning(
+                    "Payload capture disabled: cannot open %s (%s)",
+                    PAYLOAD_CAPTURE_FILE,
+                    exc,
+                )
+                _capture = None
+            _capture_key = key
+        return _capture
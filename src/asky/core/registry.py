@@ -6,6 +6,7 @@ import inspect
 import time
 from typing import Any, Dict, List, Optional, Callable
 
+from asky import tracing
 from asky.plugins.hook_types import POST_TOOL_EXECUTE, PRE_TOOL_EXECUTE, PostToolExecuteContext, PreToolExecuteContext
 from asky.plugins.hooks import HookRegistry
 
@@ -115,22 +116,24 @@ class ToolRegistry:
 
         started = time.perf_counter()
         # Check executor signature to see if it accepts summarize or crawler_state
-        try:
-            sig = inspect.signature(executor)
-            params = sig.parameters
-            call_kwargs = {}
-            if "summarize" in params:
-                call_kwargs["summarize"] = summarize
-
-            if call_kwargs:
-                # Merge with tool-provided args if they don't overlap
-                # Tool provided args take precedence if they arrive from the LLM
-                result = executor(effective_args, **call_kwargs)
-            else:
-                result = executor(effective_args)
-        except Exception as e:
-            logger.error(f"Error executing tool '{name}': {e}")
-            result = {"error": f"Tool execution failed: {str(e)}"}
+        with tracing.span(f"tool.{name}", "tool") as tool_span:
+            try:
+                sig = inspect.signature(executor)
+                params = sig.parameters
+                call_kwargs = {}
+                if "summarize" in params:
+                    call_kwargs["summarize"] = summarize
+
+                if call_kwargs:
+                    # Merge with tool-provided args if they don't overlap
+                    # Tool provided args take precedence if they arrive from the LLM
+                    result = executor(effective_args, **call_kwargs)
+                else:
+                    result = executor(effective_args)
+            except Exception as e:
+                logger.error(f"Error executing tool '{name}': {e}")
+                result = {"error": f"Tool execution failed: {str(e)}"}
+                tool_span.set(error=type(e).__name__)
 
         if self._hook_registry is not None:
             elapsed_ms = (time.perf_counter() - started) * 1000.0
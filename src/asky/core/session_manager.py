@@ -421,9 +421,10 @@ class SessionManager:
         if not self.current_session:
             return 0
 
-        # Calculate tokens (naive for now, improved later if needed)
-        q_tokens = count_tokens([{"role": "user", "content": query}])
-        a_tokens = count_tokens([{"role": "assistant", "content": answer}])
+        q_tokens = count_tokens([{"role": "user", "content": query}], self.model_config)
+        a_tokens = count_tokens(
+            [{"role": "assistant", "content": answer}], self.model_config
+        )
 
         self.repo.save_message(
             self.current_session.id, "user", query, query_summary, q_tokens
@@ -440,7 +441,7 @@ class SessionManager:
 
         # Calculate current session tokens
         messages = self.build_context_messages()
-        current_token_count = count_tokens(messages)
+        current_token_count = count_tokens(messages, self.model_config)
 
         threshold_tokens = int(self.context_size * (SESSION_COMPACTION_THRESHOLD / 100))
 
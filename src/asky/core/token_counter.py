@@ -0,0 +1,200 @@
+"""Token accounting for context budgeting.
+
+A model gets an exact counter when its `[models.*]` section names a
+`tokenizer` (or, with `tiktoken` installed, when its id is a known OpenAI
+model); everything else uses the chars/4 estimate. Per-message counts are
+memoized: string content is keyed by the string itself (CPython caches string
+hashes, so repeat lookups of the same message are O(1)), while non-string
+content and `tool_calls` are keyed by object identity. Treat those objects as
+immutable once they are appended to a conversation.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+ESTIMATED_CHARS_PER_TOKEN = 4
+MESSAGE_CACHE_SIZE = 4096
+TIKTOKEN_PREFIX = "tiktoken:"
+HF_TOKENIZER_PREFIX = "hf:"
+
+Encoder = Callable[[str], Sequence[int]]
+
+
+class TokenCounter:
+    """Counts message tokens with one tokenizer and memoizes per-message results.
+
+    Counts are accumulated in "units" (tokens for a real tokenizer, characters
+    for the estimator) and converted once per total, so the estimate matches
+    the historical `total_chars // 4` exactly.
+    """
+
+    def __init__(self, encode: Optional[Encoder] = None, name: str = "estimate") -> None:
+        self.name = name
+        self._encode = encode
+        self._units_per_token = 1 if encode is not None else ESTIMATED_CHARS_PER_TOKEN
+        self._cache: "OrderedDict[Tuple[Any, Any], Tuple[int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def is_exact(self) -> bool:
+        return self._encode is not None
+
+    def _text_units(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encode is None:
+            return len(text)
+        return len(self._encode(text))
+
+    def _compute_units(self, content: Any, tool_calls: Any) -> int:
+        units = 0
+        if isinstance(content, str):
+            units += self._text_units(content)
+        elif content is not None:
+            units += self._text_units(json.dumps(content))
+        if tool_calls:
+            units += self._text_units(json.dumps(tool_calls))
+        return units
+
+    def message_units(self, message: Dict[str, Any]) -> int:
+        """Units for one message (content plus tool calls), memoized."""
+        content = message.get("content")
+        tool_calls = message.get("tool_calls") or None
+        content_key = (
+            content if content is None or isinstance(content, str) else id(content)
+        )
+        key = (content_key, id(tool_calls) if tool_calls is not None else None)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return entry[0]
+
+        units = self._compute_units(content, tool_calls)
+        with self._lock:
+            # Holding the keyed objects keeps their ids from being reused while cached.
+            self._cache[key] = (units, (content, tool_calls))
+            self.cache_misses += 1
+            if len(self._cache) > MESSAGE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return units
+
+    def units_for(self, messages: Sequence[Dict[str, Any]]) -> List[int]:
+        return [self.message_units(message) for message in messages]
+
+    def tokens_from_units(self, units: int) -> int:
+        return int(units) // self._units_per_token
+
+    def count_messages(self, messages: Sequence[Dict[str, Any]]) -> int:
+        return self.tokens_from_units(sum(self.units_for(messages)))
+
+    def count_text(self, text: str) -> int:
+        return self.tokens_from_units(self._text_units(text or ""))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def _tiktoken_encoder(encoding_name: str) -> Encoder:
+    import tiktoken
+
+    encoding = tiktoken.get_encoding(encoding_name)
+    return lambda text: encoding.encode(text, disallowed_special=())
+
+
+def _hf_encoder(tokenizer: Any) -> Encoder:
+    return lambda text: tokenizer.encode(text, add_special_tokens=False).ids
+
+
+def _load_encoder(spec: str) -> Encoder:
+    """Build an encoder from a `tokenizer` model setting.
+
+    Accepted forms: `tiktoken:<encoding>`, `hf:<repo id>`, a path to a
+    `tokenizer.json`, or a bare tiktoken encoding name.
+    """
+    if spec.startswith(TIKTOKEN_PREFIX):
+        return _tiktoken_encoder(spec[len(TIKTOKEN_PREFIX):])
+    if spec.startswith(HF_TOKENIZER_PREFIX):
+        from tokenizers import Tokenizer
+
+        return _hf_encoder(Tokenizer.from_pretrained(spec[len(HF_TOKENIZER_PREFIX):]))
+    path = Path(spec).expanduser()
+    if path.suffix == ".json" or path.exists():
+        from tokenizers import Tokenizer
+
+        return _hf_encoder(Tokenizer.from_file(str(path)))
+    return _tiktoken_encoder(spec)
+
+
+def _auto_encoder(model_id: str) -> Optional[Tuple[str, Encoder]]:
+    if not model_id:
+        return None
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        encoding = tiktoken.encoding_for_model(model_id.rsplit("/", 1)[-1])
+    except KeyError:
+        return None
+    except Exception as exc:
+        # First use downloads the BPE file; offline or unwritable caches must
+        # not break counting. The caller caches the estimator for this model.
+        logger.warning(
+            "tiktoken encoding for %r unavailable (%s); using the chars/4 estimate.",
+            model_id,
+            exc,
+        )
+        return None
+    return (
+        f"tiktoken:{encoding.name}",
+        lambda text: encoding.encode(text, disallowed_special=()),
+    )
+
+
+_estimator = TokenCounter()
+_counters: Dict[Tuple[str, str], TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(model_config: Optional[Dict[str, Any]] = None) -> TokenCounter:
+    """Return the (cached) counter for a model config; falls back to the estimator."""
+    if not model_config:
+        return _estimator
+    spec = str(model_config.get("tokenizer", "") or "").strip()
+    model_id = str(model_config.get("id", "") or "").strip()
+    cache_key = (spec, "" if spec else model_id)
+    with _counters_lock:
+        counter = _counters.get(cache_key)
+    if counter is not None:
+        return counter
+
+    counter = _estimator
+    if spec:
+        try:
+            counter = TokenCounter(_load_encoder(spec), name=spec)
+        except Exception as exc:
+            logger.warning(
+                "Tokenizer %r unavailable (%s); using the chars/4 estimate.", spec, exc
+            )
+    else:
+        resolved = _auto_encoder(model_id)
+        if resolved is not None:
+            name, encode = resolved
+            counter = TokenCounter(encode, name=name)
+
+    with _counters_lock:
+        return _counters.setdefault(cache_key, counter)
+
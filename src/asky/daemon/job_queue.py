@@ -3,6 +3,11 @@ Daemon-core SQLite job queue.
 
 Minimal subset of ideas vendored with attribution from Pinion:
 https://github.com/Nouman64-cat/Pinion
+
+Jobs are claimed under a time-limited lease that the owning process renews
+while the handler runs. A lease that expires (daemon crash, killed worker)
+returns the job to PENDING without using up an attempt; attempts only count
+runs whose handler actually finished with an error.
 """
 
 from __future__ import annotations
@@ -16,10 +21,32 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WORKER_COUNT = 2
+DEFAULT_LEASE_SECONDS = 60.0
+DEFAULT_MAX_ATTEMPTS = 1
+DEFAULT_RETRY_BASE_DELAY_SECONDS = 5.0
+MAX_RETRY_DELAY_SECONDS = 600.0
+IDLE_POLL_SECONDS = 5.0
+SHARED_LANE = "shared"
+
+_JOB_COLUMNS = (
+    "id, func_name, args, kwargs, status, attempts, created_at, error, heartbeat_at, "
+    "priority, max_attempts, available_at, lease_expires_at"
+)
+
+# Columns added after the first schema; missing ones are added on open.
+_MIGRATION_COLUMNS = (
+    ("priority", "INTEGER NOT NULL DEFAULT 0"),
+    ("max_attempts", f"INTEGER NOT NULL DEFAULT {DEFAULT_MAX_ATTEMPTS}"),
+    ("available_at", "REAL NOT NULL DEFAULT 0"),
+    ("lease_owner", "TEXT"),
+    ("lease_expires_at", "REAL"),
+)
+
 
 class JobStatus(enum.Enum):
     PENDING = "PENDING"
@@ -40,26 +67,122 @@ class Job:
     created_at: float = field(default_factory=time.time)
     error: Optional[str] = None
     heartbeat_at: Optional[float] = None
+    priority: int = 0
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    available_at: float = 0.0
+    lease_expires_at: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """One entry for `JobQueue.enqueue_many`."""
+    func_name: str
+    args: tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    priority: Optional[int] = None
+    max_attempts: Optional[int] = None
+
+
+@dataclass
+class _HandlerOptions:
+    handler: Callable[..., None]
+    workers: Optional[int] = None
+    priority: int = 0
+    max_attempts: Optional[int] = None
+
+
+@dataclass
+class _PeriodicJob:
+    interval_seconds: float
+    next_due_at: float
+
+
+def _row_to_job(row: Tuple[Any, ...]) -> Job:
+    return Job(
+        id=row[0],
+        func_name=row[1],
+        args=tuple(json.loads(row[2])),
+        kwargs=json.loads(row[3]),
+        status=JobStatus(row[4]),
+        attempts=row[5],
+        created_at=row[6],
+        error=row[7],
+        heartbeat_at=row[8],
+        priority=row[9],
+        max_attempts=row[10],
+        available_at=row[11],
+        lease_expires_at=row[12],
+    )
+
+
+def retry_delay_seconds(attempts: int, base_delay: float) -> float:
+    """Exponential backoff after `attempts` failed runs, capped."""
+    exponent = max(0, int(attempts) - 1)
+    return min(MAX_RETRY_DELAY_SECONDS, max(0.0, base_delay) * (2 ** exponent))
 
 
 class JobQueue:
-    """SQLite-backed job queue with a single worker thread."""
+    """SQLite-backed job queue with a pool of worker threads.
+
+    `worker_count` threads serve every job type that has no dedicated lane.
+    Handlers registered with `workers=N` get their own N threads, so a
+    long-running job type cannot block unrelated ones. Within a lane jobs
+    are claimed by priority (higher first), then by age. Job types passed
+    to `schedule_periodic` are enqueued by the lease keeper on an interval.
+    """
 
-    def __init__(self, db_path: Path):
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        worker_count: int = DEFAULT_WORKER_COUNT,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_base_delay_seconds: float = DEFAULT_RETRY_BASE_DELAY_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
         self.db_path = db_path
+        self.worker_count = max(1, int(worker_count))
+        self.lease_seconds = max(0.1, float(lease_seconds))
+        self.max_attempts = max(1, int(max_attempts))
+        self.retry_base_delay_seconds = max(0.0, float(retry_base_delay_seconds))
+        self._clock = clock
+        self._owner_id = uuid.uuid4().hex
         self._lock = threading.RLock()
         self._cv = threading.Condition()
-        self._handlers: Dict[str, Callable[..., None]] = {}
-        self._worker_thread: Optional[threading.Thread] = None
+        self._local = threading.local()
+        self._handlers: Dict[str, _HandlerOptions] = {}
+        self._periodic: Dict[str, _PeriodicJob] = {}
+        self._workers: Dict[str, List[threading.Thread]] = {}
+        self._lease_thread: Optional[threading.Thread] = None
+        self._active_jobs: Dict[str, str] = {}
         self._running = False
+        self._completed = 0
+        self._failed = 0
+        self._retried = 0
+        self._reclaimed = 0
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=5000;")
+            self._local.conn = conn
+        return conn
+
+    def _close_thread_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _init_db(self) -> None:
         with self._lock:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn = self._connect()
             conn.execute("PRAGMA journal_mode=WAL;")
-            conn.execute("PRAGMA busy_timeout=5000;")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
                     id           TEXT PRIMARY KEY,
@@ -73,20 +196,95 @@ class JobQueue:
                     heartbeat_at REAL
                 );
             """)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, ddl in _MIGRATION_COLUMNS:
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {ddl}")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at);")
-            conn.close()
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_dequeue "
+                "ON jobs(status, func_name, priority DESC, created_at);"
+            )
 
-    def register_handler(self, func_name: str, handler: Callable[..., None]) -> None:
-        """Register a function to handle jobs with func_name."""
-        self._handlers[func_name.lower()] = handler
+    def register_handler(
+        self,
+        func_name: str,
+        handler: Callable[..., None],
+        *,
+        workers: Optional[int] = None,
+        priority: int = 0,
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        """Register a function to handle jobs with func_name.
+
+        `workers` gives the job type its own lane of threads instead of the
+        shared pool. `priority` and `max_attempts` are defaults for jobs of
+        this type that do not set their own.
+        """
+        name = func_name.lower()
+        with self._lock:
+            self._handlers[name] = _HandlerOptions(
+                handler=handler,
+                workers=max(1, int(workers)) if workers else None,
+                priority=int(priority),
+                max_attempts=max(1, int(max_attempts)) if max_attempts else None,
+            )
+            if self._running:
+                self._start_lanes()
+
+    def schedule_periodic(
+        self,
+        func_name: str,
+        interval_seconds: float,
+        *,
+        initial_delay_seconds: float = 0.0,
+    ) -> None:
+        """Enqueue a `func_name` job every `interval_seconds` while running.
+
+        A new job is only added when none of that type is pending or running,
+        so a slow handler never piles up behind itself.
+        """
+        name = func_name.lower()
+        with self._lock:
+            self._periodic[name] = _PeriodicJob(
+                interval_seconds=max(1.0, float(interval_seconds)),
+                next_due_at=self._clock() + max(0.0, float(initial_delay_seconds)),
+            )
+        with self._cv:
+            self._cv.notify_all()
 
     def enqueue(self, func_name: str, *args: Any, **kwargs: Any) -> str:
         """Add a job to the queue and return its ID."""
-        job = Job(func_name=func_name.lower(), args=args, kwargs=kwargs)
-        with self._lock:
-            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
-            conn.execute(
-                "INSERT INTO jobs (id, func_name, args, kwargs, status, attempts, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        return self.enqueue_many([JobSpec(func_name=func_name, args=args, kwargs=kwargs)])[0]
+
+    def enqueue_job(
+        self,
+        func_name: str,
+        args: Iterable[Any] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        *,
+        priority: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ) -> str:
+        """Add a job with explicit priority/retry settings and return its ID."""
+        spec = JobSpec(
+            func_name=func_name,
+            args=tuple(args),
+            kwargs=dict(kwargs or {}),
+            priority=priority,
+            max_attempts=max_attempts,
+        )
+        return self.enqueue_many([spec])[0]
+
+    def enqueue_many(self, specs: Iterable[JobSpec]) -> List[str]:
+        """Insert several jobs in one transaction and return their IDs in order."""
+        now = self._clock()
+        rows = []
+        job_ids: List[str] = []
+        for spec in specs:
+            job = self._build_job(spec, now)
+            job_ids.append(job.id)
+            rows.append(
                 (
                     job.id,
                     job.func_name,
@@ -95,149 +293,350 @@ class JobQueue:
                     job.status.value,
                     job.attempts,
                     job.created_at,
-                ),
+                    job.priority,
+                    job.max_attempts,
+                    job.available_at,
+                )
             )
-            conn.close()
-            with self._cv:
-                self._cv.notify_all()
-        return job.id
+        if not rows:
+            return job_ids
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            conn.executemany(
+                "INSERT INTO jobs (id, func_name, args, kwargs, status, attempts, created_at, "
+                "priority, max_attempts, available_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT;")
+        except Exception:
+            conn.execute("ROLLBACK;")
+            raise
+        with self._cv:
+            self._cv.notify_all()
+        return job_ids
+
+    def _build_job(self, spec: JobSpec, now: float) -> Job:
+        name = spec.func_name.lower()
+        options = self._handlers.get(name)
+        priority = spec.priority
+        if priority is None:
+            priority = options.priority if options else 0
+        max_attempts = spec.max_attempts
+        if max_attempts is None:
+            max_attempts = (options.max_attempts if options else None) or self.max_attempts
+        return Job(
+            func_name=name,
+            args=tuple(spec.args),
+            kwargs=dict(spec.kwargs),
+            created_at=now,
+            priority=int(priority),
+            max_attempts=max(1, int(max_attempts)),
+            available_at=now,
+        )
 
     def list_jobs(self, limit: int = 50) -> List[Job]:
         """Return recent jobs."""
-        with self._lock:
-            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
-            cursor = conn.execute(
-                "SELECT id, func_name, args, kwargs, status, attempts, created_at, error, heartbeat_at "
-                "FROM jobs ORDER BY created_at DESC LIMIT ?",
-                (limit,),
-            )
-            rows = cursor.fetchall()
-            conn.close()
-            
-            jobs = []
-            for row in rows:
-                jobs.append(Job(
-                    id=row[0],
-                    func_name=row[1],
-                    args=tuple(json.loads(row[2])),
-                    kwargs=json.loads(row[3]),
-                    status=JobStatus(row[4]),
-                    attempts=row[5],
-                    created_at=row[6],
-                    error=row[7],
-                    heartbeat_at=row[8],
-                ))
-            return jobs
+        rows = self._connect().execute(
+            f"SELECT {_JOB_COLUMNS} FROM jobs ORDER BY created_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [_row_to_job(row) for row in rows]
 
     def get_job(self, job_id: str) -> Optional[Job]:
         """Return a specific job by ID."""
-        with self._lock:
-            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
-            row = conn.execute(
-                "SELECT id, func_name, args, kwargs, status, attempts, created_at, error, heartbeat_at "
-                "FROM jobs WHERE id=?", (job_id,)
-            ).fetchone()
-            conn.close()
-            if not row:
-                return None
-            return Job(
-                id=row[0],
-                func_name=row[1],
-                args=tuple(json.loads(row[2])),
-                kwargs=json.loads(row[3]),
-                status=JobStatus(row[4]),
-                attempts=row[5],
-                created_at=row[6],
-                error=row[7],
-                heartbeat_at=row[8],
+        row = self._connect().execute(
+            f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id=?", (job_id,)
+        ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return worker and status counts for the admin console."""
+        counts = {
+            status: count
+            for status, count in self._connect().execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
             )
+        }
+        with self._lock:
+            lanes = {lane: len(threads) for lane, threads in self._workers.items()}
+            active = len(self._active_jobs)
+            periodic = {
+                name: schedule.interval_seconds
+                for name, schedule in self._periodic.items()
+            }
+        return {
+            "lanes": lanes,
+            "running_here": active,
+            "periodic_seconds": periodic,
+            "status_counts": counts,
+            "completed": self._completed,
+            "failed": self._failed,
+            "retried": self._retried,
+            "reclaimed": self._reclaimed,
+        }
 
     def start(self) -> None:
-        """Start the background worker thread."""
+        """Start worker lanes and the lease keeper."""
         with self._lock:
             if self._running:
                 return
             self._running = True
-            self._worker_thread = threading.Thread(target=self._worker_loop, name="asky-job-worker", daemon=True)
-            self._worker_thread.start()
+            self._start_lanes()
+            self._lease_thread = threading.Thread(
+                target=self._lease_loop, name="asky-job-lease", daemon=True
+            )
+            self._lease_thread.start()
 
     def stop(self) -> None:
-        """Stop the background worker thread."""
+        """Stop all worker threads; running handlers finish their current job."""
         with self._lock:
             self._running = False
-            with self._cv:
-                self._cv.notify_all()
-        if self._worker_thread:
-            self._worker_thread.join(timeout=5.0)
+            threads = [t for lane in self._workers.values() for t in lane]
+            if self._lease_thread is not None:
+                threads.append(self._lease_thread)
+            self._workers = {}
+            self._lease_thread = None
+        with self._cv:
+            self._cv.notify_all()
+        for thread in threads:
+            thread.join(timeout=5.0)
 
-    def _worker_loop(self) -> None:
-        while self._running:
-            job = self._dequeue()
-            if job is None:
-                with self._cv:
-                    self._cv.wait(timeout=1.0)
-                continue
-
-            handler = self._handlers.get(job.func_name)
-            if not handler:
-                logger.error("No handler registered for job type: %s", job.func_name)
-                self._mark_failed(job.id, f"No handler registered for {job.func_name}")
-                continue
-
-            logger.info("Starting job %s (%s)", job.id, job.func_name)
-            try:
-                handler(*job.args, **job.kwargs)
-                self._mark_success(job.id)
-                logger.info("Job %s succeeded", job.id)
-            except Exception as exc:
-                logger.exception("Job %s failed", job.id)
-                self._mark_failed(job.id, str(exc))
-
-    def _dequeue(self) -> Optional[Job]:
+    def _start_lanes(self) -> None:
+        lanes: Dict[str, int] = {SHARED_LANE: self.worker_count}
+        for name, options in self._handlers.items():
+            if options.workers:
+                lanes[name] = options.workers
+        for lane, count in lanes.items():
+            threads = self._workers.setdefault(lane, [])
+            while len(threads) < count:
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    args=(lane,),
+                    name=f"asky-job-worker-{lane}-{len(threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+    def _dedicated_lanes(self) -> List[str]:
         with self._lock:
-            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
-            try:
-                conn.execute("BEGIN IMMEDIATE;")
-                row = conn.execute(
-                    "SELECT id, func_name, args, kwargs, status, attempts, created_at FROM jobs "
-                    "WHERE status='PENDING' ORDER BY created_at LIMIT 1"
-                ).fetchone()
-                
-                if row:
-                    job_id = row[0]
-                    conn.execute(
-                        "UPDATE jobs SET status='RUNNING', attempts=attempts+1, heartbeat_at=? WHERE id=?",
-                        (time.time(), job_id),
-                    )
-                    conn.execute("COMMIT;")
-                    return Job(
-                        id=row[0],
-                        func_name=row[1],
-                        args=tuple(json.loads(row[2])),
-                        kwargs=json.loads(row[3]),
-                        status=JobStatus.RUNNING,
-                        attempts=row[5] + 1,
-                        created_at=row[6],
-                        heartbeat_at=time.time(),
-                    )
-                else:
-                    conn.execute("COMMIT;")
-                    return None
-            except Exception:
-                conn.execute("ROLLBACK;")
-                logger.exception("Failed to dequeue job")
+            return [name for name, options in self._handlers.items() if options.workers]
+
+    def _worker_loop(self, lane: str) -> None:
+        try:
+            while self._running:
+                job = self._dequeue(lane)
+                if job is None:
+                    with self._cv:
+                        if self._running:
+                            self._cv.wait(timeout=self._idle_wait_seconds(lane))
+                    continue
+                self._run_job(job)
+        finally:
+            self._close_thread_connection()
+
+    def _run_job(self, job: Job) -> None:
+        options = self._handlers.get(job.func_name)
+        if options is None:
+            logger.error("No handler registered for job type: %s", job.func_name)
+            self._mark_failed(job, f"No handler registered for {job.func_name}", retry=False)
+            return
+
+        with self._lock:
+            self._active_jobs[job.id] = job.func_name
+        logger.info("Starting job %s (%s) attempt %s/%s", job.id, job.func_name, job.attempts, job.max_attempts)
+        try:
+            options.handler(*job.args, **job.kwargs)
+        except Exception as exc:
+            logger.exception("Job %s failed", job.id)
+            self._mark_failed(job, str(exc), retry=True)
+        else:
+            self._mark_success(job.id)
+            logger.info("Job %s succeeded", job.id)
+        finally:
+            with self._lock:
+                self._active_jobs.pop(job.id, None)
+
+    def _lane_filter(self, lane: str) -> Tuple[str, Tuple[Any, ...]]:
+        if lane != SHARED_LANE:
+            return "func_name = ?", (lane,)
+        dedicated = self._dedicated_lanes()
+        if not dedicated:
+            return "1 = 1", ()
+        placeholders = ", ".join("?" for _ in dedicated)
+        return f"func_name NOT IN ({placeholders})", tuple(dedicated)
+
+    def _dequeue(self, lane: str = SHARED_LANE) -> Optional[Job]:
+        now = self._clock()
+        lane_sql, lane_params = self._lane_filter(lane)
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE;")
+            row = conn.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs "
+                f"WHERE status='PENDING' AND available_at <= ? AND {lane_sql} "
+                "ORDER BY priority DESC, created_at LIMIT 1",
+                (now, *lane_params),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT;")
                 return None
-            finally:
-                conn.close()
+            lease_expires_at = now + self.lease_seconds
+            conn.execute(
+                "UPDATE jobs SET status='RUNNING', attempts=attempts+1, heartbeat_at=?, "
+                "lease_owner=?, lease_expires_at=? WHERE id=?",
+                (now, self._owner_id, lease_expires_at, row[0]),
+            )
+            conn.execute("COMMIT;")
+        except Exception:
+            conn.execute("ROLLBACK;")
+            logger.exception("Failed to dequeue job")
+            return None
+        job = _row_to_job(row)
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.heartbeat_at = now
+        job.lease_expires_at = lease_expires_at
+        return job
+
+    def _idle_wait_seconds(self, lane: str) -> float:
+        """Sleep until the next delayed retry is due, or the idle poll."""
+        lane_sql, lane_params = self._lane_filter(lane)
+        row = self._connect().execute(
+            f"SELECT MIN(available_at) FROM jobs WHERE status='PENDING' AND {lane_sql}",
+            lane_params,
+        ).fetchone()
+        if not row or row[0] is None:
+            return IDLE_POLL_SECONDS
+        return min(IDLE_POLL_SECONDS, max(0.05, row[0] - self._clock()))
+
+    def _lease_loop(self) -> None:
+        interval = max(0.05, self.lease_seconds / 3.0)
+        try:
+            while self._running:
+                try:
+                    self._renew_leases()
+                    self._reclaim_expired_leases()
+                    self._enqueue_due_periodic()
+                except Exception:
+                    logger.exception("Job lease maintenance failed")
+                with self._cv:
+                    if self._running:
+                        self._cv.wait(timeout=interval)
+        finally:
+            self._close_thread_connection()
+
+    def _enqueue_due_periodic(self) -> List[str]:
+        """Enqueue periodic job types that are due and have no outstanding job."""
+        now = self._clock()
+        with self._lock:
+            due = [
+                name
+                for name, schedule in self._periodic.items()
+                if schedule.next_due_at <= now
+            ]
+            for name in due:
+                self._periodic[name].next_due_at = (
+                    now + self._periodic[name].interval_seconds
+                )
+        job_ids: List[str] = []
+        conn = self._connect()
+        for name in due:
+            outstanding = conn.execute(
+                "SELECT 1 FROM jobs WHERE func_name=? AND status IN ('PENDING', 'RUNNING') "
+                "LIMIT 1",
+                (name,),
+            ).fetchone()
+            if outstanding is None:
+                job_ids.append(self.enqueue(name))
+        return job_ids
+
+    def _renew_leases(self) -> None:
+        with self._lock:
+            job_ids = list(self._active_jobs)
+        if not job_ids:
+            return
+        now = self._clock()
+        self._connect().executemany(
+            "UPDATE jobs SET heartbeat_at=?, lease_expires_at=? "
+            "WHERE id=? AND status='RUNNING' AND lease_owner=?",
+            [(now, now + self.lease_seconds, job_id, self._owner_id) for job_id in job_ids],
+        )
+
+    def _reclaim_expired_leases(self) -> int:
+        """Return RUNNING jobs whose lease lapsed to PENDING.
+
+        The claim counted an attempt up front; it is handed back because the
+        handler never reported a result.
+        """
+        now = self._clock()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            rows = conn.execute(
+                "SELECT id FROM jobs WHERE status='RUNNING' "
+                "AND (lease_expires_at IS NULL OR lease_expires_at < ?)",
+                (now,),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET status='PENDING', attempts=MAX(attempts - 1, 0), "
+                "lease_owner=NULL, lease_expires_at=NULL, available_at=?, error=? WHERE id=?",
+                [(now, "lease expired; re-queued", row[0]) for row in rows],
+            )
+            conn.execute("COMMIT;")
+        except Exception:
+            conn.execute("ROLLBACK;")
+            raise
+        if rows:
+            logger.warning("Reclaimed %d job(s) with expired leases", len(rows))
+            with self._lock:
+                self._reclaimed += len(rows)
+            with self._cv:
+                self._cv.notify_all()
+        return len(rows)
+
+    def _warn_lease_lost(self, job_id: str, outcome: str) -> None:
+        logger.warning(
+            "Job %s %s after its lease was reclaimed; result discarded", job_id, outcome
+        )
 
     def _mark_success(self, job_id: str) -> None:
+        cursor = self._connect().execute(
+            "UPDATE jobs SET status='SUCCESS', error=NULL, lease_owner=NULL, lease_expires_at=NULL "
+            "WHERE id=? AND lease_owner=?",
+            (job_id, self._owner_id),
+        )
+        if cursor.rowcount == 0:
+            self._warn_lease_lost(job_id, "succeeded")
         with self._lock:
-            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
-            conn.execute("UPDATE jobs SET status='SUCCESS', error=NULL WHERE id=?", (job_id,))
-            conn.close()
+            self._completed += 1
 
-    def _mark_failed(self, job_id: str, error: str) -> None:
+    def _mark_failed(self, job: Job, error: str, *, retry: bool) -> None:
+        conn = self._connect()
+        if retry and job.attempts < job.max_attempts:
+            delay = retry_delay_seconds(job.attempts, self.retry_base_delay_seconds)
+            cursor = conn.execute(
+                "UPDATE jobs SET status='PENDING', error=?, available_at=?, lease_owner=NULL, "
+                "lease_expires_at=NULL WHERE id=? AND lease_owner=?",
+                (error, self._clock() + delay, job.id, self._owner_id),
+            )
+            if cursor.rowcount == 0:
+                self._warn_lease_lost(job.id, "failed")
+                return
+            logger.info("Job %s will retry in %.1fs", job.id, delay)
+            with self._lock:
+                self._retried += 1
+            with self._cv:
+                self._cv.notify_all()
+            return
+        cursor = conn.execute(
+            "UPDATE jobs SET status='FAILED', error=?, lease_owner=NULL, lease_expires_at=NULL "
+            "WHERE id=? AND lease_owner=?",
+            (error, job.id, self._owner_id),
+        )
+        if cursor.rowcount == 0:
+            self._warn_lease_lost(job.id, "failed")
+            return
         with self._lock:
-            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
-            conn.execute("UPDATE jobs SET status='FAILED', error=? WHERE id=?", (error, job_id))
-            conn.close()
+            self._failed += 1
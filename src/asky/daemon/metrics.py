@@ -0,0 +1,39 @@
+"""Process-wide registry of daemon metrics providers for the admin console."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+MetricsProvider = Callable[[], Dict[str, Any]]
+
+_providers: Dict[str, MetricsProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def register_metrics_provider(name: str, provider: MetricsProvider) -> None:
+    """Register (or replace) a named snapshot callable."""
+    with _providers_lock:
+        _providers[str(name)] = provider
+
+
+def unregister_metrics_provider(name: str) -> None:
+    with _providers_lock:
+        _providers.pop(str(name), None)
+
+
+def collect_daemon_metrics() -> Dict[str, Dict[str, Any]]:
+    """Return a snapshot from every registered provider, keyed by name."""
+    with _providers_lock:
+        providers = dict(_providers)
+    snapshots: Dict[str, Dict[str, Any]] = {}
+    for name, provider in sorted(providers.items()):
+        try:
+            snapshots[name] = dict(provider() or {})
+        except Exception as exc:
+            logger.debug("metrics provider %s failed: %s", name, exc)
+            snapshots[name] = {"error": str(exc)}
+    return snapshots
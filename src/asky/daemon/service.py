@@ -46,6 +46,7 @@ class DaemonService:
         self._running = False
         self._stop_event = threading.Event()
 
+        self._register_builtin_servers()
         self._register_plugin_servers()
         self._register_transport()
 
@@ -90,6 +91,35 @@ class DaemonService:
             logger.info("daemon stop requested (sidecar-only mode)")
             self._stop_event.set()
 
+    def _register_builtin_servers(self) -> None:
+        from asky.config import RESEARCH_EMBEDDING_SERVER_ENABLED
+
+        if not RESEARCH_EMBEDDING_SERVER_ENABLED:
+            return
+        from asky.daemon.metrics import (
+            register_metrics_provider,
+            unregister_metrics_provider,
+        )
+        from asky.research.embedding_server import (
+            METRICS_NAME,
+            build_configured_server,
+        )
+
+        # Hosted for the daemon's lifetime, so no idle timeout.
+        server = build_configured_server(idle_timeout_seconds=0)
+
+        def _start() -> None:
+            if server.start():
+                register_metrics_provider(METRICS_NAME, server.snapshot)
+
+        def _stop() -> None:
+            unregister_metrics_provider(METRICS_NAME)
+            server.stop()
+
+        self._add_plugin_server(
+            DaemonServerSpec(name=METRICS_NAME, start=_start, stop=_stop)
+        )
+
     def _register_plugin_servers(self) -> None:
         runtime = self.plugin_runtime
         if runtime is None:
@@ -1,5 +1,12 @@
 const list = document.getElementById('index-list');
 const frame = document.getElementById('content-frame');
+const loadMoreBtn = document.getElementById('load-more');
+const listContainer = document.querySelector('.index-list-container');
+// Entries arrive page by page (newest first) from INDEX_PAGES_DIR shards.
+const ENTRIES = [];
+const pager = { nextPage: -1, pageSize: 200, loading: false };
+// Shards are rewritten in place; bust the file:// script cache per visit.
+const CACHE_BUST = Date.now();
 const state = {
   sort: 'date',
   group: true,
@@ -170,8 +177,69 @@ function loadFromHash() {
   }
 }
 
+function loadScript(src) {
+  return new Promise((resolve, reject) => {
+    const script = document.createElement('script');
+    script.src = `${src}?v=${CACHE_BUST}`;
+    script.onload = () => { script.remove(); resolve(); };
+    script.onerror = () => { script.remove(); reject(new Error(`Failed to load ${src}`)); };
+    document.head.appendChild(script);
+  });
+}
+
+// Called by the shard scripts.
+function askyIndexManifest(manifest) {
+  pager.nextPage = manifest.last_page;
+  pager.pageSize = manifest.page_size || pager.pageSize;
+}
+
+function askyIndexPage(page, entries) {
+  ENTRIES.push(...entries);
+}
+
+function pageFile(page) {
+  return `${INDEX_PAGES_DIR}/page_${String(page).padStart(6, '0')}.js`;
+}
+
+async function loadOlder(minEntries) {
+  if (pager.loading) return;
+  pager.loading = true;
+  const target = ENTRIES.length + (minEntries || pager.pageSize);
+  try {
+    // Pages can be sparse after superseded reports are dropped; keep going
+    // until enough entries arrived or the oldest page was read.
+    while (pager.nextPage >= 0 && ENTRIES.length < target) {
+      const page = pager.nextPage;
+      pager.nextPage -= 1;
+      try {
+        await loadScript(pageFile(page));
+      } catch (err) {
+        console.error(err);
+      }
+    }
+  } finally {
+    pager.loading = false;
+  }
+  loadMoreBtn.hidden = pager.nextPage < 0;
+  render();
+}
+
+loadMoreBtn.onclick = () => loadOlder();
+listContainer.addEventListener('scroll', () => {
+  const nearBottom = listContainer.scrollTop + listContainer.clientHeight >= listContainer.scrollHeight - 200;
+  if (nearBottom && pager.nextPage >= 0) loadOlder();
+});
+
 window.addEventListener('hashchange', loadFromHash);
-window.onload = () => { loadFromHash(); render(); };
+window.onload = async () => {
+  try {
+    await loadScript(`${INDEX_PAGES_DIR}/manifest.js`);
+  } catch (err) {
+    console.error(err);
+  }
+  await loadOlder();
+  loadFromHash();
+};
 
 /**
  * Find the longest common word prefix among an array of titles.
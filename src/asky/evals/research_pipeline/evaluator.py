@@ -9,7 +9,7 @@ import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urlsplit
 
 import requests
@@ -70,6 +70,11 @@ TOKEN_USAGE_ROLES = (
     TOKEN_USAGE_ROLE_AUDIT_PLANNER,
 )
 RESULTS_TABLE_TEXT_LIMIT = 100
+RUN_SHARDS_DIRNAME = "shards"
+LLM_RATE_LIMIT_FILENAME = ".llm_rate_limit"
+SHARD_BY_RUN = "run"
+SHARD_BY_CASE = "case"
+SHARD_MODES = (SHARD_BY_RUN, SHARD_BY_CASE)
 
 
 @dataclass(frozen=True)
@@ -1295,6 +1300,311 @@ def _initialize_runtime_storage() -> None:
     init_db()
 
 
+@dataclass(frozen=True)
+class EvalShard:
+    """A slice of one run profile's cases executed against its own runtime."""
+
+    shard_id: str
+    run: RunProfile
+    shard_dir: Path
+    case_indexes: Tuple[int, ...]
+
+
+def _load_resumable_case_results(results_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return completed case rows keyed by test id from a streamed results file.
+
+    Errored rows are dropped so their cases run again, and a truncated last
+    line (process killed mid-write) is ignored.
+    """
+    completed: Dict[str, Dict[str, Any]] = {}
+    if not results_path.exists():
+        return completed
+    with results_path.open("r", encoding="utf-8") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(payload, dict) or not payload.get("test_id"):
+                continue
+            test_id = str(payload["test_id"])
+            if payload.get("error"):
+                completed.pop(test_id, None)
+                continue
+            completed[test_id] = payload
+    return completed
+
+
+def _append_jsonl_row(path: Path, row: Dict[str, Any]) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(row, default=_json_default))
+        handle.write("\n")
+        handle.flush()
+
+
+def _build_shards(
+    run: RunProfile,
+    run_dir: Path,
+    case_indexes: Sequence[int],
+    *,
+    workers: int,
+    shard_by: str,
+) -> List[EvalShard]:
+    if not case_indexes:
+        return []
+    if shard_by != SHARD_BY_CASE or workers <= 1:
+        return [EvalShard(run.id, run, run_dir, tuple(case_indexes))]
+    shard_count = min(workers, len(case_indexes))
+    return [
+        EvalShard(
+            f"{run.id}/{RUN_SHARDS_DIRNAME}/{shard_index:03d}",
+            run,
+            run_dir / RUN_SHARDS_DIRNAME / f"{shard_index:03d}",
+            tuple(case_indexes[shard_index::shard_count]),
+        )
+        for shard_index in range(shard_count)
+    ]
+
+
+def _execute_shard(
+    shard: EvalShard,
+    *,
+    dataset: DatasetSpec,
+    snapshot_manifest: Optional[SnapshotManifest],
+    emit: Callable[[Dict[str, Any]], None],
+) -> None:
+    """Evaluate one shard inside its own isolated runtime, reporting via `emit`.
+
+    Used in-process for serial runs and inside pool workers for parallel
+    runs. A `shard_end` event is always emitted last.
+    """
+    run = shard.run
+    case_total = len(dataset.tests)
+    started_at = time.time()
+    error: Optional[str] = None
+    try:
+        with isolated_asky_runtime(build_runtime_paths(shard.shard_dir)):
+            _initialize_runtime_storage()
+            for case_index in shard.case_indexes:
+                test_case = dataset.tests[case_index - 1]
+                emit(
+                    {
+                        "event": "case_start",
+                        "run_id": run.id,
+                        "case_id": test_case.id,
+                        "case_index": case_index,
+                        "case_total": case_total,
+                    }
+                )
+                case_result = _evaluate_case(
+                    run=run,
+                    dataset=dataset,
+                    test_case=test_case,
+                    snapshot_manifest=snapshot_manifest,
+                    case_progress_callback=emit,
+                )
+                emit(
+                    {
+                        "event": "case_result",
+                        "run_id": run.id,
+                        "case_index": case_index,
+                        "result": case_result,
+                    }
+                )
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    finally:
+        emit(
+            {
+                "event": "shard_end",
+                "run_id": run.id,
+                "shard_id": shard.shard_id,
+                "started_at": started_at,
+                "finished_at": time.time(),
+                "error": error,
+            }
+        )
+
+
+class _MatrixCollector:
+    """Parent-side sink for shard events: streams rows and finalizes runs."""
+
+    def __init__(
+        self,
+        *,
+        dataset: DatasetSpec,
+        output_dir: Path,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> None:
+        self.dataset = dataset
+        self.output_dir = output_dir
+        self.progress_callback = progress_callback
+        self.run_summaries: Dict[str, Dict[str, Any]] = {}
+        self.run_case_results: Dict[str, List[Dict[str, Any]]] = {}
+        self._runs: Dict[str, Dict[str, Any]] = {}
+        self._shards: Dict[str, EvalShard] = {}
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        if self.progress_callback is not None:
+            self.progress_callback(event)
+
+    def start_run(
+        self,
+        run: RunProfile,
+        *,
+        run_index: int,
+        run_total: int,
+        completed: Dict[str, Dict[str, Any]],
+        shards: Sequence[EvalShard],
+    ) -> None:
+        run_dir = self.output_dir / run.id
+        results_path = run_dir / "artifacts" / RUN_RESULTS_FILENAME
+        # Rewrite with only the kept rows; new rows are appended as they finish.
+        _write_jsonl(results_path, completed.values())
+        self._runs[run.id] = {
+            "run": run,
+            "run_index": run_index,
+            "run_total": run_total,
+            "run_dir": run_dir,
+            "results_path": results_path,
+            "completed": dict(completed),
+            "remaining_shards": len(shards),
+            "started_at": None,
+            "finished_at": None,
+        }
+        for shard in shards:
+            self._shards[shard.shard_id] = shard
+        event: Dict[str, Any] = {
+            "event": "run_start",
+            "run_id": run.id,
+            "run_index": run_index,
+            "run_total": run_total,
+            "case_total": len(self.dataset.tests),
+        }
+        if completed:
+            event["resumed_cases"] = len(completed)
+        self._emit(event)
+        if not shards:
+            self._finalize_run(run.id)
+
+    def handle(self, event: Dict[str, Any]) -> None:
+        event_type = event.get("event")
+        if event_type == "case_result":
+            self._record_case_result(
+                str(event["run_id"]), int(event["case_index"]), event["result"]
+            )
+            return
+        if event_type == "shard_end":
+            self._end_shard(event)
+            return
+        self._emit(event)
+
+    def _record_case_result(
+        self, run_id: str, case_index: int, case_result: Dict[str, Any]
+    ) -> None:
+        state = self._runs[run_id]
+        test_case = self.dataset.tests[case_index - 1]
+        case_result.setdefault("test_id", test_case.id)
+        state["completed"][test_case.id] = case_result
+        _append_jsonl_row(state["results_path"], case_result)
+        self._emit(
+            {
+                "event": "case_end",
+                "run_id": run_id,
+                "case_id": test_case.id,
+                "case_index": case_index,
+                "case_total": len(self.dataset.tests),
+                "pass": bool(case_result.get("pass")),
+                "halted": bool(case_result.get("halted")),
+                "error": case_result.get("error"),
+                "elapsed_ms": float(case_result.get("elapsed_ms", 0.0) or 0.0),
+            }
+        )
+
+    def _end_shard(self, event: Dict[str, Any]) -> None:
+        run_id = str(event["run_id"])
+        state = self._runs[run_id]
+        shard = self._shards.get(str(event.get("shard_id", "")))
+        error = event.get("error")
+        if error and shard is not None:
+            # Record unfinished cases as errors so a resume reruns them.
+            for case_index in shard.case_indexes:
+                test_case = self.dataset.tests[case_index - 1]
+                if test_case.id in state["completed"]:
+                    continue
+                self._record_case_result(
+                    run_id,
+                    case_index,
+                    {
+                        "run_id": run_id,
+                        "test_id": test_case.id,
+                        "pass": False,
+                        "elapsed_ms": 0.0,
+                        "halted": False,
+                        "error": f"shard failed: {error}",
+                    },
+                )
+        started_at = event.get("started_at")
+        finished_at = event.get("finished_at")
+        if isinstance(started_at, (int, float)):
+            current = state["started_at"]
+            state["started_at"] = started_at if current is None else min(current, started_at)
+        if isinstance(finished_at, (int, float)):
+            current = state["finished_at"]
+            state["finished_at"] = (
+                finished_at if current is None else max(current, finished_at)
+            )
+        state["remaining_shards"] -= 1
+        if state["remaining_shards"] <= 0:
+            self._finalize_run(run_id)
+
+    def _finalize_run(self, run_id: str) -> None:
+        state = self._runs[run_id]
+        run: RunProfile = state["run"]
+        completed = state["completed"]
+        case_results = [
+            completed[test_case.id]
+            for test_case in self.dataset.tests
+            if test_case.id in completed
+        ]
+        run_wall_ms = 0.0
+        if state["started_at"] is not None and state["finished_at"] is not None:
+            run_wall_ms = (state["finished_at"] - state["started_at"]) * 1000.0
+
+        run_summary = _summarize_run(run, case_results)
+        timing_totals = run_summary.get("timing_totals_ms")
+        if isinstance(timing_totals, dict):
+            timing_totals[TIMING_KEY_RUN_WALL_MS] = run_wall_ms
+        artifacts_dir = state["run_dir"] / "artifacts"
+        # Streamed rows arrive in completion order; persist them in dataset order.
+        _write_jsonl(state["results_path"], case_results)
+        _write_json(artifacts_dir / RUN_SUMMARY_FILENAME, run_summary)
+        _write_results_markdown(
+            artifacts_dir / RUN_RESULTS_MARKDOWN_FILENAME,
+            run_summary,
+            case_results,
+        )
+        self.run_summaries[run_id] = run_summary
+        self.run_case_results[run_id] = case_results
+        self._emit(
+            {
+                "event": "run_end",
+                "run_id": run_id,
+                "run_index": state["run_index"],
+                "run_total": state["run_total"],
+                "passed_cases": int(run_summary.get("passed_cases", 0) or 0),
+                "total_cases": int(run_summary.get("total_cases", 0) or 0),
+                "failed_cases": int(run_summary.get("failed_cases", 0) or 0),
+                "error_cases": int(run_summary.get("error_cases", 0) or 0),
+                "halted_cases": int(run_summary.get("halted_cases", 0) or 0),
+                "run_wall_ms": run_wall_ms,
+            }
+        )
+
+
 def run_evaluation_matrix(
     *,
     dataset: DatasetSpec,
@@ -1303,14 +1613,32 @@ def run_evaluation_matrix(
     output_root: Path,
     selected_run_ids: Optional[Sequence[str]] = None,
     progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    workers: int = 1,
+    shard_by: str = SHARD_BY_RUN,
+    resume_dir: Optional[Path] = None,
+    llm_requests_per_second: float = 0.0,
 ) -> Path:
-    """Execute all selected run profiles and persist evaluation artifacts."""
+    """Execute all selected run profiles and persist evaluation artifacts.
+
+    With `workers > 1`, shards (one per run profile, or per case slice with
+    `shard_by="case"`) run in separate processes, each with its own runtime
+    directory. Case rows are streamed to each run's `results.jsonl` as they
+    finish, so `resume_dir` can continue a partially completed output dir.
+    """
+    if shard_by not in SHARD_MODES:
+        raise ValueError(f"Unknown shard mode '{shard_by}' (expected one of {SHARD_MODES}).")
     session_started = time.perf_counter()
     selection = set(selected_run_ids or [])
+    workers = max(1, int(workers))
 
-    output_root_resolved = output_root.expanduser().resolve()
-    output_root_resolved.mkdir(parents=True, exist_ok=True)
-    output_dir = _create_unique_output_dir(output_root_resolved)
+    if resume_dir is not None:
+        output_dir = resume_dir.expanduser().resolve()
+        if not output_dir.is_dir():
+            raise ValueError(f"Resume directory does not exist: {output_dir}")
+    else:
+        output_root_resolved = output_root.expanduser().resolve()
+        output_root_resolved.mkdir(parents=True, exist_ok=True)
+        output_dir = _create_unique_output_dir(output_root_resolved)
 
     selected_runs: List[RunProfile] = []
     for run in matrix.runs:
@@ -1321,12 +1649,7 @@ def run_evaluation_matrix(
     if not selected_runs:
         raise ValueError("No runs selected for execution.")
 
-    run_summaries: List[Dict[str, Any]] = []
-    run_case_results: Dict[str, List[Dict[str, Any]]] = {}
-    run_total = len(selected_runs)
-
-    for run_index, run in enumerate(selected_runs, start=1):
-        run_started = time.perf_counter()
+    for run in selected_runs:
         if (
             run.resolved_source_provider() == SOURCE_PROVIDER_LOCAL_SNAPSHOT
             and snapshot_manifest is None
@@ -1335,88 +1658,79 @@ def run_evaluation_matrix(
                 "Run requires local_snapshot provider but snapshot manifest is missing."
             )
 
+    from asky.evals.research_pipeline.parallel import (
+        install_llm_rate_limit,
+        run_shards_in_pool,
+    )
+
+    rate_limit_path = output_dir / LLM_RATE_LIMIT_FILENAME
+    collector = _MatrixCollector(
+        dataset=dataset,
+        output_dir=output_dir,
+        progress_callback=progress_callback,
+    )
+    run_total = len(selected_runs)
+    run_plans: List[Tuple[RunProfile, Dict[str, Dict[str, Any]], List[EvalShard]]] = []
+    for run in selected_runs:
         run_dir = output_dir / run.id
-        runtime_paths = build_runtime_paths(run_dir)
-        case_total = len(dataset.tests)
-        if progress_callback is not None:
-            progress_callback(
-                {
-                    "event": "run_start",
-                    "run_id": run.id,
-                    "run_index": run_index,
-                    "run_total": run_total,
-                    "case_total": case_total,
-                }
+        completed: Dict[str, Dict[str, Any]] = {}
+        if resume_dir is not None:
+            completed = _load_resumable_case_results(
+                run_dir / "artifacts" / RUN_RESULTS_FILENAME
             )
+        pending_indexes = [
+            index
+            for index, test_case in enumerate(dataset.tests, start=1)
+            if test_case.id not in completed
+        ]
+        shards = _build_shards(
+            run, run_dir, pending_indexes, workers=workers, shard_by=shard_by
+        )
+        run_plans.append((run, completed, shards))
 
-        with isolated_asky_runtime(runtime_paths):
-            _initialize_runtime_storage()
-            case_results: List[Dict[str, Any]] = []
-            for case_index, test_case in enumerate(dataset.tests, start=1):
-                if progress_callback is not None:
-                    progress_callback(
-                        {
-                            "event": "case_start",
-                            "run_id": run.id,
-                            "case_id": test_case.id,
-                            "case_index": case_index,
-                            "case_total": case_total,
-                        }
-                    )
-                case_result = _evaluate_case(
-                    run=run,
-                    dataset=dataset,
-                    test_case=test_case,
-                    snapshot_manifest=snapshot_manifest,
-                    case_progress_callback=progress_callback,
+    restore_gate = install_llm_rate_limit(rate_limit_path, llm_requests_per_second)
+    try:
+        if workers > 1:
+            for run_index, (run, completed, shards) in enumerate(run_plans, start=1):
+                collector.start_run(
+                    run,
+                    run_index=run_index,
+                    run_total=run_total,
+                    completed=completed,
+                    shards=shards,
                 )
-                case_results.append(case_result)
-                if progress_callback is not None:
-                    progress_callback(
-                        {
-                            "event": "case_end",
-                            "run_id": run.id,
-                            "case_id": test_case.id,
-                            "case_index": case_index,
-                            "case_total": case_total,
-                            "pass": bool(case_result.get("pass")),
-                            "halted": bool(case_result.get("halted")),
-                            "error": case_result.get("error"),
-                            "elapsed_ms": float(case_result.get("elapsed_ms", 0.0) or 0.0),
-                        }
-                    )
-
-        run_summary = _summarize_run(run, case_results)
-        run_wall_ms = (time.perf_counter() - run_started) * 1000.0
-        timing_totals = run_summary.get("timing_totals_ms")
-        if isinstance(timing_totals, dict):
-            timing_totals[TIMING_KEY_RUN_WALL_MS] = run_wall_ms
-        results_jsonl_path = runtime_paths.artifacts_dir / RUN_RESULTS_FILENAME
-        _write_jsonl(results_jsonl_path, case_results)
-        _write_json(runtime_paths.artifacts_dir / RUN_SUMMARY_FILENAME, run_summary)
-        _write_results_markdown(
-            runtime_paths.artifacts_dir / RUN_RESULTS_MARKDOWN_FILENAME,
-            run_summary,
-            case_results,
-        )
-        run_summaries.append(run_summary)
-        run_case_results[run.id] = case_results
-        if progress_callback is not None:
-            progress_callback(
-                {
-                    "event": "run_end",
-                    "run_id": run.id,
-                    "run_index": run_index,
-                    "run_total": run_total,
-                    "passed_cases": int(run_summary.get("passed_cases", 0) or 0),
-                    "total_cases": int(run_summary.get("total_cases", 0) or 0),
-                    "failed_cases": int(run_summary.get("failed_cases", 0) or 0),
-                    "error_cases": int(run_summary.get("error_cases", 0) or 0),
-                    "halted_cases": int(run_summary.get("halted_cases", 0) or 0),
-                    "run_wall_ms": run_wall_ms,
-                }
+            run_shards_in_pool(
+                [shard for _run, _completed, shards in run_plans for shard in shards],
+                dataset=dataset,
+                snapshot_manifest=snapshot_manifest,
+                workers=workers,
+                on_event=collector.handle,
+                rate_limit_path=rate_limit_path,
+                llm_requests_per_second=llm_requests_per_second,
             )
+        else:
+            for run_index, (run, completed, shards) in enumerate(run_plans, start=1):
+                collector.start_run(
+                    run,
+                    run_index=run_index,
+                    run_total=run_total,
+                    completed=completed,
+                    shards=shards,
+                )
+                for shard in shards:
+                    _execute_shard(
+                        shard,
+                        dataset=dataset,
+                        snapshot_manifest=snapshot_manifest,
+                        emit=collector.handle,
+                    )
+    finally:
+        restore_gate()
 
+    run_summaries = [collector.run_summaries[run.id] for run in selected_runs]
+    run_case_results = {
+        run.id: collector.run_case_results[run.id] for run in selected_runs
+    }
     session_wall_ms = (time.perf_counter() - session_started) * 1000.0
     runs_wall_ms = sum(
         _timing_total_ms(summary, TIMING_KEY_RUN_WALL_MS) for summary in run_summaries
@@ -1425,6 +1739,12 @@ def run_evaluation_matrix(
         "dataset_id": dataset.id,
         "created_at": _format_timestamp(_utc_now()),
         "run_count": len(run_summaries),
+        "execution": {
+            "workers": workers,
+            "shard_by": shard_by,
+            "resumed": resume_dir is not None,
+            "llm_requests_per_second": float(llm_requests_per_second or 0.0),
+        },
         "timing_totals_ms": {
             TIMING_KEY_SESSION_WALL_MS: session_wall_ms,
             "runs_wall_ms": runs_wall_ms,
@@ -0,0 +1,177 @@
+"""Process pool execution and cross-process LLM pacing for evaluation runs."""
+
+from __future__ import annotations
+
+import fcntl
+import multiprocessing
+import queue
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from asky.core.api_client import set_llm_request_gate
+
+QUEUE_POLL_SECONDS = 0.2
+
+ExecutorFactory = Callable[[int, Callable[..., None], tuple], Executor]
+
+_worker_queue: Any = None
+
+
+class SharedRateLimiter:
+    """Spaces LLM requests `1 / requests_per_second` apart across processes.
+
+    The next free slot is a wall-clock timestamp kept in a small file; each
+    caller reserves a slot under an exclusive `flock` and sleeps outside it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        requests_per_second: float,
+        *,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        rate = float(requests_per_second or 0)
+        self.path = Path(path)
+        self.min_interval_seconds = 1.0 / rate if rate > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+
+    def acquire(self) -> None:
+        if self.min_interval_seconds <= 0:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a+", encoding="utf-8") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                handle.seek(0)
+                try:
+                    next_slot = float(handle.read().strip() or 0.0)
+                except ValueError:
+                    next_slot = 0.0
+                now = self._clock()
+                slot = max(now, next_slot)
+                handle.seek(0)
+                handle.truncate()
+                handle.write(repr(slot + self.min_interval_seconds))
+                handle.flush()
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        delay = slot - now
+        if delay > 0:
+            self._sleep(delay)
+
+
+def install_llm_rate_limit(
+    path: Path, requests_per_second: float
+) -> Callable[[], None]:
+    """Gate LLM requests in this process; returns a callable that restores the old gate."""
+    if float(requests_per_second or 0) <= 0:
+        return lambda: None
+    limiter = SharedRateLimiter(path, requests_per_second)
+    previous = set_llm_request_gate(limiter.acquire)
+    return lambda: set_llm_request_gate(previous)
+
+
+def _init_worker(
+    event_queue: Any, rate_limit_path: Path, llm_requests_per_second: float
+) -> None:
+    global _worker_queue
+    _worker_queue = event_queue
+    install_llm_rate_limit(rate_limit_path, llm_requests_per_second)
+
+
+def _run_shard_in_worker(shard: Any, dataset: Any, snapshot_manifest: Any) -> None:
+    from asky.evals.research_pipeline import evaluator
+
+    evaluator._execute_shard(
+        shard,
+        dataset=dataset,
+        snapshot_manifest=snapshot_manifest,
+        emit=_worker_queue.put,
+    )
+
+
+def _default_executor(
+    workers: int, initializer: Callable[..., None], initargs: tuple
+) -> Executor:
+    # Spawn so workers never inherit patched module globals or open SQLite handles.
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+def run_shards_in_pool(
+    shards: Sequence[Any],
+    *,
+    dataset: Any,
+    snapshot_manifest: Any,
+    workers: int,
+    on_event: Callable[[Dict[str, Any]], None],
+    rate_limit_path: Path,
+    llm_requests_per_second: float = 0.0,
+    executor_factory: Optional[ExecutorFactory] = None,
+) -> None:
+    """Run shards on a worker pool, forwarding their events to `on_event`.
+
+    Workers stream events through a queue; each shard's `shard_end` is its
+    last message, so a shard is complete once that event has been handled.
+    A worker that dies without reporting gets a synthesized `shard_end`.
+    """
+    if not shards:
+        return
+    event_queue = multiprocessing.get_context("spawn").Queue()
+    factory = executor_factory or _default_executor
+    executor = factory(
+        workers,
+        _init_worker,
+        (event_queue, rate_limit_path, llm_requests_per_second),
+    )
+    open_shards = {shard.shard_id for shard in shards}
+    with executor:
+        futures: Dict[Future, Any] = {
+            executor.submit(_run_shard_in_worker, shard, dataset, snapshot_manifest): shard
+            for shard in shards
+        }
+        while open_shards:
+            try:
+                event = event_queue.get(timeout=QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                _report_failed_workers(futures, open_shards, on_event)
+                continue
+            if event.get("event") == "shard_end":
+                open_shards.discard(event.get("shard_id"))
+            on_event(event)
+    event_queue.close()
+
+
+def _report_failed_workers(
+    futures: Dict[Future, Any],
+    open_shards: set,
+    on_event: Callable[[Dict[str, Any]], None],
+) -> None:
+    for future, shard in futures.items():
+        if shard.shard_id not in open_shards or not future.done():
+            continue
+        exc = future.exception()
+        if exc is None:
+            # Finished normally; its shard_end is still in flight on the queue.
+            continue
+        open_shards.discard(shard.shard_id)
+        now = time.time()
+        on_event(
+            {
+                "event": "shard_end",
+                "run_id": shard.run.id,
+                "shard_id": shard.shard_id,
+                "started_at": now,
+                "finished_at": now,
+                "error": f"{type(exc).__name__}: {exc}",
+            }
+        )
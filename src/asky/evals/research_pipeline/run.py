@@ -11,6 +11,8 @@ from asky.evals.research_pipeline.dataset import load_dataset
 from asky.evals.research_pipeline.evaluator import (
     DEFAULT_DOWNLOAD_TIMEOUT_SECONDS,
     RUN_RESULTS_MARKDOWN_FILENAME,
+    SHARD_BY_RUN,
+    SHARD_MODES,
     load_snapshot_manifest,
     prepare_dataset_snapshots,
     regenerate_report,
@@ -78,8 +80,11 @@ def _print_eval_progress(event: Dict[str, Any]) -> None:
         run_total = int(event.get("run_total", 0) or 0)
         run_id = str(event.get("run_id", "unknown"))
         case_total = int(event.get("case_total", 0) or 0)
+        resumed = int(event.get("resumed_cases", 0) or 0)
+        resumed_suffix = f", {resumed} resumed" if resumed else ""
         print(
-            f"[run {run_index}/{run_total}] {run_id} started ({case_total} cases)",
+            f"[run {run_index}/{run_total}] {run_id} started "
+            f"({case_total} cases{resumed_suffix})",
             flush=True,
         )
         return
@@ -238,6 +243,29 @@ def _build_parser() -> argparse.ArgumentParser:
         default=[],
         help="Run id filter. Can be repeated or comma-separated.",
     )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes; each shard gets its own isolated runtime (default: 1).",
+    )
+    run_parser.add_argument(
+        "--shard-by",
+        choices=SHARD_MODES,
+        default=SHARD_BY_RUN,
+        help="Parallel unit: one shard per run profile, or case slices per run.",
+    )
+    run_parser.add_argument(
+        "--resume",
+        default=None,
+        help="Continue an existing run output dir, skipping completed cases.",
+    )
+    run_parser.add_argument(
+        "--llm-rps",
+        type=float,
+        default=0.0,
+        help="Max LLM requests per second shared by all workers (0 = unlimited).",
+    )
 
     report_parser = subparsers.add_parser(
         "report",
@@ -315,6 +343,10 @@ def _handle_run(args: argparse.Namespace) -> int:
         output_root=output_root,
         selected_run_ids=selected_run_ids,
         progress_callback=_print_eval_progress,
+        workers=int(args.workers),
+        shard_by=str(args.shard_by),
+        resume_dir=Path(args.resume) if args.resume else None,
+        llm_requests_per_second=float(args.llm_rps),
     )
 
     print(f"Run output: {output_dir}")
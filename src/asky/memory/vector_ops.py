@@ -4,29 +4,69 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from asky import tracing
 from asky.research.embeddings import EmbeddingClient
+from asky.research.vector_index import (
+    GLOBAL_KEY,
+    MEMORIES_TABLE,
+    clear_vector_indexes,
+    get_vector_index,
+    session_key,
+)
 from asky.research.vector_store_common import cosine_similarity, distance_to_similarity
 
 logger = logging.getLogger(__name__)
 
 CHROMA_COLLECTION_SPACE = "cosine"
 
+# Retry a Chroma open that failed for a reason other than a missing package.
+CHROMA_OPEN_RETRY_SECONDS = 30.0
 
-def _get_chroma_client(chroma_dir: Path) -> Optional[Any]:
-    """Return a Chroma persistent client, or None if ChromaDB is unavailable."""
-    try:
-        import chromadb  # type: ignore
-        from chromadb.config import Settings
+_CHROMA_CLIENTS: Dict[str, Optional[Any]] = {}
+_CHROMA_OPEN_FAILED_AT: Dict[str, float] = {}
+_CHROMA_CLIENTS_LOCK = threading.Lock()
 
-        return chromadb.PersistentClient(
-            path=str(chroma_dir), settings=Settings(anonymized_telemetry=False)
-        )
-    except Exception as exc:
-        logger.debug("ChromaDB unavailable for memory ops: %s", exc)
-        return None
+
+def _get_chroma_client(chroma_dir: Path) -> Optional[Any]:
+    """Return a Chroma persistent client, or None if ChromaDB is unavailable.
+
+    Open clients are cached per directory so repeated memory operations in a
+    long-lived process do not reopen the store each call. A missing chromadb
+    package is cached too; other open errors (locks, I/O) are retried after
+    `CHROMA_OPEN_RETRY_SECONDS`.
+    """
+    key = str(chroma_dir)
+    with _CHROMA_CLIENTS_LOCK:
+        if key in _CHROMA_CLIENTS:
+            return _CHROMA_CLIENTS[key]
+        failed_at = _CHROMA_OPEN_FAILED_AT.get(key)
+        if failed_at is not None and time.monotonic() - failed_at < CHROMA_OPEN_RETRY_SECONDS:
+            return None
+        try:
+            import chromadb  # type: ignore
+            from chromadb.config import Settings
+        except ImportError as exc:
+            logger.debug("ChromaDB unavailable for memory ops: %s", exc)
+            _CHROMA_CLIENTS[key] = None
+            return None
+        try:
+            client = chromadb.PersistentClient(
+                path=key, settings=Settings(anonymized_telemetry=False)
+            )
+        except Exception as exc:
+            logger.debug("ChromaDB open failed for memory ops, will retry: %s", exc)
+            _CHROMA_OPEN_FAILED_AT[key] = time.monotonic()
+            return None
+        _CHROMA_OPEN_FAILED_AT.pop(key, None)
+        _CHROMA_CLIENTS[key] = client
+        return client
 
 
 def _get_chroma_collection(chroma_dir: Path, collection_name: str) -> Optional[Any]:
@@ -35,10 +75,11 @@ def _get_chroma_collection(chroma_dir: Path, collection_name: str) -> Optional[A
     if client is None:
         return None
     try:
-        return client.get_or_create_collection(
+        collection = client.get_or_create_collection(
             name=collection_name,
             metadata={"hnsw:space": CHROMA_COLLECTION_SPACE},
         )
+        return tracing.trace_collection(collection, collection_name)
     except Exception as exc:
         logger.debug("Failed to get/create Chroma memory collection: %s", exc)
         return None
@@ -88,6 +129,10 @@ def store_memory_embedding(
         if not success:
             return False
 
+        index = get_vector_index(db_path, MEMORIES_TABLE, client.model)
+        if index is not None:
+            index.add(memory_id, embedding, session_key(session_id))
+
         # Upsert to Chroma
         collection = _get_chroma_collection(chroma_dir, collection_name)
         if collection is not None:
@@ -194,16 +239,98 @@ def _search_with_chroma(
     return results[:top_k]
 
 
+def _fetch_ranked_memories(
+    db_path: Path,
+    ranked_ids: List[Tuple[int, float]],
+    min_similarity: float,
+) -> List[Tuple[Dict[str, Any], float]]:
+    """Load memory rows for `(memory_id, similarity)` pairs, keeping their order."""
+    import json
+
+    ranked_ids = [(mid, sim) for mid, sim in ranked_ids if sim >= min_similarity]
+    if not ranked_ids:
+        return []
+    memory_ids = [mid for mid, _ in ranked_ids]
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    c = conn.cursor()
+    placeholders = ",".join("?" * len(memory_ids))
+    c.execute(
+        f"SELECT id, session_id, memory_text, tags, created_at FROM user_memories WHERE id IN ({placeholders})",
+        memory_ids,
+    )
+    rows = c.fetchall()
+    conn.close()
+
+    by_id = {r["id"]: r for r in rows}
+    ranked: List[Tuple[Dict[str, Any], float]] = []
+    for mid, sim in ranked_ids:
+        row = by_id.get(mid)
+        if row is None:
+            continue
+        ranked.append(
+            (
+                {
+                    "id": row["id"],
+                    "session_id": row["session_id"],
+                    "memory_text": row["memory_text"],
+                    "tags": json.loads(row["tags"]) if row["tags"] else [],
+                    "created_at": row["created_at"],
+                },
+                sim,
+            )
+        )
+    return ranked
+
+
+def _search_with_index(
+    db_path: Path,
+    query_embedding: List[float],
+    top_k: int,
+    min_similarity: float,
+    embedding_model: str,
+    session_id: Optional[int] = None,
+) -> Optional[List[Tuple[Dict[str, Any], float]]]:
+    """Query the local vector index; None when it is disabled or cannot answer."""
+    index = get_vector_index(db_path, MEMORIES_TABLE, embedding_model)
+    if index is None:
+        return None
+    # Same visibility as the SQL fallback: this session's memories plus global ones.
+    keys = [GLOBAL_KEY] if session_id is None else [GLOBAL_KEY, session_key(session_id)]
+    ranked_ids = index.search(query_embedding, top_k, keys=keys)
+    if ranked_ids is None:
+        return None
+    return _fetch_ranked_memories(db_path, ranked_ids, min_similarity)
+
+
 def _search_with_sqlite(
     db_path: Path,
     query_embedding: List[float],
     top_k: int,
     min_similarity: float,
     session_id: Optional[int] = None,
+    embedding_model: Optional[str] = None,
 ) -> List[Tuple[Dict[str, Any], float]]:
-    """Full scan of SQLite embeddings with cosine similarity. Used as Chroma fallback."""
+    """Rank SQLite embeddings by cosine similarity. Used as Chroma fallback.
+
+    Goes through the local vector index when one is available for
+    `embedding_model`, otherwise scans every stored embedding.
+    """
     import json
 
+    if embedding_model:
+        indexed = _search_with_index(
+            db_path,
+            query_embedding,
+            top_k,
+            min_similarity,
+            embedding_model,
+            session_id=session_id,
+        )
+        if indexed is not None:
+            return indexed
+
     conn = sqlite3.connect(db_path)
     c = conn.cursor()
 
@@ -217,11 +344,12 @@ def _search_with_sqlite(
     if not rows:
         return []
 
+    query_vector = np.asarray(query_embedding, dtype=np.float32)
     results = []
     for row in rows:
         memory_id, mem_sid, memory_text, tags_json, created_at, embedding_bytes = row
-        stored_embedding = EmbeddingClient.deserialize_embedding(embedding_bytes)
-        similarity = cosine_similarity(query_embedding, stored_embedding)
+        stored_embedding = EmbeddingClient.deserialize_embedding_array(embedding_bytes)
+        similarity = cosine_similarity(query_vector, stored_embedding)
         if similarity < min_similarity:
             continue
         memory_dict = {
@@ -247,8 +375,6 @@ def search_memories(
     session_id: Optional[int] = None,
 ) -> List[Tuple[Dict[str, Any], float]]:
     """Search memories by embedding similarity. Returns (memory_dict, similarity) pairs."""
-    import json
-
     if not query or not query.strip():
         return []
 
@@ -266,40 +392,7 @@ def search_memories(
         )
 
         if chroma_results:
-            memory_ids = [mid for mid, _ in chroma_results]
-
-            # Fetch rows from SQLite for the found IDs
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            c = conn.cursor()
-            placeholders = ",".join("?" * len(memory_ids))
-            c.execute(
-                f"SELECT id, session_id, memory_text, tags, created_at FROM user_memories WHERE id IN ({placeholders})",
-                memory_ids,
-            )
-            rows = c.fetchall()
-            conn.close()
-
-            by_id = {r["id"]: r for r in rows}
-            ranked: List[Tuple[Dict[str, Any], float]] = []
-            for mid, sim in chroma_results:
-                if sim < min_similarity:
-                    continue
-                row = by_id.get(mid)
-                if row is None:
-                    continue
-                ranked.append(
-                    (
-                        {
-                            "id": row["id"],
-                            "session_id": row["session_id"],
-                            "memory_text": row["memory_text"],
-                            "tags": json.loads(row["tags"]) if row["tags"] else [],
-                            "created_at": row["created_at"],
-                        },
-                        sim,
-                    )
-                )
+            ranked = _fetch_ranked_memories(db_path, chroma_results, min_similarity)
             if ranked:
                 return ranked
 
@@ -309,6 +402,7 @@ def search_memories(
             top_k=top_k,
             min_similarity=min_similarity,
             session_id=session_id,
+            embedding_model=client.model,
         )
     except Exception as exc:
         logger.error("Memory search failed: %s", exc)
@@ -352,6 +446,7 @@ def find_near_duplicate(
             top_k=1,
             min_similarity=threshold,
             session_id=session_id,
+            embedding_model=client.model,
         )
         if fallback:
             return fallback[0][0]["id"]
@@ -384,3 +479,15 @@ def clear_all_memory_embeddings(chroma_dir: Path, collection_name: str) -> None:
         client.delete_collection(collection_name)
     except Exception as exc:
         logger.warning("Failed to clear memory Chroma collection: %s", exc)
+
+
+def delete_memory_from_index(db_path: Path, memory_id: int) -> None:
+    """Remove a memory from the local vector index."""
+    index = get_vector_index(db_path, MEMORIES_TABLE, EmbeddingClient().model)
+    if index is not None:
+        index.remove([memory_id])
+
+
+def clear_memory_index(db_path: Path) -> None:
+    """Drop every persisted local vector index for user memories."""
+    clear_vector_indexes(db_path, MEMORIES_TABLE)
@@ -0,0 +1,61 @@
+"""Per-request model overrides for helper LLM calls.
+
+Summarization (including session compaction) and interface-model calls
+normally use the globally configured aliases. A turn can override them for
+its own duration with `model_overrides`; the values live in context
+variables, so concurrent turns on different threads never see each other's
+choices. Pool threads that should inherit them must run under
+`tracing.bind_context` (or an equivalent `contextvars` copy).
+"""
+
+from __future__ import annotations
+
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_summarization_model: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "asky_summarization_model", default=None
+)
+_interface_model: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "asky_interface_model", default=None
+)
+
+
+def _normalize(alias: Optional[str]) -> Optional[str]:
+    if not isinstance(alias, str):
+        return None
+    return alias.strip() or None
+
+
+def summarization_model(default: str) -> str:
+    """Return the active summarization alias, falling back to `default`."""
+    return _summarization_model.get() or default
+
+
+def interface_model(default: str) -> str:
+    """Return the active interface-model alias, falling back to `default`."""
+    return _interface_model.get() or default
+
+
+@contextmanager
+def model_overrides(
+    *,
+    summarization_model: Optional[str] = None,
+    interface_model: Optional[str] = None,
+) -> Iterator[None]:
+    """Override helper model aliases for the enclosed block (blank = keep)."""
+    tokens = []
+    summarization_alias = _normalize(summarization_model)
+    if summarization_alias:
+        tokens.append(
+            (_summarization_model, _summarization_model.set(summarization_alias))
+        )
+    interface_alias = _normalize(interface_model)
+    if interface_alias:
+        tokens.append((_interface_model, _interface_model.set(interface_alias)))
+    try:
+        yield
+    finally:
+        for variable, token in reversed(tokens):
+            variable.reset(token)
@@ -2,18 +2,76 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
+from asky import tracing
 from asky.daemon.job_queue import JobQueue, JobStatus
+from asky.daemon.metrics import collect_daemon_metrics
 from asky.plugins.gui_server.pages.layout import page_layout
 
 
+def _format_metric_value(value: Any) -> str:
+    if isinstance(value, dict):
+        if not value:
+            return "-"
+        return ", ".join(f"{key}: {item}" for key, item in sorted(value.items()))
+    return str(value)
+
+
+def _render_daemon_metrics(ui: Any) -> None:
+    """Render registered daemon metrics (worker pools, queues) as small tables."""
+    for name, snapshot in collect_daemon_metrics().items():
+        with ui.card().classes("w-full asky-card p-0 mb-4"):
+            ui.label(name.replace("_", " ").title()).classes("font-semibold p-4 pb-0")
+            with ui.element("table").classes("asky-table"):
+                with ui.element("tbody"):
+                    for key, value in snapshot.items():
+                        with ui.element("tr"):
+                            with ui.element("td"):
+                                ui.label(str(key))
+                            with ui.element("td"):
+                                ui.label(_format_metric_value(value))
+
+
+def _download_trace(ui: Any, recorder: tracing.TraceRecorder) -> None:
+    payload = json.dumps(recorder.to_chrome_trace()).encode("utf-8")
+    ui.download(payload, f"asky-turn-trace-{int(recorder.started_at)}.json")
+
+
+def _render_recent_traces(ui: Any) -> None:
+    """Render remembered daemon turn traces with a Chrome trace download each."""
+    traces = tracing.recent_traces()
+    if not traces:
+        return
+    with ui.card().classes("w-full asky-card p-0 mb-4"):
+        ui.label("Recent Turn Traces").classes("font-semibold p-4 pb-0")
+        with ui.element("table").classes("asky-table"):
+            with ui.element("tbody"):
+                for recorder in traces:
+                    summary = recorder.summary()
+                    with ui.element("tr"):
+                        with ui.element("td"):
+                            ui.label(summary["label"] or "-")
+                        with ui.element("td"):
+                            ui.label(f"{summary['duration_ms']:.0f} ms")
+                        with ui.element("td"):
+                            ui.label(_format_metric_value(summary["by_category_ms"]))
+                        with ui.element("td"):
+                            ui.button(
+                                "Download",
+                                on_click=lambda trace=recorder: _download_trace(ui, trace),
+                            ).props("flat dense")
+
+
 def mount_jobs_page(ui: Any, queue: JobQueue) -> None:
     """Mount the jobs list page."""
 
     @ui.page("/jobs")
     def _jobs_page() -> None:
         with page_layout("Background Jobs"):
+            _render_daemon_metrics(ui)
+            _render_recent_traces(ui)
             jobs = queue.list_jobs()
             if not jobs:
                 with ui.card().classes("w-full asky-card"):
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from asky.daemon.job_queue import JobQueue
+from asky.daemon.job_queue import (
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_WORKER_COUNT,
+    JobQueue,
+)
+from asky.daemon.metrics import register_metrics_provider, unregister_metrics_provider
 from asky.plugins.base import AskyPlugin, PluginContext
 from asky.plugins.hook_types import (
     DAEMON_SERVER_REGISTER,
@@ -21,6 +27,7 @@ if TYPE_CHECKING:
 
 DAEMON_SERVER_PRIORITY = 100
 GUI_SERVER_NAME = "nicegui_server"
+JOB_QUEUE_METRICS_NAME = "job_queue"
 
 
 class GUIServerPlugin(AskyPlugin):
@@ -37,7 +44,14 @@ class GUIServerPlugin(AskyPlugin):
 
     def activate(self, context: PluginContext) -> None:
         self._context = context
-        self._queue = JobQueue(context.data_dir / "jobs.db")
+        config = context.config
+        self._queue = JobQueue(
+            context.data_dir / "jobs.db",
+            worker_count=int(config.get("job_worker_count") or DEFAULT_WORKER_COUNT),
+            lease_seconds=float(config.get("job_lease_seconds") or DEFAULT_LEASE_SECONDS),
+            max_attempts=int(config.get("job_max_attempts") or DEFAULT_MAX_ATTEMPTS),
+        )
+        register_metrics_provider(JOB_QUEUE_METRICS_NAME, self._queue.snapshot)
         context.hook_registry.register(
             DAEMON_SERVER_REGISTER,
             self._on_daemon_server_register,
@@ -52,6 +66,7 @@ class GUIServerPlugin(AskyPlugin):
 
     def deactivate(self) -> None:
         if self._queue is not None:
+            unregister_metrics_provider(JOB_QUEUE_METRICS_NAME)
             self._queue.stop()
         if self._server is not None:
             self._server.stop()
@@ -70,6 +85,10 @@ class GUIServerPlugin(AskyPlugin):
         # Start the queue worker
         self._queue.start()
 
+        from asky.research.cache_maintenance import register_maintenance_job
+
+        register_maintenance_job(self._queue)
+
         # Invoke GUI extension hooks before server starts
         registry = get_plugin_page_registry()
         ext_context = GUIExtensionRegisterContext(
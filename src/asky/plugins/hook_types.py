@@ -309,6 +309,6 @@ class GUIExtensionRegisterContext:
     """Mutable payload for GUI extension registration hooks."""
 
     register_page: Callable[[GUIPageSpec], None]
-    register_job_handler: Callable[[str, Callable[..., None]], None]
+    register_job_handler: Callable[..., None]  # JobQueue.register_handler
     queue: Any # JobQueue instance
     # Future: register_api_route, etc.
@@ -7,12 +7,14 @@ import logging
 import math
 import re
 import shutil
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from asky.config import (
     DEFAULT_MODEL,
@@ -54,10 +56,14 @@ from asky.plugins.persona_manager.knowledge import rebuild_embeddings
 from asky.research.adapters import fetch_source_via_adapter
 from asky.research.embeddings import get_embedding_client
 from asky.research.sections import build_section_index, slice_section_content
-from asky.research.vector_store_common import cosine_similarity
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BOOK_LLM_CONCURRENCY = 4
+TOPIC_CONTEXT_SECTION_COUNT = 3
+SECTION_SUMMARIES_CHECKPOINT_FILENAME = "section_summaries.partial.jsonl"
+VIEWPOINTS_CHECKPOINT_FILENAME = "viewpoints.partial.jsonl"
+
 
 def _validate_topics_payload(payload: Any) -> List[str]:
     """Validate that the topics payload is a list of non-empty strings."""
@@ -122,6 +128,49 @@ def _validate_viewpoint_payload(payload: Any, topic: str) -> Dict[str, Any]:
     }
 
 
+def _rank_sections_for_topics(
+    topic_vectors: Sequence[Sequence[float]],
+    summary_vectors: Sequence[Sequence[float]],
+    top_k: int,
+) -> List[List[int]]:
+    """Return the top-k summary indices per topic using one cosine matrix product."""
+    import numpy as np
+
+    if not len(topic_vectors) or not len(summary_vectors):
+        return [[] for _ in range(len(topic_vectors))]
+
+    def _normalized(rows: Sequence[Sequence[float]]) -> Any:
+        matrix = np.asarray(rows, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    scores = _normalized(topic_vectors) @ _normalized(summary_vectors).T
+    # Stable sort keeps section order for ties, matching the old per-topic loop.
+    order = np.argsort(-scores, axis=1, kind="stable")[:, :top_k]
+    return [[int(idx) for idx in row] for row in order]
+
+
+def _read_checkpoint_records(path: Path, key: str) -> Dict[int, Dict[str, Any]]:
+    """Read per-item JSONL checkpoint records keyed by their position field."""
+    records: Dict[int, Dict[str, Any]] = {}
+    if not path.exists():
+        return records
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A crash mid-append can leave a torn trailing line.
+            logger.debug("Ignoring malformed checkpoint line in %s", path)
+            continue
+        if isinstance(record, dict) and isinstance(record.get(key), int):
+            records[record[key]] = record
+    return records
+
+
 class BookIngestionJob:
     """Orchestrates the multi-pass authored-book ingestion process."""
 
@@ -131,13 +180,16 @@ class BookIngestionJob:
         data_dir: Path,
         persona_name: str,
         job_id: str,
+        max_concurrency: int = DEFAULT_BOOK_LLM_CONCURRENCY,
     ):
         self.data_dir = data_dir
         self.persona_name = persona_name
         self.job_id = job_id
+        self.max_concurrency = max(1, int(max_concurrency))
         self.paths = get_persona_paths(data_dir, persona_name)
         self.job_paths = get_job_paths(self.paths.root_dir, job_id)
         self.manifest: Optional[IngestionJobManifest] = None
+        self._checkpoint_lock = threading.Lock()
 
     def load_manifest(self) -> IngestionJobManifest:
         """Load manifest from disk."""
@@ -271,31 +323,96 @@ class BookIngestionJob:
             sections = [{"id": f"chunk-{i}", "start_char": i*chunk_size, "end_char": (i+1)*chunk_size} 
                         for i in range(math.ceil(len(content)/chunk_size))]
 
-        summaries = []
+        prompt = BOOK_SUMMARIZATION_PROMPT.format(
+            title=self.manifest.metadata.title,
+            authors=", ".join(self.manifest.metadata.authors),
+        )
+
+        tasks: List[Dict[str, Any]] = []
         for i, sec in enumerate(sections, 1):
-            sec_id = sec.get("id", str(i))
             start = sec.get("start_char", 0)
             end = sec.get("end_char", len(content))
-            sec_content = content[start:end].strip()
-            if not sec_content:
+            if not content[start:end].strip():
                 continue
-                
-            prompt = BOOK_SUMMARIZATION_PROMPT.format(
-                title=self.manifest.metadata.title,
-                authors=", ".join(self.manifest.metadata.authors),
-            )
-            
+            tasks.append({"position": i, "id": sec.get("id", str(i)), "start_char": start, "end_char": end})
+
+        checkpoint_path = self.job_paths.job_dir / SECTION_SUMMARIES_CHECKPOINT_FILENAME
+        completed = _read_checkpoint_records(checkpoint_path, "position")
+
+        def summarize(task: Dict[str, Any]) -> Dict[str, Any]:
+            sec_content = content[task["start_char"]:task["end_char"]].strip()
             summary = self._call_llm(SUMMARIZATION_MODEL, prompt, sec_content)
+            return {**task, "summary": summary}
+
+        pending = [task for task in tasks if task["position"] not in completed]
+        if len(pending) < len(tasks):
+            logger.info(
+                "Resuming section summaries for job %s: %d/%d already done",
+                self.job_id,
+                len(tasks) - len(pending),
+                len(tasks),
+            )
+        completed.update(self._run_checkpointed(pending, summarize, checkpoint_path, "position"))
+
+        summaries = []
+        for task in tasks:
+            record = completed[task["position"]]
             summaries.append({
-                "id": sec_id,
-                "summary": summary,
-                "start_char": start,
-                "end_char": end,
+                "id": record["id"],
+                "summary": record["summary"],
+                "start_char": record["start_char"],
+                "end_char": record["end_char"],
             })
 
         summaries_path.write_text(json.dumps(summaries), encoding="utf-8")
+        checkpoint_path.unlink(missing_ok=True)
         return summaries
 
+    def _run_checkpointed(
+        self,
+        tasks: List[Dict[str, Any]],
+        worker: Callable[[Dict[str, Any]], Dict[str, Any]],
+        checkpoint_path: Path,
+        key: str,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Run tasks concurrently, appending each result to a JSONL checkpoint.
+
+        Completed items survive a crash so a resumed job only redoes what was
+        still pending. After the first worker error, tasks that have not
+        started are cancelled, in-flight ones are still drained and
+        checkpointed, and the error is re-raised once they settle.
+        """
+        results: Dict[int, Dict[str, Any]] = {}
+        if not tasks:
+            return results
+        first_error: Optional[BaseException] = None
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(tasks)),
+            thread_name_prefix="asky-book-ingest",
+        )
+        try:
+            futures = {executor.submit(worker, task): task for task in tasks}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                try:
+                    record = future.result()
+                except Exception as exc:
+                    if first_error is None:
+                        first_error = exc
+                        for other in futures:
+                            other.cancel()
+                    continue
+                with self._checkpoint_lock:
+                    with checkpoint_path.open("a", encoding="utf-8") as handle:
+                        handle.write(json.dumps(record) + "\n")
+                results[record[key]] = record
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if first_error is not None:
+            raise first_error
+        return results
+
     def _stage_discover_topics(self, summaries: List[Dict[str, str]]) -> List[str]:
         topics_path = self.job_paths.job_dir / "topics.json"
         if topics_path.exists():
@@ -339,27 +456,34 @@ class BookIngestionJob:
                 for v in data
             ]
 
-        client = get_embedding_client()
-        summary_vectors = client.embed([s["summary"] for s in summaries])
-
-        all_viewpoints = []
         book_key = get_book_key(
             title=self.manifest.metadata.title,
             publication_year=self.manifest.metadata.publication_year,
             isbn=self.manifest.metadata.isbn,
         )
 
-        for topic in topics:
-            topic_vector = client.embed_single(topic)
-            scores = []
-            for i, vec in enumerate(summary_vectors):
-                scores.append((cosine_similarity(topic_vector, vec), i))
+        checkpoint_path = self.job_paths.job_dir / VIEWPOINTS_CHECKPOINT_FILENAME
+        completed = _read_checkpoint_records(checkpoint_path, "position")
+        tasks = [
+            {"position": i, "topic": topic}
+            for i, topic in enumerate(topics)
+            if i not in completed
+        ]
 
-            scores.sort(key=lambda x: x[0], reverse=True)
-            top_indices = [idx for _, idx in scores[:3]]
+        if tasks:
+            client = get_embedding_client()
+            summary_vectors = client.embed([s["summary"] for s in summaries])
+            topic_vectors = client.embed([task["topic"] for task in tasks])
+            rankings = _rank_sections_for_topics(
+                topic_vectors, summary_vectors, TOPIC_CONTEXT_SECTION_COUNT
+            )
+            for task, top_indices in zip(tasks, rankings):
+                task["section_indices"] = top_indices
 
+        def extract(task: Dict[str, Any]) -> Dict[str, Any]:
+            topic = task["topic"]
             context_parts = []
-            for idx in top_indices:
+            for idx in task.get("section_indices", []):
                 s = summaries[idx]
                 context_parts.append(
                     f"Source Excerpt (Section {s['id']}):\n{content[s['start_char']:s['end_char']]}"
@@ -372,6 +496,7 @@ class BookIngestionJob:
             )
 
             response = self._call_llm(DEFAULT_MODEL, prompt, context)
+            record: Dict[str, Any] = {"position": task["position"], "topic": topic}
             try:
                 json_match = re.search(r"\{.*\}", response, re.DOTALL)
                 if not json_match:
@@ -392,10 +517,25 @@ class BookIngestionJob:
                     isbn=self.manifest.metadata.isbn,
                     evidence=[ViewpointEvidence(**e) for e in vp_data["evidence"]],
                 )
-                all_viewpoints.append(entry)
+                record["viewpoint"] = asdict(entry)
             except Exception as e:
                 logger.warning("Failed to parse viewpoint for topic %s: %s", topic, e)
-                self.manifest.warnings.append(f"Failed to parse viewpoint for topic {topic}: {str(e)}")
+                record["warning"] = f"Failed to parse viewpoint for topic {topic}: {str(e)}"
+            return record
+
+        completed.update(self._run_checkpointed(tasks, extract, checkpoint_path, "position"))
+
+        all_viewpoints = []
+        for position in sorted(completed):
+            record = completed[position]
+            warning = record.get("warning")
+            if warning and warning not in self.manifest.warnings:
+                self.manifest.warnings.append(warning)
+            v = record.get("viewpoint")
+            if v:
+                all_viewpoints.append(
+                    ViewpointEntry(**{**v, "evidence": [ViewpointEvidence(**e) for e in v["evidence"]]})
+                )
 
         # Deduplicate and limit to viewpoint_target
         deduped = {}
@@ -408,6 +548,7 @@ class BookIngestionJob:
 
         viewpoints_data = [asdict(v) for v in final_viewpoints]
         viewpoints_path.write_text(json.dumps(viewpoints_data), encoding="utf-8")
+        checkpoint_path.unlink(missing_ok=True)
         return final_viewpoints
 
     def _stage_materialize_book(self, viewpoints: List[ViewpointEntry]) -> AuthoredBookReport:
@@ -297,13 +297,18 @@ def run_ingestion_job(
     data_dir: Path,
     persona_name: str,
     job_id: str,
+    max_concurrency: Optional[int] = None,
 ) -> None:
     """Delegate to the BookIngestionJob runner."""
-    from asky.plugins.manual_persona_creator.book_ingestion import BookIngestionJob
+    from asky.plugins.manual_persona_creator.book_ingestion import (
+        DEFAULT_BOOK_LLM_CONCURRENCY,
+        BookIngestionJob,
+    )
     job = BookIngestionJob(
         data_dir=data_dir,
         persona_name=persona_name,
         job_id=job_id,
+        max_concurrency=max_concurrency or DEFAULT_BOOK_LLM_CONCURRENCY,
     )
     job.run()
 
@@ -11,7 +11,13 @@ from zipfile import ZIP_DEFLATED, ZipFile
 
 import tomlkit
 
-from asky.plugins.manual_persona_creator.knowledge_catalog import KNOWLEDGE_DIR_NAME
+from asky.plugins.manual_persona_creator.knowledge_catalog import (
+    CATALOG_DB_FILENAME,
+    CATALOG_JSON_FILENAMES,
+    KNOWLEDGE_DIR_NAME,
+    MIGRATED_JSON_SUFFIX,
+    export_catalog_json,
+)
 from asky.plugins.manual_persona_creator.storage import (
     AUTHORED_BOOKS_DIR_NAME,
     INGESTED_SOURCES_DIR_NAME,
@@ -71,17 +77,29 @@ def export_persona_package(
             if file_path.is_file():
                 artifacts_to_export.append(file_path)
 
-    # Knowledge catalog
+    # Knowledge catalog: exported as JSON rendered from the SQLite catalog
+    catalog_payloads = {
+        f"{KNOWLEDGE_DIR_NAME}/{name}": payload
+        for name, payload in export_catalog_json(paths.root_dir).items()
+    }
     knowledge_root = paths.root_dir / KNOWLEDGE_DIR_NAME
     if knowledge_root.exists():
         for file_path in knowledge_root.rglob("*"):
-            if file_path.is_file() and file_path.name != "runtime_index.json":
+            if (
+                file_path.is_file()
+                and file_path.name != "runtime_index.json"
+                and file_path.name not in CATALOG_JSON_FILENAMES
+                and not file_path.name.endswith(MIGRATED_JSON_SUFFIX)
+                and not file_path.name.startswith(CATALOG_DB_FILENAME)
+            ):
                 artifacts_to_export.append(file_path)
 
     # Calculate checksums for all collected artifacts
     for file_path in artifacts_to_export:
         relative_path = file_path.relative_to(paths.root_dir)
         checksums[str(relative_path)] = _sha256_hex(file_path.read_bytes())
+    for archive_name, payload in catalog_payloads.items():
+        checksums[archive_name] = _sha256_hex(payload.encode("utf-8"))
 
     metadata_payload = _build_export_metadata(metadata, checksums)
     metadata_rendered = tomlkit.dumps(metadata_payload)
@@ -101,6 +119,8 @@ def export_persona_package(
         for file_path in artifacts_to_export:
             relative_path = file_path.relative_to(paths.root_dir)
             archive.write(file_path, str(relative_path))
+        for archive_name, payload in catalog_payloads.items():
+            archive.writestr(archive_name, payload)
     temp_destination.replace(destination)
 
     return destination
@@ -1,12 +1,23 @@
-"""Knowledge catalog management for persona packages."""
+"""Knowledge catalog management for persona packages.
+
+The catalog lives in a per-persona SQLite database. The JSON files
+(`sources.json`, `entries.json`, `conflict_groups.json`) are the archive
+format: export writes them, and a persona that still has them on disk is
+migrated into the database the first time its catalog is opened. Migrated
+files are kept as `<name>.migrated` backups.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import re
+import sqlite3
+from contextlib import closing
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from asky.plugins.manual_persona_creator.knowledge_types import (
     PersonaEntryKind,
@@ -23,10 +34,91 @@ from asky.plugins.manual_persona_creator.storage import (
     read_chunks,
 )
 
+logger = logging.getLogger(__name__)
+
 KNOWLEDGE_DIR_NAME = "persona_knowledge"
 SOURCES_FILENAME = "sources.json"
 ENTRIES_FILENAME = "entries.json"
 CONFLICTS_FILENAME = "conflict_groups.json"
+CATALOG_DB_FILENAME = "catalog.sqlite"
+CATALOG_JSON_FILENAMES = (SOURCES_FILENAME, ENTRIES_FILENAME, CONFLICTS_FILENAME)
+MIGRATED_JSON_SUFFIX = ".migrated"
+ENTRIES_FTS_TABLE_NAME = "entries_fts"
+
+_CATALOG_READY_KEY = "catalog_ready"
+_FTS_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS catalog_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS sources (
+        position INTEGER PRIMARY KEY,
+        source_id TEXT NOT NULL,
+        source_class TEXT NOT NULL,
+        trust_class TEXT NOT NULL,
+        label TEXT NOT NULL,
+        metadata TEXT NOT NULL,
+        content_fingerprint TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_sources_source_id ON sources(source_id)",
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        position INTEGER PRIMARY KEY,
+        entry_id TEXT NOT NULL,
+        entry_kind TEXT NOT NULL,
+        source_id TEXT NOT NULL,
+        text TEXT NOT NULL,
+        topic TEXT NOT NULL DEFAULT '',
+        metadata TEXT NOT NULL,
+        parent_entry_id TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_entries_kind_source ON entries(entry_kind, source_id)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_source ON entries(source_id)",
+    "CREATE INDEX IF NOT EXISTS idx_entries_topic ON entries(topic COLLATE NOCASE)",
+    """
+    CREATE TABLE IF NOT EXISTS conflicts (
+        position INTEGER PRIMARY KEY,
+        source_id TEXT,
+        topic TEXT NOT NULL DEFAULT '',
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_conflicts_source ON conflicts(source_id)",
+)
+
+_FTS_STATEMENTS = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {ENTRIES_FTS_TABLE_NAME}
+    USING fts5(text, content='entries', content_rowid='position')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS entries_fts_ai AFTER INSERT ON entries BEGIN
+        INSERT INTO {ENTRIES_FTS_TABLE_NAME}(rowid, text)
+        VALUES (new.position, new.text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS entries_fts_ad AFTER DELETE ON entries BEGIN
+        INSERT INTO {ENTRIES_FTS_TABLE_NAME}({ENTRIES_FTS_TABLE_NAME}, rowid, text)
+        VALUES ('delete', old.position, old.text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS entries_fts_au AFTER UPDATE OF text ON entries BEGIN
+        INSERT INTO {ENTRIES_FTS_TABLE_NAME}({ENTRIES_FTS_TABLE_NAME}, rowid, text)
+        VALUES ('delete', old.position, old.text);
+        INSERT INTO {ENTRIES_FTS_TABLE_NAME}(rowid, text)
+        VALUES (new.position, new.text);
+    END
+    """,
+)
 
 
 def get_knowledge_paths(persona_root: Path) -> Dict[str, Path]:
@@ -34,41 +126,231 @@ def get_knowledge_paths(persona_root: Path) -> Dict[str, Path]:
     knowledge_dir = persona_root / KNOWLEDGE_DIR_NAME
     return {
         "dir": knowledge_dir,
+        "db": knowledge_dir / CATALOG_DB_FILENAME,
         "sources": knowledge_dir / SOURCES_FILENAME,
         "entries": knowledge_dir / ENTRIES_FILENAME,
         "conflicts": knowledge_dir / CONFLICTS_FILENAME,
     }
 
 
+def catalog_exists(persona_root: Path) -> bool:
+    """Return whether the persona has a catalog (migrating JSON if needed)."""
+    conn = _connect(persona_root)
+    if conn is None:
+        return False
+    with closing(conn):
+        return _is_ready(conn)
+
+
 def write_catalog(
     persona_root: Path,
     sources: List[PersonaSourceRecord],
     entries: List[PersonaKnowledgeEntry],
 ) -> None:
-    """Persist knowledge catalog atomically."""
-    paths = get_knowledge_paths(persona_root)
-    paths["dir"].mkdir(parents=True, exist_ok=True)
+    """Replace all catalog sources and entries in one transaction."""
+    conn = _connect(persona_root, create=True)
+    with closing(conn), conn:
+        conn.execute("DELETE FROM sources")
+        conn.execute("DELETE FROM entries")
+        _insert_sources(conn, sources)
+        _insert_entries(conn, entries)
+        _mark_ready(conn)
+
+
+def add_catalog_records(
+    persona_root: Path,
+    sources: List[PersonaSourceRecord],
+    entries: List[PersonaKnowledgeEntry],
+) -> None:
+    """Append new sources and entries without touching existing rows."""
+    conn = _connect(persona_root, create=True)
+    with closing(conn), conn:
+        _insert_sources(conn, sources)
+        _insert_entries(conn, entries)
+        _mark_ready(conn)
+
+
+def replace_source_knowledge(
+    persona_root: Path,
+    source: PersonaSourceRecord,
+    entries: List[PersonaKnowledgeEntry],
+    conflicts: Optional[List[Dict[str, Any]]] = None,
+) -> None:
+    """Swap one source's record, entries and conflicts in one transaction."""
+    conn = _connect(persona_root, create=True)
+    with closing(conn), conn:
+        _delete_source_rows(conn, source.source_id)
+        _insert_sources(conn, [source])
+        _insert_entries(conn, entries)
+        _insert_conflicts(conn, conflicts or [])
+        _mark_ready(conn)
 
-    sources_data = [asdict(s) for s in sources]
-    entries_data = [asdict(e) for e in entries]
 
-    _write_json_atomic(paths["sources"], sources_data)
-    _write_json_atomic(paths["entries"], entries_data)
+def remove_source_knowledge(persona_root: Path, source_id: str) -> None:
+    """Delete one source's record, entries and conflicts in one transaction."""
+    conn = _connect(persona_root)
+    if conn is None:
+        return
+    with closing(conn), conn:
+        _delete_source_rows(conn, source_id)
 
 
 def read_catalog(persona_root: Path) -> Optional[Dict[str, Any]]:
     """Read knowledge catalog if it exists."""
-    paths = get_knowledge_paths(persona_root)
-    if not paths["sources"].exists() or not paths["entries"].exists():
+    conn = _connect(persona_root)
+    if conn is None:
         return None
+    with closing(conn):
+        if not _is_ready(conn):
+            return None
+        return {
+            "sources": _select_sources(conn),
+            "entries": _select_entries(conn, "", []),
+        }
 
-    sources_data = json.loads(paths["sources"].read_text(encoding="utf-8"))
-    entries_data = json.loads(paths["entries"].read_text(encoding="utf-8"))
 
-    return {
-        "sources": [PersonaSourceRecord(**s) for s in sources_data],
-        "entries": [PersonaKnowledgeEntry(**e) for e in entries_data],
-    }
+def read_sources(persona_root: Path) -> List[PersonaSourceRecord]:
+    """Read catalog source records without loading entries."""
+    conn = _connect(persona_root)
+    if conn is None:
+        return []
+    with closing(conn):
+        return _select_sources(conn)
+
+
+def query_entries(
+    persona_root: Path,
+    *,
+    entry_kind: Optional[PersonaEntryKind] = None,
+    source_id: Optional[str] = None,
+    topic: Optional[str] = None,
+    text_query: Optional[str] = None,
+) -> List[PersonaKnowledgeEntry]:
+    """Query entries by kind, source, topic substring and full-text terms."""
+    conn = _connect(persona_root)
+    if conn is None:
+        return []
+    clauses: List[str] = []
+    args: List[Any] = []
+    if entry_kind:
+        clauses.append("entry_kind = ?")
+        args.append(str(entry_kind))
+    if source_id:
+        clauses.append("source_id = ?")
+        args.append(source_id)
+    if topic:
+        clauses.append("topic LIKE ? ESCAPE '\\'")
+        args.append(f"%{_escape_like(topic)}%")
+    with closing(conn):
+        if text_query:
+            match_query = _build_match_query(text_query)
+            if not match_query:
+                return []
+            if _fts_available(conn):
+                clauses.append(
+                    f"position IN (SELECT rowid FROM {ENTRIES_FTS_TABLE_NAME} "
+                    f"WHERE {ENTRIES_FTS_TABLE_NAME} MATCH ?)"
+                )
+                args.append(match_query)
+            else:
+                for token in _FTS_TOKEN_PATTERN.findall(text_query):
+                    clauses.append("text LIKE ? ESCAPE '\\'")
+                    args.append(f"%{_escape_like(token)}%")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return _select_entries(conn, where, args)
+
+
+def read_conflicts(
+    persona_root: Path,
+    source_id: Optional[str] = None,
+    topic: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Read conflict groups, optionally filtered by source and topic substring."""
+    conn = _connect(persona_root)
+    if conn is None:
+        return []
+    clauses: List[str] = []
+    args: List[Any] = []
+    if source_id:
+        clauses.append("source_id = ?")
+        args.append(source_id)
+    if topic:
+        clauses.append("topic LIKE ? ESCAPE '\\'")
+        args.append(f"%{_escape_like(topic)}%")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    with closing(conn):
+        rows = conn.execute(
+            f"SELECT payload FROM conflicts {where} ORDER BY position", args
+        ).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+def export_catalog_json(persona_root: Path) -> Dict[str, str]:
+    """Render the catalog as JSON archive payloads keyed by filename."""
+    conn = _connect(persona_root)
+    if conn is None:
+        return {}
+    with closing(conn):
+        payloads = {
+            CONFLICTS_FILENAME: _dump_json(
+                [
+                    json.loads(row[0])
+                    for row in conn.execute(
+                        "SELECT payload FROM conflicts ORDER BY position"
+                    )
+                ]
+            )
+        }
+        if _is_ready(conn):
+            payloads[SOURCES_FILENAME] = _dump_json(
+                [asdict(source) for source in _select_sources(conn)]
+            )
+            payloads[ENTRIES_FILENAME] = _dump_json(
+                [asdict(entry) for entry in _select_entries(conn, "", [])]
+            )
+    return payloads
+
+
+def load_catalog_json(persona_root: Path, remove_json: bool = False) -> bool:
+    """Replace the catalog with JSON files found on disk.
+
+    Used after extracting a persona archive and for one-time migration of
+    personas written before the catalog moved to SQLite. Loaded files are
+    renamed to `<name>.migrated` so the user's only copy survives a downgrade
+    or a damaged database; `remove_json=True` deletes them instead, for
+    copies freshly extracted from an archive.
+    """
+    paths = get_knowledge_paths(persona_root)
+    present = [name for name in CATALOG_JSON_FILENAMES if (paths["dir"] / name).exists()]
+    if not present:
+        return False
+
+    has_catalog = paths["sources"].exists() and paths["entries"].exists()
+    conn = _open(paths["db"])
+    with closing(conn), conn:
+        if has_catalog:
+            conn.execute("DELETE FROM sources")
+            conn.execute("DELETE FROM entries")
+            _insert_sources(
+                conn,
+                [PersonaSourceRecord(**s) for s in _read_json(paths["sources"])],
+            )
+            _insert_entries(
+                conn,
+                [PersonaKnowledgeEntry(**e) for e in _read_json(paths["entries"])],
+            )
+            _mark_ready(conn)
+        if paths["conflicts"].exists():
+            conn.execute("DELETE FROM conflicts")
+            _insert_conflicts(conn, _read_json(paths["conflicts"]))
+
+    for name in present:
+        json_path = paths["dir"] / name
+        if remove_json:
+            json_path.unlink()
+        else:
+            json_path.replace(json_path.with_name(name + MIGRATED_JSON_SUFFIX))
+    return True
 
 
 def rebuild_catalog_from_legacy(persona_root: Path) -> None:
@@ -212,7 +494,178 @@ def rebuild_catalog_from_legacy(persona_root: Path) -> None:
     write_catalog(persona_root, sources, entries)
 
 
-def _write_json_atomic(path: Path, data: Any) -> None:
-    temp_path = path.with_suffix(path.suffix + ".tmp")
-    temp_path.write_text(json.dumps(data, indent=2, ensure_ascii=True), encoding="utf-8")
-    temp_path.replace(path)
+def _connect(persona_root: Path, create: bool = False) -> Optional[sqlite3.Connection]:
+    paths = get_knowledge_paths(persona_root)
+    if not paths["db"].exists():
+        if load_catalog_json(persona_root):
+            return _open(paths["db"])
+        if not create:
+            return None
+    return _open(paths["db"])
+
+
+def _open(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    with conn:
+        for statement in _SCHEMA_STATEMENTS:
+            conn.execute(statement)
+        try:
+            for statement in _FTS_STATEMENTS:
+                conn.execute(statement)
+        except sqlite3.OperationalError as exc:
+            logger.warning("FTS5 unavailable, persona entry search uses LIKE: %s", exc)
+    return conn
+
+
+def _is_ready(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT value FROM catalog_meta WHERE key = ?", (_CATALOG_READY_KEY,)
+    ).fetchone()
+    return row is not None
+
+
+def _mark_ready(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, '1')",
+        (_CATALOG_READY_KEY,),
+    )
+
+
+def _fts_available(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (ENTRIES_FTS_TABLE_NAME,),
+    ).fetchone()
+    return row is not None
+
+
+def _delete_source_rows(conn: sqlite3.Connection, source_id: str) -> None:
+    conn.execute("DELETE FROM sources WHERE source_id = ?", (source_id,))
+    conn.execute("DELETE FROM entries WHERE source_id = ?", (source_id,))
+    conn.execute("DELETE FROM conflicts WHERE source_id = ?", (source_id,))
+
+
+def _insert_sources(
+    conn: sqlite3.Connection, sources: Iterable[PersonaSourceRecord]
+) -> None:
+    conn.executemany(
+        """
+        INSERT INTO sources
+            (source_id, source_class, trust_class, label, metadata, content_fingerprint)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                s.source_id,
+                str(s.source_class),
+                str(s.trust_class),
+                s.label,
+                json.dumps(s.metadata or {}, ensure_ascii=True),
+                s.content_fingerprint,
+            )
+            for s in sources
+        ],
+    )
+
+
+def _insert_entries(
+    conn: sqlite3.Connection, entries: Iterable[PersonaKnowledgeEntry]
+) -> None:
+    conn.executemany(
+        """
+        INSERT INTO entries
+            (entry_id, entry_kind, source_id, text, topic, metadata, parent_entry_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                e.entry_id,
+                str(e.entry_kind),
+                e.source_id,
+                e.text,
+                str((e.metadata or {}).get("topic") or ""),
+                json.dumps(e.metadata or {}, ensure_ascii=True),
+                e.parent_entry_id,
+            )
+            for e in entries
+        ],
+    )
+
+
+def _insert_conflicts(
+    conn: sqlite3.Connection, conflicts: Iterable[Dict[str, Any]]
+) -> None:
+    conn.executemany(
+        "INSERT INTO conflicts (source_id, topic, payload) VALUES (?, ?, ?)",
+        [
+            (
+                c.get("source_id"),
+                str(c.get("topic") or ""),
+                json.dumps(c, ensure_ascii=True),
+            )
+            for c in conflicts
+        ],
+    )
+
+
+def _select_sources(conn: sqlite3.Connection) -> List[PersonaSourceRecord]:
+    rows = conn.execute(
+        """
+        SELECT source_id, source_class, trust_class, label, metadata, content_fingerprint
+        FROM sources ORDER BY position
+        """
+    ).fetchall()
+    return [
+        PersonaSourceRecord(
+            source_id=source_id,
+            source_class=PersonaSourceClass(source_class),
+            trust_class=PersonaTrustClass(trust_class),
+            label=label,
+            metadata=json.loads(metadata),
+            content_fingerprint=content_fingerprint,
+        )
+        for source_id, source_class, trust_class, label, metadata, content_fingerprint in rows
+    ]
+
+
+def _select_entries(
+    conn: sqlite3.Connection, where: str, args: List[Any]
+) -> List[PersonaKnowledgeEntry]:
+    rows = conn.execute(
+        f"""
+        SELECT entry_id, entry_kind, source_id, text, metadata, parent_entry_id
+        FROM entries {where} ORDER BY position
+        """,
+        args,
+    ).fetchall()
+    return [
+        PersonaKnowledgeEntry(
+            entry_id=entry_id,
+            entry_kind=PersonaEntryKind(entry_kind),
+            source_id=source_id,
+            text=text,
+            metadata=json.loads(metadata),
+            parent_entry_id=parent_entry_id,
+        )
+        for entry_id, entry_kind, source_id, text, metadata, parent_entry_id in rows
+    ]
+
+
+def _build_match_query(text_query: str) -> Optional[str]:
+    tokens = _FTS_TOKEN_PATTERN.findall(text_query)
+    if not tokens:
+        return None
+    return " AND ".join(f'"{token}"' for token in tokens)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _read_json(path: Path) -> Any:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _dump_json(data: Any) -> str:
+    return json.dumps(data, indent=2, ensure_ascii=True)
@@ -43,6 +43,14 @@ class ManualPersonaCreatorPlugin(AskyPlugin):
     def deactivate(self) -> None:
         self._context = None
 
+    def web_crawl_limits(self) -> dict:
+        """Return web collection crawler limits from the plugin config."""
+        config = self._context.config if self._context is not None else {}
+        return {
+            "max_workers": config.get("web_crawl_workers"),
+            "per_host_delay_seconds": config.get("web_per_host_delay_seconds"),
+        }
+
     def _on_gui_extension_register(self, payload: GUIExtensionRegisterContext) -> None:
         context = self._context
         if context is None:
@@ -64,7 +72,9 @@ class ManualPersonaCreatorPlugin(AskyPlugin):
                 data_dir=context.data_dir,
                 persona_name=kw.get("persona_name"),
                 job_id=job_id,
+                max_concurrency=context.config.get("book_llm_concurrency"),
             ),
+            workers=1,
         )
         payload.register_job_handler(
             "source_ingest",
@@ -73,6 +83,7 @@ class ManualPersonaCreatorPlugin(AskyPlugin):
                 persona_name=kw.get("persona_name"),
                 job_id=job_id,
             ),
+            workers=1,
         )
 
     def _on_tool_registry_build(self, payload: ToolRegistryBuildContext) -> None:
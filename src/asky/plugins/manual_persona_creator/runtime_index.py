@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -15,6 +17,8 @@ from asky.plugins.manual_persona_creator.knowledge_types import (
 )
 from asky.research.embeddings import get_embedding_client
 
+logger = logging.getLogger(__name__)
+
 RUNTIME_INDEX_FILENAME = "runtime_index.json"
 EMBEDDING_BATCH_SIZE = 64
 
@@ -32,6 +36,8 @@ class PersonaRuntimeIndexRecord:
     text: str  # normalized searchable text
     metadata: Dict[str, Any] = field(default_factory=dict)
     vector: List[float] = field(default_factory=list)
+    text_hash: str = ""
+    embedding_model: str = ""
 
 
 def runtime_index_path(persona_dir: Path) -> Path:
@@ -39,8 +45,30 @@ def runtime_index_path(persona_dir: Path) -> Path:
     return persona_dir / "persona_knowledge" / RUNTIME_INDEX_FILENAME
 
 
-def rebuild_runtime_index(persona_dir: Path) -> Dict[str, Any]:
-    """Rebuild the runtime index from the canonical knowledge catalog."""
+def runtime_text_hash(text: str) -> str:
+    """Return the content key used to reuse vectors across index updates."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _reusable_vectors(persona_dir: Path, model: str) -> Dict[str, List[float]]:
+    """Map text hashes to vectors already embedded with the current model."""
+    reusable: Dict[str, List[float]] = {}
+    for item in read_runtime_index(persona_dir):
+        text_hash = item.get("text_hash")
+        vector = item.get("vector")
+        if text_hash and vector and item.get("embedding_model") == model:
+            reusable[text_hash] = vector
+    return reusable
+
+
+def rebuild_runtime_index(persona_dir: Path, full: bool = False) -> Dict[str, Any]:
+    """Update the runtime index from the canonical knowledge catalog.
+
+    Vectors from the previous index are reused when the entry text hash and
+    embedding model match, so only new or edited texts are embedded and
+    retracted entries drop out. Entries with blank text are left out of the
+    index. ``full=True`` re-embeds everything.
+    """
     catalog = read_catalog(persona_dir)
     if not catalog:
         return {"rebuilt": False, "reason": "catalog_missing"}
@@ -52,6 +80,9 @@ def rebuild_runtime_index(persona_dir: Path) -> Dict[str, Any]:
         source = sources_map.get(entry.source_id)
         if not source:
             continue
+        if not entry.text or not entry.text.strip():
+            logger.debug("Skipping blank persona entry %s in runtime index", entry.entry_id)
+            continue
 
         # Extract only necessary runtime metadata
         runtime_metadata = {}
@@ -81,26 +112,50 @@ def rebuild_runtime_index(persona_dir: Path) -> Dict[str, Any]:
                 trust_class=source.trust_class,
                 text=entry.text,
                 metadata=runtime_metadata,
+                text_hash=runtime_text_hash(entry.text),
             )
         )
 
     if not records:
-        return {"rebuilt": True, "indexed_entries": 0}
+        _write_runtime_index(persona_dir, [])
+        return {"rebuilt": True, "indexed_entries": 0, "embedded_entries": 0}
 
-    # Generate embeddings
+    # Generate embeddings for texts the previous index does not cover
     client = get_embedding_client()
+    model = str(getattr(client, "model", "") or "")
+    vectors_by_hash = {} if full else _reusable_vectors(persona_dir, model)
+    pending: Dict[str, str] = {}
+    for record in records:
+        if record.text_hash not in vectors_by_hash:
+            pending.setdefault(record.text_hash, record.text)
+
+    pending_items = list(pending.items())
+    for i in range(0, len(pending_items), EMBEDDING_BATCH_SIZE):
+        batch = pending_items[i : i + EMBEDDING_BATCH_SIZE]
+        vectors = client.embed([text for _, text in batch])
+        if len(vectors) != len(batch):
+            raise RuntimeError(
+                f"Embedding client returned {len(vectors)} vectors for {len(batch)} texts"
+            )
+        for (text_hash, _), vector in zip(batch, vectors):
+            vectors_by_hash[text_hash] = [float(v) for v in vector]
+
     indexed_records: List[Dict[str, Any]] = []
+    for record in records:
+        data = asdict(record)
+        data["vector"] = vectors_by_hash[record.text_hash]
+        data["embedding_model"] = model
+        indexed_records.append(data)
 
-    for i in range(0, len(records), EMBEDDING_BATCH_SIZE):
-        batch = records[i : i + EMBEDDING_BATCH_SIZE]
-        texts = [r.text for r in batch]
-        vectors = client.embed(texts)
+    _write_runtime_index(persona_dir, indexed_records)
+    return {
+        "rebuilt": True,
+        "indexed_entries": len(indexed_records),
+        "embedded_entries": len(pending_items),
+    }
 
-        for record, vector in zip(batch, vectors):
-            data = asdict(record)
-            data["vector"] = [float(v) for v in vector]
-            indexed_records.append(data)
 
+def _write_runtime_index(persona_dir: Path, indexed_records: List[Dict[str, Any]]) -> None:
     output_path = runtime_index_path(persona_dir)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
@@ -110,8 +165,6 @@ def rebuild_runtime_index(persona_dir: Path) -> Dict[str, Any]:
     )
     temp_path.replace(output_path)
 
-    return {"rebuilt": True, "indexed_entries": len(indexed_records)}
-
 
 def read_runtime_index(persona_dir: Path) -> List[Dict[str, Any]]:
     """Read the runtime index if it exists."""
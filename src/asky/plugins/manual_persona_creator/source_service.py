@@ -16,9 +16,14 @@ from asky.plugins.manual_persona_creator.knowledge_catalog import (
     ENTRIES_FILENAME,
     KNOWLEDGE_DIR_NAME,
     SOURCES_FILENAME,
-    get_knowledge_paths,
+    add_catalog_records,
+    catalog_exists,
+    query_entries,
     read_catalog,
-    write_catalog,
+    read_conflicts,
+    read_sources,
+    remove_source_knowledge,
+    replace_source_knowledge,
 )
 from asky.plugins.manual_persona_creator.knowledge_types import (
     PersonaEntryKind,
@@ -63,18 +68,15 @@ def add_manual_sources(
     sources: Sequence[str],
 ) -> IngestionResult:
     """Ingest manual sources and update persona artifacts."""
-    catalog = read_catalog(persona_root)
-    if catalog is None:
+    if not catalog_exists(persona_root):
         from asky.plugins.manual_persona_creator.knowledge_catalog import (
             rebuild_catalog_from_legacy,
         )
         rebuild_catalog_from_legacy(persona_root)
-        catalog = read_catalog(persona_root)
-        if catalog is None:
+        if not catalog_exists(persona_root):
             raise ValueError(f"Failed to read/rebuild catalog for {persona_root}")
 
-    existing_sources = catalog["sources"]
-    existing_entries = catalog["entries"]
+    existing_sources = read_sources(persona_root)
     
     existing_fingerprints = {
         s.content_fingerprint for s in existing_sources if s.content_fingerprint
@@ -137,9 +139,7 @@ def add_manual_sources(
     if not new_sources:
         return IngestionResult(0, skipped_count, 0, len(warnings), warnings)
 
-    all_sources = list(existing_sources) + new_sources
-    all_entries = list(existing_entries) + new_entries
-    write_catalog(persona_root, all_sources, all_entries)
+    add_catalog_records(persona_root, new_sources, new_entries)
 
     existing_chunks = read_chunks(persona_root / "chunks.json")
     compat_chunks = []
@@ -321,22 +321,19 @@ def project_source_knowledge(
     metadata: Optional[Dict[str, Any]] = None,
 ):
     """Shared projection logic for any milestone-3 knowledge source (book, source bundle, web page)."""
-    catalog = read_catalog(persona_root)
-    if catalog is None:
+    if not catalog_exists(persona_root):
         from asky.plugins.manual_persona_creator.knowledge_catalog import (
             rebuild_catalog_from_legacy,
         )
         rebuild_catalog_from_legacy(persona_root)
-        catalog = read_catalog(persona_root)
-        
-    if catalog is None:
+
+    if not catalog_exists(persona_root):
         raise ValueError("Catalog not found and could not be rebuilt")
-        
-    # Idempotence: Remove existing records for this source before re-projecting
-    sources = [s for s in catalog["sources"] if s.source_id != source_id]
-    entries = [e for e in catalog["entries"] if e.source_id != source_id]
-    
-    # 1. Add Source Record
+
+    # Idempotence: replace_source_knowledge drops this source's existing records
+    entries: List[PersonaKnowledgeEntry] = []
+
+    # 1. Source Record
     source_record = PersonaSourceRecord(
         source_id=source_id,
         source_class=source_class,
@@ -344,7 +341,6 @@ def project_source_knowledge(
         label=label,
         metadata=metadata or {},
     )
-    sources.append(source_record)
         
     # 2. Project Viewpoints
     if viewpoints_path and viewpoints_path.exists():
@@ -412,28 +408,20 @@ def project_source_knowledge(
         ))
 
     # 6. Project Conflicts
-    k_paths = get_knowledge_paths(persona_root)
-    existing_conflicts = []
-    if k_paths["conflicts"].exists():
-        existing_conflicts = json.loads(k_paths["conflicts"].read_text(encoding="utf-8"))
-    
-    # Idempotence: Remove existing conflicts for this source
-    existing_conflicts = [c for c in existing_conflicts if c.get("source_id") != source_id]
-
+    projected_conflicts = []
     if conflicts_path and conflicts_path.exists():
         conflicts = json.loads(conflicts_path.read_text(encoding="utf-8"))
         for conflict in conflicts:
             conflict["conflict_id"] = f"conflict:{uuid.uuid4().hex[:8]}"
             conflict["source_id"] = source_id
-            existing_conflicts.append(conflict)
-            
-    k_paths["conflicts"].write_text(json.dumps(existing_conflicts, indent=2), encoding="utf-8")
+            projected_conflicts.append(conflict)
+
+    # Write this source's records in one catalog transaction
+    replace_source_knowledge(persona_root, source_record, entries, projected_conflicts)
 
-    # Write Catalog
-    write_catalog(persona_root, sources, entries)
-    
     # Rebuild Chunks
-    _rebuild_chunks_from_catalog(persona_root, sources, entries)
+    catalog = read_catalog(persona_root)
+    _rebuild_chunks_from_catalog(persona_root, catalog["sources"], catalog["entries"])
     
     # Rebuild runtime artifacts
     rebuild_runtime_index(persona_dir=persona_root)
@@ -447,28 +435,15 @@ def unproject_source_knowledge(
     source_id: str,
 ):
     """Remove a source and all its entries from persona knowledge."""
-    catalog = read_catalog(persona_root)
-    if not catalog:
+    if not catalog_exists(persona_root):
         return
 
-    # 1. Remove Source Record
-    sources = [s for s in catalog["sources"] if s.source_id != source_id]
-    
-    # 2. Remove Entries
-    entries = [e for e in catalog["entries"] if e.source_id != source_id]
-    
-    # 3. Remove Conflicts
-    k_paths = get_knowledge_paths(persona_root)
-    if k_paths["conflicts"].exists():
-        conflicts = json.loads(k_paths["conflicts"].read_text(encoding="utf-8"))
-        conflicts = [c for c in conflicts if c.get("source_id") != source_id]
-        k_paths["conflicts"].write_text(json.dumps(conflicts, indent=2), encoding="utf-8")
-
-    # Write Catalog
-    write_catalog(persona_root, sources, entries)
-    
+    # Remove the source record, its entries and its conflicts in one transaction
+    remove_source_knowledge(persona_root, source_id)
+
     # Rebuild Chunks and embeddings
-    _rebuild_chunks_from_catalog(persona_root, sources, entries)
+    catalog = read_catalog(persona_root)
+    _rebuild_chunks_from_catalog(persona_root, catalog["sources"], catalog["entries"])
     
     # Rebuild runtime index
     rebuild_runtime_index(persona_dir=persona_root)
@@ -527,64 +502,47 @@ def get_source_report(data_dir: Path, persona_name: str, source_id: str) -> Opti
     return json.loads(bundle_paths.report_path.read_text(encoding="utf-8"))
 
 
-def query_approved_viewpoints(data_dir: Path, persona_name: str, source_id: Optional[str] = None, topic: Optional[str] = None) -> List[PersonaKnowledgeEntry]:
+def query_approved_viewpoints(data_dir: Path, persona_name: str, source_id: Optional[str] = None, topic: Optional[str] = None, text_query: Optional[str] = None) -> List[PersonaKnowledgeEntry]:
     """Query approved viewpoint entries."""
     paths = get_persona_paths(data_dir, persona_name)
-    catalog = read_catalog(paths.root_dir)
-    if not catalog:
-        return []
-    entries = [e for e in catalog["entries"] if e.entry_kind == PersonaEntryKind.VIEWPOINT]
-    if source_id:
-        entries = [e for e in entries if e.source_id == source_id]
-    if topic:
-        t_lower = topic.lower()
-        entries = [e for e in entries if t_lower in (e.metadata.get("topic") or "").lower()]
-    return entries
-
-
-def query_approved_facts(data_dir: Path, persona_name: str, source_id: Optional[str] = None, topic: Optional[str] = None) -> List[PersonaKnowledgeEntry]:
+    return query_entries(
+        paths.root_dir,
+        entry_kind=PersonaEntryKind.VIEWPOINT,
+        source_id=source_id,
+        topic=topic,
+        text_query=text_query,
+    )
+
+
+def query_approved_facts(data_dir: Path, persona_name: str, source_id: Optional[str] = None, topic: Optional[str] = None, text_query: Optional[str] = None) -> List[PersonaKnowledgeEntry]:
     """Query approved fact entries."""
     paths = get_persona_paths(data_dir, persona_name)
-    catalog = read_catalog(paths.root_dir)
-    if not catalog:
-        return []
-    entries = [e for e in catalog["entries"] if e.entry_kind == PersonaEntryKind.PERSONA_FACT]
-    if source_id:
-        entries = [e for e in entries if e.source_id == source_id]
-    if topic:
-        t_lower = topic.lower()
-        entries = [e for e in entries if t_lower in (e.metadata.get("topic") or "").lower()]
-    return entries
-
-
-def query_approved_timeline(data_dir: Path, persona_name: str, source_id: Optional[str] = None, topic: Optional[str] = None) -> List[PersonaKnowledgeEntry]:
+    return query_entries(
+        paths.root_dir,
+        entry_kind=PersonaEntryKind.PERSONA_FACT,
+        source_id=source_id,
+        topic=topic,
+        text_query=text_query,
+    )
+
+
+def query_approved_timeline(data_dir: Path, persona_name: str, source_id: Optional[str] = None, topic: Optional[str] = None, text_query: Optional[str] = None) -> List[PersonaKnowledgeEntry]:
     """Query approved timeline entries."""
     paths = get_persona_paths(data_dir, persona_name)
-    catalog = read_catalog(paths.root_dir)
-    if not catalog:
-        return []
-    entries = [e for e in catalog["entries"] if e.entry_kind == PersonaEntryKind.TIMELINE_EVENT]
-    if source_id:
-        entries = [e for e in entries if e.source_id == source_id]
-    if topic:
-        t_lower = topic.lower()
-        entries = [e for e in entries if t_lower in (e.metadata.get("topic") or "").lower()]
+    entries = query_entries(
+        paths.root_dir,
+        entry_kind=PersonaEntryKind.TIMELINE_EVENT,
+        source_id=source_id,
+        topic=topic,
+        text_query=text_query,
+    )
     return sorted(entries, key=lambda e: e.metadata.get("year") or 0)
 
 
 def query_approved_conflicts(data_dir: Path, persona_name: str, source_id: Optional[str] = None, topic: Optional[str] = None) -> List[Dict[str, Any]]:
     """Query approved conflict groups."""
     paths = get_persona_paths(data_dir, persona_name)
-    k_paths = get_knowledge_paths(paths.root_dir)
-    if not k_paths["conflicts"].exists():
-        return []
-    conflicts = json.loads(k_paths["conflicts"].read_text(encoding="utf-8"))
-    if source_id:
-        conflicts = [c for c in conflicts if c.get("source_id") == source_id]
-    if topic:
-        t_lower = topic.lower()
-        conflicts = [c for c in conflicts if t_lower in (c.get("topic") or "").lower()]
-    return conflicts
+    return read_conflicts(paths.root_dir, source_id=source_id, topic=topic)
 
 
 def _rebuild_chunks_from_catalog(persona_root: Path, sources: List[PersonaSourceRecord], entries: List[PersonaKnowledgeEntry]):
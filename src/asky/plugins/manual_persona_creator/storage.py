@@ -400,7 +400,7 @@ def read_metadata(metadata_path: Path) -> Dict[str, Any]:
     # Automatic rebuild for missing v1/v2 catalogs and runtime index
     if schema_version < 3:
         from asky.plugins.manual_persona_creator.knowledge_catalog import (
-            get_knowledge_paths,
+            catalog_exists,
             rebuild_catalog_from_legacy,
         )
         from asky.plugins.manual_persona_creator.runtime_index import (
@@ -408,8 +408,7 @@ def read_metadata(metadata_path: Path) -> Dict[str, Any]:
             runtime_index_path,
         )
 
-        paths = get_knowledge_paths(metadata_path.parent)
-        if not paths["sources"].exists() or not paths["entries"].exists():
+        if not catalog_exists(metadata_path.parent):
             rebuild_catalog_from_legacy(metadata_path.parent)
         
         if not runtime_index_path(metadata_path.parent).exists():
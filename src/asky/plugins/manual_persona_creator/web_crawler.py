@@ -0,0 +1,218 @@
+"""Crawler primitives for persona web collections.
+
+`CollectionDedupeIndex` keeps the fingerprint, URL and embedding state of a
+collection in memory so per-page duplicate checks do not rescan every page
+manifest on disk. `HostPoliteness` spaces out requests to the same host while
+fetches for different hosts proceed in parallel.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+from urllib.parse import urlparse
+
+from asky.plugins.manual_persona_creator.storage import (
+    PAGES_DIR_NAME,
+    get_web_page_paths,
+    read_web_page_manifest,
+)
+from asky.plugins.manual_persona_creator.web_types import WebPageStatus
+from asky.url_utils import normalize_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CRAWL_WORKERS = 4
+DEFAULT_PER_HOST_DELAY_SECONDS = 0.5
+NEAR_DUPLICATE_SIMILARITY_THRESHOLD = 0.92
+INITIAL_EMBEDDING_CAPACITY = 64
+
+
+def get_url_host(url: str) -> str:
+    """Return the lowercase host of a URL, or an empty string."""
+    try:
+        return urlparse(url).netloc.lower().rstrip(".")
+    except Exception:
+        return ""
+
+
+class HostPoliteness:
+    """Enforce a minimum delay between request starts for the same host."""
+
+    def __init__(
+        self,
+        min_interval_seconds: float = DEFAULT_PER_HOST_DELAY_SECONDS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.min_interval_seconds = max(0.0, float(min_interval_seconds))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_allowed: Dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        """Block until a request to the URL's host may start."""
+        if self.min_interval_seconds <= 0:
+            return
+        host = get_url_host(url)
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self.min_interval_seconds
+        delay = slot - now
+        if delay > 0:
+            self._sleep(delay)
+
+
+class CollectionDedupeIndex:
+    """In-memory duplicate index for one web collection.
+
+    Loaded once from page manifests and updated incrementally as pages are
+    saved. Near-duplicate checks use a single matrix product over normalized
+    page embeddings instead of pairwise Python loops.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = NEAR_DUPLICATE_SIMILARITY_THRESHOLD,
+    ) -> None:
+        self.similarity_threshold = similarity_threshold
+        self.page_ids: Set[str] = set()
+        self.processed_urls: Set[str] = set()
+        self.fingerprints: Dict[str, str] = {}
+        self.review_ready_count = 0
+        self._embedding_page_ids: List[str] = []
+        # Preallocated rows; only the first len(_embedding_page_ids) are live.
+        self._matrix: Optional[Any] = None
+
+    @classmethod
+    def load(cls, collection_dir: Path, **kwargs: Any) -> "CollectionDedupeIndex":
+        """Build the index from page manifests already on disk."""
+        index = cls(**kwargs)
+        pages_root = collection_dir / PAGES_DIR_NAME
+        if not pages_root.exists():
+            return index
+        for page_dir in pages_root.iterdir():
+            if not page_dir.is_dir():
+                continue
+            page_id = page_dir.name
+            manifest_path = get_web_page_paths(collection_dir, page_id).manifest_path
+            if not manifest_path.exists():
+                index.page_ids.add(page_id)
+                continue
+            try:
+                manifest = read_web_page_manifest(manifest_path)
+            except Exception:
+                logger.debug("Skipping unreadable page manifest: %s", manifest_path)
+                index.page_ids.add(page_id)
+                continue
+            index.add_page(
+                page_id=page_id,
+                status=str(manifest.get("status", "")),
+                requested_url=manifest.get("requested_url"),
+                normalized_final_url=manifest.get("normalized_final_url"),
+                fingerprint=manifest.get("content_fingerprint"),
+                embedding=(manifest.get("similarity_metadata") or {}).get("embedding"),
+            )
+        return index
+
+    def add_page(
+        self,
+        *,
+        page_id: str,
+        status: str,
+        requested_url: Optional[str] = None,
+        normalized_final_url: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Record a saved page in the index."""
+        is_new = page_id not in self.page_ids
+        self.page_ids.add(page_id)
+        if normalized_final_url:
+            self.processed_urls.add(normalized_final_url)
+        if requested_url:
+            self.processed_urls.add(normalize_url(requested_url))
+        if fingerprint:
+            self.fingerprints.setdefault(fingerprint, page_id)
+        if is_new and status == WebPageStatus.REVIEW_READY.value:
+            self.review_ready_count += 1
+        if embedding is not None and len(embedding) > 0:
+            self._add_embedding(page_id, embedding)
+
+    def has_page(self, page_id: str) -> bool:
+        return page_id in self.page_ids
+
+    def match_fingerprint(self, fingerprint: str) -> Optional[str]:
+        """Return the page id that already holds this exact content."""
+        return self.fingerprints.get(fingerprint)
+
+    def find_near_duplicate(
+        self,
+        page_id: str,
+        embedding: Optional[Sequence[float]],
+    ) -> Optional[Dict[str, Any]]:
+        """Return the best match above the similarity threshold, if any."""
+        if embedding is None or len(embedding) == 0 or not self._embedding_page_ids:
+            return None
+        import numpy as np
+
+        query = self._normalize(embedding)
+        if query is None:
+            return None
+        matrix = self._embedding_matrix()
+        if matrix.shape[1] != query.shape[0]:
+            return None
+        scores = matrix @ query
+        for position in np.argsort(-scores):
+            other_id = self._embedding_page_ids[int(position)]
+            score = float(scores[int(position)])
+            if score < self.similarity_threshold:
+                return None
+            if other_id == page_id:
+                continue
+            return {
+                "reason": "embedding_similarity",
+                "matched_page_id": other_id,
+                "similarity_score": score,
+            }
+        return None
+
+    def _add_embedding(self, page_id: str, embedding: Sequence[float]) -> None:
+        row = self._normalize(embedding)
+        if row is None:
+            return
+        import numpy as np
+
+        count = len(self._embedding_page_ids)
+        if self._matrix is None:
+            self._matrix = np.empty(
+                (INITIAL_EMBEDDING_CAPACITY, row.shape[0]), dtype=np.float32
+            )
+        elif self._matrix.shape[1] != row.shape[0]:
+            logger.debug("Skipping embedding with mismatched dimension for %s", page_id)
+            return
+        elif count == self._matrix.shape[0]:
+            grown = np.empty((count * 2, self._matrix.shape[1]), dtype=np.float32)
+            grown[:count] = self._matrix
+            self._matrix = grown
+        self._matrix[count] = row
+        self._embedding_page_ids.append(page_id)
+
+    def _embedding_matrix(self) -> Any:
+        return self._matrix[: len(self._embedding_page_ids)]
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[Any]:
+        import numpy as np
+
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        if vector.size == 0 or norm == 0.0:
+            return None
+        return vector / norm
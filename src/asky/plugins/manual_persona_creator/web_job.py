@@ -4,11 +4,11 @@ import dataclasses
 import hashlib
 import json
 import logging
-import time
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Sequence, Callable
-from urllib.parse import urlparse, urlunparse
 
 from asky.retrieval import fetch_url_document
 from asky.url_utils import normalize_url
@@ -19,9 +19,7 @@ from asky.plugins.manual_persona_creator.storage import (
     get_web_page_paths,
     read_web_frontier,
     write_web_frontier,
-    read_web_page_manifest,
     write_web_page_manifest,
-    read_web_page_report,
     write_web_page_report,
     read_web_collection_manifest,
     write_web_collection_manifest,
@@ -40,6 +38,13 @@ from asky.plugins.manual_persona_creator.web_types import (
     DuplicateMetadata,
 )
 from asky.plugins.manual_persona_creator.web_prompts import WEB_PAGE_CLASSIFICATION_AND_PREVIEW_PROMPT
+from asky.plugins.manual_persona_creator.web_crawler import (
+    DEFAULT_CRAWL_WORKERS,
+    DEFAULT_PER_HOST_DELAY_SECONDS,
+    CollectionDedupeIndex,
+    HostPoliteness,
+    get_url_host,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +62,8 @@ class WebCollectionJob:
         embedding_client: Optional[Any] = None,
         llm_client: Optional[Any] = None,
         search_executor: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        max_workers: int = DEFAULT_CRAWL_WORKERS,
+        per_host_delay_seconds: float = DEFAULT_PER_HOST_DELAY_SECONDS,
     ):
         self.persona_name = persona_name
         self.persona_description = persona_description
@@ -66,8 +73,15 @@ class WebCollectionJob:
         self.embedding_client = embedding_client
         self.llm_client = llm_client
         self._search_executor = search_executor
+        self.max_workers = max(1, int(max_workers))
         self.seed_hosts: Set[str] = set()
-        self.processed_fingerprints: Set[str] = set()
+        self._politeness = HostPoliteness(per_host_delay_seconds)
+        self._index = CollectionDedupeIndex()
+        # Guards frontier state and the dedupe index; fetches run outside it.
+        self._state_lock = threading.RLock()
+        self._seen_urls: Set[str] = set()
+        self._fetched_urls: Set[str] = set()
+        self._in_flight: Dict[Future, str] = {}
 
     def run(self, manifest: WebCollectionManifest):
         """Execute the collection job."""
@@ -112,44 +126,86 @@ class WebCollectionJob:
                     state.queue.append(url)
                     state.seen_candidate_urls.append(normalized)
 
-        processed_urls: Set[str] = self._get_processed_urls()
-        # Ensure seen URLs also count as processed if they are already terminal
-        processed_urls.update(state.fetched_candidate_urls)
-        
-        while state.queue:
-            # Check termination criteria
-            if self.mode == WebCollectionMode.BROAD_EXPAND:
-                if state.raw_unique_fetch_count >= state.overcollect_cap:
-                    logger.info("Broad overcollection cap reached: %d", state.overcollect_cap)
+        self._index = CollectionDedupeIndex.load(self.paths.collection_dir)
+        self._seen_urls = set(state.seen_candidate_urls)
+        self._fetched_urls = set(state.fetched_candidate_urls)
+
+        self._in_flight = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="asky-web-crawl",
+        ) as executor:
+            while True:
+                self._dispatch_pending(executor, state)
+                if not self._in_flight:
                     break
-            else:
-                if self._count_review_ready() >= self.target_results:
-                    break
-
-            url = state.queue.pop(0)
-            normalized_url = normalize_url(url)
-            
-            if normalized_url in state.fetched_candidate_urls:
-                continue
-                
-            # Stay within seed domains in SEED_DOMAIN mode
-            if self.mode == WebCollectionMode.SEED_DOMAIN:
-                if not self._is_in_seed_hosts(url):
-                    logger.debug("Skipping cross-domain URL: %s", url)
-                    continue
-
-            self._process_page(url, state, processed_urls)
-            
-            # Save frontier state periodically
-            write_web_frontier(self.paths.frontier_path, dataclasses.asdict(state))
+                done, _ = wait(list(self._in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = self._in_flight.pop(future)
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        logger.warning("Web collection worker failed for %s: %s", url, exc)
+                # Save frontier state after every completed page
+                self._checkpoint_frontier(state)
 
         # Update status
         new_status = WebCollectionStatus.REVIEW_READY
         if self._count_review_ready() < self.target_results and not state.queue:
             new_status = WebCollectionStatus.EXHAUSTED
-            
+
         self._update_manifest_status(manifest, new_status)
 
+    def _dispatch_pending(
+        self,
+        executor: ThreadPoolExecutor,
+        state: WebFrontierState,
+    ) -> None:
+        """Fill free worker slots from the frontier queue."""
+        with self._state_lock:
+            while state.queue and len(self._in_flight) < self.max_workers:
+                if self._target_reached(state):
+                    return
+                url = state.queue.pop(0)
+                normalized_url = normalize_url(url)
+                if normalized_url in self._fetched_urls:
+                    continue
+                if normalized_url in {normalize_url(u) for u in self._in_flight.values()}:
+                    continue
+
+                # Stay within seed domains in SEED_DOMAIN mode
+                if self.mode == WebCollectionMode.SEED_DOMAIN:
+                    if not self._is_in_seed_hosts(url):
+                        logger.debug("Skipping cross-domain URL: %s", url)
+                        continue
+
+                future = executor.submit(self._process_page, url, state)
+                self._in_flight[future] = url
+
+    def _target_reached(self, state: WebFrontierState) -> bool:
+        """Check termination criteria, counting in-flight pages as pending results."""
+        pending = len(self._in_flight)
+        if self.mode == WebCollectionMode.BROAD_EXPAND:
+            if state.raw_unique_fetch_count + pending >= state.overcollect_cap:
+                logger.info("Broad overcollection cap reached: %d", state.overcollect_cap)
+                return True
+            return False
+        return self._count_review_ready() + pending >= self.target_results
+
+    def _checkpoint_frontier(self, state: WebFrontierState) -> None:
+        """Persist frontier state, re-queueing in-flight URLs so a crash resumes them."""
+        with self._state_lock:
+            payload = dataclasses.asdict(state)
+            in_flight = [
+                url
+                for url in self._in_flight.values()
+                if normalize_url(url) not in self._fetched_urls
+            ]
+            payload["queue"] = in_flight + [
+                url for url in payload["queue"] if url not in in_flight
+            ]
+        write_web_frontier(self.paths.frontier_path, payload)
+
     def _execute_search(self, query: str) -> List[Dict[str, Any]]:
         """Execute a web search."""
         if self._search_executor:
@@ -171,14 +227,22 @@ class WebCollectionJob:
             logger.warning("Search failed: %s", e)
             return []
 
-    def _process_page(self, url: str, state: WebFrontierState, processed_urls: Set[str]):
-        """Fetch and process a single page."""
-        logger.info("Fetching page: %s", url)
-        
+    def _process_page(self, url: str, state: WebFrontierState):
+        """Fetch and process a single page.
+
+        Runs on a crawler worker thread. Fetching, embedding and preview
+        extraction happen outside the state lock; duplicate decisions and
+        frontier updates are made under it so concurrent pages cannot both
+        claim the same content.
+        """
         normalized_requested_url = normalize_url(url)
-        if normalized_requested_url in state.fetched_candidate_urls:
-            return
-            
+        with self._state_lock:
+            if normalized_requested_url in self._fetched_urls:
+                return
+
+        self._politeness.wait(url)
+        logger.info("Fetching page: %s", url)
+
         trace_context = {
             "persona": self.persona_name,
             "collection_id": self.paths.collection_dir.name,
@@ -196,9 +260,10 @@ class WebCollectionJob:
             trace_callback=trace_callback,
             trace_context=trace_context,
         )
-        
-        state.fetched_candidate_urls.append(normalized_requested_url)
-        state.raw_unique_fetch_count = len(set(state.fetched_candidate_urls))
+
+        with self._state_lock:
+            self._mark_fetched(state, normalized_requested_url)
+            state.raw_unique_fetch_count = len(self._fetched_urls)
         
         # Build retrieval provenance from trace events
         retrieval_provider = "default"
@@ -228,77 +293,86 @@ class WebCollectionJob:
 
         final_url = payload.get("final_url", url)
         normalized_final_url = normalize_url(final_url)
-        
-        # If redirected, we might have already fetched this final URL
-        if normalized_final_url != normalized_requested_url:
-            if normalized_final_url in state.fetched_candidate_urls:
-                # We already have this content. Mark as duplicate if needed, 
-                # but since it's the same URL we can just skip or record it.
-                self._save_duplicate_page(url, payload, reason="redirect_to_fetched", retrieval_info=retrieval_info)
-                return
-            state.fetched_candidate_urls.append(normalized_final_url)
 
         content = payload.get("content", "")
-        if not content:
-            logger.warning("Empty content for %s", url)
-            self._save_failed_page(url, {"error": "Empty content"}, retrieval_info=retrieval_info)
-            return
+        fingerprint = self._calculate_fingerprint(content) if content else ""
 
-        page_id = get_web_page_id(normalized_final_url)
-        p_paths = get_web_page_paths(self.paths.collection_dir, page_id)
-        
-        if p_paths.page_dir.exists():
-            # Already processed (e.g. from another URL redirecting here)
-            self._save_duplicate_page(url, payload, reason="already_exists", matched_page_id=page_id, retrieval_info=retrieval_info)
-            return
-
-        # Duplicate filtering by fingerprint
-        fingerprint = self._calculate_fingerprint(content)
-        if self._is_duplicate_by_fingerprint(fingerprint):
-            self._save_duplicate_page(url, payload, reason="content_fingerprint", fingerprint=fingerprint, retrieval_info=retrieval_info)
-            return
-
-        # Near-duplicate filtering by embedding similarity
+        # Near-duplicate embedding is computed before taking the lock
         embedding = None
-        if self.embedding_client:
+        if content and self.embedding_client:
             try:
                 embedding = self.embedding_client.embed_text(content)
             except Exception as e:
                 logger.warning("Embedding failed for %s: %s", url, e)
-        
-        near_dup = self._is_near_duplicate(page_id, content, embedding)
-        if near_dup:
+
+        page_id = get_web_page_id(normalized_final_url)
+        duplicate: Optional[Dict[str, Any]] = None
+        with self._state_lock:
+            # If redirected, we might have already fetched this final URL
+            if normalized_final_url != normalized_requested_url:
+                if normalized_final_url in self._fetched_urls:
+                    # We already have this content. Mark as duplicate if needed,
+                    # but since it's the same URL we can just skip or record it.
+                    duplicate = {"reason": "redirect_to_fetched"}
+                else:
+                    self._mark_fetched(state, normalized_final_url)
+
+            if duplicate is None and not content:
+                logger.warning("Empty content for %s", url)
+                duplicate = {"failed": True}
+            elif duplicate is None and self._index.has_page(page_id):
+                # Already processed (e.g. from another URL redirecting here)
+                duplicate = {"reason": "already_exists", "matched_page_id": page_id}
+            elif duplicate is None and self._index.match_fingerprint(fingerprint):
+                # Duplicate filtering by fingerprint
+                duplicate = {
+                    "reason": "content_fingerprint",
+                    "matched_page_id": self._index.match_fingerprint(fingerprint),
+                    "fingerprint": fingerprint,
+                }
+            elif duplicate is None:
+                # Near-duplicate filtering by embedding similarity
+                near_dup = self._index.find_near_duplicate(page_id, embedding)
+                if near_dup:
+                    duplicate = {
+                        "reason": near_dup["reason"],
+                        "matched_page_id": near_dup["matched_page_id"],
+                        "fingerprint": fingerprint,
+                        "similarity_score": near_dup.get("similarity_score"),
+                    }
+
+            if duplicate is None:
+                # Claim the page before releasing the lock so concurrent
+                # workers see its fingerprint and embedding.
+                self._index.add_page(
+                    page_id=page_id,
+                    status=WebPageStatus.REVIEW_READY.value,
+                    requested_url=url,
+                    normalized_final_url=normalized_final_url,
+                    fingerprint=fingerprint,
+                    embedding=embedding,
+                )
+                self._enqueue_links(state, payload.get("links", []))
+
+        if duplicate is not None:
+            if duplicate.get("failed"):
+                self._save_failed_page(url, {"error": "Empty content"}, retrieval_info=retrieval_info)
+                return
             self._save_duplicate_page(
-                url, 
-                payload, 
-                reason=near_dup["reason"], 
-                matched_page_id=near_dup["matched_page_id"],
-                fingerprint=fingerprint,
-                similarity_score=near_dup.get("similarity_score"),
-                retrieval_info=retrieval_info
+                url,
+                payload,
+                reason=duplicate["reason"],
+                matched_page_id=duplicate.get("matched_page_id"),
+                fingerprint=duplicate.get("fingerprint"),
+                similarity_score=duplicate.get("similarity_score"),
+                retrieval_info=retrieval_info,
             )
             return
 
-        # Extract links for frontier
-        for link in payload.get("links", []):
-            href = link.get("href")
-            if not href:
-                continue
-            normalized_href = normalize_url(href)
-            if normalized_href in state.seen_candidate_urls:
-                continue
-                
-            if self.mode == WebCollectionMode.SEED_DOMAIN:
-                if self._is_in_seed_hosts(href):
-                    state.queue.append(href)
-                    state.seen_candidate_urls.append(normalized_href)
-            else:
-                # BROAD_EXPAND mode (milestone 4) allows cross-domain link extraction
-                state.queue.append(href)
-                state.seen_candidate_urls.append(normalized_href)
-
         # Classify and extract preview
         preview = self._extract_preview(payload)
+
+        p_paths = get_web_page_paths(self.paths.collection_dir, page_id)
         
         # Persist artifacts
         p_paths.page_dir.mkdir(parents=True, exist_ok=True)
@@ -337,6 +411,29 @@ class WebCollectionJob:
         )
         write_web_page_report(p_paths.report_path, dataclasses.asdict(report))
 
+    def _mark_fetched(self, state: WebFrontierState, normalized_url: str) -> None:
+        if normalized_url in self._fetched_urls:
+            return
+        self._fetched_urls.add(normalized_url)
+        state.fetched_candidate_urls.append(normalized_url)
+
+    def _enqueue_links(self, state: WebFrontierState, links: List[Dict[str, Any]]) -> None:
+        """Extract links for frontier. Caller must hold the state lock."""
+        for link in links:
+            href = link.get("href")
+            if not href:
+                continue
+            normalized_href = normalize_url(href)
+            if normalized_href in self._seen_urls:
+                continue
+
+            if self.mode == WebCollectionMode.SEED_DOMAIN and not self._is_in_seed_hosts(href):
+                continue
+            # BROAD_EXPAND mode (milestone 4) allows cross-domain link extraction
+            state.queue.append(href)
+            state.seen_candidate_urls.append(normalized_href)
+            self._seen_urls.add(normalized_href)
+
     def _extract_preview(self, payload: Dict[str, Any]) -> Optional[WebPagePreview]:
         """Call LLM to extract page classification and preview metadata."""
         if not self.llm_client:
@@ -365,64 +462,8 @@ class WebCollectionJob:
             logger.warning("LLM preview extraction failed: %s", e)
             return None
 
-    def _is_duplicate_by_fingerprint(self, fingerprint: str) -> bool:
-        """Check for exact duplicates by content fingerprint."""
-        if fingerprint in self.processed_fingerprints:
-            return True
-            
-        # Check existing pages in collection
-        for page_id in self._list_processed_page_ids():
-            p_paths = get_web_page_paths(self.paths.collection_dir, page_id)
-            if p_paths.manifest_path.exists():
-                try:
-                    m = read_web_page_manifest(p_paths.manifest_path)
-                    if m.get("content_fingerprint") == fingerprint:
-                        self.processed_fingerprints.add(fingerprint)
-                        return True
-                except Exception:
-                    continue
-        
-        self.processed_fingerprints.add(fingerprint)
-        return False
-
-    def _is_near_duplicate(self, page_id: str, content: str, embedding: Optional[List[float]]) -> Optional[Dict[str, Any]]:
-        """Check for near-duplicates using embedding similarity."""
-        if not embedding or not self.embedding_client:
-            return None
-
-        for other_id in self._list_processed_page_ids():
-            if other_id == page_id:
-                continue
-                
-            p_paths = get_web_page_paths(self.paths.collection_dir, other_id)
-            if not p_paths.manifest_path.exists():
-                continue
-                
-            try:
-                m = read_web_page_manifest(p_paths.manifest_path)
-                other_similarity = m.get("similarity_metadata", {})
-                other_embedding = other_similarity.get("embedding")
-                
-                if other_embedding:
-                    from asky.research.vector_store_common import cosine_similarity
-                    similarity = cosine_similarity(embedding, other_embedding)
-                    if similarity >= 0.92:
-                        return {
-                            "reason": "embedding_similarity",
-                            "matched_page_id": other_id,
-                            "similarity_score": similarity
-                        }
-            except Exception:
-                continue
-        return None
-
     def _get_normalized_host(self, url: str) -> str:
-        try:
-            parsed = urlparse(url)
-            host = parsed.netloc.lower().rstrip(".")
-            return host
-        except Exception:
-            return ""
+        return get_url_host(url)
 
     def _get_seed_host_allowlist(self, seed_urls: Sequence[str]) -> Set[str]:
         allowlist = set()
@@ -442,39 +483,8 @@ class WebCollectionJob:
         host = self._get_normalized_host(url)
         return host in self.seed_hosts if host else False
 
-    def _get_processed_urls(self) -> Set[str]:
-        urls = set()
-        for page_id in self._list_processed_page_ids():
-            p_paths = get_web_page_paths(self.paths.collection_dir, page_id)
-            if p_paths.manifest_path.exists():
-                try:
-                    m = read_web_page_manifest(p_paths.manifest_path)
-                    if m.get("normalized_final_url"):
-                        urls.add(m["normalized_final_url"])
-                    if m.get("requested_url"):
-                        urls.add(normalize_url(m["requested_url"]))
-                except Exception:
-                    continue
-        return urls
-
-    def _list_processed_page_ids(self) -> List[str]:
-        pages_root = self.paths.collection_dir / "pages"
-        if not pages_root.exists():
-            return []
-        return [p.name for p in pages_root.iterdir() if p.is_dir()]
-
     def _count_review_ready(self) -> int:
-        count = 0
-        for page_id in self._list_processed_page_ids():
-            p_paths = get_web_page_paths(self.paths.collection_dir, page_id)
-            if p_paths.manifest_path.exists():
-                try:
-                    m = read_web_page_manifest(p_paths.manifest_path)
-                    if m.get("status") == WebPageStatus.REVIEW_READY:
-                        count += 1
-                except Exception:
-                    continue
-        return count
+        return self._index.review_ready_count
 
     def _calculate_fingerprint(self, content: str) -> str:
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
@@ -511,6 +521,13 @@ class WebCollectionJob:
             created_at=datetime.now(UTC).isoformat(),
         )
         write_web_page_report(p_paths.report_path, dataclasses.asdict(report))
+        with self._state_lock:
+            self._index.add_page(
+                page_id=page_id,
+                status=WebPageStatus.FETCH_FAILED.value,
+                requested_url=url,
+                normalized_final_url=manifest.normalized_final_url,
+            )
 
     def _save_duplicate_page(
         self, 
@@ -557,6 +574,14 @@ class WebCollectionJob:
             created_at=datetime.now(UTC).isoformat(),
         )
         write_web_page_report(p_paths.report_path, dataclasses.asdict(report))
+        with self._state_lock:
+            self._index.add_page(
+                page_id=page_id,
+                status=WebPageStatus.DUPLICATE_FILTERED.value,
+                requested_url=url,
+                normalized_final_url=manifest.normalized_final_url,
+                fingerprint=fingerprint,
+            )
 
     def _update_manifest_status(self, manifest: WebCollectionManifest, status: WebCollectionStatus):
         manifest_data = read_web_collection_manifest(self.paths.manifest_path)
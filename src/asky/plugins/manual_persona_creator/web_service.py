@@ -17,6 +17,10 @@ from asky.plugins.manual_persona_creator.storage import (
     list_web_collections,
     list_web_pages,
 )
+from asky.plugins.manual_persona_creator.web_crawler import (
+    DEFAULT_CRAWL_WORKERS,
+    DEFAULT_PER_HOST_DELAY_SECONDS,
+)
 from asky.plugins.manual_persona_creator.web_job import WebCollectionJob
 from asky.plugins.manual_persona_creator.web_types import (
     WebCollectionManifest,
@@ -28,6 +32,21 @@ from asky.plugins.manual_persona_creator.web_types import (
 logger = logging.getLogger(__name__)
 
 
+def _crawl_limits(
+    max_workers: Optional[int],
+    per_host_delay_seconds: Optional[float],
+) -> Dict[str, Any]:
+    """Resolve crawler limits, falling back to the crawler defaults."""
+    return {
+        "max_workers": max_workers or DEFAULT_CRAWL_WORKERS,
+        "per_host_delay_seconds": (
+            DEFAULT_PER_HOST_DELAY_SECONDS
+            if per_host_delay_seconds is None
+            else float(per_host_delay_seconds)
+        ),
+    }
+
+
 def start_seed_domain_collection(
     *,
     data_dir: Path,
@@ -37,6 +56,8 @@ def start_seed_domain_collection(
     url_file: Optional[Path] = None,
     embedding_client: Optional[Any] = None,
     llm_client: Optional[Any] = None,
+    max_workers: Optional[int] = None,
+    per_host_delay_seconds: Optional[float] = None,
 ) -> str:
     """Start a new bounded seed-domain web collection."""
     paths = get_persona_paths(data_dir, persona_name)
@@ -96,6 +117,7 @@ def start_seed_domain_collection(
         mode=WebCollectionMode.SEED_DOMAIN,
         embedding_client=embedding_client,
         llm_client=llm_client,
+        **_crawl_limits(max_workers, per_host_delay_seconds),
     )
     job.run(manifest)
 
@@ -112,6 +134,8 @@ def start_broad_web_expansion(
     url_file: Optional[Path] = None,
     embedding_client: Optional[Any] = None,
     llm_client: Optional[Any] = None,
+    max_workers: Optional[int] = None,
+    per_host_delay_seconds: Optional[float] = None,
 ) -> str:
     """Start a broad public-web expansion."""
     paths = get_persona_paths(data_dir, persona_name)
@@ -171,6 +195,7 @@ def start_broad_web_expansion(
         mode=WebCollectionMode.BROAD_EXPAND,
         embedding_client=embedding_client,
         llm_client=llm_client,
+        **_crawl_limits(max_workers, per_host_delay_seconds),
     )
     job.run(manifest)
 
@@ -184,6 +209,8 @@ def continue_collection(
     collection_id: str,
     embedding_client: Optional[Any] = None,
     llm_client: Optional[Any] = None,
+    max_workers: Optional[int] = None,
+    per_host_delay_seconds: Optional[float] = None,
 ) -> None:
     """Resume an existing collection."""
     paths = get_persona_paths(data_dir, persona_name)
@@ -219,6 +246,7 @@ def continue_collection(
         mode=manifest.mode,
         embedding_client=embedding_client,
         llm_client=llm_client,
+        **_crawl_limits(max_workers, per_host_delay_seconds),
     )
     job.run(manifest)
 
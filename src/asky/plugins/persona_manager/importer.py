@@ -10,7 +10,8 @@ from zipfile import ZipFile
 
 from asky.plugins.manual_persona_creator.knowledge_catalog import (
     KNOWLEDGE_DIR_NAME,
-    get_knowledge_paths,
+    catalog_exists,
+    load_catalog_json,
     rebuild_catalog_from_legacy,
 )
 from asky.plugins.manual_persona_creator.runtime_index import rebuild_runtime_index
@@ -103,11 +104,12 @@ def import_persona_archive(*, data_dir: Path, archive_path: str) -> Dict[str, An
                 target_path.parent.mkdir(parents=True, exist_ok=True)
                 target_path.write_bytes(archive.read(member_name))
 
+    # Archives carry the catalog as JSON; load it into the SQLite catalog
+    load_catalog_json(paths.root_dir, remove_json=True)
+
     # Ensure catalog exists for legacy schemas
-    if schema_version < 3:
-        k_paths = get_knowledge_paths(paths.root_dir)
-        if not k_paths["sources"].exists() or not k_paths["entries"].exists():
-            rebuild_catalog_from_legacy(paths.root_dir)
+    if schema_version < 3 and not catalog_exists(paths.root_dir):
+        rebuild_catalog_from_legacy(paths.root_dir)
 
     embedding_stats = rebuild_embeddings(persona_dir=paths.root_dir, chunks=chunks)
     rebuild_runtime_index(persona_dir=paths.root_dir)
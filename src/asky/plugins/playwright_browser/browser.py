@@ -1,26 +1,26 @@
-"""Sync Playwright browser manager with session persistence and CAPTCHA handling."""
+"""Playwright browser manager with a bounded page pool, session persistence and CAPTCHA handling.
+
+Playwright objects are bound to the event loop that created them, so the manager
+owns one background thread running an asyncio loop with the async Playwright
+API. `fetch_page` is a blocking call usable from any thread; concurrent callers
+share up to `max_pages` tabs of a single browser context.
+"""
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import random
+import threading
 import time
 from pathlib import Path
-from threading import Lock
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 try:
-    from playwright.sync_api import (
-        Browser,
-        BrowserContext,
-        Page,
-        TimeoutError,
-        sync_playwright,
-    )
+    from playwright.async_api import TimeoutError, async_playwright
 except ImportError:
-    sync_playwright = None  # type: ignore
+    async_playwright = None  # type: ignore
     TimeoutError = Exception  # type: ignore
 
 logger = logging.getLogger(__name__)
@@ -40,9 +40,36 @@ CHALLENGE_URL_PATTERNS = [
     "checkpoint/challenge",
 ]
 
+DEFAULT_MAX_PAGES = 4
+DEFAULT_READY_POLL_INTERVAL_MS = 250
+DEFAULT_READY_STABLE_POLLS = 2
+BLOCKABLE_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+SHUTDOWN_TIMEOUT_SECONDS = 10.0
+PAGE_POOL_METRICS_NAME = "playwright_page_pool"
+# Cheap DOM signature polled until it stops changing (text length + element count).
+CONTENT_SIGNATURE_SCRIPT = (
+    "() => { const body = document.body;"
+    " return body ? [body.innerText.length, body.getElementsByTagName('*').length]"
+    " : [0, 0]; }"
+)
+WEBDRIVER_MASK_SCRIPT = (
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+)
+
+
+def _normalize_blocked_types(resource_types: Optional[Iterable[str]]) -> frozenset:
+    normalized = {str(item).strip().lower() for item in resource_types or ()}
+    unknown = normalized - BLOCKABLE_RESOURCE_TYPES
+    if unknown:
+        logger.warning(
+            "Ignoring unsupported Playwright block_resources entries: %s",
+            ", ".join(sorted(unknown)),
+        )
+    return frozenset(normalized & BLOCKABLE_RESOURCE_TYPES)
+
 
 class PlaywrightBrowserManager:
-    """Manages a lazy-started Playwright browser instance with session persistence."""
+    """Manages a lazy-started Playwright browser and a bounded pool of pages."""
 
     def __init__(
         self,
@@ -55,6 +82,12 @@ class PlaywrightBrowserManager:
         network_idle_timeout_ms: int = 2000,
         keep_browser_open: bool = True,
         post_load_delay_ms: int = 2000,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        block_resources: Optional[Iterable[str]] = None,
+        ready_poll_interval_ms: int = DEFAULT_READY_POLL_INTERVAL_MS,
+        ready_stable_polls: int = DEFAULT_READY_STABLE_POLLS,
+        headless: bool = False,
+        playwright_factory: Optional[Callable[[], Any]] = None,
     ) -> None:
         self._data_dir = data_dir
         self._browser_type = browser_type
@@ -64,131 +97,297 @@ class PlaywrightBrowserManager:
         self._page_timeout_ms = page_timeout_ms
         self._network_idle_timeout_ms = network_idle_timeout_ms
         self._keep_browser_open = keep_browser_open
-        self._post_load_delay_ms = post_load_delay_ms
+        # Upper bound for the content-stability wait after `domcontentloaded`.
+        self._post_load_delay_ms = max(0, int(post_load_delay_ms))
+        self._max_pages = max(1, int(max_pages))
+        self._blocked_resource_types = _normalize_blocked_types(block_resources)
+        self._ready_poll_interval_ms = max(10, int(ready_poll_interval_ms))
+        self._ready_stable_polls = max(1, int(ready_stable_polls))
+        self._headless = bool(headless)
+        self._playwright_factory = playwright_factory or async_playwright
 
         self._playwright = None
-        self._browser: Optional[Browser] = None
-        self._context: Optional[BrowserContext] = None
-        self._lock = Lock()
-        self._last_request_time: Dict[str, float] = {}
+        self._browser = None
+        self._context = None
+        self._idle_pages: List[Any] = []
+        self._active_fetches = 0
 
-    def _ensure_started(self) -> None:
-        if self._context is not None:
-            return
+        self._state_lock = threading.Lock()
+        self._last_request_time: Dict[str, float] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._page_slots: Optional[asyncio.Semaphore] = None
+
+        self._metrics_lock = threading.Lock()
+        self._pages_open = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._fetches = 0
+        self._failures = 0
+        self._blocked_requests = 0
+        self._ready_timeouts = 0
+        self._total_fetch_seconds = 0.0
+        self._total_ready_seconds = 0.0
+        self._total_slot_wait_seconds = 0.0
+        self._max_slot_wait_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Event loop plumbing
+    # ------------------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._state_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="asky-playwright",
+                    daemon=True,
+                )
+                thread.start()
+                # asyncio primitives bind to the loop they are first used on.
+                self._start_lock = asyncio.Lock()
+                self._page_slots = asyncio.Semaphore(self._max_pages)
+                self._loop = loop
+                self._loop_thread = thread
+            return self._loop
+
+    def _run(self, coro: Any) -> Any:
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    # ------------------------------------------------------------------
+    # Browser lifecycle
+    # ------------------------------------------------------------------
+
+    async def _ensure_started(self) -> None:
+        assert self._start_lock is not None
+        async with self._start_lock:
+            if self._context is not None:
+                return
+            await self._start_browser()
 
-        if sync_playwright is None:
+    async def _start_browser(self) -> None:
+        if self._playwright_factory is None:
             raise ImportError(
                 "Playwright not installed. Run 'uv pip install asky-cli[playwright]' "
                 "and 'playwright install chromium'."
             )
 
-        self._playwright = sync_playwright().start()
+        self._playwright = await self._playwright_factory().start()
         browser_launcher = getattr(self._playwright, self._browser_type)
 
-        launch_args: Dict[str, Any] = {"headless": False}
+        launch_args: Dict[str, Any] = {"headless": self._headless}
         if self._browser_type == "chromium":
             launch_args["args"] = ["--disable-blink-features=AutomationControlled"]
 
-        def _launch() -> None:
+        async def _launch() -> None:
             if self._persist_session:
                 user_data_dir = (
                     self._data_dir / f"playwright_profile_{self._browser_type}"
                 )
                 user_data_dir.mkdir(parents=True, exist_ok=True)
-                self._context = browser_launcher.launch_persistent_context(
+                self._context = await browser_launcher.launch_persistent_context(
                     user_data_dir=str(user_data_dir), **launch_args
                 )
             else:
-                self._browser = browser_launcher.launch(**launch_args)
-                self._context = self._browser.new_context()
+                self._browser = await browser_launcher.launch(**launch_args)
+                self._context = await self._browser.new_context()
 
         try:
-            _launch()
+            await _launch()
         except Exception as e:
             error_msg = str(e)
             if (
                 "Executable doesn't exist at" in error_msg
                 or "playwright install" in error_msg
             ):
-                import sys
-                import subprocess
+                await asyncio.to_thread(self._install_browser, e)
+                # Retry launch after installation
+                await _launch()
+            else:
+                raise
 
-                logger.info(
-                    "Playwright browser %s missing. Attempting automatic installation...",
-                    self._browser_type,
-                )
-                try:
-                    from rich.console import Console
+        if self._context is None:
+            return
+        await self._context.add_init_script(WEBDRIVER_MASK_SCRIPT)
+        if self._blocked_resource_types:
+            await self._context.route("**/*", self._route_request)
+        # Persistent contexts open with one blank tab; adopt it into the pool.
+        existing_pages = list(self._context.pages)
+        self._idle_pages.extend(existing_pages)
+        with self._metrics_lock:
+            self._pages_open = len(existing_pages)
+
+    def _install_browser(self, launch_error: Exception) -> None:
+        import subprocess
+        import sys
+
+        logger.info(
+            "Playwright browser %s missing. Attempting automatic installation...",
+            self._browser_type,
+        )
+        try:
+            from rich.console import Console
 
-                    console = Console()
-                    console.print(
-                        f"\n[bold yellow]Playwright Plugin:[/bold yellow] Installing [cyan]{self._browser_type}[/cyan] browser... this may take a minute."
-                    )
-                except ImportError:
-                    print(
-                        f"\n[Playwright Plugin] Installing {self._browser_type} browser... this may take a minute.",
-                        file=sys.stderr,
-                    )
+            console = Console()
+            console.print(
+                f"\n[bold yellow]Playwright Plugin:[/bold yellow] Installing [cyan]{self._browser_type}[/cyan] browser... this may take a minute."
+            )
+        except ImportError:
+            print(
+                f"\n[Playwright Plugin] Installing {self._browser_type} browser... this may take a minute.",
+                file=sys.stderr,
+            )
 
-                try:
-                    subprocess.run(
-                        [
-                            sys.executable,
-                            "-m",
-                            "playwright",
-                            "install",
-                            self._browser_type,
-                        ],
-                        check=True,
-                    )
-                    try:
-                        Console().print(
-                            f"[bold green]Playwright Plugin:[/bold green] Successfully installed [cyan]{self._browser_type}[/cyan]."
-                        )
-                    except ImportError:
-                        print(
-                            f"[Playwright Plugin] Successfully installed {self._browser_type}.",
-                            file=sys.stderr,
-                        )
-
-                    # Retry launch after installation
-                    _launch()
-                except subprocess.CalledProcessError as install_err:
-                    raise RuntimeError(
-                        f"Failed to automatically install Playwright browser: {install_err}"
-                    ) from e
-            else:
-                raise
+        try:
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "playwright",
+                    "install",
+                    self._browser_type,
+                ],
+                check=True,
+            )
+        except subprocess.CalledProcessError as install_err:
+            raise RuntimeError(
+                f"Failed to automatically install Playwright browser: {install_err}"
+            ) from launch_error
+        try:
+            from rich.console import Console
 
-        if self._context is not None:
-            self._context.add_init_script(
-                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+            Console().print(
+                f"[bold green]Playwright Plugin:[/bold green] Successfully installed [cyan]{self._browser_type}[/cyan]."
+            )
+        except ImportError:
+            print(
+                f"[Playwright Plugin] Successfully installed {self._browser_type}.",
+                file=sys.stderr,
             )
 
-    def _apply_delay(self, url: str) -> None:
-        netloc = urlparse(url).netloc
-        if not netloc:
+    async def _route_request(self, route: Any) -> None:
+        if route.request.resource_type in self._blocked_resource_types:
+            with self._metrics_lock:
+                self._blocked_requests += 1
+            await route.abort()
             return
+        await route.continue_()
 
-        if netloc not in self._last_request_time:
-            self._last_request_time[netloc] = time.perf_counter()
+    async def _shutdown_browser(self) -> None:
+        self._idle_pages = []
+        try:
+            if self._context:
+                await self._context.close()
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        finally:
+            self._browser = None
+            self._context = None
+            self._playwright = None
+            with self._metrics_lock:
+                self._pages_open = 0
+
+    # ------------------------------------------------------------------
+    # Page pool
+    # ------------------------------------------------------------------
+
+    async def _acquire_page(self) -> Any:
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                return page
+            with self._metrics_lock:
+                self._pages_open -= 1
+        if not self._context:
+            raise RuntimeError("Browser context not initialized")
+        page = await self._context.new_page()
+        with self._metrics_lock:
+            self._pages_open += 1
+        return page
+
+    async def _release_page(self, page: Any, reusable: bool) -> None:
+        if reusable and self._keep_browser_open and not page.is_closed():
+            self._idle_pages.append(page)
             return
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.debug("Playwright page close failed: %s", e)
+        with self._metrics_lock:
+            self._pages_open = max(0, self._pages_open - 1)
 
-        last_time = self._last_request_time.get(netloc, 0)
-        elapsed = (time.perf_counter() - last_time) * 1000
-
-        delay = random.randint(
-            self._same_site_min_delay_ms, self._same_site_max_delay_ms
-        )
-        if elapsed < delay:
-            sleep_time = (delay - elapsed) / 1000
-            logger.debug("Applying same-site delay for %s: %.2fs", netloc, sleep_time)
-            time.sleep(sleep_time)
+    def _reserve_site_delay(self, url: str) -> float:
+        """Reserve the next request slot for `url`'s site; returns seconds to wait.
 
-        self._last_request_time[netloc] = time.perf_counter()
+        Slots are handed out in call order, so concurrent fetches to one site
+        stay spaced by the configured random delay while other sites proceed.
+        """
+        netloc = urlparse(url).netloc
+        if not netloc:
+            return 0.0
+
+        with self._state_lock:
+            now = time.perf_counter()
+            last_time = self._last_request_time.get(netloc)
+            if last_time is None:
+                self._last_request_time[netloc] = now
+                return 0.0
+            delay = (
+                random.randint(
+                    self._same_site_min_delay_ms, self._same_site_max_delay_ms
+                )
+                / 1000
+            )
+            start_at = max(now, last_time + delay)
+            self._last_request_time[netloc] = start_at
+            return start_at - now
 
-    def _detect_challenge(
-        self, page: Page, response_status: Optional[int]
+    async def _wait_until_ready(self, page: Any) -> None:
+        """Poll a DOM signature until it is stable, bounded by `post_load_delay_ms`."""
+        if self._post_load_delay_ms <= 0:
+            return
+        started = time.perf_counter()
+        deadline = started + self._post_load_delay_ms / 1000
+        interval = self._ready_poll_interval_ms / 1000
+        previous = None
+        stable_polls = 0
+        try:
+            while True:
+                try:
+                    signature = await page.evaluate(CONTENT_SIGNATURE_SCRIPT)
+                except Exception as e:
+                    # Navigations in progress reset the execution context.
+                    logger.debug("Playwright readiness probe failed: %s", e)
+                    signature = None
+                if signature is not None and signature == previous:
+                    stable_polls += 1
+                    if stable_polls >= self._ready_stable_polls:
+                        return
+                else:
+                    stable_polls = 0
+                    previous = signature
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    with self._metrics_lock:
+                        self._ready_timeouts += 1
+                    return
+                await asyncio.sleep(min(interval, remaining))
+        finally:
+            with self._metrics_lock:
+                self._total_ready_seconds += time.perf_counter() - started
+
+    # ------------------------------------------------------------------
+    # Challenge handling
+    # ------------------------------------------------------------------
+
+    async def _detect_challenge(
+        self, page: Any, response_status: Optional[int]
     ) -> Optional[str]:
         if response_status in CHALLENGE_HTTP_STATUSES:
             return f"HTTP status {response_status}"
@@ -200,14 +399,16 @@ class PlaywrightBrowserManager:
 
         for selector in CHALLENGE_SELECTORS:
             try:
-                if page.locator(selector).count() > 0:
+                if await page.locator(selector).count() > 0:
                     return f"Selector '{selector}' found"
             except Exception as e:
                 logger.debug("Playwright challenge selector check failed: %s", e)
                 continue
         return None
 
-    def _wait_for_challenge_resolution(self, page: Page, initial_reason: str) -> None:
+    async def _wait_for_challenge_resolution(
+        self, page: Any, initial_reason: str
+    ) -> None:
         logger.warning(
             "Challenge detected on %s (Reason: %s). Please solve it in the browser window.",
             page.url,
@@ -216,71 +417,135 @@ class PlaywrightBrowserManager:
 
         start_time = time.perf_counter()
         while (time.perf_counter() - start_time) * 1000 < CHALLENGE_WAIT_TIMEOUT_MS:
-            time.sleep(CHALLENGE_WAIT_POLL_INTERVAL_MS / 1000)
-            if not self._detect_challenge(page, None):
+            await asyncio.sleep(CHALLENGE_WAIT_POLL_INTERVAL_MS / 1000)
+            if not await self._detect_challenge(page, None):
                 logger.info("Challenge resolved.")
                 return
 
         logger.warning("Challenge resolution timed out.")
 
-    def fetch_page(self, url: str) -> Tuple[str, str]:
-        with self._lock:
-            self._ensure_started()
-            self._apply_delay(url)
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
 
-            if not self._context:
-                raise RuntimeError("Browser context not initialized")
+    def fetch_page(self, url: str) -> Tuple[str, str]:
+        """Fetch `url` and return `(html, final_url)`; safe to call from any thread."""
+        return self._run(self._fetch_page(url))
 
-            if self._keep_browser_open and self._context.pages:
-                page = self._context.pages[-1]
-            else:
-                page = self._context.new_page()
+    async def _fetch_page(self, url: str) -> Tuple[str, str]:
+        delay = self._reserve_site_delay(url)
+        if delay > 0:
+            logger.debug("Applying same-site delay for %s: %.2fs", url, delay)
+            await asyncio.sleep(delay)
 
-            try:
-                logger.debug("Playwright navigating to: %s", url)
-                # Use 'domcontentloaded' instead of 'networkidle' to avoid hanging on
-                # infinite background requests (ads, tracking, video players)
-                response = page.goto(
-                    url, wait_until="domcontentloaded", timeout=self._page_timeout_ms
-                )
+        self._active_fetches += 1
+        try:
+            await self._ensure_started()
+            assert self._page_slots is not None
+            wait_started = time.perf_counter()
+            async with self._page_slots:
+                self._record_slot_wait(time.perf_counter() - wait_started)
+                return await self._fetch_in_slot(url)
+        finally:
+            self._active_fetches -= 1
+            if not self._keep_browser_open and self._active_fetches == 0:
+                await self._shutdown_browser()
+
+    async def _fetch_in_slot(self, url: str) -> Tuple[str, str]:
+        fetch_started = time.perf_counter()
+        with self._metrics_lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        page = await self._acquire_page()
+        reusable = False
+        try:
+            logger.debug("Playwright navigating to: %s", url)
+            # Use 'domcontentloaded' instead of 'networkidle' to avoid hanging on
+            # infinite background requests (ads, tracking, video players)
+            response = await page.goto(
+                url, wait_until="domcontentloaded", timeout=self._page_timeout_ms
+            )
 
-                # Give SPAs and dynamic sites a moment to render their main content
-                page.wait_for_timeout(self._post_load_delay_ms)
+            # Give SPAs and dynamic sites a chance to render their main content
+            await self._wait_until_ready(page)
 
-                status = response.status if response else None
-                challenge_reason = self._detect_challenge(page, status)
+            status = response.status if response else None
+            challenge_reason = await self._detect_challenge(page, status)
 
-                if challenge_reason:
-                    self._wait_for_challenge_resolution(page, challenge_reason)
-                    try:
-                        page.wait_for_load_state(
-                            "domcontentloaded", timeout=self._page_timeout_ms
-                        )
-                        page.wait_for_timeout(self._post_load_delay_ms)
-                    except (TimeoutError, Exception) as e:
-                        logger.debug(
-                            "Post-challenge load state wait failed/timed out: %s", e
-                        )
+            if challenge_reason:
+                await self._wait_for_challenge_resolution(page, challenge_reason)
+                try:
+                    await page.wait_for_load_state(
+                        "domcontentloaded", timeout=self._page_timeout_ms
+                    )
+                    await self._wait_until_ready(page)
+                except (TimeoutError, Exception) as e:
+                    logger.debug(
+                        "Post-challenge load state wait failed/timed out: %s", e
+                    )
 
-                html = page.content()
-                final_url = page.url
+            html = await page.content()
+            final_url = page.url
 
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Playwright fetched final_url=%s status=%s title='%s' content_length=%d",
                     final_url,
                     status,
-                    page.title(),
+                    await page.title(),
                     len(html),
                 )
 
-                return html, final_url
-            except Exception as e:
-                logger.debug("Playwright fetch failed for %s. Error: %s", url, e)
-                raise
-            finally:
-                if not self._keep_browser_open:
-                    page.close()
-                    self._close_unlocked()
+            reusable = True
+            return html, final_url
+        except Exception as e:
+            with self._metrics_lock:
+                self._failures += 1
+            logger.debug("Playwright fetch failed for %s. Error: %s", url, e)
+            raise
+        finally:
+            await self._release_page(page, reusable)
+            with self._metrics_lock:
+                self._in_flight -= 1
+                self._fetches += 1
+                self._total_fetch_seconds += time.perf_counter() - fetch_started
+
+    def _record_slot_wait(self, seconds: float) -> None:
+        with self._metrics_lock:
+            self._total_slot_wait_seconds += seconds
+            self._max_slot_wait_seconds = max(self._max_slot_wait_seconds, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return page-pool metrics for the admin console."""
+        with self._metrics_lock:
+            fetches = self._fetches
+            return {
+                "max_pages": self._max_pages,
+                "pages_open": self._pages_open,
+                "idle_pages": len(self._idle_pages),
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "fetches": fetches,
+                "failures": self._failures,
+                "blocked_requests": self._blocked_requests,
+                "ready_timeouts": self._ready_timeouts,
+                "avg_fetch_ms": round(
+                    self._total_fetch_seconds * 1000.0 / fetches, 1
+                )
+                if fetches
+                else 0.0,
+                "avg_ready_ms": round(
+                    self._total_ready_seconds * 1000.0 / fetches, 1
+                )
+                if fetches
+                else 0.0,
+                "avg_slot_wait_ms": round(
+                    self._total_slot_wait_seconds * 1000.0 / fetches, 1
+                )
+                if fetches
+                else 0.0,
+                "max_slot_wait_ms": round(self._max_slot_wait_seconds * 1000.0, 1),
+            }
 
     def open_login_session(self, url: str) -> None:
         from asky.daemon.launch_context import is_interactive
@@ -290,55 +555,64 @@ class PlaywrightBrowserManager:
                 "open_login_session (input()) called in non-interactive context"
             )
 
-        with self._lock:
-            self._ensure_started()
-            if not self._context:
-                return
-
-            url = url.strip()
-            if url.startswith("https//"):
-                url = url.replace("https//", "https://", 1)
-            elif url.startswith("http//"):
-                url = url.replace("http//", "http://", 1)
-            elif not url.startswith("http://") and not url.startswith("https://"):
-                url = f"https://{url}"
+        url = url.strip()
+        if url.startswith("https//"):
+            url = url.replace("https//", "https://", 1)
+        elif url.startswith("http//"):
+            url = url.replace("http//", "http://", 1)
+        elif not url.startswith("http://") and not url.startswith("https://"):
+            url = f"https://{url}"
 
-            if self._keep_browser_open and self._context.pages:
-                page = self._context.pages[-1]
-            else:
-                page = self._context.new_page()
+        page = None
+        try:
+            page = self._run(self._open_login_page(url))
+            logger.info(
+                "Please log in and then press ENTER in this terminal to save the session."
+            )
+            input()
+            logger.info("Session saved.")
+        except Exception as e:
+            import sys
 
-            try:
-                logger.info("Opening %s for manual login.", url)
-                logger.info(
-                    "Please log in and then press ENTER in this terminal to save the session."
-                )
-                page.goto(url)
-                input()
-                logger.info("Session saved.")
-            except Exception as e:
-                import sys
+            print(
+                f"\n[Playwright Plugin] Failed to open login session for '{url}': {e}",
+                file=sys.stderr,
+            )
+        finally:
+            if page is not None:
+                self._run(self._finish_login_page(page))
+
+    async def _open_login_page(self, url: str) -> Any:
+        await self._ensure_started()
+        page = await self._acquire_page()
+        logger.info("Opening %s for manual login.", url)
+        try:
+            await page.goto(url)
+        except Exception:
+            await self._release_page(page, reusable=False)
+            raise
+        return page
 
-                print(
-                    f"\n[Playwright Plugin] Failed to open login session for '{url}': {e}",
-                    file=sys.stderr,
-                )
-            finally:
-                if not self._keep_browser_open:
-                    page.close()
-                    self._close_unlocked()
+    async def _finish_login_page(self, page: Any) -> None:
+        await self._release_page(page, reusable=True)
+        if not self._keep_browser_open and self._active_fetches == 0:
+            await self._shutdown_browser()
 
     def close(self) -> None:
-        with self._lock:
-            self._close_unlocked()
-
-    def _close_unlocked(self) -> None:
-        if self._context:
-            self._context.close()
-        if self._browser:
-            self._browser.close()
-        if self._playwright:
-            self._playwright.stop()
-        self._browser = None
-        self._context = None
-        self._playwright = None
+        """Close the browser and stop the background event loop."""
+        with self._state_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown_browser(), loop).result(
+                timeout=SHUTDOWN_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            logger.debug("Playwright shutdown failed: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=SHUTDOWN_TIMEOUT_SECONDS)
+        loop.close()
@@ -32,7 +32,12 @@ class PlaywrightBrowserPlugin(AskyPlugin):
         ]
 
     def activate(self, context: PluginContext) -> None:
-        from asky.plugins.playwright_browser.browser import PlaywrightBrowserManager
+        from asky.daemon.metrics import register_metrics_provider
+        from asky.plugins.playwright_browser.browser import (
+            DEFAULT_MAX_PAGES,
+            PAGE_POOL_METRICS_NAME,
+            PlaywrightBrowserManager,
+        )
 
         config = context.config or {}
 
@@ -51,7 +56,11 @@ class PlaywrightBrowserPlugin(AskyPlugin):
             network_idle_timeout_ms=config.get("network_idle_timeout_ms", 2000),
             keep_browser_open=config.get("keep_browser_open", True),
             post_load_delay_ms=config.get("post_load_delay_ms", 2000),
+            max_pages=config.get("max_pages", DEFAULT_MAX_PAGES),
+            block_resources=config.get("block_resources", []),
+            headless=config.get("headless", False),
         )
+        register_metrics_provider(PAGE_POOL_METRICS_NAME, self._browser_manager.snapshot)
 
         context.hook_registry.register(
             FETCH_URL_OVERRIDE,
@@ -63,6 +72,10 @@ class PlaywrightBrowserPlugin(AskyPlugin):
         )
 
     def deactivate(self) -> None:
+        from asky.daemon.metrics import unregister_metrics_provider
+        from asky.plugins.playwright_browser.browser import PAGE_POOL_METRICS_NAME
+
+        unregister_metrics_provider(PAGE_POOL_METRICS_NAME)
         self._browser_manager.close()
 
     def _on_fetch_url_override(self, ctx: FetchURLContext) -> None:
@@ -6,7 +6,6 @@ import argparse
 import io
 import os
 import re
-import threading
 import time
 from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from typing import Any, Callable, Optional, TYPE_CHECKING
@@ -14,7 +13,7 @@ from urllib.parse import urlparse
 
 import requests
 
-from asky import summarization
+from asky import tracing
 from asky.api import AskyClient, AskyConfig, AskyTurnRequest
 from asky.cli import history, memory_commands, sessions, utils
 from asky.cli.main import (
@@ -28,11 +27,12 @@ from asky.cli.main import (
     section_commands,
 )
 from asky.cli.verbose_output import build_verbose_output_callback
-from asky.config import DEFAULT_MODEL
+from asky.config import DEFAULT_MODEL, XMPP_TRACE_HISTORY, XMPP_TRACE_TURNS
 from asky.plugins.xmpp_daemon.query_progress import (
     QueryProgressAdapter,
     QueryProgressEvent,
 )
+from asky.plugins.xmpp_daemon.query_runtime import DaemonQueryRuntime
 from asky.plugins.xmpp_daemon.transcript_manager import TranscriptManager
 from asky.storage import init_db
 
@@ -78,7 +78,6 @@ INLINE_TOML_PATTERN = re.compile(
     r"(?is)(?P<filename>[a-zA-Z0-9_\-]+\.toml)\s*```toml\s*(?P<content>.{0,65536}?)```"
 )
 POINTER_PATTERN = re.compile(r"#(it|i|at|a)(\d+)\b", re.IGNORECASE)
-_SUMMARIZATION_MODEL_OVERRIDE_LOCK = threading.Lock()
 
 _HELP_TEXT = """\
 asky XMPP Help
@@ -158,8 +157,10 @@ class CommandExecutor:
         double_verbose: bool = False,
         plugin_runtime: Optional["PluginRuntime"] = None,
         query_progress_callback: Optional[Callable[[QueryProgressEvent], None]] = None,
+        query_runtime: Optional[DaemonQueryRuntime] = None,
     ):
         self.transcript_manager = transcript_manager
+        self.query_runtime = query_runtime or DaemonQueryRuntime()
         self.session_profile_manager = transcript_manager.session_profile_manager
         self.double_verbose = double_verbose
         self.plugin_runtime = plugin_runtime
@@ -720,6 +721,7 @@ class CommandExecutor:
         double_verbose = self.double_verbose or bool(
             getattr(args, "double_verbose", False)
         )
+        setup_timer = self.query_runtime.begin_query()
         client = AskyClient(
             AskyConfig(
                 model_alias=model_alias,
@@ -730,8 +732,10 @@ class CommandExecutor:
                 research_mode=bool(getattr(args, "research", False)),
                 disabled_tools=set(),
                 system_prompt_override=getattr(args, "system_prompt", None),
+                summarization_model_alias=profile.summarization_model or None,
             ),
             plugin_runtime=self.plugin_runtime,
+            model_config=self.query_runtime.model_config(model_alias),
         )
         request = AskyTurnRequest(
             query_text=query_text,
@@ -750,10 +754,8 @@ class CommandExecutor:
             ),
             shortlist_override=getattr(args, "shortlist", None),
         )
-        from rich.console import Console
-
         verbose_output_cb = (
-            build_verbose_output_callback(Console(highlight=False))
+            build_verbose_output_callback(self.query_runtime.verbose_console())
             if double_verbose
             else None
         )
@@ -763,7 +765,8 @@ class CommandExecutor:
             source="command_executor",
             emit_event=self.query_progress_callback,
         )
-        with _summarization_model_override(profile.summarization_model):
+        setup_timer.client_ready()
+        with _turn_trace(f"{jid} {model_alias}"):
             progress_adapter.emit_start(model_alias=model_alias)
             try:
                 result = client.run_turn(
@@ -773,7 +776,9 @@ class CommandExecutor:
                     summarization_status_callback=(
                         progress_adapter.summarization_status_callback
                     ),
-                    event_callback=progress_adapter.event_callback,
+                    event_callback=setup_timer.wrap_event_callback(
+                        progress_adapter.event_callback
+                    ),
                     preload_status_callback=progress_adapter.preload_status_callback,
                 )
             except Exception as exc:
@@ -1207,15 +1212,15 @@ def _download_text_file(url: str, *, timeout_seconds: int, max_bytes: int) -> st
 
 
 @contextmanager
-def _summarization_model_override(alias: str):
-    normalized = str(alias or "").strip()
-    if not normalized:
+def _turn_trace(label: str):
+    """Record one query turn for the admin console when turn tracing is enabled."""
+    if not XMPP_TRACE_TURNS:
         yield
         return
-    with _SUMMARIZATION_MODEL_OVERRIDE_LOCK:
-        original = summarization.SUMMARIZATION_MODEL
-        summarization.SUMMARIZATION_MODEL = normalized
-        try:
+    tracing.set_recent_trace_limit(XMPP_TRACE_HISTORY)
+    recorder = tracing.TraceRecorder(label=label)
+    try:
+        with tracing.recording(recorder):
             yield
-        finally:
-            summarization.SUMMARIZATION_MODEL = original
+    finally:
+        tracing.remember_trace(recorder)
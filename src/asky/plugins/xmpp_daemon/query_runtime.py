@@ -0,0 +1,203 @@
+"""Warm, shared state reused by every daemon query turn."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+QUERY_RUNTIME_METRICS_NAME = "xmpp_query_runtime"
+SETUP_EMA_ALPHA = 0.2
+
+
+class DaemonQueryRuntime:
+    """Process-lifetime state that per-message AskyClient instances borrow.
+
+    The daemon builds one of these at startup. `warm` pays the one-time
+    costs a first query would otherwise hit (research tool modules, the
+    embedding model, Chroma clients) on a background thread. Each message
+    then only builds cheap per-turn views: an AskyClient over a cached model
+    config, tool registries bound to that turn's trackers, and the shared
+    verbose console. Setup overhead per message is recorded for the admin
+    console.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._model_configs: Dict[str, Dict[str, Any]] = {}
+        self._console: Any = None
+        self._warm_thread: Optional[threading.Thread] = None
+        self._warm_state = "cold"
+        self._warm_ms: Dict[str, float] = {}
+        self._queries = 0
+        self._last_client_setup_ms = 0.0
+        self._avg_client_setup_ms = 0.0
+        self._max_client_setup_ms = 0.0
+        self._first_turn_samples = 0
+        self._last_first_turn_ms = 0.0
+        self._avg_first_turn_ms = 0.0
+        self._max_first_turn_ms = 0.0
+
+    def model_config(self, model_alias: str) -> Optional[Dict[str, Any]]:
+        """Return the resolved model config for an alias, cached per alias."""
+        from asky.config import MODELS
+
+        with self._lock:
+            cached = self._model_configs.get(model_alias)
+            if cached is None and model_alias in MODELS:
+                cached = copy.deepcopy(MODELS[model_alias])
+                self._model_configs[model_alias] = cached
+            return cached
+
+    def verbose_console(self) -> Any:
+        """Return the console shared by double-verbose daemon turns."""
+        with self._lock:
+            if self._console is None:
+                from rich.console import Console
+
+                self._console = Console(highlight=False)
+            return self._console
+
+    def start_warmup(self) -> None:
+        """Warm shared components on a daemon thread (once)."""
+        with self._lock:
+            if self._warm_thread is not None:
+                return
+            self._warm_state = "warming"
+            self._warm_thread = threading.Thread(
+                target=self.warm,
+                daemon=True,
+                name="asky-query-runtime-warmup",
+            )
+            self._warm_thread.start()
+
+    def warm(self) -> None:
+        """Load the components the first query turn would otherwise load."""
+        self._warm_step("tool_registries", _warm_tool_registries)
+        self._warm_step("embedding_client", _warm_embedding_client)
+        self._warm_step("chroma", _warm_chroma_clients)
+        with self._lock:
+            self._warm_state = "warm"
+
+    def begin_query(self) -> "QuerySetupTimer":
+        """Start timing one query's setup."""
+        return QuerySetupTimer(self, self._clock)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return warm-up status and per-message setup overhead."""
+        with self._lock:
+            return {
+                "warm_state": self._warm_state,
+                "warmup_ms": dict(self._warm_ms),
+                "cached_model_configs": len(self._model_configs),
+                "queries": self._queries,
+                "client_setup_last_ms": round(self._last_client_setup_ms, 2),
+                "client_setup_avg_ms": round(self._avg_client_setup_ms, 2),
+                "client_setup_max_ms": round(self._max_client_setup_ms, 2),
+                "first_turn_last_ms": round(self._last_first_turn_ms, 1),
+                "first_turn_avg_ms": round(self._avg_first_turn_ms, 1),
+                "first_turn_max_ms": round(self._max_first_turn_ms, 1),
+            }
+
+    def _warm_step(self, name: str, step: Callable[[], None]) -> None:
+        started = self._clock()
+        try:
+            step()
+        except Exception as exc:
+            logger.debug("query runtime warm-up step %s failed: %s", name, exc)
+        elapsed_ms = (self._clock() - started) * 1000.0
+        with self._lock:
+            self._warm_ms[name] = round(elapsed_ms, 1)
+
+    def _record_client_setup(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self._queries += 1
+            self._last_client_setup_ms = elapsed_ms
+            self._max_client_setup_ms = max(self._max_client_setup_ms, elapsed_ms)
+            self._avg_client_setup_ms = _ema(
+                self._avg_client_setup_ms, elapsed_ms, self._queries
+            )
+
+    def _record_first_turn(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self._first_turn_samples += 1
+            self._last_first_turn_ms = elapsed_ms
+            self._max_first_turn_ms = max(self._max_first_turn_ms, elapsed_ms)
+            self._avg_first_turn_ms = _ema(
+                self._avg_first_turn_ms, elapsed_ms, self._first_turn_samples
+            )
+
+
+class QuerySetupTimer:
+    """Measures one query's setup: client construction and time to first LLM turn.
+
+    `client_ready` marks the end of per-message object construction. The
+    first `turn_start` engine event marks the end of session, preload and
+    tool-registry setup inside `run_turn`.
+    """
+
+    def __init__(self, runtime: DaemonQueryRuntime, clock: Callable[[], float]):
+        self._runtime = runtime
+        self._clock = clock
+        self._started = clock()
+        self._first_turn_seen = False
+
+    def client_ready(self) -> None:
+        self._runtime._record_client_setup((self._clock() - self._started) * 1000.0)
+
+    def wrap_event_callback(
+        self, callback: Optional[Callable[[str, dict], None]]
+    ) -> Callable[[str, dict], None]:
+        def _event_callback(name: str, payload: dict) -> None:
+            if name == "turn_start" and not self._first_turn_seen:
+                self._first_turn_seen = True
+                self._runtime._record_first_turn(
+                    (self._clock() - self._started) * 1000.0
+                )
+            if callback is not None:
+                callback(name, payload)
+
+        return _event_callback
+
+
+def _ema(average: float, sample: float, count: int) -> float:
+    if count <= 1:
+        return sample
+    return average + SETUP_EMA_ALPHA * (sample - average)
+
+
+def _warm_tool_registries() -> None:
+    # Registries bind per-turn trackers and callbacks, so they are rebuilt per
+    # message; building one of each mode here imports their modules and the
+    # research bindings so those builds stay sub-millisecond.
+    from asky.core.tool_registry_factory import (
+        create_research_tool_registry,
+        create_tool_registry,
+    )
+
+    create_tool_registry()
+    create_research_tool_registry()
+
+
+def _warm_embedding_client() -> None:
+    from asky.research.embeddings import get_embedding_client
+
+    get_embedding_client().is_available()
+
+
+def _warm_chroma_clients() -> None:
+    from asky.config import RESEARCH_CHROMA_PERSIST_DIRECTORY
+    from asky.memory.vector_ops import _get_chroma_client
+    from asky.research.vector_store import get_vector_store
+
+    get_vector_store()._get_chroma_client()
+    _get_chroma_client(RESEARCH_CHROMA_PERSIST_DIRECTORY)
@@ -0,0 +1,205 @@
+"""Bounded keyed worker pool for XMPP daemon message processing."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKER_COUNT = 4
+DEFAULT_MAX_QUEUE_DEPTH = 10
+DEFAULT_IDLE_KEY_TTL_SECONDS = 300.0
+WAIT_TIME_EMA_ALPHA = 0.2
+
+
+@dataclass
+class _KeyState:
+    """Serial task queue and bookkeeping for one key (JID or room)."""
+
+    tasks: Deque[Tuple[Callable[[], None], float]] = field(default_factory=deque)
+    busy: bool = False
+    last_active: float = 0.0
+
+
+class KeyedWorkerPool:
+    """Fixed-size thread pool that runs tasks serially per key.
+
+    Tasks for the same key never overlap and run in submission order. Keys
+    with pending work are served round-robin, one task per turn, so a busy
+    room cannot starve other contacts. Each key has a queue-depth limit;
+    `submit` returns False instead of queueing when it is reached. Idle keys
+    are forgotten after `idle_ttl_seconds`.
+    """
+
+    def __init__(
+        self,
+        *,
+        worker_count: int = DEFAULT_WORKER_COUNT,
+        max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH,
+        idle_ttl_seconds: float = DEFAULT_IDLE_KEY_TTL_SECONDS,
+        thread_name_prefix: str = "asky-xmpp-worker",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.worker_count = max(1, int(worker_count))
+        self.max_queue_depth = max(1, int(max_queue_depth))
+        self.idle_ttl_seconds = max(0.0, float(idle_ttl_seconds))
+        self._thread_name_prefix = thread_name_prefix
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._keys: Dict[str, _KeyState] = {}
+        self._ready: Deque[str] = deque()
+        self._workers: list[threading.Thread] = []
+        self._stopping = False
+        self._busy_workers = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._failed = 0
+        self._wait_samples = 0
+        self._max_wait_seconds = 0.0
+        self._avg_wait_seconds = 0.0
+
+    def submit(self, key: str, task: Callable[[], None]) -> bool:
+        """Queue a task for a key. Returns False when the key's queue is full."""
+        with self._condition:
+            if self._stopping:
+                return False
+            self._ensure_workers()
+            state = self._keys.get(key)
+            if state is None:
+                state = _KeyState(last_active=self._clock())
+                self._keys[key] = state
+            if len(state.tasks) >= self.max_queue_depth:
+                self._rejected += 1
+                return False
+            state.tasks.append((task, self._clock()))
+            self._submitted += 1
+            if not state.busy and len(state.tasks) == 1:
+                self._ready.append(key)
+                self._condition.notify()
+            return True
+
+    def queue_depth(self, key: str) -> int:
+        with self._condition:
+            state = self._keys.get(key)
+            return len(state.tasks) if state is not None else 0
+
+    def shutdown(self, *, wait: bool = False, timeout: Optional[float] = None) -> None:
+        """Stop accepting work and let workers exit once queues drain."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            workers = list(self._workers)
+        if wait:
+            for worker in workers:
+                worker.join(timeout=timeout)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return queue depth and wait-time metrics for the admin console."""
+        with self._condition:
+            depths = {
+                key: len(state.tasks) for key, state in self._keys.items() if state.tasks
+            }
+            return {
+                "workers": self.worker_count,
+                "busy_workers": self._busy_workers,
+                "tracked_keys": len(self._keys),
+                "queued_tasks": sum(depths.values()),
+                "max_queue_depth": self.max_queue_depth,
+                "queue_depths": depths,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._avg_wait_seconds * 1000.0, 1),
+                "max_wait_ms": round(self._max_wait_seconds * 1000.0, 1),
+            }
+
+    def _ensure_workers(self) -> None:
+        if self._workers:
+            return
+        for index in range(self.worker_count):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                daemon=True,
+                name=f"{self._thread_name_prefix}-{index}",
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _next_task(self) -> Optional[Tuple[str, Callable[[], None]]]:
+        with self._condition:
+            while not self._ready:
+                if self._stopping:
+                    return None
+                timed_out = not self._condition.wait(timeout=self._reap_interval())
+                if timed_out:
+                    self._reap_idle_keys()
+            key = self._ready.popleft()
+            state = self._keys[key]
+            task, enqueued_at = state.tasks.popleft()
+            state.busy = True
+            self._busy_workers += 1
+            self._record_wait(self._clock() - enqueued_at)
+            return key, task
+
+    def _worker_loop(self) -> None:
+        while True:
+            item = self._next_task()
+            if item is None:
+                return
+            key, task = item
+            failed = False
+            try:
+                task()
+            except Exception:
+                failed = True
+                logger.exception("failed to process daemon task for key=%s", key)
+            finally:
+                self._finish_task(key, failed=failed)
+
+    def _finish_task(self, key: str, *, failed: bool) -> None:
+        with self._condition:
+            state = self._keys[key]
+            state.busy = False
+            state.last_active = self._clock()
+            self._busy_workers -= 1
+            self._completed += 1
+            if failed:
+                self._failed += 1
+            if state.tasks:
+                # Re-enter at the back of the ring for round-robin fairness.
+                self._ready.append(key)
+                self._condition.notify()
+            self._reap_idle_keys()
+
+    def _reap_idle_keys(self) -> None:
+        now = self._clock()
+        idle = [
+            key
+            for key, state in self._keys.items()
+            if not state.busy
+            and not state.tasks
+            and now - state.last_active >= self.idle_ttl_seconds
+        ]
+        for key in idle:
+            del self._keys[key]
+
+    def _reap_interval(self) -> Optional[float]:
+        if not self._keys:
+            return None
+        return max(1.0, self.idle_ttl_seconds)
+
+    def _record_wait(self, waited: float) -> None:
+        waited = max(0.0, waited)
+        self._max_wait_seconds = max(self._max_wait_seconds, waited)
+        if self._wait_samples == 0:
+            self._avg_wait_seconds = waited
+        else:
+            self._avg_wait_seconds += WAIT_TIME_EMA_ALPHA * (waited - self._avg_wait_seconds)
+        self._wait_samples += 1
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import queue
 import re
 import threading
 from typing import Any, Callable, Optional
@@ -24,8 +23,13 @@ from asky.config import (
     XMPP_RESPONSE_CHUNK_CHARS,
     XMPP_TRANSCRIPT_MAX_PER_SESSION,
     XMPP_CLIENT_CAPABILITIES,
+    XMPP_IDLE_JID_TTL_SECONDS,
+    XMPP_MAX_QUEUE_DEPTH_PER_JID,
+    XMPP_WARM_RUNTIME,
+    XMPP_WORKER_COUNT,
 )
 from asky.daemon.errors import DaemonUserError
+from asky.daemon.metrics import register_metrics_provider, unregister_metrics_provider
 from asky.plugins.xmpp_daemon.adhoc_commands import AdHocCommandHandler
 from asky.plugins.xmpp_daemon.chunking import chunk_text
 from asky.plugins.xmpp_daemon.command_executor import CommandExecutor
@@ -44,8 +48,13 @@ from asky.plugins.xmpp_daemon.query_progress import (
     QueryProgressEvent,
     QueryStatusPublisher,
 )
+from asky.plugins.xmpp_daemon.query_runtime import (
+    QUERY_RUNTIME_METRICS_NAME,
+    DaemonQueryRuntime,
+)
 from asky.plugins.xmpp_daemon.router import DaemonRouter
 from asky.plugins.xmpp_daemon.transcript_manager import TranscriptManager
+from asky.plugins.xmpp_daemon.worker_pool import KeyedWorkerPool
 from asky.plugins.xmpp_daemon.xmpp_client import AskyXMPPClient
 from asky.plugins.xmpp_daemon.constants import (
     XMPP_IMAGE_STORAGE_DIR,
@@ -60,6 +69,11 @@ IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".gif")
 GENERIC_ADHOC_QUERY_ERROR = (
     "Error: failed to execute the requested command. Please try again."
 )
+QUEUE_FULL_REPLY = (
+    "Busy: {depth} messages are already waiting for you. "
+    "Please wait for them to finish before sending more."
+)
+WORKER_POOL_METRICS_NAME = "xmpp_worker_pool"
 
 
 """XMPP transport: wires daemon router, background workers, and XMPP client."""
@@ -84,11 +98,13 @@ class XMPPService:
         self.transcript_manager = TranscriptManager(
             transcript_cap=XMPP_TRANSCRIPT_MAX_PER_SESSION
         )
+        self.query_runtime = DaemonQueryRuntime()
         self.command_executor = CommandExecutor(
             self.transcript_manager,
             double_verbose=double_verbose,
             plugin_runtime=self.plugin_runtime,
             query_progress_callback=self._on_query_progress_event,
+            query_runtime=self.query_runtime,
         )
         self.interface_planner = InterfacePlanner(
             INTERFACE_MODEL,
@@ -145,9 +161,13 @@ class XMPPService:
             image_enabled=True,
             query_dispatch_callback=self._schedule_adhoc_query,
         )
-        self._jid_queues: dict[str, queue.Queue[Callable[[], None]]] = {}
-        self._jid_workers: dict[str, threading.Thread] = {}
-        self._jid_workers_lock = threading.Lock()
+        self._worker_pool = KeyedWorkerPool(
+            worker_count=XMPP_WORKER_COUNT,
+            max_queue_depth=XMPP_MAX_QUEUE_DEPTH_PER_JID,
+            idle_ttl_seconds=XMPP_IDLE_JID_TTL_SECONDS,
+        )
+        register_metrics_provider(WORKER_POOL_METRICS_NAME, self._worker_pool.snapshot)
+        register_metrics_provider(QUERY_RUNTIME_METRICS_NAME, self.query_runtime.snapshot)
         self._query_publishers: dict[str, QueryStatusPublisher] = {}
         self._query_publishers_lock = threading.Lock()
         self._client = AskyXMPPClient(
@@ -173,12 +193,19 @@ class XMPPService:
 
     def run(self) -> None:
         """Blocking foreground loop: connect XMPP and process messages."""
+        if XMPP_WARM_RUNTIME:
+            self.query_runtime.start_warmup()
         self._client.start_foreground()
 
     def stop(self) -> None:
         """Request graceful shutdown of the XMPP client and worker threads."""
         logger.info("XMPPService stop requested")
         set_file_upload_service(None)
+        worker_pool = getattr(self, "_worker_pool", None)
+        if worker_pool is not None:
+            worker_pool.shutdown()
+            unregister_metrics_provider(WORKER_POOL_METRICS_NAME)
+        unregister_metrics_provider(QUERY_RUNTIME_METRICS_NAME)
         self.voice_transcriber.shutdown()
         self.image_transcriber.shutdown()
         self._client.stop()
@@ -188,6 +215,11 @@ class XMPPService:
         if not from_jid:
             return
         queue_key = _resolve_queue_key(payload, fallback_jid=from_jid)
+        reply_target = _resolve_reply_target(
+            from_jid=from_jid,
+            message_type=str(payload.get("type", "") or "").strip().lower(),
+            room_jid=str(payload.get("room_jid", "") or "").strip().lower(),
+        )
 
         def _task() -> None:
             oob_urls = payload.get("oob_urls", []) or []
@@ -310,7 +342,7 @@ class XMPPService:
                     message_type=target_message_type,
                 )
 
-        self._enqueue_for_jid(queue_key, _task)
+        self._enqueue_for_jid(queue_key, _task, reply_target=reply_target)
 
     def _schedule_adhoc_query(
         self,
@@ -356,31 +388,26 @@ class XMPPService:
 
         self._enqueue_for_jid(normalized_jid, _task)
 
-    def _enqueue_for_jid(self, jid: str, task: Callable[[], None]) -> None:
-        if jid not in self._jid_queues:
-            self._jid_queues[jid] = queue.Queue()
-        with self._jid_workers_lock:
-            if jid not in self._jid_workers or not self._jid_workers[jid].is_alive():
-                worker = threading.Thread(
-                    target=self._jid_worker_loop,
-                    args=(jid,),
-                    daemon=True,
-                    name=f"asky-xmpp-{jid}",
-                )
-                worker.start()
-                self._jid_workers[jid] = worker
-        self._jid_queues[jid].put(task)
-
-    def _jid_worker_loop(self, jid: str) -> None:
-        jid_queue = self._jid_queues[jid]
-        while True:
-            task = jid_queue.get()
-            try:
-                task()
-            except Exception:
-                logger.exception("failed to process daemon task for jid=%s", jid)
-            finally:
-                jid_queue.task_done()
+    def _enqueue_for_jid(
+        self,
+        jid: str,
+        task: Callable[[], None],
+        *,
+        reply_target: Optional[tuple[str, str]] = None,
+    ) -> None:
+        if self._worker_pool.submit(jid, task):
+            return
+        depth = self._worker_pool.queue_depth(jid)
+        logger.warning("daemon queue full for jid=%s depth=%s", jid, depth)
+        target_jid, message_type = reply_target or (jid, "chat")
+        try:
+            self._send_chunked(
+                target_jid,
+                QUEUE_FULL_REPLY.format(depth=depth),
+                message_type=message_type,
+            )
+        except Exception:
+            logger.exception("failed to send queue-full reply to jid=%s", target_jid)
 
     def _send_chunked(self, jid: str, text: str, *, message_type: str = "chat") -> None:
         model = extract_markdown_tables(text)
@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 import re
 import shutil
 import webbrowser
@@ -8,6 +9,7 @@ from importlib.metadata import version as _pkg_version
 from pathlib import Path
 from typing import Optional, Tuple, List
 
+from asky.archive_index import ARCHIVE_INDEX_PAGES_DIRNAME, ArchiveIndex
 from asky.config import ARCHIVE_DIR
 from asky.core.utils import generate_slug
 
@@ -223,6 +225,70 @@ def save_html_report(
         return "", ""
 
 
+_LEGACY_ENTRIES_MARKER_START = "/* ENTRIES_JSON_START */"
+_LEGACY_ENTRIES_MARKER_END = "/* ENTRIES_JSON_END */"
+
+
+def _get_archive_index() -> ArchiveIndex:
+    return ArchiveIndex(ARCHIVE_DIR)
+
+
+def _read_legacy_index_entries(index_path: Path) -> List[dict]:
+    """Return entries embedded in a pre-store index.html, if any."""
+    if not index_path.exists():
+        return []
+    try:
+        content = index_path.read_text()
+        if _LEGACY_ENTRIES_MARKER_START not in content or _LEGACY_ENTRIES_MARKER_END not in content:
+            return []
+        json_str = (
+            content.split(_LEGACY_ENTRIES_MARKER_START)[1]
+            .split(_LEGACY_ENTRIES_MARKER_END)[0]
+            .strip()
+        )
+        return list(json.loads(json_str))
+    except Exception as e:
+        logger.warning(f"Could not parse existing index.html: {e}")
+        return []
+
+
+def _render_index_html(current_ver: str) -> str:
+    return f"""<!doctype html>
+<html>
+  <head>
+    <meta charset="UTF-8" />
+    <title>asky History</title>
+    <link rel="icon" type="image/png" href="assets/asky-icon.png">
+    <link rel="stylesheet" href="assets/asky-sidebar_v{current_ver}.css">
+  </head>
+  <body>
+    <div class="sidebar">
+      <div class="sidebar-header">
+        <h2>asky History</h2>
+        <div class="controls">
+          <button id="sort-date" class="btn active">By Date</button>
+          <button id="sort-alpha" class="btn">A-Z</button>
+          <button id="toggle-group" class="btn">Group</button>
+        </div>
+      </div>
+      <div class="index-list-container">
+        <ul id="index-list"></ul>
+        <button id="load-more" class="btn load-more" hidden>Load older</button>
+      </div>
+    </div>
+    <div class="content-area">
+      <iframe id="content-frame" name="content-frame"></iframe>
+    </div>
+
+    <script>
+      const INDEX_PAGES_DIR = "{ARCHIVE_INDEX_PAGES_DIRNAME}";
+    </script>
+    <script src="assets/asky-sidebar_v{current_ver}.js"></script>
+  </body>
+</html>
+"""
+
+
 def _update_sidebar_index(
     filename: str,
     display_title: str,
@@ -231,12 +297,19 @@ def _update_sidebar_index(
     session_id: Optional[int] = None,
     converted_message_id: Optional[int] = None,
 ) -> List[str]:
-    """Update the sidebar index HTML file with the latest generated report.
+    """Record the latest generated report in the archive index.
+
+    The entry is appended to the SQLite-backed `ArchiveIndex`, which
+    republishes only the page shard it touched; `index.html` itself is a
+    static shell rewritten only when the asky version changes.
 
     Args:
         filename: The filename of the newly generated HTML report.
         display_title: The title to display for the link.
         session_name: The name of the session this report belongs to.
+
+    Returns:
+        Archive-relative filenames of reports superseded by this one.
     """
     if not ARCHIVE_DIR.exists():
         ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
@@ -261,80 +334,29 @@ def _update_sidebar_index(
         "session_id": session_id,
     }
 
-    current_ver = _asky_version()
     index_path = ARCHIVE_DIR / "index.html"
-    entries = []
-
-    if index_path.exists():
-        try:
-            with open(index_path, "r") as f:
-                content = f.read()
-                # Extract JSON from the ENTRIES_JSON marker
-                marker_start = "/* ENTRIES_JSON_START */"
-                marker_end = "/* ENTRIES_JSON_END */"
-                if marker_start in content and marker_end in content:
-                    json_str = (
-                        content.split(marker_start)[1].split(marker_end)[0].strip()
-                    )
-                    entries = json.loads(json_str)
-        except Exception as e:
-            logger.warning(f"Could not parse existing index.html: {e}")
-
-    # Process entries to find and remove superseded ones
-    new_entries = []
-    superseded_filenames = []
-
-    for e in entries:
-        if session_id is not None and e.get("session_id") == session_id:
-            superseded_filenames.append(e.get("filename"))
-        elif converted_message_id is not None and e.get("message_id") == converted_message_id and session_id is not None:
-            superseded_filenames.append(e.get("filename"))
-        else:
-            new_entries.append(e)
-
-    # Add new entry (avoid duplicates, insert at top)
-    if not any(e.get("filename") == new_entry["filename"] for e in new_entries):
-        new_entries.insert(0, new_entry)
-
-    # Clean up entries (keep them unique and sorted by date by default)
-    # We always rewrite the file to ensure the JS logic is up to date
-    entries_json = json.dumps(new_entries, indent=2)
-
-    base_html = f"""<!doctype html>
-<html>
-  <head>
-    <meta charset="UTF-8" />
-    <title>asky History</title>
-    <link rel="icon" type="image/png" href="assets/asky-icon.png">
-    <link rel="stylesheet" href="assets/asky-sidebar_v{current_ver}.css">
-  </head>
-  <body>
-    <div class="sidebar">
-      <div class="sidebar-header">
-        <h2>asky History</h2>
-        <div class="controls">
-          <button id="sort-date" class="btn active">By Date</button>
-          <button id="sort-alpha" class="btn">A-Z</button>
-          <button id="toggle-group" class="btn">Group</button>
-        </div>
-      </div>
-      <div class="index-list-container">
-        <ul id="index-list"></ul>
-      </div>
-    </div>
-    <div class="content-area">
-      <iframe id="content-frame" name="content-frame"></iframe>
-    </div>
+    archive_index = _get_archive_index()
+    if not archive_index.exists():
+        legacy_entries = _read_legacy_index_entries(index_path)
+        if legacy_entries:
+            imported = archive_index.import_entries(legacy_entries)
+            logger.info(f"Migrated {imported} archive entries from index.html")
+
+    superseded_filenames = archive_index.add_entry(
+        new_entry,
+        session_id=session_id,
+        converted_message_id=converted_message_id,
+    )
 
-    <script>
-      const ENTRIES = /* ENTRIES_JSON_START */ {entries_json} /* ENTRIES_JSON_END */;
-    </script>
-    <script src="assets/asky-sidebar_v{current_ver}.js"></script>
-  </body>
-</html>
-"""
-    with open(index_path, "w") as f:
-        f.write(base_html)
+    base_html = _render_index_html(_asky_version())
+    try:
+        current_html = index_path.read_text() if index_path.exists() else ""
+    except OSError:
+        current_html = ""
+    if current_html != base_html:
+        tmp_path = index_path.with_name(f".index.html.{os.getpid()}.tmp")
+        tmp_path.write_text(base_html)
+        os.replace(tmp_path, index_path)
 
     return superseded_filenames
 
@@ -9,6 +9,7 @@ from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set
 
+from asky import tracing
 from asky.config import (
     DB_PATH,
     RESEARCH_CACHE_TTL_HOURS,
@@ -16,11 +17,65 @@ from asky.config import (
     SUMMARIZE_PAGE_PROMPT,
 )
 
+from asky.research.content_store import (
+    CHUNK_OFFSET_COLUMNS,
+    compact_research_store,
+    decode_text,
+    delete_chunks,
+    encode_text,
+    rebuild_chunk_fts,
+)
+
 logger = logging.getLogger(__name__)
 CHUNK_FTS_TABLE_NAME = "content_chunks_fts"
 BACKGROUND_SUMMARY_INPUT_CHARS = 24000
 BACKGROUND_SUMMARY_MAX_OUTPUT_CHARS = 800
 DEFAULT_LIST_CACHED_SOURCES_LIMIT = 50
+REVALIDATION_COLUMNS = ("etag", "last_modified", "final_url", "content_type")
+# How a `fetch_url_document` result was extracted, so cache hits are only
+# served to callers asking for the same shape.
+DOCUMENT_COLUMNS = (
+    ("output_format", "TEXT"),
+    ("page_type", "TEXT"),
+    ("published_date", "TEXT"),
+    ("links_included", "INTEGER"),
+)
+# Reads refresh `last_accessed_at` at most this often per row, so LRU
+# tracking does not turn every cache hit into a write.
+ACCESS_TOUCH_INTERVAL_SECONDS = 300
+META_TABLE_NAME = "research_cache_meta"
+# Approximate stored bytes per cache row (content, summary and links, plus its
+# chunk text/vectors and link vectors) are kept in `entry_bytes`. Triggers
+# reset it to NULL when the row, its chunks or its link embeddings change, and
+# only those rows are re-measured before the budget is checked.
+REFRESH_ENTRY_BYTES_SQL = """
+    UPDATE research_cache
+    SET entry_bytes =
+        COALESCE(length(content), 0)
+        + COALESCE(length(summary), 0)
+        + COALESCE(length(links_json), 0)
+        + COALESCE((SELECT SUM(COALESCE(length(cc.chunk_text), 0)
+                               + COALESCE(length(cc.embedding), 0))
+                    FROM content_chunks cc WHERE cc.cache_id = research_cache.id), 0)
+        + COALESCE((SELECT SUM(COALESCE(length(le.link_text), 0)
+                               + COALESCE(length(le.link_url), 0)
+                               + COALESCE(length(le.embedding), 0))
+                    FROM link_embeddings le WHERE le.cache_id = research_cache.id), 0)
+    WHERE entry_bytes IS NULL
+"""
+# (trigger name, event, row holding the cache id) for the entry_bytes triggers.
+ENTRY_BYTES_TRIGGERS = (
+    ("research_cache_bytes_au", "UPDATE OF content, summary, links_json ON research_cache", "NEW.id"),
+    ("content_chunks_bytes_ai", "INSERT ON content_chunks", "NEW.cache_id"),
+    ("content_chunks_bytes_au", "UPDATE OF chunk_text, embedding ON content_chunks", "NEW.cache_id"),
+    ("content_chunks_bytes_ad", "DELETE ON content_chunks", "OLD.cache_id"),
+    ("link_embeddings_bytes_ai", "INSERT ON link_embeddings", "NEW.cache_id"),
+    ("link_embeddings_bytes_au", "UPDATE OF embedding ON link_embeddings", "NEW.cache_id"),
+    ("link_embeddings_bytes_ad", "DELETE ON link_embeddings", "OLD.cache_id"),
+)
+LEGACY_CHUNK_FTS_TRIGGERS = ("content_chunks_ai", "content_chunks_ad", "content_chunks_au")
+SQLITE_AUTO_VACUUM_INCREMENTAL = 2
+INCREMENTAL_VACUUM_CONVERT_MIN_FREE_BYTES = 32 * 1024 * 1024
 
 
 class ResearchCache:
@@ -56,7 +111,11 @@ class ResearchCache:
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get a database connection."""
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+        return sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            factory=tracing.sqlite_connection_factory(),
+        )
 
     def init_db(self) -> None:
         """Initialize research cache tables."""
@@ -98,6 +157,63 @@ class ResearchCache:
         """
         )
 
+        # HTTP validators for conditional revalidation of stale rows.
+        for column_name in REVALIDATION_COLUMNS:
+            self._ensure_column(
+                cursor=c,
+                table_name="research_cache",
+                column_name=column_name,
+                column_sql_type="TEXT",
+            )
+
+        for column_name, column_sql_type in DOCUMENT_COLUMNS:
+            self._ensure_column(
+                cursor=c,
+                table_name="research_cache",
+                column_name=column_name,
+                column_sql_type=column_sql_type,
+            )
+
+        self._ensure_column(
+            cursor=c,
+            table_name="research_cache",
+            column_name="last_accessed_at",
+            column_sql_type="TEXT",
+        )
+        self._ensure_column(
+            cursor=c,
+            table_name="research_cache",
+            column_name="entry_bytes",
+            column_sql_type="INTEGER",
+        )
+        # Covers both the LRU scan and the byte total, so neither reads rows.
+        c.execute("DROP INDEX IF EXISTS idx_research_cache_last_accessed")
+        c.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_research_cache_lru
+            ON research_cache(last_accessed_at, entry_bytes)
+        """
+        )
+        c.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_research_cache_unmeasured
+            ON research_cache(id) WHERE entry_bytes IS NULL
+        """
+        )
+        # Rows from before LRU tracking count as last used when last updated.
+        c.execute(
+            "UPDATE research_cache SET last_accessed_at = updated_at "
+            "WHERE last_accessed_at IS NULL"
+        )
+        c.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {META_TABLE_NAME} (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """
+        )
+
         # Content chunks table for RAG
         c.execute(
             """
@@ -121,6 +237,13 @@ class ResearchCache:
             ON content_chunks(cache_id)
         """
         )
+        for column_name in CHUNK_OFFSET_COLUMNS:
+            self._ensure_column(
+                cursor=c,
+                table_name="content_chunks",
+                column_name=column_name,
+                column_sql_type="INTEGER",
+            )
         self._init_chunk_fts_index(c)
 
         # Link embeddings table for relevance filtering
@@ -153,6 +276,16 @@ class ResearchCache:
             column_name="embedding_model",
             column_sql_type="TEXT",
         )
+        for trigger_name, event, cache_id_ref in ENTRY_BYTES_TRIGGERS:
+            c.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {trigger_name} AFTER {event}
+                BEGIN
+                    UPDATE research_cache SET entry_bytes = NULL
+                    WHERE id = {cache_id_ref} AND entry_bytes IS NOT NULL;
+                END
+            """
+            )
 
         # Research findings table for persistent memory across sessions
         c.execute(
@@ -183,55 +316,31 @@ class ResearchCache:
         logger.debug("Research cache database initialized")
 
     def _init_chunk_fts_index(self, cursor: sqlite3.Cursor) -> None:
-        """Initialize FTS index and triggers for chunk_text BM25 search."""
+        """Initialize the contentless FTS index for chunk_text BM25 search.
+
+        Chunk text may be compressed or stored as offsets into the parent
+        document, so postings are written by `content_store` rather than by
+        triggers. Indexes from older versions (external-content tables kept
+        in sync by triggers) are replaced and rebuilt once.
+        """
         try:
             cursor.execute(
-                f"""
-                CREATE VIRTUAL TABLE IF NOT EXISTS {CHUNK_FTS_TABLE_NAME}
-                USING fts5(
-                    chunk_text,
-                    content='content_chunks',
-                    content_rowid='id'
-                )
-                """
-            )
-            cursor.execute(
-                f"""
-                CREATE TRIGGER IF NOT EXISTS content_chunks_ai
-                AFTER INSERT ON content_chunks
-                BEGIN
-                    INSERT INTO {CHUNK_FTS_TABLE_NAME}(rowid, chunk_text)
-                    VALUES (new.id, new.chunk_text);
-                END
-                """
-            )
-            cursor.execute(
-                f"""
-                CREATE TRIGGER IF NOT EXISTS content_chunks_ad
-                AFTER DELETE ON content_chunks
-                BEGIN
-                    INSERT INTO {CHUNK_FTS_TABLE_NAME}({CHUNK_FTS_TABLE_NAME}, rowid, chunk_text)
-                    VALUES('delete', old.id, old.chunk_text);
-                END
-                """
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (CHUNK_FTS_TABLE_NAME,),
             )
+            row = cursor.fetchone()
+            if row and "content=''" in (row[0] or ""):
+                return
+            for trigger_name in LEGACY_CHUNK_FTS_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+            cursor.execute(f"DROP TABLE IF EXISTS {CHUNK_FTS_TABLE_NAME}")
             cursor.execute(
                 f"""
-                CREATE TRIGGER IF NOT EXISTS content_chunks_au
-                AFTER UPDATE ON content_chunks
-                BEGIN
-                    INSERT INTO {CHUNK_FTS_TABLE_NAME}({CHUNK_FTS_TABLE_NAME}, rowid, chunk_text)
-                    VALUES('delete', old.id, old.chunk_text);
-                    INSERT INTO {CHUNK_FTS_TABLE_NAME}(rowid, chunk_text)
-                    VALUES (new.id, new.chunk_text);
-                END
+                CREATE VIRTUAL TABLE {CHUNK_FTS_TABLE_NAME}
+                USING fts5(chunk_text, content='')
                 """
             )
-
-            # Ensure legacy rows (before trigger/index creation) are indexed.
-            cursor.execute(
-                f"INSERT INTO {CHUNK_FTS_TABLE_NAME}({CHUNK_FTS_TABLE_NAME}) VALUES('rebuild')"
-            )
+            rebuild_chunk_fts(cursor)
         except sqlite3.OperationalError as exc:
             logger.warning(f"FTS5 unavailable, BM25 lexical search disabled: {exc}")
 
@@ -260,7 +369,7 @@ class ResearchCache:
     ) -> None:
         """Remove stale vector rows tied to outdated cached payloads."""
         if clear_chunks:
-            cursor.execute("DELETE FROM content_chunks WHERE cache_id = ?", (cache_id,))
+            delete_chunks(cursor, [cache_id])
         if clear_links:
             cursor.execute(
                 "DELETE FROM link_embeddings WHERE cache_id = ?", (cache_id,)
@@ -320,6 +429,24 @@ class ResearchCache:
         """Generate hash for content change detection."""
         return hashlib.md5(content.encode()).hexdigest()
 
+    def _touch(self, cache_id: int, last_accessed_at: Optional[str]) -> None:
+        """Record a read for LRU eviction, at most once per touch interval."""
+        now = datetime.now()
+        threshold = (now - timedelta(seconds=ACCESS_TOUCH_INTERVAL_SECONDS)).isoformat()
+        if last_accessed_at and last_accessed_at > threshold:
+            return
+        try:
+            with self._db_lock:
+                conn = self._get_conn()
+                conn.execute(
+                    "UPDATE research_cache SET last_accessed_at = ? WHERE id = ?",
+                    (now.isoformat(), cache_id),
+                )
+                conn.commit()
+                conn.close()
+        except sqlite3.Error as exc:
+            logger.debug("Skipping cache access update for id=%s: %s", cache_id, exc)
+
     def get_cached(self, url: str) -> Optional[Dict[str, Any]]:
         """Get cached content if valid (not expired)."""
         conn = self._get_conn()
@@ -329,7 +456,7 @@ class ResearchCache:
         c.execute(
             """
             SELECT id, content, title, summary, summary_status, links_json,
-                   fetch_timestamp, expires_at
+                   fetch_timestamp, expires_at, last_accessed_at
             FROM research_cache
             WHERE url_hash = ? AND expires_at > ?
         """,
@@ -340,10 +467,11 @@ class ResearchCache:
         conn.close()
 
         if row:
+            self._touch(row[0], row[8])
             return {
                 "id": row[0],
                 "url": url,
-                "content": row[1],
+                "content": decode_text(row[1]),
                 "title": row[2],
                 "summary": row[3],
                 "summary_status": row[4],
@@ -354,6 +482,63 @@ class ResearchCache:
             }
         return None
 
+    def get_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get a cached row with its HTTP validators, even if it has expired.
+
+        The returned dict carries `expired` so callers can decide between
+        serving it directly and revalidating it with a conditional request.
+        """
+        conn = self._get_conn()
+        c = conn.cursor()
+        c.execute(
+            """
+            SELECT id, content, title, links_json, fetch_timestamp, expires_at,
+                   etag, last_modified, final_url, content_type, last_accessed_at,
+                   output_format, page_type, published_date, links_included
+            FROM research_cache
+            WHERE url_hash = ?
+        """,
+            (self._url_hash(url),),
+        )
+        row = c.fetchone()
+        conn.close()
+
+        if not row:
+            return None
+        self._touch(row[0], row[10])
+        return {
+            "id": row[0],
+            "url": url,
+            "content": decode_text(row[1]),
+            "title": row[2],
+            "links": json.loads(row[3]) if row[3] else [],
+            "fetch_timestamp": row[4],
+            "expires_at": row[5],
+            "etag": row[6],
+            "last_modified": row[7],
+            "final_url": row[8],
+            "content_type": row[9],
+            "output_format": row[11],
+            "page_type": row[12],
+            "published_date": row[13],
+            "links_included": bool(row[14]),
+            "expired": row[5] <= datetime.now().isoformat(),
+        }
+
+    def extend_expiry(self, cache_id: int) -> str:
+        """Restart the TTL of a row after the origin confirmed it is unchanged."""
+        now = datetime.now()
+        expires_at = (now + timedelta(hours=self.ttl_hours)).isoformat()
+        with self._db_lock:
+            conn = self._get_conn()
+            conn.execute(
+                "UPDATE research_cache SET expires_at = ?, fetch_timestamp = ? WHERE id = ?",
+                (expires_at, now.isoformat(), cache_id),
+            )
+            conn.commit()
+            conn.close()
+        return expires_at
+
     def get_cached_by_id(self, cache_id: int) -> Optional[Dict[str, Any]]:
         """Get cached content by cache ID if valid (not expired)."""
         conn = self._get_conn()
@@ -363,7 +548,7 @@ class ResearchCache:
         c.execute(
             """
             SELECT id, url, content, title, summary, summary_status, links_json,
-                   fetch_timestamp, expires_at
+                   fetch_timestamp, expires_at, last_accessed_at
             FROM research_cache
             WHERE id = ? AND expires_at > ?
         """,
@@ -373,10 +558,11 @@ class ResearchCache:
         conn.close()
 
         if row:
+            self._touch(row[0], row[9])
             return {
                 "id": row[0],
                 "url": row[1],
-                "content": row[2],
+                "content": decode_text(row[2]),
                 "title": row[3],
                 "summary": row[4],
                 "summary_status": row[5],
@@ -430,19 +616,34 @@ class ResearchCache:
         url: str,
         content: str,
         title: str,
-        links: List[Dict[str, str]],
+        links: Optional[List[Dict[str, str]]],
         trigger_summarization: bool = True,
         usage_tracker: Optional[Any] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        final_url: Optional[str] = None,
+        content_type: Optional[str] = None,
+        output_format: Optional[str] = None,
+        page_type: Optional[str] = None,
+        published_date: Optional[str] = None,
+        links_included: Optional[bool] = None,
     ) -> int:
         """Cache URL content and optionally trigger background summarization.
 
-        Returns the cache ID.
+        `etag`/`last_modified` are the response validators used to revalidate
+        the row once it expires. `output_format`, `page_type`,
+        `published_date` and `links_included` describe how the content was
+        extracted; rows written without them are never served as fetch hits.
+        `links=None` keeps the row's stored links and link embeddings. Chunks,
+        embeddings and the summary are kept when the content hash is
+        unchanged. Returns the cache ID.
         """
         now = datetime.now()
         expires = now + timedelta(hours=self.ttl_hours)
         url_hash = self._url_hash(url)
         content_hash = self._content_hash(content)
-        links_json = json.dumps(links)
+        keep_links = links is None
+        links_json = json.dumps(links or [])
 
         with self._db_lock:
             conn = self._get_conn()
@@ -461,22 +662,44 @@ class ResearchCache:
                 old_hash = existing[1]
                 old_links_json = existing[2]
                 content_changed = old_hash != content_hash
-                links_changed = old_links_json != links_json
+                links_changed = not keep_links and old_links_json != links_json
+                # Offset-backed chunks resolve against the stored content, so
+                # they must be dropped before it is replaced.
+                self._clear_stale_vectors(
+                    cursor=c,
+                    cache_id=existing[0],
+                    clear_chunks=content_changed,
+                    clear_links=links_changed,
+                )
 
             c.execute(
                 """
                 INSERT INTO research_cache
                 (url, url_hash, content, title, summary_status, links_json,
-                 fetch_timestamp, expires_at, content_hash, created_at, updated_at)
-                VALUES (?, ?, ?, ?, 'pending', ?, ?, ?, ?, ?, ?)
+                 fetch_timestamp, expires_at, content_hash, created_at, updated_at,
+                 etag, last_modified, final_url, content_type, last_accessed_at,
+                 output_format, page_type, published_date, links_included)
+                VALUES (?, ?, ?, ?, 'pending', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(url) DO UPDATE SET
                     content = excluded.content,
                     title = excluded.title,
-                    links_json = excluded.links_json,
+                    links_json = CASE
+                        WHEN ? THEN research_cache.links_json
+                        ELSE excluded.links_json
+                    END,
                     fetch_timestamp = excluded.fetch_timestamp,
                     expires_at = excluded.expires_at,
                     content_hash = excluded.content_hash,
                     updated_at = excluded.updated_at,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    final_url = excluded.final_url,
+                    content_type = excluded.content_type,
+                    last_accessed_at = excluded.last_accessed_at,
+                    output_format = excluded.output_format,
+                    page_type = excluded.page_type,
+                    published_date = excluded.published_date,
+                    links_included = excluded.links_included,
                     summary_status = CASE
                         WHEN research_cache.content_hash != excluded.content_hash
                         THEN 'pending'
@@ -491,7 +714,7 @@ class ResearchCache:
                 (
                     url,
                     url_hash,
-                    content,
+                    encode_text(content),
                     title,
                     links_json,
                     now.isoformat(),
@@ -499,6 +722,16 @@ class ResearchCache:
                     content_hash,
                     now.isoformat(),
                     now.isoformat(),
+                    etag,
+                    last_modified,
+                    final_url,
+                    content_type,
+                    now.isoformat(),
+                    output_format,
+                    page_type,
+                    published_date,
+                    None if links_included is None else int(bool(links_included)),
+                    int(keep_links),
                 ),
             )
 
@@ -512,14 +745,6 @@ class ResearchCache:
                 result = c.fetchone()
                 cache_id = result[0] if result else 0
 
-            if existing:
-                self._clear_stale_vectors(
-                    cursor=c,
-                    cache_id=cache_id,
-                    clear_chunks=content_changed,
-                    clear_links=links_changed,
-                )
-
             conn.commit()
             conn.close()
 
@@ -571,48 +796,192 @@ class ResearchCache:
         cached = self.get_cached(url)
         return cached["content"] if cached else None
 
-    def cleanup_expired(self) -> int:
-        """Remove expired cache entries and their related data."""
+    def _delete_entries(self, cursor: sqlite3.Cursor, cache_ids: List[int]) -> None:
+        """Delete cache rows with their chunks and link embeddings.
+
+        Callers clear the matching Chroma vectors after releasing `_db_lock`.
+        """
+        if not cache_ids:
+            return
+        placeholders = ",".join("?" * len(cache_ids))
+        delete_chunks(cursor, cache_ids)
+        cursor.execute(
+            f"DELETE FROM link_embeddings WHERE cache_id IN ({placeholders})",
+            cache_ids,
+        )
+        cursor.execute(
+            f"DELETE FROM research_cache WHERE id IN ({placeholders})",
+            cache_ids,
+        )
+
+    def cleanup_expired(self, limit: Optional[int] = None) -> int:
+        """Remove expired cache entries and their related data.
+
+        `limit` caps how many rows one call removes, so scheduled maintenance
+        can work through a large backlog in short passes.
+        """
         with self._db_lock:
             conn = self._get_conn()
             c = conn.cursor()
 
             now = datetime.now().isoformat()
-
-            # Get IDs of expired entries first
-            c.execute("SELECT id FROM research_cache WHERE expires_at < ?", (now,))
+            query = "SELECT id FROM research_cache WHERE expires_at < ? ORDER BY expires_at"
+            params: tuple = (now,)
+            if limit is not None:
+                query += " LIMIT ?"
+                params = (now, max(0, int(limit)))
+            c.execute(query, params)
             expired_ids = [row[0] for row in c.fetchall()]
-
-            if expired_ids:
-                self._clear_chroma_vectors_bulk(expired_ids)
-                placeholders = ",".join("?" * len(expired_ids))
-
-                # Delete related chunks
-                c.execute(
-                    f"DELETE FROM content_chunks WHERE cache_id IN ({placeholders})",
-                    expired_ids,
-                )
-
-                # Delete related link embeddings
-                c.execute(
-                    f"DELETE FROM link_embeddings WHERE cache_id IN ({placeholders})",
-                    expired_ids,
-                )
-
-                # Delete cache entries
-                c.execute(
-                    f"DELETE FROM research_cache WHERE id IN ({placeholders})",
-                    expired_ids,
-                )
+            self._delete_entries(c, expired_ids)
 
             deleted = len(expired_ids)
             conn.commit()
             conn.close()
 
+        self._clear_chroma_vectors_bulk(expired_ids)
         if deleted:
             logger.info(f"Cleaned up {deleted} expired cache entries")
         return deleted
 
+    def _measure_total_bytes(self, cursor: sqlite3.Cursor) -> int:
+        """Re-measure changed rows, then sum `entry_bytes` from the LRU index."""
+        cursor.execute(REFRESH_ENTRY_BYTES_SQL)
+        cursor.execute("SELECT COALESCE(SUM(entry_bytes), 0) FROM research_cache")
+        return int(cursor.fetchone()[0] or 0)
+
+    def get_total_bytes(self) -> int:
+        """Return the approximate bytes held by cached content, chunks and vectors."""
+        with self._db_lock:
+            conn = self._get_conn()
+            try:
+                total = self._measure_total_bytes(conn.cursor())
+                conn.commit()
+            finally:
+                conn.close()
+        return total
+
+    def evict_to_budget(
+        self,
+        max_bytes: int,
+        limit: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Evict least-recently-used entries until the cache fits `max_bytes`.
+
+        A budget of zero or less disables eviction. `limit` caps how many rows
+        one call removes. Victims are picked from the LRU index and deleted
+        under the cache lock; their Chroma vectors are removed after it is
+        released. Returns byte totals before/after and the row count.
+        """
+        result = {"evicted": 0, "bytes_before": 0, "bytes_after": 0}
+        victims: List[int] = []
+        with self._db_lock:
+            conn = self._get_conn()
+            try:
+                c = conn.cursor()
+                total = self._measure_total_bytes(c)
+                result["bytes_before"] = total
+                if max_bytes > 0 and total > max_bytes:
+                    rows = c.execute(
+                        "SELECT id, entry_bytes FROM research_cache "
+                        "ORDER BY last_accessed_at"
+                    )
+                    for cache_id, entry_bytes in rows:
+                        if total <= max_bytes:
+                            break
+                        if limit is not None and len(victims) >= limit:
+                            break
+                        victims.append(cache_id)
+                        total -= int(entry_bytes or 0)
+                    self._delete_entries(c, victims)
+                conn.commit()
+            finally:
+                conn.close()
+
+        self._clear_chroma_vectors_bulk(victims)
+        result["evicted"] = len(victims)
+        result["bytes_after"] = total
+        if victims:
+            logger.info(
+                "Evicted %d research cache entries to fit %d bytes", len(victims), max_bytes
+            )
+        return result
+
+    def sweep_orphan_vectors(self) -> int:
+        """Delete Chroma vectors whose cache row no longer exists."""
+        conn = self._get_conn()
+        try:
+            valid_ids = {row[0] for row in conn.execute("SELECT id FROM research_cache")}
+        finally:
+            conn.close()
+        try:
+            from asky.research.vector_store import get_vector_store
+
+            return get_vector_store().sweep_orphan_cache_embeddings(valid_ids)
+        except Exception as exc:
+            logger.debug("Skipping Chroma orphan sweep: %s", exc)
+            return 0
+
+    def incremental_vacuum(self, max_pages: int) -> int:
+        """Release up to `max_pages` free pages to the filesystem.
+
+        Databases created without `auto_vacuum = INCREMENTAL` are converted
+        with one full VACUUM once their free space reaches
+        `INCREMENTAL_VACUUM_CONVERT_MIN_FREE_BYTES`. Returns pages released.
+        """
+        with self._db_lock:
+            conn = self._get_conn()
+            try:
+                mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+                before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if mode != SQLITE_AUTO_VACUUM_INCREMENTAL:
+                    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+                    if before * page_size < INCREMENTAL_VACUUM_CONVERT_MIN_FREE_BYTES:
+                        return 0
+                    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                    conn.execute("VACUUM")
+                else:
+                    conn.execute(f"PRAGMA incremental_vacuum({max(0, int(max_pages))})")
+                    conn.commit()
+                after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            finally:
+                conn.close()
+        return max(0, int(before) - int(after))
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read one research-cache bookkeeping value."""
+        conn = self._get_conn()
+        try:
+            row = conn.execute(
+                f"SELECT value FROM {META_TABLE_NAME} WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Write one research-cache bookkeeping value."""
+        with self._db_lock:
+            conn = self._get_conn()
+            conn.execute(
+                f"INSERT INTO {META_TABLE_NAME} (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+            conn.commit()
+            conn.close()
+
+    def compact(self) -> Dict[str, int]:
+        """Drop expired rows, migrate legacy rows to compressed storage, and VACUUM."""
+        expired = self.cleanup_expired()
+        with self._db_lock:
+            conn = self._get_conn()
+            try:
+                stats = compact_research_store(conn)
+            finally:
+                conn.close()
+        stats["expired_removed"] = expired
+        return stats
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         conn = self._get_conn()
@@ -642,6 +1011,7 @@ class ResearchCache:
             "expired_entries": total - valid,
             "summarized_entries": summarized,
             "total_chunks": chunks,
+            "total_bytes": self.get_total_bytes(),
         }
 
     def save_finding(
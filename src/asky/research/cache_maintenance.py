@@ -0,0 +1,143 @@
+"""Scheduled research-cache maintenance: expiry, LRU eviction and space reclaim."""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from asky.config import (
+    RESEARCH_CACHE_MAINTENANCE_INTERVAL_MINUTES,
+    RESEARCH_CACHE_MAX_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+RESEARCH_CACHE_MAINTENANCE_JOB = "research_cache_maintenance"
+LAST_MAINTENANCE_META_KEY = "last_maintenance_at"
+# Rows removed per step in one pass; a larger backlog is finished by later
+# passes so no single pass holds the cache write lock for long.
+MAX_ROWS_PER_PASS = 500
+INCREMENTAL_VACUUM_PAGES = 2048
+# Delay the first daemon pass so it does not compete with startup work.
+DAEMON_INITIAL_DELAY_SECONDS = 120.0
+
+
+def maintenance_interval_seconds() -> float:
+    return float(RESEARCH_CACHE_MAINTENANCE_INTERVAL_MINUTES) * 60.0
+
+
+def maintenance_due(cache: Any, interval_seconds: Optional[float] = None) -> bool:
+    """Return True when no maintenance pass ran within the interval."""
+    interval = (
+        maintenance_interval_seconds() if interval_seconds is None else interval_seconds
+    )
+    raw = cache.get_meta(LAST_MAINTENANCE_META_KEY)
+    try:
+        last_run = float(raw) if raw is not None else 0.0
+    except ValueError:
+        last_run = 0.0
+    return time.time() - last_run >= interval
+
+
+def run_research_cache_maintenance(
+    cache: Any = None,
+    *,
+    max_bytes: Optional[int] = None,
+) -> Dict[str, int]:
+    """Run one bounded maintenance pass over the research cache.
+
+    Expired rows are dropped first, then least-recently-used rows until the
+    cache fits `max_bytes`, then Chroma vectors whose cache row is gone are
+    swept and free pages are released with an incremental VACUUM. Each step
+    is best-effort.
+    """
+    if cache is None:
+        from asky.research.cache import ResearchCache
+
+        cache = ResearchCache()
+    budget = RESEARCH_CACHE_MAX_BYTES if max_bytes is None else int(max_bytes)
+    stats = {
+        "expired_removed": 0,
+        "evicted": 0,
+        "bytes_after": 0,
+        "orphan_vectors_removed": 0,
+        "pages_released": 0,
+    }
+    # Stamp first so a failing pass is retried on schedule, not on every call.
+    cache.set_meta(LAST_MAINTENANCE_META_KEY, str(time.time()))
+
+    try:
+        stats["expired_removed"] = cache.cleanup_expired(limit=MAX_ROWS_PER_PASS)
+    except Exception as exc:
+        logger.warning("Research cache expiry failed: %s", exc)
+    try:
+        eviction = cache.evict_to_budget(budget, limit=MAX_ROWS_PER_PASS)
+        stats["evicted"] = eviction["evicted"]
+        stats["bytes_after"] = eviction["bytes_after"]
+    except Exception as exc:
+        logger.warning("Research cache eviction failed: %s", exc)
+    try:
+        stats["orphan_vectors_removed"] = cache.sweep_orphan_vectors()
+    except Exception as exc:
+        logger.warning("Research cache vector sweep failed: %s", exc)
+    try:
+        stats["pages_released"] = cache.incremental_vacuum(INCREMENTAL_VACUUM_PAGES)
+    except Exception as exc:
+        logger.warning("Research cache vacuum failed: %s", exc)
+
+    logger.debug("research cache maintenance stats=%s", stats)
+    return stats
+
+
+def spawn_research_cache_maintenance_if_due() -> bool:
+    """Start a detached maintenance pass when the configured interval has elapsed.
+
+    Used by the CLI so eviction and Chroma deletes never delay its exit. The
+    interval is stamped before spawning so back-to-back commands start at
+    most one pass. Returns True when a process was started.
+    """
+    from asky.research.cache import ResearchCache
+
+    cache = ResearchCache()
+    if not maintenance_due(cache):
+        return False
+    cache.set_meta(LAST_MAINTENANCE_META_KEY, str(time.time()))
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "asky.research.cache_maintenance"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+    except OSError as exc:
+        logger.debug("Could not spawn research cache maintenance: %s", exc)
+        return False
+    return True
+
+
+def register_maintenance_job(queue: Any) -> None:
+    """Register the maintenance handler and its schedule on a daemon JobQueue."""
+    queue.register_handler(
+        RESEARCH_CACHE_MAINTENANCE_JOB,
+        lambda *_args, **_kwargs: run_research_cache_maintenance(),
+        priority=-1,
+    )
+    queue.schedule_periodic(
+        RESEARCH_CACHE_MAINTENANCE_JOB,
+        maintenance_interval_seconds(),
+        initial_delay_seconds=DAEMON_INITIAL_DELAY_SECONDS,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    del argv
+    run_research_cache_maintenance()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
 """Text chunking utilities for RAG."""
 
+import bisect
 import logging
 import re
 from typing import Any, List, Optional, Tuple
 
 from asky.config import RESEARCH_CHUNK_SIZE, RESEARCH_CHUNK_OVERLAP
 from asky.research.embeddings import get_embedding_client
+from asky.research.tokenization import (
+    TokenizedText,
+    supports_batch_offsets,
+    token_span_text,
+    tokenize_batch,
+)
 
 SENTENCE_BOUNDARY_SEARCH_FRACTION = 0.8
 SENTENCE_BOUNDARY_LOOKAHEAD_CHARS = 50
@@ -86,34 +93,60 @@ def _get_embedding_tokenizer() -> Tuple[Optional[Any], int]:
         return None, 0
 
 
-def _encode_tokens(tokenizer: Any, text: str) -> List[int]:
-    """Encode text to token IDs across tokenizer implementations."""
-    try:
-        return tokenizer.encode(text, add_special_tokens=False, verbose=False)
-    except TypeError:
-        try:
-            return tokenizer.encode(text, add_special_tokens=False)
-        except TypeError:
-            return tokenizer.encode(text)
+def _sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """Split normalized text into `(start, end)` sentence-like character spans."""
+    spans: List[Tuple[int, int]] = []
+    start = 0
+    for match in TOKENIZER_SENTENCE_SPLIT_PATTERN.finditer(text):
+        if match.start() > start:
+            spans.append((start, match.start()))
+        start = match.end()
+    if start < len(text):
+        spans.append((start, len(text)))
+    return spans
 
 
-def _decode_tokens(tokenizer: Any, token_ids: List[int]) -> str:
-    """Decode token IDs back to text."""
-    try:
-        return tokenizer.decode(token_ids, skip_special_tokens=True).strip()
-    except TypeError:
-        return tokenizer.decode(token_ids).strip()
-
+def _tokenize_sentences(
+    text: str,
+    spans: List[Tuple[int, int]],
+    tokenizer: Any,
+) -> Tuple[List[str], List[TokenizedText]]:
+    """Tokenize the document once and split the ids at sentence boundaries.
 
-def _split_sentences(text: str) -> List[str]:
-    """Split text to sentence-like units for semantic chunking."""
-    pieces = TOKENIZER_SENTENCE_SPLIT_PATTERN.split(text)
-    return [piece.strip() for piece in pieces if piece and piece.strip()]
+    Fast tokenizers tokenize the whole text in one call; each token is assigned
+    to the sentence holding its last character, and offsets are rebased onto
+    the sentence. Tokenizers without offsets fall back to one encode per
+    sentence.
+    """
+    sentences = [text[start:end] for start, end in spans]
+    if not supports_batch_offsets(tokenizer):
+        return sentences, tokenize_batch(tokenizer, sentences)
+
+    (document,) = tokenize_batch(tokenizer, [text])
+    if document.offsets is None:
+        return sentences, tokenize_batch(tokenizer, sentences)
+
+    sentence_starts = [start for start, _ in spans]
+    ids_by_sentence: List[List[int]] = [[] for _ in spans]
+    offsets_by_sentence: List[List[Tuple[int, int]]] = [[] for _ in spans]
+    for token_id, (char_start, char_end) in zip(document.ids, document.offsets):
+        anchor = max(char_start, char_end - 1)
+        sentence_idx = max(0, bisect.bisect_right(sentence_starts, anchor) - 1)
+        base = sentence_starts[sentence_idx]
+        ids_by_sentence[sentence_idx].append(token_id)
+        offsets_by_sentence[sentence_idx].append(
+            (max(0, char_start - base), max(0, char_end - base))
+        )
+    return sentences, [
+        TokenizedText(ids=ids, offsets=offsets)
+        for ids, offsets in zip(ids_by_sentence, offsets_by_sentence)
+    ]
 
 
 def _chunk_long_sentence(
     tokenizer: Any,
-    sentence_tokens: List[int],
+    sentence: str,
+    sentence_tokens: TokenizedText,
     chunk_size: int,
     overlap: int,
 ) -> List[str]:
@@ -123,7 +156,7 @@ def _chunk_long_sentence(
 
     while start < len(sentence_tokens):
         end = min(start + chunk_size, len(sentence_tokens))
-        chunk_text = _decode_tokens(tokenizer, sentence_tokens[start:end])
+        chunk_text = token_span_text(tokenizer, sentence, sentence_tokens, start, end)
         if chunk_text:
             chunks.append(chunk_text)
 
@@ -142,11 +175,8 @@ def _chunk_text_by_tokens(
     tokenizer: Any,
 ) -> List[Tuple[int, str]]:
     """Create sentence-aware chunks bounded by token counts."""
-    sentences = _split_sentences(text)
-    if not sentences:
-        sentences = [text]
-
-    sentence_tokens = [_encode_tokens(tokenizer, sentence) for sentence in sentences]
+    spans = _sentence_spans(text) or [(0, len(text))]
+    sentences, sentence_tokens = _tokenize_sentences(text, spans, tokenizer)
 
     chunks: List[Tuple[int, str]] = []
     chunk_index = 0
@@ -163,6 +193,7 @@ def _chunk_text_by_tokens(
             if token_len > chunk_size and end_idx == start_idx:
                 for part in _chunk_long_sentence(
                     tokenizer=tokenizer,
+                    sentence=sentences[end_idx],
                     sentence_tokens=sentence_tokens[end_idx],
                     chunk_size=chunk_size,
                     overlap=overlap,
@@ -180,7 +211,7 @@ def _chunk_text_by_tokens(
             end_idx += 1
 
         if end_idx > start_idx and not long_sentence_split:
-            chunk_text = " ".join(sentences[start_idx:end_idx]).strip()
+            chunk_text = text[spans[start_idx][0] : spans[end_idx - 1][1]].strip()
             if chunk_text:
                 chunks.append((chunk_index, chunk_text))
                 chunk_index += 1
@@ -0,0 +1,265 @@
+"""Compressed storage for research cache documents and their chunks.
+
+`research_cache.content` holds zlib-compressed UTF-8 as a BLOB once a row is
+(re)written; legacy TEXT values stay readable, so old rows migrate lazily on
+their next write or on `asky corpus compact`. Chunks that are a literal slice
+of their parent document store only `char_start`/`char_end` offsets and an
+empty `chunk_text`; chunks that cannot be located are stored compressed.
+
+The chunk FTS index is contentless (`content=''`), so it never keeps a
+plain-text copy of the chunks and is maintained here instead of by triggers.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from asky.research.vector_store_common import CHUNK_FTS_TABLE_NAME
+
+logger = logging.getLogger(__name__)
+
+# Short texts barely compress and are cheaper to keep as TEXT.
+COMPRESSION_MIN_CHARS = 256
+ZLIB_LEVEL = 6
+CHUNK_OFFSET_COLUMNS = ("char_start", "char_end")
+
+ChunkStorageRow = Tuple[Any, Optional[int], Optional[int]]
+
+
+def encode_text(text: Optional[str]) -> Any:
+    """Return the column value for `text`: compressed BLOB or short TEXT."""
+    value = str(text or "")
+    if len(value) < COMPRESSION_MIN_CHARS:
+        return value
+    return zlib.compress(value.encode("utf-8"), ZLIB_LEVEL)
+
+
+def decode_text(value: Any) -> str:
+    """Inverse of `encode_text`; also accepts legacy plain TEXT values."""
+    if value is None:
+        return ""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return zlib.decompress(bytes(value)).decode("utf-8")
+    return str(value)
+
+
+def locate_chunk_spans(
+    document: str, chunks: Sequence[str]
+) -> List[Optional[Tuple[int, int]]]:
+    """Find each chunk as a literal slice of `document`, scanning forward.
+
+    Chunkers emit chunks in document order, so each search starts at the
+    previous match; a miss falls back to a search from the beginning.
+    """
+    spans: List[Optional[Tuple[int, int]]] = []
+    cursor = 0
+    for chunk in chunks:
+        if not chunk or not document:
+            spans.append(None)
+            continue
+        start = document.find(chunk, cursor)
+        if start < 0:
+            start = document.find(chunk)
+        if start < 0:
+            spans.append(None)
+            continue
+        spans.append((start, start + len(chunk)))
+        cursor = start + 1
+    return spans
+
+
+def chunk_storage_rows(document: str, chunks: Sequence[str]) -> List[ChunkStorageRow]:
+    """Return `(chunk_text, char_start, char_end)` column values per chunk."""
+    rows: List[ChunkStorageRow] = []
+    for chunk, span in zip(chunks, locate_chunk_spans(document, chunks)):
+        if span is None:
+            rows.append((encode_text(chunk), None, None))
+        else:
+            rows.append(("", span[0], span[1]))
+    return rows
+
+
+def resolve_chunk_text(
+    stored_text: Any,
+    char_start: Optional[int],
+    char_end: Optional[int],
+    document: str,
+) -> str:
+    if char_start is not None and char_end is not None:
+        return document[char_start:char_end]
+    return decode_text(stored_text)
+
+
+def load_document(cursor: sqlite3.Cursor, cache_id: int) -> str:
+    cursor.execute("SELECT content FROM research_cache WHERE id = ?", (cache_id,))
+    row = cursor.fetchone()
+    return decode_text(row[0]) if row else ""
+
+
+def load_chunk_rows(
+    cursor: sqlite3.Cursor, cache_id: int
+) -> List[Tuple[int, int, str, Any]]:
+    """Return `(id, chunk_index, text, embedding)` for embedded chunks of a source."""
+    cursor.execute(
+        """
+        SELECT id, chunk_index, chunk_text, char_start, char_end, embedding
+        FROM content_chunks
+        WHERE cache_id = ? AND embedding IS NOT NULL
+        """,
+        (cache_id,),
+    )
+    rows = cursor.fetchall()
+    document = ""
+    if any(row[3] is not None for row in rows):
+        document = load_document(cursor, cache_id)
+    return [
+        (row[0], row[1], resolve_chunk_text(row[2], row[3], row[4], document), row[5])
+        for row in rows
+    ]
+
+
+def _chunk_texts_for_sources(
+    cursor: sqlite3.Cursor, cache_ids: Iterable[int]
+) -> List[Tuple[int, str]]:
+    texts: List[Tuple[int, str]] = []
+    for cache_id in cache_ids:
+        cursor.execute(
+            "SELECT id, chunk_text, char_start, char_end FROM content_chunks WHERE cache_id = ?",
+            (cache_id,),
+        )
+        rows = cursor.fetchall()
+        document = ""
+        if any(row[2] is not None for row in rows):
+            document = load_document(cursor, cache_id)
+        texts.extend(
+            (row[0], resolve_chunk_text(row[1], row[2], row[3], document)) for row in rows
+        )
+    return texts
+
+
+def chunk_fts_available(cursor: sqlite3.Cursor) -> bool:
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (CHUNK_FTS_TABLE_NAME,),
+    )
+    return cursor.fetchone() is not None
+
+
+def index_chunk_fts(cursor: sqlite3.Cursor, rowid: int, text: str) -> None:
+    cursor.execute(
+        f"INSERT INTO {CHUNK_FTS_TABLE_NAME}(rowid, chunk_text) VALUES (?, ?)",
+        (rowid, text),
+    )
+
+
+def delete_chunks(cursor: sqlite3.Cursor, cache_ids: Sequence[int]) -> None:
+    """Delete chunks of the given sources, removing their FTS postings first.
+
+    Must run before the parent content is replaced: contentless FTS deletes
+    need the original text, which offset-backed chunks resolve from it.
+    """
+    if not cache_ids:
+        return
+    if chunk_fts_available(cursor):
+        for rowid, text in _chunk_texts_for_sources(cursor, cache_ids):
+            try:
+                cursor.execute(
+                    f"INSERT INTO {CHUNK_FTS_TABLE_NAME}({CHUNK_FTS_TABLE_NAME}, rowid, chunk_text) "
+                    "VALUES('delete', ?, ?)",
+                    (rowid, text),
+                )
+            except sqlite3.DatabaseError as exc:
+                # Rows written without postings are rejected by FTS5; the
+                # failed statement is rolled back and leaves the index intact.
+                logger.debug("Skipping FTS delete for chunk rowid=%s: %s", rowid, exc)
+    placeholders = ",".join("?" * len(cache_ids))
+    cursor.execute(
+        f"DELETE FROM content_chunks WHERE cache_id IN ({placeholders})",
+        list(cache_ids),
+    )
+
+
+def rebuild_chunk_fts(cursor: sqlite3.Cursor) -> int:
+    """Repopulate the contentless chunk index from `content_chunks`."""
+    cursor.execute(f"INSERT INTO {CHUNK_FTS_TABLE_NAME}({CHUNK_FTS_TABLE_NAME}) VALUES('delete-all')")
+    cursor.execute("SELECT DISTINCT cache_id FROM content_chunks")
+    cache_ids = [row[0] for row in cursor.fetchall()]
+    indexed = 0
+    for rowid, text in _chunk_texts_for_sources(cursor, cache_ids):
+        index_chunk_fts(cursor, rowid, text)
+        indexed += 1
+    return indexed
+
+
+def compact_research_store(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Compress legacy rows, convert chunk copies to offsets, then VACUUM.
+
+    The chunk FTS index is rebuilt from the resolved chunk text. Returns
+    counters for the CLI report.
+    """
+    stats = {
+        "documents_compressed": 0,
+        "chunks_offset": 0,
+        "chunks_compressed": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+    }
+    stats["bytes_before"] = _database_bytes(conn)
+    c = conn.cursor()
+
+    c.execute("SELECT id, content FROM research_cache WHERE typeof(content) = 'text'")
+    for cache_id, content in c.fetchall():
+        encoded = encode_text(content)
+        if isinstance(encoded, bytes):
+            c.execute(
+                "UPDATE research_cache SET content = ? WHERE id = ?", (encoded, cache_id)
+            )
+            stats["documents_compressed"] += 1
+
+    c.execute(
+        "SELECT DISTINCT cache_id FROM content_chunks "
+        "WHERE char_start IS NULL AND typeof(chunk_text) = 'text'"
+    )
+    for (cache_id,) in c.fetchall():
+        document = load_document(c, cache_id)
+        c.execute(
+            "SELECT id, chunk_text FROM content_chunks "
+            "WHERE cache_id = ? AND char_start IS NULL AND typeof(chunk_text) = 'text' "
+            "ORDER BY chunk_index",
+            (cache_id,),
+        )
+        rows = c.fetchall()
+        texts = [str(text or "") for _rowid, text in rows]
+        for (rowid, _text), (stored, start, end) in zip(
+            rows, chunk_storage_rows(document, texts)
+        ):
+            if start is not None:
+                stats["chunks_offset"] += 1
+            elif isinstance(stored, bytes):
+                stats["chunks_compressed"] += 1
+            else:
+                continue
+            c.execute(
+                "UPDATE content_chunks SET chunk_text = ?, char_start = ?, char_end = ? "
+                "WHERE id = ?",
+                (stored, start, end, rowid),
+            )
+
+    if chunk_fts_available(c):
+        # Rebuilding also repairs postings for rows written outside this module.
+        rebuild_chunk_fts(c)
+    conn.commit()
+    # Lets scheduled maintenance reclaim pages with `incremental_vacuum`.
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("VACUUM")
+    stats["bytes_after"] = _database_bytes(conn)
+    return stats
+
+
+def _database_bytes(conn: sqlite3.Connection) -> int:
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    return int(page_count) * int(page_size)
@@ -0,0 +1,485 @@
+"""Local Unix-socket embedding server shared by asky processes.
+
+One process keeps the sentence-transformer warm; CLI invocations send texts
+over a Unix socket instead of loading the model themselves. The XMPP daemon
+hosts the server when `research.embedding.server_enabled` is true; otherwise
+the first CLI process that finds no server spawns one in the background
+(`python -m asky.research.embedding_server`), which exits after an idle
+timeout. `EmbeddingClient` falls back to in-process loading whenever the
+socket is unreachable or the server runs a different model.
+
+Wire format: every message is a 4-byte big-endian length followed by the
+payload. Requests and response headers are JSON; a successful `embed`
+response is followed by one frame of raw native float32 rows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 256 * 1024 * 1024
+CONNECT_TIMEOUT_SECONDS = 0.5
+REQUEST_TIMEOUT_SECONDS = 120.0
+SPAWN_COOLDOWN_SECONDS = 60.0
+IDLE_CHECK_SECONDS = 5.0
+METRICS_NAME = "embedding_server"
+
+
+class EmbeddingServerError(RuntimeError):
+    """The server answered with an error or broke the wire protocol."""
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1 << 20))
+        if not chunk:
+            raise ConnectionError("embedding server connection closed")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _send_frame(sock: socket.socket, payload: bytes) -> None:
+    sock.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_frame(sock: socket.socket) -> bytes:
+    (size,) = FRAME_HEADER.unpack(_recv_exact(sock, FRAME_HEADER.size))
+    if size > MAX_FRAME_BYTES:
+        raise EmbeddingServerError(f"frame of {size} bytes exceeds limit")
+    return _recv_exact(sock, size)
+
+
+def _send_json(sock: socket.socket, payload: Dict[str, Any]) -> None:
+    _send_frame(sock, json.dumps(payload).encode("utf-8"))
+
+
+def _recv_json(sock: socket.socket) -> Dict[str, Any]:
+    return json.loads(_recv_frame(sock).decode("utf-8"))
+
+
+# --- Client side -------------------------------------------------------------
+
+
+class RemoteEmbeddingClient:
+    """Talks to a running embedding server; one short connection per call."""
+
+    def __init__(self, socket_path: Path, timeout: float = REQUEST_TIMEOUT_SECONDS):
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        sock.settimeout(self.timeout)
+        return sock
+
+    def info(self) -> Dict[str, Any]:
+        with self._connect() as sock:
+            _send_json(sock, {"op": "info"})
+            return _recv_json(sock)
+
+    def embed_array(
+        self, texts: List[str], model: str, normalize: bool
+    ) -> Tuple[np.ndarray, int]:
+        """Return `(float32 matrix, prompt_tokens)` for `texts`."""
+        with self._connect() as sock:
+            _send_json(
+                sock,
+                {"op": "embed", "texts": texts, "model": model, "normalize": normalize},
+            )
+            header = _recv_json(sock)
+            if not header.get("ok"):
+                raise EmbeddingServerError(str(header.get("error", "unknown error")))
+            data = _recv_frame(sock)
+        rows, dim = int(header["rows"]), int(header["dim"])
+        matrix = np.frombuffer(data, dtype=np.float32)
+        return matrix.reshape(rows, dim) if rows else matrix.reshape(0, dim), int(
+            header.get("prompt_tokens", 0)
+        )
+
+
+def socket_is_live(socket_path: Path) -> bool:
+    """True if something accepts connections on `socket_path`."""
+    if not Path(socket_path).exists():
+        return False
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+    try:
+        sock.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def spawn_server(socket_path: Path, idle_timeout_seconds: float) -> bool:
+    """Start a detached server process unless one was spawned recently."""
+    socket_path = Path(socket_path)
+    marker = socket_path.with_name(socket_path.name + ".spawn")
+    try:
+        socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        if marker.exists() and time.time() - marker.stat().st_mtime < SPAWN_COOLDOWN_SECONDS:
+            return False
+        marker.touch()
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "asky.research.embedding_server",
+                "--socket",
+                str(socket_path),
+                "--idle-timeout",
+                str(idle_timeout_seconds),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+        logger.info("Spawned embedding server on %s", socket_path)
+        return True
+    except OSError as exc:
+        logger.debug("Could not spawn embedding server: %s", exc)
+        return False
+
+
+# --- Server side -------------------------------------------------------------
+
+
+@dataclass
+class _PendingEmbed:
+    texts: List[str]
+    done: threading.Event = field(default_factory=threading.Event)
+    matrix: Optional[np.ndarray] = None
+    prompt_tokens: int = 0
+    error: Optional[str] = None
+
+
+class EmbeddingServer:
+    """Serves `embed`/`info` requests and batches concurrent embeds together."""
+
+    def __init__(
+        self,
+        socket_path: Path,
+        client: Optional[Any] = None,
+        batch_window_ms: float = 5.0,
+        max_batch_texts: int = 256,
+        idle_timeout_seconds: float = 0.0,
+    ) -> None:
+        self.socket_path = Path(socket_path).expanduser()
+        self._client = client
+        self.batch_window = max(0.0, float(batch_window_ms)) / 1000.0
+        self.max_batch_texts = max(1, int(max_batch_texts))
+        self.idle_timeout_seconds = max(0.0, float(idle_timeout_seconds))
+        self._queue: "queue.Queue[Optional[_PendingEmbed]]" = queue.Queue()
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._threads: List[threading.Thread] = []
+        self._stopped = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._last_activity = time.monotonic()
+        self._stats = {
+            "requests": 0,
+            "texts": 0,
+            "batches": 0,
+            "max_batch_requests": 0,
+            "errors": 0,
+            "embed_ms_total": 0.0,
+        }
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from asky.research.embeddings import get_embedding_client
+
+            self._client = get_embedding_client()
+        # The hosting process always embeds in-process.
+        self._client.use_server = False
+        return self._client
+
+    def start(self) -> bool:
+        """Bind the socket and start serving; False if another server owns it."""
+        if socket_is_live(self.socket_path):
+            logger.info("Embedding server already running on %s", self.socket_path)
+            return False
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+        server = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                server._handle_connection(self.request)
+
+        # The socket is created owner-only at bind time; a chmod afterwards
+        # would leave a window where other local users could connect.
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(
+                str(self.socket_path), _Handler
+            )
+        finally:
+            os.umask(previous_umask)
+        self._server.daemon_threads = True
+        os.chmod(self.socket_path, 0o600)
+        self._stopped.clear()
+        self._last_activity = time.monotonic()
+        self._threads = [
+            threading.Thread(
+                target=self._server.serve_forever,
+                name="asky-embedding-server",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._batch_loop, name="asky-embedding-batcher", daemon=True
+            ),
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info("Embedding server listening on %s", self.socket_path)
+        return True
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._stopped.set()
+        self._queue.put(None)
+        self._server.shutdown()
+        self._server.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._server = None
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        logger.info("Embedding server on %s stopped", self.socket_path)
+
+    def serve_until_idle(self) -> None:
+        """Block until stopped, or until idle for `idle_timeout_seconds`."""
+        if not self.start():
+            return
+        try:
+            while not self._stopped.wait(IDLE_CHECK_SECONDS):
+                idle_for = time.monotonic() - self._last_activity
+                if self.idle_timeout_seconds and idle_for >= self.idle_timeout_seconds:
+                    logger.info("Embedding server idle for %.0fs; exiting", idle_for)
+                    break
+        finally:
+            self.stop()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        batches = stats["batches"]
+        embed_ms_total = stats.pop("embed_ms_total")
+        stats["avg_batch_texts"] = round(stats["texts"] / batches, 2) if batches else 0.0
+        stats["avg_embed_ms"] = round(embed_ms_total / batches, 2) if batches else 0.0
+        stats["queued"] = self._queue.qsize()
+        stats["socket"] = str(self.socket_path)
+        stats["running"] = self._server is not None
+        return stats
+
+    def _handle_connection(self, sock: socket.socket) -> None:
+        try:
+            request = _recv_json(sock)
+        except (ConnectionError, ValueError, EmbeddingServerError):
+            return
+        self._last_activity = time.monotonic()
+        op = request.get("op")
+        if op == "info":
+            _send_json(sock, self._info())
+        elif op == "embed":
+            self._handle_embed(sock, request)
+        else:
+            _send_json(sock, {"ok": False, "error": f"unknown op {op!r}"})
+
+    def _info(self) -> Dict[str, Any]:
+        client = self.client
+        tokenizer = client.get_tokenizer()
+        return {
+            "ok": True,
+            "pid": os.getpid(),
+            "model": client.model,
+            "normalize": client.normalize_embeddings,
+            "max_seq_length": client.max_seq_length,
+            "tokenizer": str(getattr(tokenizer, "name_or_path", "") or ""),
+        }
+
+    def _handle_embed(self, sock: socket.socket, request: Dict[str, Any]) -> None:
+        client = self.client
+        if request.get("model") != client.model or bool(
+            request.get("normalize")
+        ) != bool(client.normalize_embeddings):
+            _send_json(sock, {"ok": False, "error": "model_mismatch"})
+            return
+        texts = [str(text) for text in request.get("texts") or []]
+        pending = _PendingEmbed(texts=texts)
+        self._queue.put(pending)
+        pending.done.wait()
+        if pending.error is not None or pending.matrix is None:
+            _send_json(sock, {"ok": False, "error": pending.error or "no result"})
+            return
+        matrix = np.ascontiguousarray(pending.matrix, dtype=np.float32)
+        dim = int(matrix.shape[1]) if matrix.ndim == 2 else 0
+        _send_json(
+            sock,
+            {
+                "ok": True,
+                "rows": int(matrix.shape[0]),
+                "dim": dim,
+                "prompt_tokens": pending.prompt_tokens,
+            },
+        )
+        _send_frame(sock, matrix.tobytes())
+
+    def _next_batch(self) -> List[_PendingEmbed]:
+        first = self._queue.get()
+        if first is None:
+            return []
+        batch = [first]
+        total = len(first.texts)
+        deadline = time.monotonic() + self.batch_window
+        while total < self.max_batch_texts:
+            remaining = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+            total += len(item.texts)
+        return batch
+
+    def _batch_loop(self) -> None:
+        try:
+            self.client.is_available()  # warm the model before the first request
+        except Exception:
+            logger.debug("Embedding model warm-up failed", exc_info=True)
+        while not self._stopped.is_set():
+            batch = self._next_batch()
+            if not batch:
+                continue
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: List[_PendingEmbed]) -> None:
+        client = self.client
+        texts = [text for item in batch for text in item.texts]
+        tokens_before = client.prompt_tokens
+        started = time.perf_counter()
+        try:
+            matrix = client.embed_array(texts)
+            if len(matrix) != len(texts):
+                raise EmbeddingServerError(
+                    f"expected {len(texts)} rows, got {len(matrix)} (blank texts?)"
+                )
+            error = None
+        except Exception as exc:
+            logger.warning("Embedding server batch failed: %s", exc)
+            matrix, error = None, str(exc)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        batch_tokens = client.prompt_tokens - tokens_before
+
+        offset = 0
+        for item in batch:
+            count = len(item.texts)
+            if error is None:
+                item.matrix = matrix[offset : offset + count]
+                item.prompt_tokens = (
+                    round(batch_tokens * count / len(texts)) if texts else 0
+                )
+            item.error = error
+            offset += count
+            item.done.set()
+
+        with self._stats_lock:
+            self._stats["requests"] += len(batch)
+            self._stats["texts"] += len(texts)
+            self._stats["batches"] += 1
+            self._stats["max_batch_requests"] = max(
+                self._stats["max_batch_requests"], len(batch)
+            )
+            self._stats["embed_ms_total"] += elapsed_ms
+            if error is not None:
+                self._stats["errors"] += 1
+        self._last_activity = time.monotonic()
+
+
+def build_configured_server(idle_timeout_seconds: float = 0.0) -> EmbeddingServer:
+    from asky.config import (
+        RESEARCH_EMBEDDING_BATCH_SIZE,
+        RESEARCH_EMBEDDING_SERVER_BATCH_WINDOW_MS,
+        RESEARCH_EMBEDDING_SERVER_SOCKET,
+    )
+
+    return EmbeddingServer(
+        socket_path=Path(RESEARCH_EMBEDDING_SERVER_SOCKET),
+        batch_window_ms=RESEARCH_EMBEDDING_SERVER_BATCH_WINDOW_MS,
+        max_batch_texts=max(RESEARCH_EMBEDDING_BATCH_SIZE, 1) * 8,
+        idle_timeout_seconds=idle_timeout_seconds,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="asky embedding server")
+    parser.add_argument("--socket", help="Unix socket path (default: from config)")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Exit after this many idle seconds (0 = never)",
+    )
+    args = parser.parse_args(argv)
+
+    from asky.config import RESEARCH_EMBEDDING_SERVER_IDLE_TIMEOUT_SECONDS
+
+    idle_timeout = (
+        RESEARCH_EMBEDDING_SERVER_IDLE_TIMEOUT_SECONDS
+        if args.idle_timeout is None
+        else args.idle_timeout
+    )
+    server = build_configured_server(idle_timeout_seconds=idle_timeout)
+    if args.socket:
+        server.socket_path = Path(args.socket).expanduser()
+    server.serve_until_idle()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,52 @@
 """Embedding client backed by sentence-transformers."""
 
 import contextlib
+import importlib.util
 import io
 import logging
 import os
-import struct
 import threading
-from typing import Any, Dict, List, Optional
+import time
+import warnings
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
+
+from asky import tracing
 from asky.config import (
+    RESEARCH_EMBEDDING_BACKEND,
     RESEARCH_EMBEDDING_BATCH_SIZE,
     RESEARCH_EMBEDDING_DEVICE,
     RESEARCH_EMBEDDING_LOCAL_FILES_ONLY,
     RESEARCH_EMBEDDING_MODEL,
     RESEARCH_EMBEDDING_NORMALIZE,
+    RESEARCH_EMBEDDING_SERVER_AUTOSTART,
+    RESEARCH_EMBEDDING_SERVER_ENABLED,
+    RESEARCH_EMBEDDING_SERVER_IDLE_TIMEOUT_SECONDS,
+    RESEARCH_EMBEDDING_SERVER_SOCKET,
 )
+from asky.research.tokenization import tokenize_batch, truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 UNBOUNDED_TOKENIZER_LIMIT = 100_000
 FALLBACK_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+BACKEND_TORCH = "torch"
+BACKEND_ONNX = "onnx"
+BACKEND_INT8 = "int8"
+SUPPORTED_BACKENDS = (BACKEND_TORCH, BACKEND_ONNX, BACKEND_INT8)
+# Backends whose vectors are not interchangeable with full-precision torch
+# output get their own `embedding_model` tag suffix.
+VECTOR_TAG_SUFFIXES = {BACKEND_INT8: "@int8"}
+# Modules each optional backend needs; checked up front without importing them.
+BACKEND_REQUIRED_MODULES = {
+    BACKEND_ONNX: ("optimum", "onnxruntime"),
+    BACKEND_INT8: ("torch",),
+}
+# How long to wait before probing an unreachable embedding server again.
+REMOTE_RETRY_SECONDS = 30.0
+# Stored BLOBs are native-endian float32, matching the historical struct "f" format.
+EMBEDDING_DTYPE = np.float32
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -50,6 +78,7 @@ class EmbeddingClient:
         device: str = None,
         normalize_embeddings: Optional[bool] = None,
         local_files_only: Optional[bool] = None,
+        backend: Optional[str] = None,
     ):
         if self._initialized:
             return
@@ -59,9 +88,29 @@ class EmbeddingClient:
         self.retry_attempts = retry_attempts
         self.retry_backoff_seconds = retry_backoff_seconds
 
-        self.model = model or RESEARCH_EMBEDDING_MODEL
+        self.model_name = model or RESEARCH_EMBEDDING_MODEL
+        self.backend = (backend or RESEARCH_EMBEDDING_BACKEND or BACKEND_TORCH).lower()
+        if self.backend not in SUPPORTED_BACKENDS:
+            logger.warning(
+                "Unknown research.embedding.backend '%s'; using '%s'.",
+                self.backend,
+                BACKEND_TORCH,
+            )
+            self.backend = BACKEND_TORCH
+        missing = _missing_backend_module(self.backend)
+        if missing:
+            # Decided here, before anything reads the `model` vector tag.
+            logger.warning(
+                "Embedding backend '%s' needs '%s', which is not installed; using torch.",
+                self.backend,
+                missing,
+            )
+            self.backend = BACKEND_TORCH
         self.batch_size = batch_size or RESEARCH_EMBEDDING_BATCH_SIZE
         self.device = device or RESEARCH_EMBEDDING_DEVICE
+        if self.backend == BACKEND_INT8 and self.device != "cpu":
+            logger.info("int8 embedding backend runs on CPU; ignoring device=%s", self.device)
+            self.device = "cpu"
         self.normalize_embeddings = (
             RESEARCH_EMBEDDING_NORMALIZE
             if normalize_embeddings is None
@@ -77,6 +126,15 @@ class EmbeddingClient:
         self._tokenizer: Optional[Any] = None
         self._model_load_error: Optional[Exception] = None
 
+        # Shared embedding server (see asky.research.embedding_server)
+        self.use_server = bool(RESEARCH_EMBEDDING_SERVER_ENABLED)
+        self.server_socket = Path(RESEARCH_EMBEDDING_SERVER_SOCKET).expanduser()
+        self.server_autostart = bool(RESEARCH_EMBEDDING_SERVER_AUTOSTART)
+        self._remote: Optional[Any] = None
+        self._remote_info: dict = {}
+        self._remote_retry_at = 0.0
+        self._remote_lock = threading.Lock()
+
         # Usage tracking
         self.texts_embedded: int = 0
         self.api_calls: int = 0
@@ -84,16 +142,33 @@ class EmbeddingClient:
 
         self._initialized = True
         logger.debug(
-            "EmbeddingClient initialized: model=%s, device=%s",
-            self.model,
+            "EmbeddingClient initialized: model=%s, backend=%s, device=%s",
+            self.model_name,
+            self.backend,
             self.device,
         )
 
+    @property
+    def model(self) -> str:
+        """Vector tag stored as `embedding_model` and used to filter reads.
+
+        Equals the model name unless the backend produces vectors that must not
+        be compared with full-precision ones (int8), so switching backends
+        re-embeds content instead of silently mixing vector spaces.
+        """
+        return self.model_name + VECTOR_TAG_SUFFIXES.get(self.backend, "")
+
+    @model.setter
+    def model(self, value: str) -> None:
+        self.model_name = value
+
     def _load_sentence_transformer(
-        self, model_name: str, local_files_only: bool
+        self, model_name: str, local_files_only: bool, backend: str = BACKEND_TORCH
     ) -> Any:
         """Load a sentence-transformer model with compatibility fallback."""
         kwargs = {"device": self.device}
+        if backend == BACKEND_ONNX:
+            kwargs["backend"] = BACKEND_ONNX
         if local_files_only:
             kwargs["local_files_only"] = True
         captured_stdout = io.StringIO()
@@ -109,12 +184,15 @@ class EmbeddingClient:
             kwargs.pop("local_files_only", None)
             return _construct_model(kwargs)
 
-    def _load_model_with_cache_preference(self, model_name: str) -> Any:
+    def _load_model_with_cache_preference(
+        self, model_name: str, backend: str = BACKEND_TORCH
+    ) -> Any:
         """Load from local cache first, then allow network download if configured."""
         try:
             model = self._load_sentence_transformer(
                 model_name=model_name,
                 local_files_only=True,
+                backend=backend,
             )
             logger.debug(
                 "Loaded embedding model '%s' from local Hugging Face cache.",
@@ -131,8 +209,43 @@ class EmbeddingClient:
             return self._load_sentence_transformer(
                 model_name=model_name,
                 local_files_only=False,
+                backend=backend,
             )
 
+    def _load_backend_model(self, model_name: str) -> Any:
+        """Load `model_name` for the configured backend, degrading to torch.
+
+        Missing backend packages are caught in `__init__`, so the vector tag
+        is settled before the first read. A backend whose packages are present
+        but that still fails here falls back to full-precision torch and resets
+        `self.backend`; `model` then changes from `<model>@int8` to the plain
+        name, so rows written afterwards carry the tag of what actually ran.
+        """
+        if self.backend == BACKEND_ONNX:
+            try:
+                return self._load_model_with_cache_preference(
+                    model_name, backend=BACKEND_ONNX
+                )
+            except Exception as exc:
+                logger.warning(
+                    "ONNX embedding backend unavailable for '%s' (%s); using torch.",
+                    model_name,
+                    exc,
+                )
+                self.backend = BACKEND_TORCH
+        model = self._load_model_with_cache_preference(model_name)
+        if self.backend == BACKEND_INT8:
+            try:
+                model = _quantize_dynamic_int8(model)
+            except Exception as exc:
+                logger.warning(
+                    "int8 quantization failed for '%s' (%s); using torch.",
+                    model_name,
+                    exc,
+                )
+                self.backend = BACKEND_TORCH
+        return model
+
     def _ensure_model_loaded(self) -> Any:
         """Load sentence-transformer lazily and cache it."""
         if self._model is not None:
@@ -153,11 +266,9 @@ class EmbeddingClient:
                 )
                 raise RuntimeError("Embedding model is unavailable") from self._model_load_error
 
-            configured_model = self.model
+            configured_model = self.model_name
             try:
-                self._model = self._load_model_with_cache_preference(
-                    model_name=configured_model,
-                )
+                self._model = self._load_backend_model(configured_model)
             except Exception as primary_exc:
                 should_try_fallback = (
                     not self.local_files_only and configured_model != FALLBACK_EMBEDDING_MODEL
@@ -170,14 +281,14 @@ class EmbeddingClient:
                         FALLBACK_EMBEDDING_MODEL,
                     )
                     try:
-                        self._model = self._load_model_with_cache_preference(
-                            model_name=FALLBACK_EMBEDDING_MODEL,
+                        self._model = self._load_backend_model(
+                            FALLBACK_EMBEDDING_MODEL
                         )
-                        self.model = FALLBACK_EMBEDDING_MODEL
+                        self.model_name = FALLBACK_EMBEDDING_MODEL
                         logger.info(
                             "Loaded fallback embedding model '%s' successfully. "
                             "Update research.embedding.model to avoid repeated primary model load failures.",
-                            self.model,
+                            self.model_name,
                         )
                     except Exception as fallback_exc:
                         self._model_load_error = fallback_exc
@@ -204,105 +315,113 @@ class EmbeddingClient:
             self._tokenizer = getattr(self._model, "tokenizer", None)
             return self._model
 
-    def _to_embedding_rows(self, encoded: Any) -> List[List[float]]:
-        """Normalize model output to List[List[float]]."""
-        rows = encoded.tolist() if hasattr(encoded, "tolist") else encoded
-        if rows is None:
-            return []
-        if isinstance(rows, tuple):
-            rows = list(rows)
-        if not isinstance(rows, list):
-            return []
-        if rows and isinstance(rows[0], (int, float)):
-            rows = [rows]
-        normalized: List[List[float]] = []
-        for row in rows:
-            if not isinstance(row, list):
-                continue
-            normalized.append([float(value) for value in row])
-        return normalized
-
-    def _count_text_tokens(self, texts: List[str]) -> int:
-        """Estimate total input tokens for lightweight usage tracking."""
-        tokenizer = self.get_tokenizer()
-        if tokenizer is None:
-            return 0
-        max_length = self.max_seq_length
+    def _remote_server(self) -> Optional[Any]:
+        """Return a client for the shared embedding server when it can be used.
 
-        total = 0
-        for text in texts:
-            try:
-                kwargs = {"add_special_tokens": False}
-                if max_length > 0:
-                    kwargs["truncation"] = True
-                    kwargs["max_length"] = max_length
-                kwargs["verbose"] = False
-                token_ids = tokenizer.encode(text, **kwargs)
-            except TypeError:
-                token_ids = tokenizer.encode(text)
-            except Exception:
-                continue
-            total += len(token_ids)
-        return total
+        The server is only consulted while no model is loaded in this process.
+        An unreachable socket is re-probed after `REMOTE_RETRY_SECONDS`; with
+        autostart on, a detached server is spawned for later invocations and
+        the current call falls back to in-process loading.
+        """
+        if not self.use_server or self._model is not None:
+            return None
+        if self._remote is not None:
+            return self._remote
+        with self._remote_lock:
+            if self._remote is not None:
+                return self._remote
+            now = time.monotonic()
+            if now < self._remote_retry_at:
+                return None
+            from asky.research.embedding_server import (
+                EmbeddingServerError,
+                RemoteEmbeddingClient,
+                spawn_server,
+            )
 
-    def _encode_token_ids(
-        self,
-        tokenizer: Any,
-        text: str,
-        kwargs: Dict[str, Any],
-    ) -> List[int]:
-        """Encode text into token IDs with compatibility fallbacks."""
-        try:
-            return tokenizer.encode(text, **kwargs)
-        except TypeError:
-            compat_kwargs = {}
-            if "add_special_tokens" in kwargs:
-                compat_kwargs["add_special_tokens"] = kwargs["add_special_tokens"]
+            remote = RemoteEmbeddingClient(self.server_socket)
             try:
-                return tokenizer.encode(text, **compat_kwargs)
-            except TypeError:
-                return tokenizer.encode(text)
-
-    def _decode_token_ids(self, tokenizer: Any, token_ids: List[int]) -> str:
-        """Decode token IDs back to text when tokenizer supports decode()."""
-        if not hasattr(tokenizer, "decode"):
-            return ""
+                info = remote.info()
+            except (OSError, ValueError, EmbeddingServerError) as exc:
+                logger.debug("Embedding server unreachable at %s: %s", self.server_socket, exc)
+                self._remote_retry_at = now + REMOTE_RETRY_SECONDS
+                if self.server_autostart:
+                    spawn_server(
+                        self.server_socket,
+                        RESEARCH_EMBEDDING_SERVER_IDLE_TIMEOUT_SECONDS,
+                    )
+                return None
+            if info.get("model") != self.model or bool(info.get("normalize")) != (
+                self.normalize_embeddings
+            ):
+                logger.info(
+                    "Embedding server runs model=%s normalize=%s; loading %s in-process",
+                    info.get("model"),
+                    info.get("normalize"),
+                    self.model,
+                )
+                self.use_server = False
+                return None
+            self._remote = remote
+            self._remote_info = info
+            return remote
+
+    def _drop_remote(self, exc: Exception) -> None:
+        logger.warning("Embedding server request failed, using in-process model: %s", exc)
+        self._remote = None
+        self._remote_info = {}
+        self._remote_retry_at = time.monotonic() + REMOTE_RETRY_SECONDS
+
+    def _load_remote_tokenizer(self) -> Optional[Any]:
+        """Load only the tokenizer the server reports, skipping model weights."""
+        name = self._remote_info.get("tokenizer")
+        if not name:
+            return None
         try:
-            return str(tokenizer.decode(token_ids, skip_special_tokens=True)).strip()
-        except TypeError:
-            return str(tokenizer.decode(token_ids)).strip()
-        except Exception:
-            return ""
+            from transformers import AutoTokenizer
+
+            return AutoTokenizer.from_pretrained(name, local_files_only=True)
+        except Exception as exc:
+            logger.debug("Could not load server tokenizer %s: %s", name, exc)
+            return None
 
-    def _prepare_texts_for_embedding(self, texts: List[str]) -> List[str]:
-        """Truncate over-length embedding inputs to avoid tokenizer/model warnings."""
+    def _to_embedding_matrix(self, encoded: Any) -> np.ndarray:
+        """Normalize model output to a 2-D float32 array without per-value copies."""
+        if encoded is None:
+            return np.empty((0, 0), dtype=EMBEDDING_DTYPE)
+        if not isinstance(encoded, np.ndarray) and hasattr(encoded, "tolist"):
+            encoded = encoded.tolist()
+        matrix = np.asarray(encoded, dtype=EMBEDDING_DTYPE)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        if matrix.ndim != 2:
+            return np.empty((0, 0), dtype=EMBEDDING_DTYPE)
+        return np.ascontiguousarray(matrix)
+
+    def _prepare_texts_for_embedding(self, texts: List[str]) -> Tuple[List[str], int]:
+        """Truncate over-length inputs and count tokens from one tokenization pass.
+
+        Returns the texts to encode and their total token count (after
+        truncation) for usage tracking.
+        """
         tokenizer = self.get_tokenizer()
+        if tokenizer is None:
+            return texts, 0
         max_length = self.max_seq_length
-        if tokenizer is None or max_length <= 0:
-            return texts
 
         prepared: List[str] = []
+        token_count = 0
         truncated_count = 0
-        length_check_kwargs: Dict[str, Any] = {
-            "add_special_tokens": False,
-            "verbose": False,
-        }
-        truncation_kwargs: Dict[str, Any] = {
-            "add_special_tokens": False,
-            "truncation": True,
-            "max_length": max_length,
-            "verbose": False,
-        }
-        for text in texts:
-            token_ids = self._encode_token_ids(tokenizer, text, length_check_kwargs)
-            if len(token_ids) <= max_length:
+        for text, tokenized in zip(texts, tokenize_batch(tokenizer, texts)):
+            if max_length > 0 and len(tokenized) > max_length:
+                prepared.append(
+                    truncate_to_tokens(tokenizer, text, tokenized, max_length)
+                )
+                token_count += max_length
+                truncated_count += 1
+            else:
                 prepared.append(text)
-                continue
-
-            truncated_ids = self._encode_token_ids(tokenizer, text, truncation_kwargs)
-            truncated_text = self._decode_token_ids(tokenizer, truncated_ids)
-            prepared.append(truncated_text or text)
-            truncated_count += 1
+                token_count += len(tokenized)
 
         if truncated_count:
             logger.debug(
@@ -310,12 +429,12 @@ class EmbeddingClient:
                 truncated_count,
                 max_length,
             )
-        return prepared
+        return prepared, token_count
 
-    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
         """Encode one text batch using sentence-transformers."""
         model = self._ensure_model_loaded()
-        prepared_texts = self._prepare_texts_for_embedding(texts)
+        prepared_texts, token_count = self._prepare_texts_for_embedding(texts)
         encoded = model.encode(
             prepared_texts,
             batch_size=len(prepared_texts),
@@ -323,27 +442,55 @@ class EmbeddingClient:
             show_progress_bar=False,
             normalize_embeddings=self.normalize_embeddings,
         )
-        rows = self._to_embedding_rows(encoded)
+        matrix = self._to_embedding_matrix(encoded)
 
         self.api_calls += 1
         self.texts_embedded += len(prepared_texts)
-        self.prompt_tokens += self._count_text_tokens(prepared_texts)
-        return rows
+        self.prompt_tokens += token_count
+        return matrix
 
-    def embed(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for a list of texts."""
-        if not texts:
-            return []
+    def embed_array(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings as one `(n_texts, dim)` float32 array.
 
-        filtered_texts = [text for text in texts if text and text.strip()]
+        Blank texts are skipped, as in `embed()`. Rows can go straight to
+        `serialize_embedding()` and Chroma without a list round-trip.
+        """
+        filtered_texts = [text for text in texts or [] if text and text.strip()]
         if not filtered_texts:
-            return []
+            return np.empty((0, 0), dtype=EMBEDDING_DTYPE)
 
-        all_embeddings: List[List[float]] = []
+        remote = self._remote_server()
+        if remote is not None:
+            try:
+                with tracing.span(
+                    "embedding.remote", "embedding", texts=len(filtered_texts)
+                ):
+                    matrix, token_count = remote.embed_array(
+                        filtered_texts, self.model, self.normalize_embeddings
+                    )
+                self.api_calls += 1
+                self.texts_embedded += len(filtered_texts)
+                self.prompt_tokens += token_count
+                return matrix
+            except Exception as exc:
+                self._drop_remote(exc)
+
+        batches: List[np.ndarray] = []
         for i in range(0, len(filtered_texts), self.batch_size):
             batch = filtered_texts[i : i + self.batch_size]
-            all_embeddings.extend(self._embed_batch(batch))
-        return all_embeddings
+            with tracing.span("embedding.batch", "embedding", texts=len(batch)):
+                matrix = self._embed_batch(batch)
+            if len(matrix):
+                batches.append(matrix)
+        if not batches:
+            return np.empty((0, 0), dtype=EMBEDDING_DTYPE)
+        if len(batches) == 1:
+            return batches[0]
+        return np.concatenate(batches, axis=0)
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for a list of texts (list form of `embed_array`)."""
+        return self.embed_array(texts).tolist()
 
     def embed_single(self, text: str) -> List[float]:
         """Generate embedding for a single text."""
@@ -354,6 +501,8 @@ class EmbeddingClient:
 
     def is_available(self) -> bool:
         """Check whether the embedding model is loadable."""
+        if self._remote_server() is not None:
+            return True
         try:
             self._ensure_model_loaded()
             return True
@@ -366,6 +515,10 @@ class EmbeddingClient:
 
     def get_tokenizer(self) -> Optional[Any]:
         """Expose tokenizer for token-aware chunking."""
+        if self._tokenizer is None and self._remote_server() is not None:
+            self._tokenizer = self._load_remote_tokenizer()
+            if self._tokenizer is not None:
+                return self._tokenizer
         try:
             self._ensure_model_loaded()
         except Exception:
@@ -375,11 +528,14 @@ class EmbeddingClient:
     @property
     def max_seq_length(self) -> int:
         """Expose finite model sequence length when available."""
-        try:
-            model = self._ensure_model_loaded()
-        except Exception:
-            return 0
-        raw_value = getattr(model, "max_seq_length", 0)
+        if self._remote_server() is not None:
+            raw_value = self._remote_info.get("max_seq_length", 0)
+        else:
+            try:
+                model = self._ensure_model_loaded()
+            except Exception:
+                return 0
+            raw_value = getattr(model, "max_seq_length", 0)
         try:
             max_length = int(raw_value)
         except (TypeError, ValueError):
@@ -389,17 +545,22 @@ class EmbeddingClient:
         return max_length
 
     @staticmethod
-    def serialize_embedding(embedding: List[float]) -> bytes:
+    def serialize_embedding(embedding: Union[Sequence[float], np.ndarray]) -> bytes:
         """Convert embedding to bytes for SQLite storage."""
-        return struct.pack(f"{len(embedding)}f", *embedding)
+        return np.asarray(embedding, dtype=EMBEDDING_DTYPE).tobytes()
+
+    @staticmethod
+    def deserialize_embedding_array(data: Optional[bytes]) -> np.ndarray:
+        """View stored bytes as a read-only float32 array (no copy)."""
+        if not data:
+            return np.empty(0, dtype=EMBEDDING_DTYPE)
+        count = len(data) // EMBEDDING_DTYPE().itemsize
+        return np.frombuffer(data, dtype=EMBEDDING_DTYPE, count=count)
 
     @staticmethod
     def deserialize_embedding(data: bytes) -> List[float]:
         """Convert bytes back to embedding list."""
-        if not data:
-            return []
-        count = len(data) // 4
-        return list(struct.unpack(f"{count}f", data))
+        return EmbeddingClient.deserialize_embedding_array(data).tolist()
 
     def get_usage_stats(self) -> dict:
         """Get current usage statistics."""
@@ -415,6 +576,26 @@ def get_embedding_client() -> EmbeddingClient:
     return EmbeddingClient()
 
 
+def _missing_backend_module(backend: str) -> Optional[str]:
+    """Return the first module `backend` needs that cannot be found, if any."""
+    for module_name in BACKEND_REQUIRED_MODULES.get(backend, ()):
+        if importlib.util.find_spec(module_name) is None:
+            return module_name
+    return None
+
+
+def _quantize_dynamic_int8(model: Any) -> Any:
+    """Swap Linear layers for dynamically quantized int8 ones, in place."""
+    import torch
+
+    with warnings.catch_warnings():
+        # torch.ao.quantization is deprecated upstream in favour of torchao.
+        warnings.simplefilter("ignore")
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+
+
 @contextlib.contextmanager
 def _silence_process_output(
     captured_stdout: io.StringIO, captured_stderr: io.StringIO
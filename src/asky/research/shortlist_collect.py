@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urlsplit
 
 from asky.research.shortlist_types import (
@@ -101,6 +101,42 @@ def collect_seed_link_candidates(
     return output
 
 
+SearchOutcome = Tuple[Any, Optional[Exception], float]
+
+
+def _run_searches(
+    search_jobs: Sequence[Tuple[str, int]],
+    *,
+    search_executor: SearchExecutor,
+    max_workers: int,
+) -> List[SearchOutcome]:
+    """Run searches, returning (payload, error, elapsed_ms) in job order."""
+    import time
+
+    from asky import tracing
+
+    def run_one(job: Tuple[str, int]) -> SearchOutcome:
+        query, count = job
+        started = time.perf_counter()
+        try:
+            with tracing.span("shortlist.search", "search", count=count):
+                payload = search_executor({"q": query, "count": count})
+        except Exception as exc:
+            return None, exc, (time.perf_counter() - started) * 1000
+        return payload, None, (time.perf_counter() - started) * 1000
+
+    workers = max(1, min(int(max_workers or 1), len(search_jobs)))
+    if workers <= 1:
+        return [run_one(job) for job in search_jobs]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="asky-shortlist-search"
+    ) as pool:
+        return list(pool.map(tracing.bind_context(run_one), search_jobs))
+
+
 def collect_candidates(
     *,
     seed_urls: Sequence[str],
@@ -123,8 +159,13 @@ def collect_candidates(
     is_blocked_seed_link: IsBlockedSeedLink,
     elapsed_ms: ElapsedMs,
     logger: Any,
+    search_max_concurrency: int = 1,
 ) -> List[CandidateRecord]:
-    """Collect candidates from prompt seed URLs and optional web searches."""
+    """Collect candidates from prompt seed URLs and optional web searches.
+
+    Sub-query searches run concurrently (up to `search_max_concurrency`);
+    provider rate limits are enforced by the search executor.
+    """
     import time
 
     collected: List[CandidateRecord] = [
@@ -184,42 +225,56 @@ def collect_candidates(
                 query_count - 1
             )
 
-        for idx, q in enumerate(search_queries):
-            if not q:
-                continue
+        search_jobs = [
+            (q, budget_allocation[idx]) for idx, q in enumerate(search_queries) if q
+        ]
+        if metrics is not None:
+            metrics["search_calls"] += len(search_jobs)
+        search_outcomes = _run_searches(
+            search_jobs,
+            search_executor=search_executor,
+            max_workers=search_max_concurrency,
+        )
 
-            search_start = time.perf_counter()
-            try:
-                if metrics is not None:
-                    metrics["search_calls"] += 1
-                search_payload = search_executor({"q": q, "count": budget_allocation[idx]})
-            except Exception as exc:
-                warnings.append(f"search_error:{exc}")
+        # Results are consumed in query order so dedupe stays deterministic.
+        for (q, _count), (search_payload, search_exc, search_elapsed) in zip(
+            search_jobs, search_outcomes
+        ):
+            if search_exc is not None:
+                warnings.append(f"search_error:{search_exc}")
                 logger.debug(
                     "source_shortlist search failed query_len=%d elapsed=%.2fms error=%s",
                     len(q),
-                    elapsed_ms(search_start),
-                    exc,
+                    search_elapsed,
+                    search_exc,
                 )
                 search_payload = {"results": []}
 
             if isinstance(search_payload, dict):
+                if metrics is not None and search_exc is None:
+                    cache_metric = (
+                        "search_cache_hits"
+                        if search_payload.get("cache_hit")
+                        else "search_cache_misses"
+                    )
+                    metrics[cache_metric] = metrics.get(cache_metric, 0) + 1
                 if search_payload.get("error"):
                     warnings.append(f"search_error:{search_payload['error']}")
                     logger.debug(
                         "source_shortlist search error payload query_len=%d elapsed=%.2fms error=%s",
                         len(q),
-                        elapsed_ms(search_start),
+                        search_elapsed,
                         search_payload.get("error"),
                     )
                 results_count = len(search_payload.get("results", []))
                 if metrics is not None:
                     metrics["search_results"] += results_count
                 logger.debug(
-                    "source_shortlist search completed query_len=%d results=%d elapsed=%.2fms",
+                    "source_shortlist search completed query_len=%d results=%d elapsed=%.2fms cache_hit=%s",
                     len(q),
                     results_count,
-                    elapsed_ms(search_start),
+                    search_elapsed,
+                    bool(search_payload.get("cache_hit")),
                 )
                 for result in search_payload.get("results", []):
                     url = normalize_whitespace(str(result.get("url", "")))
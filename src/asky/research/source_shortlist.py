@@ -21,7 +21,9 @@ from urllib.parse import urlsplit
 import requests
 
 from asky.config import (
+    FETCH_MAX_CONCURRENCY,
     FETCH_TIMEOUT,
+    SEARCH_MAX_CONCURRENCY,
     SOURCE_SHORTLIST_DOC_LEAD_CHARS,
     SOURCE_SHORTLIST_ENABLE_RESEARCH_MODE,
     SOURCE_SHORTLIST_ENABLE_STANDARD_MODE,
@@ -49,7 +51,7 @@ from asky.config import (
     USER_AGENT,
 )
 from asky.html import HTMLStripper
-from asky.retrieval import fetch_url_document
+from asky.retrieval import fetch_url_document, fetch_urls_in_order
 from asky.research.shortlist_collect import collect_candidates
 from asky.research.shortlist_score import resolve_scoring_queries, score_candidates
 from asky.research.shortlist_types import (
@@ -245,6 +247,8 @@ def shortlist_prompt_sources(
     metrics: ShortlistMetrics = {
         "search_calls": 0,
         "search_results": 0,
+        "search_cache_hits": 0,
+        "search_cache_misses": 0,
         "candidate_inputs": 0,
         "candidate_deduped": 0,
         "fetch_calls": 0,
@@ -368,6 +372,7 @@ def shortlist_prompt_sources(
             seed_links_per_page=SOURCE_SHORTLIST_SEED_LINKS_PER_PAGE,
             search_with_seed_urls=SOURCE_SHORTLIST_SEARCH_WITH_SEED_URLS,
             search_result_count=SOURCE_SHORTLIST_SEARCH_RESULT_COUNT,
+            search_max_concurrency=SEARCH_MAX_CONCURRENCY,
             max_candidates=SOURCE_SHORTLIST_MAX_CANDIDATES,
             max_title_chars=MAX_TITLE_CHARS,
             normalize_source_url=normalize_source_url,
@@ -447,6 +452,7 @@ def shortlist_prompt_sources(
         fetch_executor=fetch_executor_with_trace,
         warnings=warnings,
         metrics=metrics,
+        fetch_max_concurrency=FETCH_MAX_CONCURRENCY,
     )
     seed_url_documents = _build_seed_url_documents(
         seed_urls=seed_urls,
@@ -679,17 +685,59 @@ def _shortlist_enabled_for_mode(research_mode: bool) -> bool:
     return bool(SOURCE_SHORTLIST_ENABLE_STANDARD_MODE)
 
 
+def _run_fetches(
+    urls: Sequence[str],
+    *,
+    fetch_executor: FetchExecutor,
+    max_workers: int,
+) -> List[Tuple[Dict[str, Any], float]]:
+    """Fetch URLs, returning (payload, elapsed_ms) in input order."""
+
+    def run_one(url: str) -> Tuple[Dict[str, Any], float]:
+        started = time.perf_counter()
+        payload = fetch_executor(url)
+        return payload, _elapsed_ms(started)
+
+    return fetch_urls_in_order(
+        urls,
+        run_one,
+        max_workers=max_workers,
+        thread_name_prefix="asky-shortlist-fetch",
+    )
+
+
 def _fetch_candidate_content(
     candidates: Sequence[CandidateRecord],
     seed_urls: Sequence[str],
     fetch_executor: FetchExecutor,
     warnings: List[str],
     metrics: Optional[ShortlistMetrics] = None,
+    fetch_max_concurrency: int = 1,
 ) -> List[CandidateRecord]:
-    """Fetch and extract main text for candidate URLs."""
+    """Fetch and extract main text for candidate URLs.
+
+    Fetches run concurrently (up to `fetch_max_concurrency`); results are
+    processed in candidate order so dedupe and warnings stay deterministic.
+    """
     extracted: List[CandidateRecord] = []
     seen_canonical_urls = set()
     seed_url_set = set(seed_urls)
+    fetch_indexes: List[int] = []
+    for index, candidate in enumerate(candidates):
+        if candidate.source_type == "corpus" and candidate.fetched_content:
+            continue
+        should_fetch_seed_document = (
+            candidate.source_type == "seed" and candidate.requested_url in seed_url_set
+        )
+        if index < SOURCE_SHORTLIST_MAX_FETCH_URLS or should_fetch_seed_document:
+            fetch_indexes.append(index)
+    fetched_payloads = _run_fetches(
+        [candidates[index].url for index in fetch_indexes],
+        fetch_executor=fetch_executor,
+        max_workers=fetch_max_concurrency,
+    )
+    payload_by_index = dict(zip(fetch_indexes, fetched_payloads))
+
     for index, candidate in enumerate(candidates):
         # Corpus candidates already have content; pass through without fetching
         if candidate.source_type == "corpus" and candidate.fetched_content:
@@ -698,19 +746,14 @@ def _fetch_candidate_content(
             extracted.append(candidate)
             continue
 
-        should_fetch_for_scoring = index < SOURCE_SHORTLIST_MAX_FETCH_URLS
-        should_fetch_seed_document = (
-            candidate.source_type == "seed" and candidate.requested_url in seed_url_set
-        )
-        if not should_fetch_for_scoring and not should_fetch_seed_document:
+        if index not in payload_by_index:
             continue
+        should_fetch_for_scoring = index < SOURCE_SHORTLIST_MAX_FETCH_URLS
 
-        fetch_start = time.perf_counter()
         if metrics is not None:
             metrics["fetch_calls"] += 1
 
-        payload = fetch_executor(candidate.url)
-        fetch_elapsed = _elapsed_ms(fetch_start)
+        payload, fetch_elapsed = payload_by_index[index]
         warning_text = str(payload.get("warning", "") or "")
         candidate.fetch_warning = warning_text
         candidate.fetch_error = _extract_fetch_error(payload)
@@ -923,6 +966,7 @@ def _default_fetch_executor(
             "tool_name": "shortlist",
             "operation": "shortlist_fetch",
         },
+        use_cache=True,
     )
     try:
         from asky.research.cache import ResearchCache
@@ -930,7 +974,7 @@ def _default_fetch_executor(
         cache = ResearchCache()
 
         content_to_cache = str(payload.get("text") or payload.get("content") or "")
-        if content_to_cache and not payload.get("error"):
+        if content_to_cache and not payload.get("error") and not payload.get("cache_id"):
             # Only cache successfully extracted content
             cache.cache_url(
                 url=str(payload.get("final_url", "") or url),
@@ -1066,10 +1110,16 @@ def _default_search_executor(
     args: Dict[str, Any],
     trace_callback: Optional[TraceCallback] = None,
 ) -> Dict[str, Any]:
-    """Lazy-load web search executor to avoid shortlist import overhead."""
-    from asky.tools import execute_web_search as execute_web_search_impl
+    """Lazy-load web search executor to avoid shortlist import overhead.
+
+    Cache hits are flagged with `cache_hit` so collection can count them.
+    """
+    from asky.tools import execute_cached_web_search
 
-    return execute_web_search_impl(args, trace_callback=trace_callback)
+    payload, cache_hit = execute_cached_web_search(args, trace_callback=trace_callback)
+    if cache_hit and isinstance(payload, dict):
+        payload = {**payload, "cache_hit": True}
+    return payload
 
 
 def _get_embedding_client() -> "EmbeddingClient":
@@ -0,0 +1,122 @@
+"""Single-pass tokenization shared by embedding preparation and chunking.
+
+Fast (Rust-backed) Hugging Face tokenizers are called once per batch with
+`return_offsets_mapping=True`, so callers can measure, truncate and split text
+from one set of token ids and character offsets. Other tokenizers fall back to
+one `encode()` per text and report no offsets.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TokenizedText:
+    """Token ids for one text, with `(start, end)` character offsets when known."""
+
+    ids: List[int]
+    offsets: Optional[List[Tuple[int, int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def encode_token_ids(
+    tokenizer: Any, text: str, kwargs: Optional[Dict[str, Any]] = None
+) -> List[int]:
+    """Encode text into token IDs with compatibility fallbacks."""
+    kwargs = kwargs if kwargs is not None else {
+        "add_special_tokens": False,
+        "verbose": False,
+    }
+    try:
+        return list(tokenizer.encode(text, **kwargs))
+    except TypeError:
+        compat_kwargs = {}
+        if "add_special_tokens" in kwargs:
+            compat_kwargs["add_special_tokens"] = kwargs["add_special_tokens"]
+        try:
+            return list(tokenizer.encode(text, **compat_kwargs))
+        except TypeError:
+            return list(tokenizer.encode(text))
+
+
+def decode_token_ids(tokenizer: Any, token_ids: Sequence[int]) -> str:
+    """Decode token IDs back to text when the tokenizer supports decode()."""
+    if not hasattr(tokenizer, "decode"):
+        return ""
+    try:
+        return str(tokenizer.decode(list(token_ids), skip_special_tokens=True)).strip()
+    except TypeError:
+        return str(tokenizer.decode(list(token_ids))).strip()
+    except Exception:
+        return ""
+
+
+def supports_batch_offsets(tokenizer: Any) -> bool:
+    """True for fast tokenizers that return offsets from one batched call."""
+    return bool(getattr(tokenizer, "is_fast", False)) and callable(tokenizer)
+
+
+def tokenize_batch(tokenizer: Any, texts: Sequence[str]) -> List[TokenizedText]:
+    """Tokenize every text exactly once, without special tokens."""
+    if not texts:
+        return []
+    if supports_batch_offsets(tokenizer):
+        try:
+            encoded = tokenizer(
+                list(texts),
+                add_special_tokens=False,
+                return_offsets_mapping=True,
+                return_attention_mask=False,
+                return_token_type_ids=False,
+                verbose=False,
+            )
+            return [
+                TokenizedText(
+                    ids=list(ids),
+                    offsets=[(int(start), int(end)) for start, end in offsets],
+                )
+                for ids, offsets in zip(
+                    encoded["input_ids"], encoded["offset_mapping"]
+                )
+            ]
+        except Exception as exc:
+            logger.debug("Batch tokenization failed, encoding per text: %s", exc)
+    return [TokenizedText(ids=encode_token_ids(tokenizer, text)) for text in texts]
+
+
+def token_span_text(
+    tokenizer: Any,
+    text: str,
+    tokenized: TokenizedText,
+    start: int,
+    end: int,
+) -> str:
+    """Return the text covered by tokens `[start, end)`.
+
+    Uses offsets to slice the original text when available, so casing and
+    spacing survive; otherwise decodes the ids.
+    """
+    if start >= end:
+        return ""
+    if tokenized.offsets is not None:
+        return text[tokenized.offsets[start][0] : tokenized.offsets[end - 1][1]].strip()
+    return decode_token_ids(tokenizer, tokenized.ids[start:end])
+
+
+def truncate_to_tokens(
+    tokenizer: Any,
+    text: str,
+    tokenized: TokenizedText,
+    max_length: int,
+) -> str:
+    """Cut `text` to its first `max_length` tokens, reusing `tokenized`."""
+    if max_length <= 0 or len(tokenized) <= max_length:
+        return text
+    return token_span_text(tokenizer, text, tokenized, 0, max_length) or text
@@ -704,6 +704,7 @@ def _fetch_and_parse(
             include_links=True,
             max_links=max_links or RESEARCH_MAX_LINKS_PER_URL,
             trace_context={"tool_name": "research"},
+            use_cache=True,
         )
         if payload.get("error"):
             return {
@@ -717,6 +718,8 @@ def _fetch_and_parse(
             "content": str(payload.get("content", "")),
             "title": str(payload.get("title", "") or url),
             "links": payload.get("links", []),
+            "cache_id": payload.get("cache_id"),
+            "source": payload.get("source"),
             "error": None,
         }
     except Exception as e:
@@ -895,18 +898,20 @@ def execute_extract_links(args: Dict[str, Any]) -> Dict[str, Any]:
                 results[url] = {"error": parsed["error"]}
                 continue
 
-            # Cache the content (triggers background summarization)
-            cache_id = cache.cache_url(
-                url=url,
-                content=parsed["content"],
-                title=parsed["title"],
-                links=parsed["links"],
-                trigger_summarization=bool(parsed["content"]),
-                usage_tracker=usage_tracker,
-            )
-
             links = parsed["links"]
-            from_cache = False
+            # Revalidated or already written back by the cache-aware fetch.
+            cache_id = parsed.get("cache_id")
+            from_cache = parsed.get("source") in {"cache", "cache_revalidated"}
+            if not cache_id:
+                # Cache the content (triggers background summarization)
+                cache_id = cache.cache_url(
+                    url=url,
+                    content=parsed["content"],
+                    title=parsed["title"],
+                    links=links,
+                    trigger_summarization=bool(parsed["content"]),
+                    usage_tracker=usage_tracker,
+                )
 
         # Try to embed links for relevance filtering
         _try_embed_links(cache_id, links)
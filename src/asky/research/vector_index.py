@@ -0,0 +1,594 @@
+"""Persistent IVF-flat nearest-neighbour index over SQLite embedding BLOBs.
+
+Used when Chroma is missing or disabled, so findings and memory search do not
+deserialize and score every stored vector per query. Each index covers the
+rows of one table (`research_findings`, `user_memories`) for one embedding
+model tag and lives beside the SQLite DB in `vector_index/`:
+
+- `<table>-<model digest>.npz` holds unit-normalized vectors, ids, session
+  keys and the IVF centroids;
+- `<table>-<model digest>.log` is an append-only log of adds and deletes
+  written by `store_*_embedding`. Every process replays it on load and before
+  each query, and folds it into the snapshot once it grows.
+
+Small tables (up to `exact_scan_rows`) are scored exactly with one matrix
+product. Larger ones are partitioned by spherical k-means, and only the
+`probe_lists` closest partitions are scored. On first use, and whenever the
+row count or max id no longer matches SQLite (other writers, deletes), the
+index is rebuilt from the table. A new model tag maps to new files, so model
+changes rebuild lazily too. Rows embedded under another tag (or none) are not
+indexed; while any exist the index declines to answer, so callers keep using
+their full scan and older findings and memories stay searchable.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import sqlite3
+import struct
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR_NAME = "vector_index"
+FINDINGS_TABLE = "research_findings"
+MEMORIES_TABLE = "user_memories"
+GLOBAL_KEY = ""
+
+# Log record: op, row id, key length, vector dims; then key bytes and vector.
+LOG_RECORD = struct.Struct("<cqHI")
+OP_ADD = b"A"
+OP_DELETE = b"D"
+# Fold the log into the snapshot once it holds this many records...
+COMPACT_LOG_RECORDS = 2048
+# ...and stop appending (forcing a rebuild) if nobody has loaded it for a while.
+MAX_LOG_BYTES = 64 * 1024 * 1024
+
+KMEANS_ITERATIONS = 8
+KMEANS_SAMPLE_PER_LIST = 40
+ASSIGN_CHUNK_ROWS = 8192
+# Retrain centroids once the index has grown this much since training.
+RETRAIN_GROWTH = 2.0
+
+
+def session_key(session_id: Any) -> str:
+    """Filter key stored per row; global (session-less) rows use `GLOBAL_KEY`."""
+    return GLOBAL_KEY if session_id is None else str(session_id)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    assign = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGN_CHUNK_ROWS):
+        block = vectors[start : start + ASSIGN_CHUNK_ROWS]
+        assign[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return assign
+
+
+def _train_centroids(
+    vectors: np.ndarray, n_lists: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Spherical k-means on a sample of unit vectors."""
+    sample_size = min(len(vectors), n_lists * KMEANS_SAMPLE_PER_LIST)
+    sample = vectors[rng.choice(len(vectors), size=sample_size, replace=False)]
+    centroids = sample[rng.choice(sample_size, size=n_lists, replace=False)].copy()
+    for _ in range(KMEANS_ITERATIONS):
+        assign = _nearest_centroids(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        empty = np.bincount(assign, minlength=n_lists) == 0
+        sums[empty] = centroids[empty]
+        centroids = _normalize_rows(sums)
+    return centroids
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path, exclusive: bool) -> Iterator[None]:
+    """Advisory lock shared by every process touching one index."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a+b") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class VectorIndex:
+    """Cosine top-k search over one table's embeddings for one model tag."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        table: str,
+        model: str,
+        exact_scan_rows: int = 20_000,
+        probe_lists: int = 16,
+        seed: int = 0,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.table = table
+        self.model = model
+        self.exact_scan_rows = max(0, int(exact_scan_rows))
+        self.probe_lists = max(1, int(probe_lists))
+        index_dir = self.db_path.parent / INDEX_DIR_NAME
+        stem = f"{table}-{hashlib.sha1(model.encode('utf-8')).hexdigest()[:12]}"
+        self.snapshot_path = index_dir / f"{stem}.npz"
+        self.log_path = index_dir / f"{stem}.log"
+        self.lock_path = index_dir / f"{stem}.lock"
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._loaded = False
+        self._ids = np.empty(0, dtype=np.int64)
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._keys = np.empty(0, dtype=str)
+        self._assign = np.empty(0, dtype=np.int32)
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_rows = 0
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._has_stale_rows = False
+        self._log_offset = 0
+        self._log_records = 0
+        self._pending: Dict[int, Tuple[np.ndarray, str]] = {}
+        self._deleted: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # --- Writes --------------------------------------------------------------
+
+    def add(self, row_id: int, vector: Sequence[float], key: str = GLOBAL_KEY) -> None:
+        """Record an inserted or re-embedded row."""
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        key_bytes = key.encode("utf-8")
+        record = (
+            LOG_RECORD.pack(OP_ADD, int(row_id), len(key_bytes), len(vector))
+            + key_bytes
+            + vector.tobytes()
+        )
+        with self._lock:
+            self._append_log(record)
+            if self._loaded:
+                self._deleted.discard(int(row_id))
+                self._pending[int(row_id)] = (vector, key)
+
+    def remove(self, row_ids: Iterable[int]) -> None:
+        """Record deleted rows."""
+        row_ids = [int(row_id) for row_id in row_ids]
+        if not row_ids:
+            return
+        record = b"".join(LOG_RECORD.pack(OP_DELETE, row_id, 0, 0) for row_id in row_ids)
+        with self._lock:
+            self._append_log(record)
+            if self._loaded:
+                for row_id in row_ids:
+                    self._pending.pop(row_id, None)
+                    self._deleted.add(row_id)
+
+    def clear(self) -> None:
+        """Drop the persisted index; the next search rebuilds it."""
+        with self._lock:
+            with self._exclusive():
+                for path in (self.snapshot_path, self.log_path):
+                    with contextlib.suppress(FileNotFoundError):
+                        path.unlink()
+            self._reset()
+
+    def _append_log(self, record: bytes) -> None:
+        # Without a snapshot the next load rebuilds from SQLite anyway.
+        if not self.snapshot_path.exists():
+            return
+        try:
+            with self._exclusive():
+                if not self.snapshot_path.exists():
+                    return
+                size = self.log_path.stat().st_size if self.log_path.exists() else 0
+                if size + len(record) > MAX_LOG_BYTES:
+                    self.snapshot_path.unlink()
+                    self.log_path.unlink()
+                    return
+                with open(self.log_path, "ab") as handle:
+                    handle.write(record)
+        except OSError as exc:
+            logger.debug("Vector index log append failed for %s: %s", self.table, exc)
+
+    # --- Search --------------------------------------------------------------
+
+    def search(
+        self,
+        query: Sequence[float],
+        top_k: int,
+        keys: Optional[Iterable[str]] = None,
+    ) -> Optional[List[Tuple[int, float]]]:
+        """Return `(row_id, cosine)` pairs, best first.
+
+        `keys` restricts results to rows with those session keys. Returns None
+        when the index cannot answer (rows embedded under another model tag,
+        dimension mismatch, I/O failure) so the caller can fall back to a full
+        scan.
+        """
+        query_vector = np.asarray(query, dtype=np.float32).reshape(-1)
+        with self._lock:
+            try:
+                self._ensure_ready()
+            except (OSError, sqlite3.Error, ValueError) as exc:
+                logger.warning("Vector index for %s unavailable: %s", self.table, exc)
+                self._reset()
+                return None
+            if self._has_stale_rows:
+                return None
+            if len(self._ids) == 0 or top_k <= 0:
+                return []
+            if self._vectors.shape[1] != len(query_vector):
+                return None
+            norm = float(np.linalg.norm(query_vector))
+            if norm == 0:
+                return []
+            query_vector = query_vector / norm
+
+            allowed = None
+            if keys is not None:
+                allowed = np.isin(self._keys, list(keys))
+            rows = self._candidate_rows(query_vector, allowed, top_k)
+            if len(rows) == 0:
+                return []
+            scores = self._vectors[rows] @ query_vector
+            k = min(top_k, len(scores))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(int(self._ids[rows[i]]), float(scores[i])) for i in top]
+
+    def _candidate_rows(
+        self, query_vector: np.ndarray, allowed: Optional[np.ndarray], top_k: int
+    ) -> np.ndarray:
+        def _all_allowed() -> np.ndarray:
+            if allowed is None:
+                return np.arange(len(self._ids))
+            return np.flatnonzero(allowed)
+
+        if self._centroids is None or len(self._ids) <= self.exact_scan_rows:
+            return _all_allowed()
+        if allowed is not None and int(allowed.sum()) <= self.exact_scan_rows:
+            return _all_allowed()
+
+        n_probe = min(self.probe_lists, len(self._centroids))
+        centroid_scores = self._centroids @ query_vector
+        probes = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+        mask = np.isin(self._assign, probes)
+        if allowed is not None:
+            mask &= allowed
+        rows = np.flatnonzero(mask)
+        return rows if len(rows) >= top_k else _all_allowed()
+
+    # --- Loading, rebuilding and compaction -----------------------------------
+
+    def _exclusive(self):
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        return _file_lock(self.lock_path, exclusive=True)
+
+    def _ensure_ready(self) -> None:
+        if self._loaded and self._snapshot_stamp() != self._stamp:
+            # Another process compacted or rebuilt the index; reload it.
+            self._reset()
+        if self._loaded:
+            self._replay_log()
+            self._materialize()
+            if self._has_stale_rows:
+                # Cleared once those rows are deleted or re-embedded.
+                self._has_stale_rows = self._count_stale_rows() > 0
+        elif self._load_snapshot():
+            self._replay_log()
+            self._materialize()
+            if not self._matches_database():
+                self._rebuild()
+        else:
+            self._rebuild()
+
+        if self._needs_training():
+            self._train()
+            self._save_snapshot()
+        elif self._log_records >= COMPACT_LOG_RECORDS:
+            self._save_snapshot()
+
+    def _snapshot_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.snapshot_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _load_snapshot(self) -> bool:
+        if not self.snapshot_path.exists():
+            return False
+        try:
+            with _file_lock(self.lock_path, exclusive=False):
+                stamp = self._snapshot_stamp()
+                with np.load(self.snapshot_path, allow_pickle=False) as data:
+                    model = str(data["model"])
+                    ids = data["ids"].astype(np.int64)
+                    vectors = data["vectors"].astype(np.float32, copy=False)
+                    keys = data["keys"]
+                    assign = data["assign"].astype(np.int32)
+                    centroids = data["centroids"] if "centroids" in data else None
+                    trained_rows = int(data["trained_rows"])
+        except (OSError, KeyError, ValueError) as exc:
+            logger.debug("Discarding unreadable vector index %s: %s", self.snapshot_path, exc)
+            return False
+        if model != self.model:
+            return False
+        self._ids, self._vectors, self._keys = ids, vectors, keys
+        self._assign = assign
+        self._centroids = centroids if centroids is not None and len(centroids) else None
+        self._trained_rows = trained_rows
+        self._stamp = stamp
+        self._log_offset = 0
+        self._log_records = 0
+        self._loaded = True
+        return True
+
+    def _replay_log(self) -> None:
+        try:
+            size = self.log_path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size <= self._log_offset:
+            return
+        with _file_lock(self.lock_path, exclusive=False):
+            self._read_log_tail()
+
+    def _read_log_tail(self) -> None:
+        with open(self.log_path, "rb") as handle:
+            handle.seek(self._log_offset)
+            data = handle.read()
+        offset = 0
+        while offset + LOG_RECORD.size <= len(data):
+            op, row_id, key_len, dims = LOG_RECORD.unpack_from(data, offset)
+            end = offset + LOG_RECORD.size + key_len + dims * 4
+            if end > len(data):
+                break  # partially written record; picked up next time
+            if op == OP_ADD:
+                key_start = offset + LOG_RECORD.size
+                key = data[key_start : key_start + key_len].decode("utf-8")
+                vector = np.frombuffer(
+                    data, dtype=np.float32, count=dims, offset=key_start + key_len
+                )
+                self._deleted.discard(row_id)
+                self._pending[row_id] = (vector, key)
+            elif op == OP_DELETE:
+                self._pending.pop(row_id, None)
+                self._deleted.add(row_id)
+            offset = end
+            self._log_records += 1
+        self._log_offset += offset
+
+    def _materialize(self) -> None:
+        """Fold pending adds and deletes into the arrays."""
+        if not self._pending and not self._deleted:
+            return
+        drop = set(self._deleted) | set(self._pending)
+        if drop and len(self._ids):
+            keep = ~np.isin(self._ids, np.fromiter(drop, dtype=np.int64))
+            self._ids = self._ids[keep]
+            self._vectors = self._vectors[keep]
+            self._keys = self._keys[keep]
+            self._assign = self._assign[keep]
+        if self._pending:
+            dims = self._vectors.shape[1] if len(self._ids) else None
+            items = [
+                (row_id, vector, key)
+                for row_id, (vector, key) in self._pending.items()
+                if dims is None or len(vector) == dims
+            ]
+            if dims is None and items:
+                dims = len(items[0][1])
+                items = [item for item in items if len(item[1]) == dims]
+            if items:
+                new_vectors = _normalize_rows(np.stack([item[1] for item in items]))
+                new_assign = (
+                    _nearest_centroids(new_vectors, self._centroids)
+                    if self._centroids is not None
+                    and self._centroids.shape[1] == new_vectors.shape[1]
+                    else np.zeros(len(items), dtype=np.int32)
+                )
+                base_vectors = (
+                    self._vectors if len(self._ids) else np.empty((0, dims), np.float32)
+                )
+                self._ids = np.concatenate(
+                    [self._ids, np.array([item[0] for item in items], dtype=np.int64)]
+                )
+                self._vectors = np.concatenate([base_vectors, new_vectors])
+                self._keys = np.concatenate(
+                    [self._keys, np.array([item[2] for item in items], dtype=str)]
+                )
+                self._assign = np.concatenate([self._assign, new_assign])
+        self._pending.clear()
+        self._deleted.clear()
+
+    def _matches_database(self) -> bool:
+        count, max_id, stale = self._database_fingerprint()
+        self._has_stale_rows = stale > 0
+        index_max = int(self._ids.max()) if len(self._ids) else 0
+        return count == len(self._ids) and max_id == index_max
+
+    def _database_fingerprint(self) -> Tuple[int, int, int]:
+        """Indexed row count, max indexed id, and rows under another model tag."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(embedding_model IS ?), 0), "
+                "COALESCE(MAX(CASE WHEN embedding_model IS ? THEN id END), 0), "
+                "COALESCE(SUM(embedding_model IS NOT ?), 0) "
+                f"FROM {self.table} WHERE embedding IS NOT NULL",
+                (self.model, self.model, self.model),
+            ).fetchone()
+        finally:
+            conn.close()
+        return int(row[0]), int(row[1]), int(row[2])
+
+    def _count_stale_rows(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """Rows with an embedding from another model tag, or an untagged one."""
+        own_conn = conn is None
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                f"SELECT COUNT(*) FROM {self.table} "
+                "WHERE embedding IS NOT NULL AND embedding_model IS NOT ?",
+                (self.model,),
+            ).fetchone()
+        finally:
+            if own_conn:
+                conn.close()
+        return int(row[0])
+
+    def _rebuild(self) -> None:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(
+                f"SELECT id, session_id, embedding FROM {self.table} "
+                "WHERE embedding IS NOT NULL AND embedding_model = ?",
+                (self.model,),
+            ).fetchall()
+            stale = self._count_stale_rows(conn)
+        finally:
+            conn.close()
+
+        self._reset()
+        self._loaded = True
+        self._has_stale_rows = stale > 0
+        if rows:
+            vectors = [
+                np.frombuffer(blob, dtype=np.float32, count=len(blob) // 4)
+                for _, _, blob in rows
+            ]
+            # Rows with a stray dimension (corrupt or foreign BLOBs) are skipped.
+            dims = Counter(len(vector) for vector in vectors).most_common(1)[0][0]
+            kept = [
+                (row_id, sid, vector)
+                for (row_id, sid, _), vector in zip(rows, vectors)
+                if len(vector) == dims and dims > 0
+            ]
+            if kept:
+                self._ids = np.array([item[0] for item in kept], dtype=np.int64)
+                self._keys = np.array([session_key(item[1]) for item in kept], dtype=str)
+                self._vectors = _normalize_rows(np.stack([item[2] for item in kept]))
+                self._assign = np.zeros(len(kept), dtype=np.int32)
+        if self._needs_training():
+            self._train()
+        self._save_snapshot(absorb_log=False)
+        logger.debug("Rebuilt vector index %s with %d rows", self.snapshot_path, len(self))
+
+    def _needs_training(self) -> bool:
+        if len(self._ids) <= self.exact_scan_rows:
+            return False
+        return (
+            self._centroids is None
+            or len(self._ids) > self._trained_rows * RETRAIN_GROWTH
+        )
+
+    def _train(self) -> None:
+        n_lists = max(1, int(np.sqrt(len(self._ids))))
+        self._centroids = _train_centroids(self._vectors, n_lists, self._rng)
+        self._assign = _nearest_centroids(self._vectors, self._centroids)
+        self._trained_rows = len(self._ids)
+
+    def _save_snapshot(self, absorb_log: bool = True) -> None:
+        """Write the in-memory index and truncate the log.
+
+        With `absorb_log`, records other processes appended since our last
+        replay are folded in first. A rebuild skips them: it was read from
+        SQLite, which is at least as new as the log.
+        """
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._exclusive():
+            if absorb_log and self.log_path.exists():
+                self._read_log_tail()
+                self._materialize()
+            tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            with open(tmp_path, "wb") as handle:
+                np.savez(
+                    handle,
+                    model=np.array(self.model),
+                    ids=self._ids,
+                    vectors=self._vectors,
+                    keys=self._keys,
+                    assign=self._assign,
+                    centroids=(
+                        self._centroids
+                        if self._centroids is not None
+                        else np.empty((0, 0), dtype=np.float32)
+                    ),
+                    trained_rows=np.array(self._trained_rows),
+                )
+            os.replace(tmp_path, self.snapshot_path)
+            with open(self.log_path, "wb"):
+                pass
+            self._stamp = self._snapshot_stamp()
+        self._log_offset = 0
+        self._log_records = 0
+
+
+_indexes: Dict[Tuple[str, str, str], VectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_vector_index(db_path: Any, table: str, model: str) -> Optional[VectorIndex]:
+    """Return the shared index for `table` rows embedded with `model`, if enabled."""
+    from asky.config import (
+        RESEARCH_VECTOR_INDEX_ENABLED,
+        RESEARCH_VECTOR_INDEX_EXACT_SCAN_ROWS,
+        RESEARCH_VECTOR_INDEX_PROBE_LISTS,
+    )
+
+    if not RESEARCH_VECTOR_INDEX_ENABLED or not isinstance(model, str) or not model:
+        return None
+    key = (str(Path(db_path).resolve()), table, model)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = VectorIndex(
+                Path(db_path),
+                table,
+                model,
+                exact_scan_rows=RESEARCH_VECTOR_INDEX_EXACT_SCAN_ROWS,
+                probe_lists=RESEARCH_VECTOR_INDEX_PROBE_LISTS,
+            )
+            _indexes[key] = index
+        return index
+
+
+def clear_vector_indexes(db_path: Any, table: str) -> None:
+    """Drop every persisted index for `table`, whatever its model."""
+    resolved = str(Path(db_path).resolve())
+    with _indexes_lock:
+        for key, index in list(_indexes.items()):
+            if key[0] == resolved and key[1] == table:
+                index.clear()
+                del _indexes[key]
+    index_dir = Path(db_path).parent / INDEX_DIR_NAME
+    for path in index_dir.glob(f"{table}-*"):
+        with contextlib.suppress(OSError):
+            path.unlink()
@@ -3,8 +3,9 @@
 import logging
 import sqlite3
 import threading
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from asky import tracing
 from asky.config import (
     DB_PATH,
     RESEARCH_CHROMA_CHUNKS_COLLECTION,
@@ -73,6 +74,7 @@ class VectorStore:
         self.db_path = db_path or str(DB_PATH)
         self._embedding_client = embedding_client
         self._fts_available: Optional[bool] = None
+        self._chunk_offsets_ready = False
 
         self.chroma_persist_directory = str(
             chroma_persist_directory or RESEARCH_CHROMA_PERSIST_DIRECTORY
@@ -96,7 +98,11 @@ class VectorStore:
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get a database connection."""
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+        return sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            factory=tracing.sqlite_connection_factory(),
+        )
 
     def _get_chroma_client(self) -> Any:
         """Return a Chroma client when available, else None."""
@@ -130,10 +136,11 @@ class VectorStore:
             return None
 
         try:
-            return client.get_or_create_collection(
+            collection = client.get_or_create_collection(
                 name=collection_name,
                 metadata={"hnsw:space": CHROMA_COLLECTION_SPACE},
             )
+            return tracing.trace_collection(collection, collection_name)
         except Exception as exc:
             logger.error(
                 "Failed to open Chroma collection '%s': %s", collection_name, exc
@@ -149,6 +156,14 @@ class VectorStore:
         conn.close()
         return column_name in columns
 
+    def _chunk_offsets_supported(self) -> bool:
+        """Return whether content_chunks has the compressed-storage columns."""
+        if not self._chunk_offsets_ready:
+            self._chunk_offsets_ready = self._table_has_column(
+                "content_chunks", "char_start"
+            )
+        return self._chunk_offsets_ready
+
     def _table_exists(self, table_name: str) -> bool:
         """Check if a table exists in the current SQLite database."""
         conn = self._get_conn()
@@ -300,6 +315,10 @@ class VectorStore:
             clear_links=clear_links,
         )
 
+    def sweep_orphan_cache_embeddings(self, valid_cache_ids: Set[int]) -> int:
+        """Delete Chroma chunk/link vectors for cache IDs not in `valid_cache_ids`."""
+        return chunk_link_ops.sweep_orphan_cache_embeddings(self, valid_cache_ids)
+
     def store_chunk_embeddings(
         self,
         cache_id: int,
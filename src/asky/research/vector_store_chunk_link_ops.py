@@ -4,9 +4,19 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
+
+import numpy as np
 
 from asky.config import RESEARCH_MAX_CHUNKS_PER_RETRIEVAL
+from asky.research.content_store import (
+    chunk_fts_available,
+    chunk_storage_rows,
+    delete_chunks,
+    index_chunk_fts,
+    load_chunk_rows,
+    load_document,
+)
 from asky.research.embeddings import EmbeddingClient
 from asky.research.vector_store_common import (
     DEFAULT_DENSE_WEIGHT,
@@ -22,6 +32,8 @@ if TYPE_CHECKING:
     from asky.research.vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
+CHROMA_DELETE_BATCH_SIZE = 500
+CHROMA_SCAN_PAGE_SIZE = 1000
 
 
 def _build_chroma_cache_model_filter(cache_id: int, embedding_model: str) -> Dict[str, Any]:
@@ -40,7 +52,7 @@ def upsert_chunks_to_chroma(
     store: "VectorStore",
     cache_id: int,
     chunks: List[Tuple[int, str]],
-    embeddings: List[List[float]],
+    embeddings: "np.ndarray | List[List[float]]",
 ) -> None:
     collection = store._get_chroma_collection(store.chroma_chunks_collection)
     if collection is None:
@@ -71,7 +83,7 @@ def upsert_links_to_chroma(
     cache_id: int,
     links_with_text: List[Dict[str, str]],
     embedding_inputs: List[str],
-    embeddings: List[List[float]],
+    embeddings: "np.ndarray | List[List[float]]",
 ) -> None:
     collection = store._get_chroma_collection(store.chroma_links_collection)
     if collection is None:
@@ -136,13 +148,117 @@ def clear_cache_embeddings_bulk(
     clear_chunks: bool = True,
     clear_links: bool = True,
 ) -> None:
-    for cache_id in cache_ids:
-        clear_cache_embeddings(
-            store,
-            cache_id=cache_id,
-            clear_chunks=clear_chunks,
-            clear_links=clear_links,
+    ids = sorted({int(cache_id) for cache_id in cache_ids if int(cache_id) > 0})
+    if not ids:
+        return
+    collection_names = []
+    if clear_chunks:
+        collection_names.append(store.chroma_chunks_collection)
+    if clear_links:
+        collection_names.append(store.chroma_links_collection)
+    for collection_name in collection_names:
+        collection = store._get_chroma_collection(collection_name)
+        if collection is None:
+            continue
+        for start in range(0, len(ids), CHROMA_DELETE_BATCH_SIZE):
+            batch = ids[start : start + CHROMA_DELETE_BATCH_SIZE]
+            try:
+                collection.delete(where={"cache_id": {"$in": batch}})
+            except Exception as exc:
+                logger.warning(
+                    "Failed to clear vectors in ChromaDB collection %s: %s",
+                    collection_name,
+                    exc,
+                )
+
+
+def sweep_orphan_cache_embeddings(store: "VectorStore", valid_ids: Set[int]) -> int:
+    """Delete chunk/link vectors whose cache row is gone; return orphan cache IDs."""
+    orphan_ids: Set[int] = set()
+    for collection_name in (store.chroma_chunks_collection, store.chroma_links_collection):
+        collection = store._get_chroma_collection(collection_name)
+        if collection is None:
+            continue
+        offset = 0
+        while True:
+            page = collection.get(
+                include=["metadatas"],
+                limit=CHROMA_SCAN_PAGE_SIZE,
+                offset=offset,
+            )
+            metadatas = page.get("metadatas") or []
+            for metadata in metadatas:
+                cache_id = (metadata or {}).get("cache_id")
+                if isinstance(cache_id, int) and cache_id not in valid_ids:
+                    orphan_ids.add(cache_id)
+            if len(metadatas) < CHROMA_SCAN_PAGE_SIZE:
+                break
+            offset += CHROMA_SCAN_PAGE_SIZE
+    clear_cache_embeddings_bulk(store, sorted(orphan_ids))
+    return len(orphan_ids)
+
+
+def _insert_compact_chunks(
+    store: "VectorStore",
+    cursor: Any,
+    cache_id: int,
+    chunks: List[Tuple[int, str]],
+    embeddings: "np.ndarray | List[List[float]]",
+    now: str,
+) -> None:
+    """Insert chunks as offsets into (or compressed copies of) the parent document."""
+    document = load_document(cursor, cache_id)
+    texts = [chunk_text for _, chunk_text in chunks]
+    index_fts = chunk_fts_available(cursor)
+    delete_chunks(cursor, [cache_id])
+    for (chunk_idx, chunk_text), embedding, (stored_text, char_start, char_end) in zip(
+        chunks, embeddings, chunk_storage_rows(document, texts)
+    ):
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO content_chunks
+            (cache_id, chunk_index, chunk_text, char_start, char_end,
+             embedding, embedding_model, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                cache_id,
+                chunk_idx,
+                stored_text,
+                char_start,
+                char_end,
+                EmbeddingClient.serialize_embedding(embedding),
+                store.embedding_client.model,
+                now,
+            ),
+        )
+        if index_fts:
+            index_chunk_fts(cursor, cursor.lastrowid, chunk_text)
+
+
+def _embedded_chunk_rows(
+    store: "VectorStore", cache_id: int
+) -> List[Tuple[int, str, Any]]:
+    """Return `(chunk_index, text, embedding)` for a source's embedded chunks."""
+    conn = store._get_conn()
+    try:
+        c = conn.cursor()
+        if store._chunk_offsets_supported():
+            return [
+                (chunk_index, text, embedding)
+                for _id, chunk_index, text, embedding in load_chunk_rows(c, cache_id)
+            ]
+        c.execute(
+            """
+            SELECT chunk_index, chunk_text, embedding
+            FROM content_chunks
+            WHERE cache_id = ? AND embedding IS NOT NULL
+        """,
+            (cache_id,),
         )
+        return c.fetchall()
+    finally:
+        conn.close()
 
 
 def store_chunk_embeddings(
@@ -155,7 +271,7 @@ def store_chunk_embeddings(
 
     try:
         texts = [chunk[1] for chunk in chunks]
-        embeddings = store.embedding_client.embed(texts)
+        embeddings = store.embedding_client.embed_array(texts)
         if len(embeddings) != len(chunks):
             logger.warning(
                 "Embedding count mismatch: %s vs %s",
@@ -167,6 +283,14 @@ def store_chunk_embeddings(
         conn = store._get_conn()
         c = conn.cursor()
         now = datetime.now().isoformat()
+        if store._chunk_offsets_supported():
+            _insert_compact_chunks(store, c, cache_id, chunks, embeddings, now)
+            conn.commit()
+            conn.close()
+            upsert_chunks_to_chroma(store, cache_id, chunks, embeddings)
+            logger.debug("Stored %s chunk embeddings for cache_id=%s", len(chunks), cache_id)
+            return len(chunks)
+
         c.execute("DELETE FROM content_chunks WHERE cache_id = ?", (cache_id,))
 
         for (chunk_idx, chunk_text), embedding in zip(chunks, embeddings):
@@ -223,7 +347,7 @@ def store_link_embeddings(
         if not embedding_inputs:
             return 0
 
-        embeddings = store.embedding_client.embed(embedding_inputs)
+        embeddings = store.embedding_client.embed_array(embedding_inputs)
 
         conn = store._get_conn()
         c = conn.cursor()
@@ -342,25 +466,15 @@ def search_chunks_with_sqlite(
     query_embedding: List[float],
     top_k: int,
 ) -> List[Tuple[str, float]]:
-    conn = store._get_conn()
-    c = conn.cursor()
-    c.execute(
-        """
-        SELECT chunk_text, embedding FROM content_chunks
-        WHERE cache_id = ? AND embedding IS NOT NULL
-    """,
-        (cache_id,),
-    )
-    rows = c.fetchall()
-    conn.close()
-
+    rows = _embedded_chunk_rows(store, cache_id)
     if not rows:
         return []
 
+    query_vector = np.asarray(query_embedding, dtype=np.float32)
     results = []
-    for chunk_text, embedding_bytes in rows:
-        embedding = EmbeddingClient.deserialize_embedding(embedding_bytes)
-        similarity = cosine_similarity(query_embedding, embedding)
+    for _chunk_index, chunk_text, embedding_bytes in rows:
+        embedding = EmbeddingClient.deserialize_embedding_array(embedding_bytes)
+        similarity = cosine_similarity(query_vector, embedding)
         results.append((chunk_text, similarity))
     results.sort(key=lambda x: x[1], reverse=True)
     return results[:top_k]
@@ -460,10 +574,11 @@ def rank_links_with_sqlite(
     if not rows:
         return []
 
+    query_vector = np.asarray(query_embedding, dtype=np.float32)
     results = []
     for link_text, link_url, embedding_bytes in rows:
-        embedding = EmbeddingClient.deserialize_embedding(embedding_bytes)
-        similarity = cosine_similarity(query_embedding, embedding)
+        embedding = EmbeddingClient.deserialize_embedding_array(embedding_bytes)
+        similarity = cosine_similarity(query_vector, embedding)
         results.append(({"text": link_text, "href": link_url}, similarity))
     results.sort(key=lambda x: x[1], reverse=True)
     return results[:top_k]
@@ -619,18 +734,7 @@ def search_chunks_hybrid(
         query_embedding = store.embedding_client.embed_single(query)
         query_tokens = tokenize_text(query)
 
-        conn = store._get_conn()
-        c = conn.cursor()
-        c.execute(
-            """
-            SELECT chunk_index, chunk_text, embedding
-            FROM content_chunks
-            WHERE cache_id = ? AND embedding IS NOT NULL
-        """,
-            (cache_id,),
-        )
-        rows = c.fetchall()
-        conn.close()
+        rows = _embedded_chunk_rows(store, cache_id)
         if not rows:
             return []
 
@@ -643,6 +747,7 @@ def search_chunks_hybrid(
             top_k=dense_candidate_limit,
         )
         use_chroma_dense_scores = len(dense_scores_by_chunk) > 0
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
 
         bm25_limit = max(top_k * HYBRID_LEXICAL_CANDIDATE_MULTIPLIER, top_k)
         bm25_scores_by_chunk = store._get_bm25_scores(
@@ -657,8 +762,8 @@ def search_chunks_hybrid(
             if use_chroma_dense_scores:
                 dense_score = dense_scores_by_chunk.get(chunk_index, 0.0)
             else:
-                embedding = EmbeddingClient.deserialize_embedding(embedding_bytes)
-                dense_score = max(0.0, cosine_similarity(query_embedding, embedding))
+                embedding = EmbeddingClient.deserialize_embedding_array(embedding_bytes)
+                dense_score = max(0.0, cosine_similarity(query_vector, embedding))
 
             if use_bm25_scores:
                 lexical_score = bm25_scores_by_chunk.get(chunk_index, 0.0)
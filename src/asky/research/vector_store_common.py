@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import math
 import re
-from typing import Any, List
+from typing import Any, List, Sequence
 
 TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_]{2,}")
 DEFAULT_DENSE_WEIGHT = 0.75
@@ -14,11 +14,21 @@ CHROMA_COLLECTION_SPACE = "cosine"
 CHROMA_TO_SIMILARITY_BASE = 1.0
 
 
-def cosine_similarity(a: List[float], b: List[float]) -> float:
-    """Compute cosine similarity between two vectors."""
-    if not a or not b or len(a) != len(b):
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Compute cosine similarity between two vectors (lists or NumPy arrays)."""
+    if len(a) == 0 or len(b) == 0 or len(a) != len(b):
         return 0.0
 
+    if not isinstance(a, (list, tuple)) or not isinstance(b, (list, tuple)):
+        import numpy as np
+
+        a_vec = np.asarray(a, dtype=np.float64)
+        b_vec = np.asarray(b, dtype=np.float64)
+        norm_product = float(np.linalg.norm(a_vec) * np.linalg.norm(b_vec))
+        if norm_product == 0:
+            return 0.0
+        return float(np.dot(a_vec, b_vec)) / norm_product
+
     dot = sum(x * y for x, y in zip(a, b))
     norm_a = math.sqrt(sum(x * x for x in a))
     norm_b = math.sqrt(sum(x * x for x in b))
@@ -6,7 +6,10 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from asky.research.embeddings import EmbeddingClient
+from asky.research.vector_index import FINDINGS_TABLE, get_vector_index, session_key
 from asky.research.vector_store_common import (
     cosine_similarity,
     distance_to_similarity,
@@ -70,9 +73,24 @@ def store_finding_embedding(
         )
         success = c.rowcount > 0
         conn.commit()
+        session_row = None
+        if success:
+            c.execute(
+                "SELECT session_id FROM research_findings WHERE id = ?", (finding_id,)
+            )
+            session_row = c.fetchone()
         conn.close()
 
         if success:
+            index = get_vector_index(
+                store.db_path, FINDINGS_TABLE, store.embedding_client.model
+            )
+            if index is not None:
+                index.add(
+                    finding_id,
+                    embedding,
+                    session_key(session_row[0] if session_row else None),
+                )
             upsert_finding_to_chroma(
                 store=store,
                 finding_id=finding_id,
@@ -172,12 +190,41 @@ def fetch_findings_by_ids(
     return mapped
 
 
+def search_findings_with_index(
+    store: "VectorStore",
+    query_embedding: List[float],
+    top_k: int,
+    session_id: Optional[str] = None,
+) -> Optional[List[Tuple[Dict[str, Any], float]]]:
+    """Rank findings through the local vector index; None if it cannot answer."""
+    index = get_vector_index(store.db_path, FINDINGS_TABLE, store.embedding_client.model)
+    if index is None:
+        return None
+    keys = None if session_id is None else [session_key(session_id)]
+    ranked_ids = index.search(query_embedding, top_k, keys=keys)
+    if ranked_ids is None:
+        return None
+    findings_by_id = store._fetch_findings_by_ids(
+        [finding_id for finding_id, _ in ranked_ids],
+        session_id=session_id,
+    )
+    return [
+        (findings_by_id[finding_id], similarity)
+        for finding_id, similarity in ranked_ids
+        if finding_id in findings_by_id
+    ]
+
+
 def search_findings_with_sqlite(
     store: "VectorStore",
     query_embedding: List[float],
     top_k: int,
     session_id: Optional[str] = None,
 ) -> List[Tuple[Dict[str, Any], float]]:
+    indexed = search_findings_with_index(store, query_embedding, top_k, session_id)
+    if indexed is not None:
+        return indexed
+
     conn = store._get_conn()
     c = conn.cursor()
     query = """
@@ -198,6 +245,7 @@ def search_findings_with_sqlite(
     if not rows:
         return []
 
+    query_vector = np.asarray(query_embedding, dtype=np.float32)
     results = []
     for row in rows:
         (
@@ -210,8 +258,8 @@ def search_findings_with_sqlite(
             created_at,
             session_id,
         ) = row
-        embedding = EmbeddingClient.deserialize_embedding(embedding_bytes)
-        similarity = cosine_similarity(query_embedding, embedding)
+        embedding = EmbeddingClient.deserialize_embedding_array(embedding_bytes)
+        similarity = cosine_similarity(query_vector, embedding)
         finding_dict = {
             "id": finding_id,
             "finding_text": finding_text,
@@ -365,6 +413,11 @@ def delete_findings_by_session(store: "VectorStore", session_id: str) -> int:
     conn.commit()
     conn.close()
 
+    # 3. Drop them from the local vector index
+    index = get_vector_index(store.db_path, FINDINGS_TABLE, store.embedding_client.model)
+    if index is not None:
+        index.remove(finding_ids)
+
     if deleted_count > 0:
         logger.debug(
             "Deleted %s findings and embeddings for session %s",
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, TypeVar
 
 import requests
 
@@ -22,6 +22,7 @@ except ImportError:
 SUPPORTED_OUTPUT_FORMATS = {"markdown", "txt"}
 MAX_TITLE_CHARS = 220
 TraceCallback = Callable[[Dict[str, Any]], None]
+FetchResult = TypeVar("FetchResult")
 
 # Portal detection: if extracted content is less than this fraction of total
 # visible text, the page is classified as a listing/portal page.
@@ -67,10 +68,18 @@ def fetch_url_document(
     max_links: Optional[int] = None,
     trace_callback: Optional[TraceCallback] = None,
     trace_context: Optional[Dict[str, Any]] = None,
+    use_cache: bool = False,
 ) -> Dict[str, Any]:
     """Fetch URL and extract structured main content.
 
     Returns a payload with common fields shared by standard, research, and shortlist flows.
+
+    With `use_cache`, the research cache is consulted first: fresh rows are
+    served without network access, stale rows are revalidated with
+    `If-None-Match`/`If-Modified-Since` (a 304 only extends their expiry),
+    and full fetches are written back with their validators. Only rows
+    extracted in the requested format (and with links, when links are
+    requested) are used. Payloads backed by the cache carry `cache_id`.
     """
     requested_url = sanitize_url(url)
     if not requested_url:
@@ -83,6 +92,19 @@ def fetch_url_document(
             "links": [],
         }
 
+    normalized_format = (
+        output_format if output_format in SUPPORTED_OUTPUT_FORMATS else "markdown"
+    )
+    cache = _open_research_cache() if use_cache else None
+    cached_entry = _lookup_cache_entry(
+        cache, requested_url, normalized_format, include_links
+    )
+    if cached_entry is not None and not cached_entry["expired"]:
+        logger.debug("retrieval cache hit url=%s cache_id=%s", requested_url, cached_entry["id"])
+        return _cached_document_payload(
+            cached_entry, requested_url, include_links, max_links, source="cache"
+        )
+
     override_attempt_trace = {
         "kind": "override_attempt",
         "operation": "fetch_url_document",
@@ -110,12 +132,18 @@ def fetch_url_document(
         if trace_context:
             override_success_trace.update(trace_context)
         _emit_trace_event(trace_callback, override_success_trace)
+        if cache is not None and not _plugin_override.get("error"):
+            _store_fetched_document(
+                cache,
+                requested_url,
+                _plugin_override,
+                None,
+                output_format=normalized_format,
+                include_links=include_links,
+            )
         return _plugin_override
 
     started = time.perf_counter()
-    normalized_format = (
-        output_format if output_format in SUPPORTED_OUTPUT_FORMATS else "markdown"
-    )
     link_limit = max_links if isinstance(max_links, int) and max_links > 0 else MAX_URL_DETAIL_LINKS
 
     try:
@@ -131,9 +159,12 @@ def fetch_url_document(
             request_trace.update(trace_context)
         _emit_trace_event(trace_callback, request_trace)
 
+        headers = {"User-Agent": USER_AGENT}
+        if cached_entry is not None:
+            headers.update(_conditional_request_headers(cached_entry))
         response = requests.get(
             requested_url,
-            headers={"User-Agent": USER_AGENT},
+            headers=headers,
             timeout=FETCH_TIMEOUT,
         )
         response.raise_for_status()
@@ -186,6 +217,27 @@ def fetch_url_document(
             "links": [],
         }
 
+    if response.status_code == 304 and cached_entry is not None:
+        cached_entry["expires_at"] = cache.extend_expiry(cached_entry["id"])
+        not_modified_trace = {
+            "kind": "transport_response",
+            "transport": "http",
+            "source": "retrieval",
+            "operation": "fetch_url_document",
+            "method": "GET",
+            "url": requested_url,
+            "status_code": response.status_code,
+            "response_bytes": 0,
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+        }
+        if trace_context:
+            not_modified_trace.update(trace_context)
+        _emit_trace_event(trace_callback, not_modified_trace)
+        logger.debug("retrieval revalidated url=%s cache_id=%s", requested_url, cached_entry["id"])
+        return _cached_document_payload(
+            cached_entry, requested_url, include_links, max_links, source="cache_revalidated"
+        )
+
     html = response.text or ""
     final_url = sanitize_url(response.url) or requested_url
 
@@ -232,6 +284,15 @@ def fetch_url_document(
     }
     if warning:
         payload["warning"] = warning
+    if cache is not None:
+        _store_fetched_document(
+            cache,
+            requested_url,
+            payload,
+            response.headers,
+            output_format=normalized_format,
+            include_links=include_links,
+        )
 
     response_trace = {
         "kind": "transport_response",
@@ -253,6 +314,147 @@ def fetch_url_document(
     return payload
 
 
+def fetch_urls_in_order(
+    urls: Sequence[str],
+    fetch: Callable[[str], FetchResult],
+    *,
+    max_workers: int,
+    thread_name_prefix: str = "asky-url-fetch",
+) -> List[FetchResult]:
+    """Run `fetch` for each URL on up to `max_workers` threads, in input order.
+
+    Worker threads inherit the caller's tracing context. A single worker (or a
+    single URL) runs inline without a pool.
+    """
+    workers = max(1, min(int(max_workers or 1), len(urls)))
+    if workers <= 1:
+        return [fetch(url) for url in urls]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    from asky import tracing
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix=thread_name_prefix
+    ) as pool:
+        return list(pool.map(tracing.bind_context(fetch), urls))
+
+
+def _open_research_cache() -> Optional[Any]:
+    try:
+        from asky.research.cache import ResearchCache
+
+        return ResearchCache()
+    except Exception as exc:
+        logger.debug("Research cache unavailable for retrieval: %s", exc)
+        return None
+
+
+def _lookup_cache_entry(
+    cache: Optional[Any],
+    url: str,
+    output_format: str,
+    include_links: bool,
+) -> Optional[Dict[str, Any]]:
+    """Return a cache row usable for this request, or None to fetch in full.
+
+    Rows extracted in another format, or without links when links are
+    requested, are neither served nor revalidated; the full fetch replaces
+    them.
+    """
+    if cache is None:
+        return None
+    try:
+        entry = cache.get_entry(url)
+    except Exception as exc:
+        logger.debug("Research cache lookup failed url=%s err=%s", url, exc)
+        return None
+    if not entry or not entry.get("content"):
+        return None
+    if entry.get("output_format") != output_format:
+        return None
+    if include_links and not entry.get("links_included"):
+        return None
+    return entry
+
+
+def _conditional_request_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = str(entry["etag"])
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = str(entry["last_modified"])
+    return headers
+
+
+def _cached_document_payload(
+    entry: Dict[str, Any],
+    requested_url: str,
+    include_links: bool,
+    max_links: Optional[int],
+    source: str,
+) -> Dict[str, Any]:
+    """Build a `fetch_url_document` payload from a research cache row."""
+    content = str(entry.get("content") or "")
+    final_url = str(entry.get("final_url") or requested_url)
+    links: List[Dict[str, str]] = []
+    if include_links:
+        links = list(entry.get("links") or [])
+        if isinstance(max_links, int) and max_links > 0:
+            links = links[:max_links]
+    title = str(entry.get("title") or "") or _derive_title(content, final_url)
+    return {
+        "error": None,
+        "requested_url": requested_url,
+        "final_url": final_url,
+        "content": content,
+        "text": content,
+        "title": title[:MAX_TITLE_CHARS],
+        "date": entry.get("published_date"),
+        "links": links,
+        "source": source,
+        "output_format": entry["output_format"],
+        "page_type": entry.get("page_type") or "article",
+        "cache_id": entry["id"],
+    }
+
+
+def _store_fetched_document(
+    cache: Any,
+    requested_url: str,
+    payload: Dict[str, Any],
+    headers: Optional[Any],
+    *,
+    output_format: str,
+    include_links: bool,
+) -> None:
+    """Write a full fetch back to the research cache with its validators."""
+    content = str(payload.get("content") or "")
+    if not content:
+        return
+    headers = headers or {}
+    published_date = payload.get("date")
+    try:
+        payload["cache_id"] = cache.cache_url(
+            url=requested_url,
+            content=content,
+            title=str(payload.get("title") or ""),
+            # Without extracted links, keep the ones research tools stored.
+            links=list(payload.get("links") or []) if include_links else None,
+            trigger_summarization=False,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            final_url=str(payload.get("final_url") or requested_url),
+            content_type=headers.get("Content-Type"),
+            output_format=str(payload.get("output_format") or output_format),
+            page_type=payload.get("page_type"),
+            published_date=str(published_date) if published_date else None,
+            links_included=include_links,
+        )
+    except Exception as exc:
+        logger.debug("Research cache write failed url=%s err=%s", requested_url, exc)
+
+
 def _extract_main_content(
     html: str,
     source_url: str,
@@ -0,0 +1,206 @@
+"""Persistent web search result cache and per-provider request pacing."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from asky import tracing
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_DB_FILENAME = "search_cache.db"
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_search_query(query: str) -> str:
+    """Case- and whitespace-insensitive form used in cache keys."""
+    return _WHITESPACE_PATTERN.sub(" ", str(query or "")).strip().lower()
+
+
+def search_cache_key(provider: str, query: str, count: int) -> str:
+    raw = json.dumps([str(provider).lower(), normalize_search_query(query), int(count)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache:
+    """SQLite cache of search payloads keyed by (provider, query, count).
+
+    Entries expire after `ttl_seconds`; once more than `max_entries` rows
+    exist, the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(
+            self.db_path, timeout=10.0, factory=tracing.sqlite_connection_factory()
+        )
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    cache_key    TEXT PRIMARY KEY,
+                    provider     TEXT NOT NULL,
+                    query        TEXT NOT NULL,
+                    result_count INTEGER NOT NULL,
+                    payload_json TEXT NOT NULL,
+                    created_at   REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    hit_count    INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_last_used "
+                "ON search_cache(last_used_at)"
+            )
+
+    def get(self, provider: str, query: str, count: int) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached payload, or None."""
+        key = search_cache_key(provider, query, count)
+        now = self._clock()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload_json, created_at FROM search_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            payload_json, created_at = row
+            if now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM search_cache WHERE cache_key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE search_cache SET last_used_at = ?, hit_count = hit_count + 1 "
+                "WHERE cache_key = ?",
+                (now, key),
+            )
+        try:
+            return json.loads(payload_json)
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, provider: str, query: str, count: int, payload: Dict[str, Any]) -> None:
+        """Store a successful payload and evict beyond the size cap."""
+        key = search_cache_key(provider, query, count)
+        now = self._clock()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache "
+                "(cache_key, provider, query, result_count, payload_json, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    str(provider).lower(),
+                    normalize_search_query(query),
+                    int(count),
+                    json.dumps(payload),
+                    now,
+                    now,
+                ),
+            )
+            conn.execute(
+                "DELETE FROM search_cache WHERE cache_key IN ("
+                "SELECT cache_key FROM search_cache ORDER BY last_used_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM search_cache")
+
+
+class ProviderRateLimiter:
+    """Spaces calls to one provider at least `1 / requests_per_second` apart.
+
+    Slots are reserved under a lock and the wait happens outside it, so
+    concurrent callers queue up without serializing their HTTP requests.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        rate = float(requests_per_second or 0)
+        self.min_interval_seconds = 1.0 / rate if rate > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        if self.min_interval_seconds <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval_seconds
+        delay = slot - now
+        if delay > 0:
+            self._sleep(delay)
+
+
+_caches: Dict[str, SearchResultCache] = {}
+_rate_limiters: Dict[str, ProviderRateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_search_cache(
+    config_dir: Path, *, ttl_seconds: float, max_entries: int
+) -> SearchResultCache:
+    """Return the shared cache for a config dir, creating it on first use."""
+    db_path = Path(config_dir) / SEARCH_CACHE_DB_FILENAME
+    with _registry_lock:
+        cache = _caches.get(str(db_path))
+        if cache is None:
+            cache = SearchResultCache(
+                db_path, ttl_seconds=ttl_seconds, max_entries=max_entries
+            )
+            _caches[str(db_path)] = cache
+        return cache
+
+
+def get_provider_rate_limiter(provider: str, requests_per_second: float) -> ProviderRateLimiter:
+    key = str(provider).lower()
+    with _registry_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = ProviderRateLimiter(requests_per_second)
+            _rate_limiters[key] = limiter
+        return limiter
@@ -7,6 +7,7 @@ import sqlite3
 from datetime import datetime
 from typing import List, Optional
 
+from asky import tracing
 from asky.config import DB_PATH
 from asky.storage.interface import (
     HistoryRepository,
@@ -166,7 +167,9 @@ class SQLiteHistoryRepository(HistoryRepository):
         self.db_path = DB_PATH
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path)
+        return sqlite3.connect(
+            self.db_path, factory=tracing.sqlite_connection_factory()
+        )
 
     def _find_partner_message_id(
         self,
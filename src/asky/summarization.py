@@ -21,6 +21,7 @@ from asky.config import (
     SUMMARIZE_ANSWER_PROMPT_TEMPLATE,
     SUMMARIZE_QUERY_PROMPT_TEMPLATE,
 )
+from asky import model_overrides
 from asky.core import UsageTracker, get_llm_msg
 from asky.html import strip_think_tags
 
@@ -78,8 +79,9 @@ def _summarize_single_pass(
         {"role": "system", "content": prompt_template},
         {"role": "user", "content": truncated_content},
     ]
-    model_id = MODELS[SUMMARIZATION_MODEL]["id"]
-    model_alias = MODELS[SUMMARIZATION_MODEL].get("alias", SUMMARIZATION_MODEL)
+    summarization_alias = model_overrides.summarization_model(SUMMARIZATION_MODEL)
+    model_id = MODELS[summarization_alias]["id"]
+    model_alias = MODELS[summarization_alias].get("alias", summarization_alias)
     msg = llm_func(
         model_id,
         msgs,
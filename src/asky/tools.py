@@ -5,13 +5,18 @@ import logging
 import os
 import subprocess
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 
 from asky.config import (
     CUSTOM_TOOLS,
+    FETCH_MAX_CONCURRENCY,
+    SEARCH_CACHE_ENABLED,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL_SECONDS,
     SEARCH_PROVIDER,
+    SEARCH_RATE_LIMITS,
     SEARXNG_URL,
     SERPER_API_KEY_ENV,
     SERPER_API_URL,
@@ -23,7 +28,13 @@ from asky.config import (
     TAVILY_API_URL,
 )
 from asky.html import strip_tags
-from asky.retrieval import fetch_url_document
+from asky.config.loader import _get_config_dir
+from asky.retrieval import fetch_url_document, fetch_urls_in_order
+from asky.search_cache import (
+    SearchResultCache,
+    get_provider_rate_limiter,
+    get_search_cache,
+)
 from asky.url_utils import is_http_url, is_local_filesystem_target, sanitize_url
 
 logger = logging.getLogger(__name__)
@@ -340,20 +351,78 @@ def _execute_tavily_search(
         return {"error": f"Tavily search failed: {str(e)}"}
 
 
-def execute_web_search(
+def _active_search_provider() -> str:
+    if SEARCH_PROVIDER in ("serper", "tavily"):
+        return SEARCH_PROVIDER
+    return "searxng"
+
+
+def _get_search_result_cache() -> Optional[SearchResultCache]:
+    if not SEARCH_CACHE_ENABLED:
+        return None
+    try:
+        return get_search_cache(
+            _get_config_dir(),
+            ttl_seconds=SEARCH_CACHE_TTL_SECONDS,
+            max_entries=SEARCH_CACHE_MAX_ENTRIES,
+        )
+    except Exception as exc:
+        logger.debug("Search cache unavailable: %s", exc)
+        return None
+
+
+def execute_cached_web_search(
     args: Dict[str, Any],
     trace_callback: Optional[TraceCallback] = None,
-) -> Dict[str, Any]:
-    """Execute a web search using the configured provider."""
+) -> Tuple[Dict[str, Any], bool]:
+    """Execute a web search through the result cache.
+
+    Returns `(payload, cache_hit)`. Only successful, non-empty payloads are
+    cached; live calls are paced by the provider's configured rate limit.
+    """
     q = args.get("q", "")
     count = args.get("count", 5)
-
-    if SEARCH_PROVIDER == "serper":
-        return _execute_serper_search(q, count, trace_callback=trace_callback)
-    elif SEARCH_PROVIDER == "tavily":
-        return _execute_tavily_search(q, count, trace_callback=trace_callback)
+    provider = _active_search_provider()
+
+    cache = _get_search_result_cache()
+    if cache is not None:
+        try:
+            cached = cache.get(provider, q, count)
+        except Exception as exc:
+            logger.debug("Search cache read failed: %s", exc)
+            cached = None
+        if cached is not None:
+            logger.debug("web_search cache hit provider=%s query_len=%d", provider, len(q))
+            return cached, True
+
+    get_provider_rate_limiter(provider, SEARCH_RATE_LIMITS.get(provider, 0.0)).acquire()
+    if provider == "serper":
+        payload = _execute_serper_search(q, count, trace_callback=trace_callback)
+    elif provider == "tavily":
+        payload = _execute_tavily_search(q, count, trace_callback=trace_callback)
     else:
-        return _execute_searxng_search(q, count, trace_callback=trace_callback)
+        payload = _execute_searxng_search(q, count, trace_callback=trace_callback)
+
+    if (
+        cache is not None
+        and isinstance(payload, dict)
+        and not payload.get("error")
+        and payload.get("results")
+    ):
+        try:
+            cache.put(provider, q, count, payload)
+        except Exception as exc:
+            logger.debug("Search cache write failed: %s", exc)
+    return payload, False
+
+
+def execute_web_search(
+    args: Dict[str, Any],
+    trace_callback: Optional[TraceCallback] = None,
+) -> Dict[str, Any]:
+    """Execute a web search using the configured provider."""
+    payload, _cache_hit = execute_cached_web_search(args, trace_callback=trace_callback)
+    return payload
 
 
 def _sanitize_url(url: str) -> str:
@@ -379,6 +448,7 @@ def fetch_single_url(
             "tool_name": "get_url_content",
             "provider": "retrieval",
         },
+        use_cache=True,
     )
     if payload.get("error"):
         return {sanitized_url: f"Error: {payload['error']}"}
@@ -414,11 +484,23 @@ def execute_get_url_content(
     if not urls:
         return {"error": "No URLs provided."}
     results = {}
-    for url in urls:
-        results.update(fetch_single_url(url, trace_callback=trace_callback))
+    for fetched in _fetch_urls_concurrently(urls, trace_callback=trace_callback):
+        results.update(fetched)
     return results
 
 
+def _fetch_urls_concurrently(
+    urls: List[str],
+    trace_callback: Optional[TraceCallback] = None,
+) -> List[Dict[str, str]]:
+    """Run `fetch_single_url` for each URL (up to FETCH_MAX_CONCURRENCY at once), in order."""
+
+    def run_one(url: str) -> Dict[str, str]:
+        return fetch_single_url(url, trace_callback=trace_callback)
+
+    return fetch_urls_in_order(urls, run_one, max_workers=FETCH_MAX_CONCURRENCY)
+
+
 def execute_get_url_details(
     args: Dict[str, Any],
     trace_callback: Optional[TraceCallback] = None,
@@ -442,6 +524,7 @@ def execute_get_url_details(
             "tool_name": "get_url_details",
             "provider": "retrieval",
         },
+        use_cache=True,
     )
     if payload.get("error"):
         return {"error": f"Failed to fetch details: {payload['error']}"}
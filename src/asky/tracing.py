@@ -0,0 +1,403 @@
+"""Lightweight span tracing with Chrome/Perfetto trace export.
+
+Spans are recorded only while a `TraceRecorder` is active (see `recording`);
+otherwise `span()` returns a shared no-op object, so instrumented hot paths pay
+one context-variable lookup. The active recorder is held in a context variable
+so concurrent daemon turns keep separate traces; `process_wide=True` makes a
+recorder the fallback for every thread (used by the CLI `--trace-out` flag).
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+DEFAULT_MAX_EVENTS = 200_000
+DEFAULT_RECENT_TRACE_LIMIT = 20
+SQL_PREVIEW_CHARS = 120
+CHROMA_TRACED_METHODS = frozenset(
+    {"add", "upsert", "update", "query", "get", "delete", "count"}
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _NullSpan:
+    """Stand-in returned when tracing is off; every operation is a no-op."""
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        return None
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """One timed region; becomes a Chrome `X` (complete) event when it closes."""
+
+    __slots__ = ("name", "category", "args", "_recorder", "_start_ns", "_nested")
+
+    def __init__(
+        self,
+        recorder: "TraceRecorder",
+        name: str,
+        category: str,
+        args: Dict[str, Any],
+    ) -> None:
+        self.name = name
+        self.category = category
+        self.args = args
+        self._recorder = recorder
+        self._start_ns = 0
+        self._nested = False
+
+    def set(self, **args: Any) -> None:
+        """Attach extra arguments (token counts, row counts, ...) to the span."""
+        self.args.update(args)
+
+    def __enter__(self) -> "Span":
+        self._recorder._begin(self)
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._recorder._end(self, end_ns)
+
+
+class TraceRecorder:
+    """Collects finished spans from any thread for one traced operation."""
+
+    def __init__(self, label: str = "", max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        self.label = str(label or "")
+        self.max_events = max(1, int(max_events))
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.dropped_events = 0
+        self._origin_ns = time.perf_counter_ns()
+        self._end_ns: Optional[int] = None
+        self._events: List[Dict[str, Any]] = []
+        self._category_ns: Dict[str, int] = {}
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def _begin(self, span: Span) -> None:
+        stack = self._stack()
+        span._nested = any(open_span.category == span.category for open_span in stack)
+        stack.append(span)
+
+    def _end(self, span: Span, end_ns: int) -> None:
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+        elif span in stack:
+            stack.remove(span)
+        thread = threading.current_thread()
+        duration_ns = end_ns - span._start_ns
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": (span._start_ns - self._origin_ns) / 1000.0,
+            "dur": duration_ns / 1000.0,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if span.args:
+            event["args"] = dict(span.args)
+        with self._lock:
+            if not span._nested:
+                self._category_ns[span.category] = (
+                    self._category_ns.get(span.category, 0) + duration_ns
+                )
+            if len(self._events) >= self.max_events:
+                self.dropped_events += 1
+                return
+            self._events.append(event)
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    def current_span(self) -> Optional[Span]:
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def finish(self) -> None:
+        if self._end_ns is None:
+            self._end_ns = time.perf_counter_ns()
+            self.finished_at = time.time()
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self._end_ns if self._end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self._origin_ns) / 1_000_000.0
+
+    def events(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(event) for event in self._events]
+
+    def summary(self) -> Dict[str, Any]:
+        """Wall time per category; nested spans of the same category count once."""
+        with self._lock:
+            by_category = {
+                category: round(total_ns / 1_000_000.0, 3)
+                for category, total_ns in sorted(self._category_ns.items())
+            }
+            event_count = len(self._events)
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "events": event_count,
+            "dropped_events": self.dropped_events,
+            "by_category_ms": by_category,
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the trace as a Chrome/Perfetto `traceEvents` document."""
+        pid = os.getpid()
+        with self._lock:
+            events = [dict(event) for event in self._events]
+            thread_names = dict(self._thread_names)
+        metadata = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": 0,
+                "args": {"name": f"asky {self.label}".strip()},
+            }
+        ]
+        metadata.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in sorted(thread_names.items())
+        )
+        return {
+            "traceEvents": metadata + sorted(events, key=lambda item: item["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": self.summary(),
+        }
+
+    def write(self, path: Path | str) -> Path:
+        target = Path(path).expanduser()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        return target
+
+
+_active_recorder: contextvars.ContextVar[Optional[TraceRecorder]] = (
+    contextvars.ContextVar("asky_trace_recorder", default=None)
+)
+_process_recorder: Optional[TraceRecorder] = None
+_recent_traces: Deque[TraceRecorder] = deque(maxlen=DEFAULT_RECENT_TRACE_LIMIT)
+_recent_lock = threading.Lock()
+
+
+def current_recorder() -> Optional[TraceRecorder]:
+    return _active_recorder.get() or _process_recorder
+
+
+def is_enabled() -> bool:
+    return current_recorder() is not None
+
+
+def span(name: str, category: str = "asky", **args: Any) -> Span | _NullSpan:
+    """Open a span in the active recorder, or a no-op when tracing is off."""
+    recorder = _active_recorder.get() or _process_recorder
+    if recorder is None:
+        return _NULL_SPAN
+    return Span(recorder, name, category, args)
+
+
+def annotate(**args: Any) -> None:
+    """Attach arguments to the innermost open span on this thread, if any."""
+    recorder = _active_recorder.get() or _process_recorder
+    if recorder is None:
+        return
+    current = recorder.current_span()
+    if current is not None:
+        current.set(**args)
+
+
+def traced(name: Optional[str] = None, category: str = "asky") -> Callable[[F], F]:
+    """Decorator wrapping every call of a function in a span."""
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = _active_recorder.get() or _process_recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            with Span(recorder, span_name, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def bind_context(func: F) -> F:
+    """Run `func` in a copy of the caller's context so pool threads keep the recorder."""
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@contextmanager
+def recording(
+    recorder: Optional[TraceRecorder] = None,
+    *,
+    label: str = "",
+    process_wide: bool = False,
+) -> Iterator[TraceRecorder]:
+    """Activate `recorder` (or a new one) for the enclosed block."""
+    global _process_recorder
+    active = recorder or TraceRecorder(label=label)
+    token = _active_recorder.set(active)
+    previous_process = _process_recorder
+    if process_wide:
+        _process_recorder = active
+    try:
+        yield active
+    finally:
+        active.finish()
+        if process_wide:
+            _process_recorder = previous_process
+        _active_recorder.reset(token)
+
+
+def install_process_recorder(
+    recorder: Optional[TraceRecorder],
+) -> Optional[TraceRecorder]:
+    """Make `recorder` the fallback for every thread; returns the previous one."""
+    global _process_recorder
+    previous = _process_recorder
+    _process_recorder = recorder
+    return previous
+
+
+def remember_trace(recorder: TraceRecorder) -> None:
+    """Keep a finished trace for the daemon admin console."""
+    with _recent_lock:
+        _recent_traces.append(recorder)
+
+
+def recent_traces() -> List[TraceRecorder]:
+    """Most recent remembered traces, newest first."""
+    with _recent_lock:
+        return list(reversed(_recent_traces))
+
+
+def set_recent_trace_limit(limit: int) -> None:
+    global _recent_traces
+    with _recent_lock:
+        _recent_traces = deque(_recent_traces, maxlen=max(1, int(limit)))
+
+
+def _sql_preview(sql: Any) -> str:
+    return " ".join(str(sql).split())[:SQL_PREVIEW_CHARS]
+
+
+class _TracedCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=(), /):
+        with span("sqlite.execute", "sqlite", sql=_sql_preview(sql)):
+            return super().execute(sql, parameters)
+
+    def executemany(self, sql, parameters, /):
+        with span("sqlite.executemany", "sqlite", sql=_sql_preview(sql)):
+            return super().executemany(sql, parameters)
+
+    def executescript(self, sql_script, /):
+        with span("sqlite.executescript", "sqlite", sql=_sql_preview(sql_script)):
+            return super().executescript(sql_script)
+
+
+class _TracedConnection(sqlite3.Connection):
+    # Statements are traced on the cursor only; the connection shortcuts go
+    # through a traced cursor so each statement is recorded exactly once.
+    def cursor(self, factory=_TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=(), /):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, parameters, /):
+        return self.cursor().executemany(sql, parameters)
+
+    def executescript(self, sql_script, /):
+        return self.cursor().executescript(sql_script)
+
+    def commit(self):
+        with span("sqlite.commit", "sqlite"):
+            return super().commit()
+
+
+def sqlite_connection_factory() -> type:
+    """Connection class for `sqlite3.connect(factory=...)`; traced only while recording."""
+    if current_recorder() is None:
+        return sqlite3.Connection
+    return _TracedConnection
+
+
+class _TracedCollection:
+    """Proxy timing the data-path methods of a Chroma collection."""
+
+    def __init__(self, collection: Any, collection_name: str) -> None:
+        self._collection = collection
+        self._collection_name = collection_name
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._collection, attr)
+        if attr not in CHROMA_TRACED_METHODS or not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(f"chroma.{attr}", "chroma", collection=self._collection_name):
+                return value(*args, **kwargs)
+
+        return wrapper
+
+
+def trace_collection(collection: Any, collection_name: str) -> Any:
+    """Wrap a Chroma collection so its calls become spans while recording."""
+    if collection is None or current_recorder() is None:
+        return collection
+    return _TracedCollection(collection, collection_name)
@@ -194,6 +194,13 @@ def test_parse_args_query_corpus_options():
         assert args.query_corpus_max_chunks == 2
 
 
+def test_parse_args_corpus_compact_grouped_command():
+    with patch("sys.argv", ["asky", "corpus", "compact"]):
+        args = parse_args()
+        assert args.compact_corpus is True
+        assert not args.query
+
+
 def test_parse_args_summarize_section_options():
     with patch(
         "sys.argv",
@@ -770,7 +777,7 @@ def test_parse_args_session_query_shortcut_generates_sticky_session():
 
 
 @patch("asky.plugins.runtime.get_or_create_plugin_runtime")
-@patch("asky.cli.main._start_research_cache_cleanup_thread")
+@patch("asky.cli.main._run_research_cache_maintenance")
 @patch("asky.cli.main.chat.run_chat")
 @patch("asky.cli.main.history.print_answers_command")
 @patch("asky.cli.main.init_db")
@@ -778,11 +785,10 @@ def test_main_history_show_invalid_selector_reports_grouped_error(
     _mock_init_db,
     mock_print_answers,
     mock_run_chat,
-    mock_cleanup_thread,
+    _mock_cache_maintenance,
     mock_get_runtime,
     capsys,
 ):
-    mock_cleanup_thread.return_value = MagicMock(join=MagicMock())
     mock_get_runtime.return_value = None
 
     with patch(
@@ -1759,13 +1765,13 @@ def test_main_completion_script_early_exit(
 @patch("asky.cli.chat.generate_summaries")
 @patch("asky.cli.chat.save_interaction")
 @patch("asky.cli.main.setup_logging")
-@patch("asky.cli.main.ResearchCache")
+@patch("asky.cli.main._run_research_cache_maintenance")
 @patch("asky.cli.terminal.get_terminal_context")
 @patch("asky.cli.chat.get_shell_session_id", return_value=None)
 def test_main_flow(
     mock_get_shell,
     mock_get_term,
-    mock_research_cache,
+    _mock_cache_maintenance,
     mock_setup_logging,
     mock_save,
     mock_gen_sum,
@@ -1838,7 +1844,7 @@ def test_main_flow(
 @patch("asky.cli.chat.generate_summaries")
 @patch("asky.cli.chat.save_interaction")
 @patch("asky.cli.main.setup_logging")
-@patch("asky.cli.main.ResearchCache")
+@patch("asky.cli.main._run_research_cache_maintenance")
 @patch("asky.cli.terminal.get_terminal_context")
 @patch("asky.cli.chat.get_shell_session_id", return_value=None)
 @patch("asky.storage.sqlite.SQLiteHistoryRepository")
@@ -1846,7 +1852,7 @@ def test_main_flow_verbose(
     mock_repo,
     mock_get_shell,
     mock_get_term,
-    mock_research_cache,
+    _mock_cache_maintenance,
     mock_setup_logging,
     mock_save,
     mock_gen_sum,
@@ -2004,7 +2010,7 @@ def test_main_flow_default_no_context(
 @patch("asky.cli.chat.save_interaction")
 @patch("asky.cli.terminal.get_terminal_context")
 @patch("asky.cli.chat.InterfaceRenderer")
-@patch("asky.cli.main.ResearchCache")
+@patch("asky.cli.main._run_research_cache_maintenance")
 @patch("asky.cli.main.setup_logging")
 @patch("asky.cli.chat.shortlist_prompt_sources")
 @patch("asky.cli.chat.SessionManager")
@@ -2014,7 +2020,7 @@ def test_main_terminal_lines_callback(
     mock_session_manager,
     mock_shortlist,
     mock_setup_logging,
-    mock_research_cache,
+    _mock_cache_maintenance,
     mock_renderer_cls,
     mock_get_term,
     mock_save,
@@ -2765,6 +2771,8 @@ def test_main_explicit_conversion_sets_converted_message_id(
     mock_args.list_memories = False
     mock_args.delete_memory = None
     mock_args.clear_memories = False
+    mock_args.compact_corpus = False
+    mock_args.trace_out = None
     mock_args.history = None
     mock_args.delete_messages = None
     mock_args.delete_sessions = None
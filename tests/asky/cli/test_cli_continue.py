@@ -61,6 +61,8 @@ def test_main_continue_resolves_sentinel_and_converts_session(
     mock_args.list_memories = False
     mock_args.delete_memory = None
     mock_args.clear_memories = False
+    mock_args.compact_corpus = False
+    mock_args.trace_out = None
     mock_args.history = None
     mock_args.delete_messages = None
     mock_args.delete_sessions = None
@@ -11,6 +11,7 @@ from asky.cli import persona_commands
 def test_handle_persona_web_collect(tmp_path):
     with patch("asky.cli.persona_commands.persona_exists", return_value=True), \
          patch("asky.cli.persona_commands._get_data_dir", return_value=tmp_path), \
+         patch("asky.cli.persona_commands._web_crawl_limits", return_value={"max_workers": 2, "per_host_delay_seconds": 1.5}), \
          patch("asky.cli.persona_commands.web_service.start_seed_domain_collection", return_value="web_123") as mock_start:
         
         args = argparse.Namespace(
@@ -26,7 +27,9 @@ def test_handle_persona_web_collect(tmp_path):
             persona_name="arendt",
             target_results=10,
             urls=["https://example.com"],
-            url_file=None
+            url_file=None,
+            max_workers=2,
+            per_host_delay_seconds=1.5,
         )
 
 
@@ -83,3 +83,36 @@ def test_plain_query_interface_config():
     assert isinstance(INTERFACE_MODEL_PLAIN_QUERY_PROMPT_ENRICHMENT_ENABLED, bool)
     assert isinstance(PLAIN_QUERY_INTERFACE_SYSTEM_PROMPT, str)
     assert len(PLAIN_QUERY_INTERFACE_SYSTEM_PROMPT) > 0
+
+
+def test_load_config_reuses_snapshot_until_a_source_changes(monkeypatch, tmp_path):
+    from unittest.mock import patch
+    from asky.config import loader
+
+    monkeypatch.setenv("ASKY_HOME", str(tmp_path / "home"))
+    monkeypatch.delenv(loader.CONFIG_SNAPSHOT_DISABLE_ENV_VAR, raising=False)
+
+    first = loader.load_config()
+    snapshot_path = tmp_path / "home" / loader.CONFIG_SNAPSHOT_FILENAME
+    assert snapshot_path.exists()
+
+    with patch.object(loader, "_build_config", side_effect=AssertionError("rebuilt")):
+        assert loader.load_config() == first
+
+    general = tmp_path / "home" / "general.toml"
+    general.write_text(
+        general.read_text().replace("[general]", "[general]\nsnapshot_probe = 7", 1),
+        encoding="utf-8",
+    )
+    rebuilt = loader.load_config()
+    assert rebuilt["general"]["snapshot_probe"] == 7
+
+
+def test_load_config_ignores_corrupt_snapshot(monkeypatch, tmp_path):
+    from asky.config import loader
+
+    monkeypatch.setenv("ASKY_HOME", str(tmp_path / "home"))
+    expected = loader.load_config()
+    (tmp_path / "home" / loader.CONFIG_SNAPSHOT_FILENAME).write_bytes(b"not marshal")
+
+    assert loader.load_config() == expected
@@ -0,0 +1,116 @@
+"""Tests for lazy debug payload logging and sampled payload capture."""
+
+from __future__ import annotations
+
+import json
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from asky.core import api_client, payload_capture
+from asky.core.api_client import get_llm_msg
+from asky.core.payload_capture import PayloadCapture
+
+
+@pytest.fixture
+def capture_config(monkeypatch, tmp_path):
+    import asky.config as config
+
+    path = tmp_path / "logs" / "payloads.jsonl"
+    monkeypatch.setattr(config, "PAYLOAD_CAPTURE_FILE", str(path))
+    monkeypatch.setattr(config, "PAYLOAD_CAPTURE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(payload_capture, "_capture", None)
+    monkeypatch.setattr(payload_capture, "_capture_key", None)
+    yield path
+    if payload_capture._capture is not None:
+        payload_capture._capture.close()
+
+
+def _ok_response(content="Hello"):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "choices": [{"message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 1},
+    }
+    return response
+
+
+@patch("asky.core.api_client.requests.post")
+def test_debug_payload_is_not_built_when_debug_is_off(mock_post):
+    mock_post.return_value = _ok_response()
+    logging.getLogger(api_client.__name__).setLevel(logging.INFO)
+    try:
+        with patch.object(api_client, "format_log_content") as formatter:
+            get_llm_msg("q34", [{"role": "user", "content": "Hi"}])
+        formatter.assert_not_called()
+
+        logging.getLogger(api_client.__name__).setLevel(logging.DEBUG)
+        with patch.object(api_client, "format_log_content", return_value="Hi") as formatter:
+            get_llm_msg("q34", [{"role": "user", "content": "Hi"}])
+        formatter.assert_called_once()
+    finally:
+        logging.getLogger(api_client.__name__).setLevel(logging.NOTSET)
+
+
+@patch("asky.core.api_client.requests.post")
+def test_capture_writes_full_request_and_response(mock_post, capture_config):
+    mock_post.return_value = _ok_response("Full answer")
+    long_text = "word " * 500
+
+    get_llm_msg("q34", [{"role": "user", "content": long_text}], model_alias="q34")
+
+    (line,) = capture_config.read_text(encoding="utf-8").splitlines()
+    record = json.loads(line)
+    assert record["request"]["messages"][0]["content"] == long_text
+    assert record["response"]["choices"][0]["message"]["content"] == "Full answer"
+    assert record["status_code"] == 200
+    assert record["attempt"] == 1
+    assert "Authorization" not in line
+
+
+@patch("asky.core.api_client.requests.post")
+def test_capture_records_failed_attempts(mock_post, capture_config):
+    import requests
+
+    mock_post.side_effect = [requests.exceptions.ConnectionError("down"), _ok_response()]
+    with patch("asky.core.api_client.time.sleep"):
+        get_llm_msg("q34", [{"role": "user", "content": "Hi"}])
+
+    records = [
+        json.loads(line)
+        for line in capture_config.read_text(encoding="utf-8").splitlines()
+    ]
+    assert [record["attempt"] for record in records] == [1, 2]
+    assert records[0]["error"] == "down"
+    assert records[1]["error"] is None
+
+
+def test_capture_disabled_without_file(monkeypatch):
+    import asky.config as config
+
+    monkeypatch.setattr(config, "PAYLOAD_CAPTURE_FILE", "")
+    assert payload_capture.get_payload_capture() is None
+
+
+def test_sampling_and_rotation(tmp_path):
+    draws = iter([0.05, 0.5, 0.09])
+    capture = PayloadCapture(
+        tmp_path / "cap.jsonl",
+        sample_rate=0.1,
+        max_bytes=200,
+        backup_count=1,
+        rng=lambda: next(draws),
+    )
+    try:
+        assert [capture.should_sample() for _ in range(3)] == [True, False, True]
+        for index in range(5):
+            capture.write({"request": {"n": index, "pad": "x" * 100}})
+    finally:
+        capture.close()
+
+    assert (tmp_path / "cap.jsonl").exists()
+    assert (tmp_path / "cap.jsonl.1").exists()
+    assert not (tmp_path / "cap.jsonl.2").exists()
+    assert PayloadCapture(tmp_path / "off.jsonl", sample_rate=0).should_sample() is False
@@ -136,10 +136,11 @@ def test_set_shell_session_id_removes_tmp_file_after_replace(tmp_path):
     assert not tmp_file.exists(), ".tmp file should be gone after atomic replace"
 
 
-def test_enqueue_for_jid_starts_single_worker_under_concurrency():
+def test_enqueue_for_jid_uses_bounded_pool_under_concurrency():
     from unittest.mock import patch as _patch
 
     from asky.plugins.xmpp_daemon import xmpp_service as svc
+    from asky.plugins.xmpp_daemon.worker_pool import KeyedWorkerPool
 
     with (
         _patch("asky.plugins.xmpp_daemon.xmpp_service.TranscriptManager"),
@@ -149,31 +150,38 @@ def test_enqueue_for_jid_starts_single_worker_under_concurrency():
         _patch("asky.plugins.xmpp_daemon.xmpp_service.AskyXMPPClient"),
     ):
         service = svc.XMPPService.__new__(svc.XMPPService)
-        service._jid_queues = {}
-        service._jid_workers = {}
-        service._jid_workers_lock = threading.Lock()
+        service._worker_pool = KeyedWorkerPool(worker_count=2, max_queue_depth=100)
 
         exceptions = []
+        done = threading.Event()
+        counter = {"n": 0}
+        counter_lock = threading.Lock()
 
-        def _run():
+        def _task():
+            with counter_lock:
+                counter["n"] += 1
+                if counter["n"] == 40:
+                    done.set()
+
+        def _run(index):
             try:
-                service._enqueue_for_jid("user@example.com", lambda: None)
+                service._enqueue_for_jid(f"user{index % 20}@example.com", _task)
             except Exception as e:
                 exceptions.append(e)
 
-        t1 = threading.Thread(target=_run)
-        t2 = threading.Thread(target=_run)
-        t1.start()
-        t2.start()
-        t1.join(timeout=3)
-        t2.join(timeout=3)
+        threads = [threading.Thread(target=_run, args=(i,)) for i in range(40)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=3)
 
         assert not exceptions
-
-        alive_workers = [w for w in service._jid_workers.values() if w.is_alive()]
-        assert len(alive_workers) <= 1, (
-            "Only one worker thread should be running per JID"
-        )
+        assert done.wait(timeout=3)
+        pool_threads = [
+            t for t in threading.enumerate() if t.name.startswith("asky-xmpp-worker")
+        ]
+        assert len(pool_threads) <= 2, "Worker threads must not grow per JID"
+        service._worker_pool.shutdown(wait=True, timeout=3)
 
 
 def test_create_session_rejects_invalid_research_source_mode(tmp_path):
@@ -0,0 +1,161 @@
+"""Tests for tokenizer-aware, memoized token counting."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from asky.core import token_counter
+from asky.core.engine import ConversationEngine
+from asky.core.registry import ToolRegistry
+from asky.core.token_counter import TokenCounter, get_token_counter
+
+
+def _legacy_count(messages):
+    total_chars = 0
+    for m in messages:
+        content = m.get("content")
+        if isinstance(content, str):
+            total_chars += len(content)
+        elif content is not None:
+            total_chars += len(json.dumps(content))
+        tc = m.get("tool_calls")
+        if tc:
+            total_chars += len(json.dumps(tc))
+    return total_chars // 4
+
+
+def _legacy_compact(messages, threshold_tokens):
+    system_msgs = [m for m in messages if m.get("role") == "system"]
+    history = [m for m in messages if m.get("role") != "system"]
+    last_msg = history.pop()
+    while history:
+        history.pop(0)
+        candidate = system_msgs + history + [last_msg]
+        if _legacy_count(candidate) < threshold_tokens:
+            return candidate
+    return system_msgs + [last_msg]
+
+
+def test_estimator_matches_legacy_chars_over_four():
+    messages = [
+        {"role": "system", "content": "abc"},
+        {"role": "user", "content": [{"type": "text", "text": "hello"}]},
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"id": "1", "function": {"name": "f", "arguments": "{}"}}],
+        },
+        {"role": "tool", "content": "x" * 13},
+    ]
+    counter = TokenCounter()
+    assert counter.count_messages(messages) == _legacy_count(messages)
+    # Remainders accumulate across messages instead of truncating per message.
+    assert counter.count_messages([{"content": "abc"}, {"content": "d"}]) == 1
+
+
+def test_message_counts_are_memoized():
+    calls = []
+
+    def _encode(text):
+        calls.append(text)
+        return text.split()
+
+    counter = TokenCounter(_encode, name="words")
+    tool_calls = [{"id": "1", "function": {"name": "search", "arguments": "{}"}}]
+    messages = [
+        {"role": "user", "content": "one two three"},
+        {"role": "assistant", "content": "", "tool_calls": tool_calls},
+    ]
+
+    first = counter.count_messages(messages)
+    # Equal content in a fresh dict still hits; tool_calls hit by identity.
+    again = counter.count_messages([dict(m) for m in messages])
+
+    assert first == again == 3 + len(json.dumps(tool_calls).split())
+    assert counter.is_exact is True
+    assert len(calls) == 2
+    assert counter.cache_hits == 2
+
+
+def test_model_tokenizer_setting_selects_exact_counter(monkeypatch):
+    monkeypatch.setattr(token_counter, "_counters", {})
+    monkeypatch.setattr(
+        token_counter, "_load_encoder", lambda spec: lambda text: list(text)
+    )
+    counter = get_token_counter({"id": "m", "tokenizer": "fake:chars"})
+
+    assert counter.name == "fake:chars"
+    assert counter.count_messages([{"content": "abcdef"}]) == 6
+    assert get_token_counter({"id": "other", "tokenizer": "fake:chars"}) is counter
+
+
+def test_unloadable_tokenizer_falls_back_to_estimate(monkeypatch, caplog):
+    monkeypatch.setattr(token_counter, "_counters", {})
+    counter = get_token_counter({"id": "m", "tokenizer": "hf:"})
+
+    assert counter is get_token_counter(None)
+    assert counter.is_exact is False
+    assert "using the chars/4 estimate" in caplog.text
+
+
+def test_tiktoken_download_failure_falls_back_once(monkeypatch, caplog):
+    import sys
+    import types
+
+    from asky.core.api_client import count_tokens
+
+    calls = []
+
+    def _encoding_for_model(name):
+        calls.append(name)
+        raise ConnectionError("offline")
+
+    fake_tiktoken = types.SimpleNamespace(encoding_for_model=_encoding_for_model)
+    monkeypatch.setitem(sys.modules, "tiktoken", fake_tiktoken)
+    monkeypatch.setattr(token_counter, "_counters", {})
+
+    first = get_token_counter({"id": "gpt-4o"})
+    second = get_token_counter({"id": "gpt-4o"})
+
+    assert first is second is get_token_counter(None)
+    assert count_tokens([{"content": "abcdefgh"}], {"id": "gpt-4o"}) == 2
+    assert calls == ["gpt-4o"]
+    assert caplog.text.count("using the chars/4 estimate") == 1
+
+
+def test_tokenizer_json_file(tmp_path, monkeypatch):
+    tokenizers = pytest.importorskip("tokenizers")
+    vocab = {"[UNK]": 0, "hello": 1, "world": 2}
+    tokenizer = tokenizers.Tokenizer(
+        tokenizers.models.WordLevel(vocab, unk_token="[UNK]")
+    )
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    path = tmp_path / "tokenizer.json"
+    tokenizer.save(str(path))
+    monkeypatch.setattr(token_counter, "_counters", {})
+
+    counter = get_token_counter({"id": "local", "tokenizer": str(path)})
+
+    assert counter.is_exact is True
+    assert counter.count_text("hello world hello") == 3
+
+
+@pytest.mark.parametrize("threshold_percent", [10, 30, 60])
+def test_compaction_matches_legacy_drop_order(threshold_percent):
+    engine = ConversationEngine(
+        model_config={"id": "test-model", "alias": "test", "context_size": 1000},
+        tool_registry=ToolRegistry(),
+    )
+    messages = [{"role": "system", "content": "s" * 40}]
+    for index in range(20):
+        role = "user" if index % 2 == 0 else "assistant"
+        messages.append({"role": role, "content": f"{index} " + "w" * (40 * index)})
+
+    threshold = int(1000 * threshold_percent / 100)
+    with patch("asky.core.engine.SESSION_COMPACTION_THRESHOLD", threshold_percent):
+        compacted = engine.check_and_compact(list(messages))
+
+    assert compacted == _legacy_compact(messages, threshold)
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from pathlib import Path
 
-from asky.daemon.job_queue import JobQueue, JobStatus
+from asky.daemon.job_queue import JobQueue, JobSpec, JobStatus, retry_delay_seconds
 
 
 def test_job_queue_lifecycle(tmp_path: Path):
@@ -77,3 +78,141 @@ def test_job_queue_list_jobs(tmp_path: Path):
     assert len(jobs) == 2
     assert jobs[0].func_name == "job2"
     assert jobs[1].func_name == "job1"
+
+
+def _wait_for_status(queue: JobQueue, job_id: str, status: JobStatus, timeout: float = 5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get_job(job_id)
+        if job and job.status == status:
+            return job
+        time.sleep(0.05)
+    return queue.get_job(job_id)
+
+
+def test_job_queue_dequeues_by_priority(tmp_path: Path):
+    queue = JobQueue(tmp_path / "jobs.db")
+    low = queue.enqueue_job("work", priority=0)
+    high = queue.enqueue_job("work", priority=10)
+
+    first = queue._dequeue()
+    second = queue._dequeue()
+
+    assert (first.id, second.id) == (high, low)
+    assert first.status == JobStatus.RUNNING
+    assert first.lease_expires_at is not None
+
+
+def test_job_queue_enqueue_many_is_batched(tmp_path: Path):
+    queue = JobQueue(tmp_path / "jobs.db")
+    ids = queue.enqueue_many(
+        [JobSpec("a", args=(1,)), JobSpec("b", kwargs={"x": 2}, priority=5)]
+    )
+
+    assert len(ids) == 2
+    assert queue.get_job(ids[0]).args == (1,)
+    assert queue.get_job(ids[1]).priority == 5
+
+
+def test_job_queue_retries_with_backoff_until_max_attempts(tmp_path: Path):
+    queue = JobQueue(tmp_path / "jobs.db", retry_base_delay_seconds=0.05)
+    calls = []
+
+    def flaky():
+        calls.append(time.time())
+        if len(calls) < 3:
+            raise RuntimeError("transient")
+
+    queue.register_handler("flaky", flaky, max_attempts=3)
+    queue.start()
+    try:
+        job_id = queue.enqueue("flaky")
+        job = _wait_for_status(queue, job_id, JobStatus.SUCCESS)
+    finally:
+        queue.stop()
+
+    assert job.status == JobStatus.SUCCESS
+    assert job.attempts == 3
+    assert calls[2] - calls[1] >= calls[1] - calls[0]
+    assert retry_delay_seconds(3, 1.0) == 4.0
+
+
+def test_job_queue_reclaims_expired_lease(tmp_path: Path):
+    now = [1000.0]
+    db_path = tmp_path / "jobs.db"
+    crashed = JobQueue(db_path, lease_seconds=10, clock=lambda: now[0])
+    job_id = crashed.enqueue("work")
+    assert crashed._dequeue().id == job_id
+
+    recovered = JobQueue(db_path, lease_seconds=10, clock=lambda: now[0])
+    assert recovered._reclaim_expired_leases() == 0
+
+    now[0] += 11
+    assert recovered._reclaim_expired_leases() == 1
+    job = recovered.get_job(job_id)
+    assert job.status == JobStatus.PENDING
+    assert job.attempts == 0
+
+    # Repeated crashes keep re-queueing; only handler failures use up attempts.
+    assert recovered._dequeue().id == job_id
+    now[0] += 11
+    recovered._reclaim_expired_leases()
+    assert recovered.get_job(job_id).status == JobStatus.PENDING
+    assert recovered._dequeue().attempts == 1
+
+
+def test_job_queue_logs_result_of_reclaimed_job(tmp_path: Path, caplog):
+    now = [1000.0]
+    db_path = tmp_path / "jobs.db"
+    slow = JobQueue(db_path, lease_seconds=10, clock=lambda: now[0])
+    slow.enqueue("work")
+    job = slow._dequeue()
+
+    now[0] += 11
+    other = JobQueue(db_path, lease_seconds=10, clock=lambda: now[0])
+    other._reclaim_expired_leases()
+    with caplog.at_level("WARNING", logger="asky.daemon.job_queue"):
+        slow._mark_success(job.id)
+
+    assert "lease was reclaimed" in caplog.text
+    assert other.get_job(job.id).status == JobStatus.PENDING
+
+
+def test_job_queue_dedicated_lane_does_not_block_other_jobs(tmp_path: Path):
+    queue = JobQueue(tmp_path / "jobs.db", worker_count=1)
+    release = threading.Event()
+    quick_done = threading.Event()
+
+    queue.register_handler("slow", lambda: release.wait(5), workers=1)
+    queue.register_handler("quick", quick_done.set)
+    queue.start()
+    try:
+        slow_id = queue.enqueue("slow")
+        _wait_for_status(queue, slow_id, JobStatus.RUNNING)
+        queue.enqueue("quick")
+        assert quick_done.wait(3)
+        assert queue.snapshot()["lanes"] == {"shared": 1, "slow": 1}
+    finally:
+        release.set()
+        queue.stop()
+
+
+def test_job_queue_periodic_jobs_do_not_pile_up(tmp_path: Path):
+    now = [1000.0]
+    queue = JobQueue(tmp_path / "jobs.db", clock=lambda: now[0])
+    queue.schedule_periodic("sweep", 60, initial_delay_seconds=30)
+
+    assert queue._enqueue_due_periodic() == []
+    now[0] += 30
+    first = queue._enqueue_due_periodic()
+    assert len(first) == 1
+
+    # Due again, but the previous run is still pending: nothing new is added.
+    now[0] += 60
+    assert queue._enqueue_due_periodic() == []
+
+    job = queue._dequeue()
+    queue._mark_success(job.id)
+    now[0] += 60
+    assert len(queue._enqueue_due_periodic()) == 1
+    assert queue.snapshot()["periodic_seconds"] == {"sweep": 60.0}
@@ -63,6 +63,8 @@ class TestStartupCleanup:
                 args.list_memories = False
                 args.delete_memory = None
                 args.clear_memories = False
+                args.compact_corpus = False
+                args.trace_out = None
                 args.shortlist = None
                 args.turns = None
                 args.elephant_mode = False
@@ -70,9 +72,8 @@ class TestStartupCleanup:
                 mock_parse.return_value = args
                 yield mock_parse
 
-    def test_cleanup_on_startup(self, cache, mock_args, tmp_path):
-        """Test that expired entries are cleaned up on startup."""
-        # Insert an expired entry
+    def test_maintenance_spawned_after_query(self, cache, mock_args, tmp_path):
+        """Test that maintenance starts detached after the query, not before it."""
         url = "http://expired.example.com"
         url_hash = cache._url_hash(url)
         expired_time = (datetime.now() - timedelta(hours=25)).isoformat()
@@ -101,60 +102,43 @@ class TestStartupCleanup:
         conn.commit()
         conn.close()
 
-        # Verify it exists
-        assert (
-            cache.get_cached(url) is None
-        )  # get_cached filters by expiry, so returns None
-
-        # Verify it exists in DB directly
-        conn = sqlite3.connect(cache.db_path)
-        c = conn.cursor()
-        c.execute("SELECT count(*) FROM research_cache WHERE url = ?", (url,))
-        assert c.fetchone()[0] == 1
-        conn.close()
-
-        # Mock other dependencies to run main() minimalistically
+        order = []
         with (
-            patch("asky.cli.main.chat.run_chat"),
+            patch(
+                "asky.cli.main.chat.run_chat",
+                side_effect=lambda *a, **k: order.append("chat"),
+            ),
             patch("asky.cli.main.setup_logging"),
             patch("asky.cli.main.init_db"),
             patch("asky.cli.main.utils.load_custom_prompts"),
             patch("asky.cli.main.utils.expand_query_text", return_value="test query"),
-            patch("asky.cli.main._start_research_cache_cleanup_thread") as mock_start,
+            patch(
+                "asky.research.cache_maintenance.subprocess.Popen",
+                side_effect=lambda *a, **k: order.append("maintenance"),
+            ) as mock_popen,
         ):
-            # Force cleanup to run synchronously for deterministic assertion.
-            dummy_thread = MagicMock()
-
-            def run_cleanup_sync():
-                from asky.cli.main import _run_research_cache_cleanup
-
-                _run_research_cache_cleanup()
-                return dummy_thread
-
-            mock_start.side_effect = run_cleanup_sync
-
-            # We need to ensure ResearchCache uses our test instance
-            # Since main instantiates ResearchCache(), we need to patch it or ensure singleton works
-            # The test fixture sets _instance = None, then creates one.
-            # main() calls ResearchCache() which should return our instance if valid
-            # BUT ResearchCache args in main are defaults (db_path=None).
-            # Our fixture created one with specific db_path.
-            # ResearchCache singleton logic: if _instance exists, return it.
-            # So main() 'ResearchCache()' call will return 'cache' fixture instance.
-
+            # main() calls ResearchCache() after the chat; the singleton returns
+            # the fixture instance, and a fresh cache has never been maintained,
+            # so a pass is due.
             main()
 
+        assert order == ["chat", "maintenance"]
+        assert mock_popen.call_args.args[0][1:] == [
+            "-m",
+            "asky.research.cache_maintenance",
+        ]
+        # The CLI process itself deletes nothing; the detached pass does.
         conn = sqlite3.connect(cache.db_path)
         c = conn.cursor()
         c.execute("SELECT count(*) FROM research_cache WHERE url = ?", (url,))
-        assert c.fetchone()[0] == 0
+        assert c.fetchone()[0] == 1
         conn.close()
 
-    def test_cleanup_failure_does_not_crash_startup(self, cache, mock_args):
-        """Test that cleanup failure logs error but continues startup."""
+    def test_cleanup_failure_does_not_crash_cli(self, cache, mock_args):
+        """Test that cleanup failure is logged and does not fail the command."""
         with (
             patch.object(
-                ResearchCache, "cleanup_expired", side_effect=Exception("DB Error")
+                ResearchCache, "get_meta", side_effect=Exception("DB Error")
             ),
             patch("asky.cli.main.chat.run_chat") as mock_run_chat,
             patch("asky.cli.main.setup_logging"),
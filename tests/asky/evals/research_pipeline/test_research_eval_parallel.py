@@ -0,0 +1,223 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from asky.core import api_client
+from asky.evals.research_pipeline.dataset import (
+    DatasetDocument,
+    DatasetExpected,
+    DatasetSpec,
+    DatasetTestCase,
+)
+from asky.evals.research_pipeline.evaluator import (
+    RUN_RESULTS_FILENAME,
+    SHARD_BY_CASE,
+    SnapshotManifest,
+    run_evaluation_matrix,
+)
+from asky.evals.research_pipeline.matrix import MatrixSpec, RunProfile
+from asky.evals.research_pipeline.parallel import (
+    SharedRateLimiter,
+    install_llm_rate_limit,
+)
+
+
+def _dataset(tmp_path, case_count=4):
+    docs = {
+        "doc-1": DatasetDocument(id="doc-1", title="Doc 1", url="https://example.com/1")
+    }
+    tests = [
+        DatasetTestCase(
+            id=f"case-{index}",
+            doc_ids=["doc-1"],
+            query=f"q{index}",
+            expected=DatasetExpected(type="contains", text="ok"),
+        )
+        for index in range(1, case_count + 1)
+    ]
+    return DatasetSpec(
+        id="dataset", docs=docs, tests=tests, source_path=tmp_path / "dataset.yaml"
+    )
+
+
+def _manifest(tmp_path):
+    doc_path = tmp_path / "doc-1.txt"
+    doc_path.write_text("doc", encoding="utf-8")
+    return SnapshotManifest(
+        dataset_id="dataset",
+        dataset_dir=tmp_path,
+        manifest_path=tmp_path / "manifest.json",
+        doc_paths={"doc-1": doc_path},
+        doc_sha256={"doc-1": "unused"},
+        timings_ms={},
+        doc_prepare_timings_ms={},
+    )
+
+
+@pytest.fixture
+def fake_cases(monkeypatch):
+    calls = []
+
+    def _fake_evaluate_case(*, run, test_case, **_):
+        calls.append((run.id, test_case.id))
+        return {
+            "run_id": run.id,
+            "test_id": test_case.id,
+            "pass": True,
+            "elapsed_ms": 5.0,
+            "error": None,
+            "halted": False,
+            "token_usage": {
+                "main": {"input_tokens": 10, "output_tokens": 2, "total_tokens": 12}
+            },
+        }
+
+    monkeypatch.setattr(
+        "asky.evals.research_pipeline.evaluator._initialize_runtime_storage",
+        lambda: None,
+    )
+    monkeypatch.setattr(
+        "asky.evals.research_pipeline.evaluator._evaluate_case", _fake_evaluate_case
+    )
+    # Threads stand in for processes so the monkeypatched evaluator is visible.
+    monkeypatch.setattr(
+        "asky.evals.research_pipeline.parallel._default_executor",
+        lambda workers, initializer, initargs: ThreadPoolExecutor(
+            max_workers=1, initializer=initializer, initargs=initargs
+        ),
+    )
+    return calls
+
+
+def test_case_shards_stream_and_merge_in_dataset_order(tmp_path, fake_cases):
+    dataset = _dataset(tmp_path)
+    matrix = MatrixSpec(
+        runs=[
+            RunProfile(id="run-a", model_alias="gf", research_mode=True),
+            RunProfile(id="run-b", model_alias="gf", research_mode=True),
+        ],
+        source_path=tmp_path / "matrix.toml",
+    )
+    events = []
+
+    output_dir = run_evaluation_matrix(
+        dataset=dataset,
+        matrix=matrix,
+        snapshot_manifest=_manifest(tmp_path),
+        output_root=tmp_path / "out",
+        progress_callback=events.append,
+        workers=2,
+        shard_by=SHARD_BY_CASE,
+    )
+
+    assert len(fake_cases) == 8
+    assert (output_dir / "run-a" / "shards" / "000" / "runtime").is_dir()
+    assert (output_dir / "run-a" / "shards" / "001" / "runtime").is_dir()
+    rows = [
+        json.loads(line)
+        for line in (output_dir / "run-a" / "artifacts" / RUN_RESULTS_FILENAME)
+        .read_text(encoding="utf-8")
+        .splitlines()
+    ]
+    assert [row["test_id"] for row in rows] == ["case-1", "case-2", "case-3", "case-4"]
+
+    summary = json.loads((output_dir / "summary.json").read_text(encoding="utf-8"))
+    assert summary["execution"]["workers"] == 2
+    run_a = summary["runs"][0]
+    assert run_a["run_id"] == "run-a"
+    assert run_a["passed_cases"] == 4
+    assert run_a["token_usage_totals"]["main"]["total_tokens"] == 48
+    assert [e["event"] for e in events].count("run_end") == 2
+    assert [e["event"] for e in events].count("case_end") == 8
+
+
+def test_resume_skips_completed_cases_and_reruns_errors(tmp_path, fake_cases):
+    dataset = _dataset(tmp_path, case_count=3)
+    matrix = MatrixSpec(
+        runs=[RunProfile(id="run-a", model_alias="gf", research_mode=True)],
+        source_path=tmp_path / "matrix.toml",
+    )
+    resume_dir = tmp_path / "partial"
+    results_path = resume_dir / "run-a" / "artifacts" / RUN_RESULTS_FILENAME
+    results_path.parent.mkdir(parents=True)
+    results_path.write_text(
+        json.dumps({"test_id": "case-2", "pass": True, "elapsed_ms": 1.0})
+        + "\n"
+        + json.dumps({"test_id": "case-1", "pass": False, "error": "timeout"})
+        + "\n"
+        + '{"test_id": "case-3", "pa',
+        encoding="utf-8",
+    )
+
+    output_dir = run_evaluation_matrix(
+        dataset=dataset,
+        matrix=matrix,
+        snapshot_manifest=_manifest(tmp_path),
+        output_root=tmp_path / "unused",
+        resume_dir=resume_dir,
+    )
+
+    assert output_dir == resume_dir.resolve()
+    assert fake_cases == [("run-a", "case-1"), ("run-a", "case-3")]
+    rows = [
+        json.loads(line)
+        for line in results_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert [row["test_id"] for row in rows] == ["case-1", "case-2", "case-3"]
+    assert all(row.get("error") is None for row in rows)
+
+
+def test_failed_shard_records_error_rows(tmp_path, fake_cases, monkeypatch):
+    def _broken_storage():
+        raise RuntimeError("db unavailable")
+
+    monkeypatch.setattr(
+        "asky.evals.research_pipeline.evaluator._initialize_runtime_storage",
+        _broken_storage,
+    )
+    dataset = _dataset(tmp_path, case_count=2)
+    matrix = MatrixSpec(
+        runs=[RunProfile(id="run-a", model_alias="gf", research_mode=True)],
+        source_path=tmp_path / "matrix.toml",
+    )
+
+    output_dir = run_evaluation_matrix(
+        dataset=dataset,
+        matrix=matrix,
+        snapshot_manifest=_manifest(tmp_path),
+        output_root=tmp_path / "out",
+        workers=2,
+    )
+
+    summary = json.loads(
+        (output_dir / "run-a" / "artifacts" / "summary.json").read_text(encoding="utf-8")
+    )
+    assert summary["error_cases"] == 2
+    assert fake_cases == []
+
+
+def test_shared_rate_limiter_spaces_callers_through_one_file(tmp_path):
+    now = [100.0]
+    sleeps = []
+    path = tmp_path / "rate"
+    first = SharedRateLimiter(path, 2.0, clock=lambda: now[0], sleep=sleeps.append)
+    second = SharedRateLimiter(path, 2.0, clock=lambda: now[0], sleep=sleeps.append)
+
+    first.acquire()
+    second.acquire()
+    first.acquire()
+
+    assert sleeps == [0.5, 1.0]
+
+
+def test_install_llm_rate_limit_restores_previous_gate(tmp_path):
+    previous = api_client._llm_request_gate
+    restore = install_llm_rate_limit(tmp_path / "rate", 5.0)
+    try:
+        assert api_client._llm_request_gate is not previous
+    finally:
+        restore()
+    assert api_client._llm_request_gate is previous
+    install_llm_rate_limit(tmp_path / "rate", 0)()
+    assert api_client._llm_request_gate is previous
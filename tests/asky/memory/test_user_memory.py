@@ -155,7 +155,7 @@ class TestDedup:
             mock_instance.model = "mock-model"
             MockEmbClient.return_value = mock_instance
             MockEmbClient.serialize_embedding = MagicMock(return_value=b"\x00" * 16)
-            MockEmbClient.deserialize_embedding = MagicMock(
+            MockEmbClient.deserialize_embedding_array = MagicMock(
                 return_value=fake_embedding
             )
 
@@ -188,6 +188,111 @@ class TestDedup:
             assert len(get_all_memories(db)) == 1
 
 
+class TestLocalVectorIndex:
+    def test_sqlite_fallback_uses_vector_index(self, tmp_path, monkeypatch):
+        """Without Chroma, ranking goes through the local index, not a row scan."""
+        import numpy as np
+
+        from asky.memory import vector_ops
+
+        db = _make_db(tmp_path)
+        vectors = {"likes tea": [1.0, 0.0, 0.0], "likes coffee": [0.0, 1.0, 0.0]}
+        ids = {text: save_memory(db, text) for text in vectors}
+        conn = sqlite3.connect(db)
+        for text, vector in vectors.items():
+            conn.execute(
+                "UPDATE user_memories SET embedding = ?, embedding_model = ? WHERE id = ?",
+                (np.asarray(vector, dtype=np.float32).tobytes(), "mem-model", ids[text]),
+            )
+        conn.commit()
+        conn.close()
+        monkeypatch.setattr(
+            vector_ops,
+            "cosine_similarity",
+            lambda *_: pytest.fail("indexed search should not scan rows"),
+        )
+
+        results = vector_ops._search_with_sqlite(
+            db,
+            [0.9, 0.1, 0.0],
+            top_k=1,
+            min_similarity=0.5,
+            embedding_model="mem-model",
+        )
+
+        assert [(m["id"], m["memory_text"]) for m, _ in results] == [
+            (ids["likes tea"], "likes tea")
+        ]
+        assert (tmp_path / "vector_index").is_dir()
+
+    def test_sqlite_fallback_keeps_memories_from_previous_model(self, tmp_path):
+        """Memories embedded under an older model tag are still scanned."""
+        import numpy as np
+
+        from asky.memory import vector_ops
+
+        db = _make_db(tmp_path)
+        old_id = save_memory(db, "likes tea")
+        new_id = save_memory(db, "likes coffee")
+        conn = sqlite3.connect(db)
+        for mid, vector, model in (
+            (old_id, [1.0, 0.0, 0.0], "mem-model"),
+            (new_id, [0.0, 1.0, 0.0], "mem-model@int8"),
+        ):
+            conn.execute(
+                "UPDATE user_memories SET embedding = ?, embedding_model = ? WHERE id = ?",
+                (np.asarray(vector, dtype=np.float32).tobytes(), model, mid),
+            )
+        conn.commit()
+        conn.close()
+
+        results = vector_ops._search_with_sqlite(
+            db,
+            [0.9, 0.1, 0.0],
+            top_k=2,
+            min_similarity=0.0,
+            embedding_model="mem-model@int8",
+        )
+
+        assert [m["id"] for m, _ in results] == [old_id, new_id]
+
+
+class TestChromaClientCache:
+    def test_transient_open_failure_is_retried(self, tmp_path, monkeypatch):
+        import sys
+        import types
+
+        from asky.memory import vector_ops
+
+        attempts = []
+
+        def persistent_client(path, settings):
+            attempts.append(path)
+            if len(attempts) == 1:
+                raise OSError("database is locked")
+            return "client"
+
+        chromadb = types.ModuleType("chromadb")
+        chromadb.PersistentClient = persistent_client
+        chromadb_config = types.ModuleType("chromadb.config")
+        chromadb_config.Settings = lambda **_: None
+        monkeypatch.setitem(sys.modules, "chromadb", chromadb)
+        monkeypatch.setitem(sys.modules, "chromadb.config", chromadb_config)
+        now = [100.0]
+        monkeypatch.setattr(vector_ops.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(vector_ops, "_CHROMA_CLIENTS", {})
+        monkeypatch.setattr(vector_ops, "_CHROMA_OPEN_FAILED_AT", {})
+
+        assert vector_ops._get_chroma_client(tmp_path) is None
+        assert vector_ops._get_chroma_client(tmp_path) is None
+        assert len(attempts) == 1
+
+        now[0] += vector_ops.CHROMA_OPEN_RETRY_SECONDS
+        assert vector_ops._get_chroma_client(tmp_path) == "client"
+        assert vector_ops._get_chroma_client(tmp_path) == "client"
+        assert len(attempts) == 2
+
+
 # ---------------------------------------------------------------------------
 # Step 5: Recall pipeline tests
 # ---------------------------------------------------------------------------
@@ -223,7 +328,7 @@ class TestRecallPipeline:
             mock_instance.embed_single.return_value = fake_embedding
             mock_instance.model = "mock-model"
             MockEmbClient.return_value = mock_instance
-            MockEmbClient.deserialize_embedding = MagicMock(
+            MockEmbClient.deserialize_embedding_array = MagicMock(
                 return_value=fake_embedding
             )
             MockEmbClient.serialize_embedding = MagicMock(return_value=b"\x00" * 16)
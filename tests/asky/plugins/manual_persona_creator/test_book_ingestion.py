@@ -4,7 +4,9 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from asky.plugins.manual_persona_creator.book_ingestion import (
+    SECTION_SUMMARIES_CHECKPOINT_FILENAME,
     BookIngestionJob,
+    _rank_sections_for_topics,
     _validate_topics_payload,
     _validate_viewpoint_payload,
 )
@@ -161,8 +163,7 @@ def test_stage_extract_viewpoints_warning_accumulation(
     job.job_paths.job_dir.mkdir(parents=True, exist_ok=True)
 
     mock_client = MagicMock()
-    mock_client.embed.return_value = [[0.1] * 1536]
-    mock_client.embed_single.return_value = [0.1] * 1536
+    mock_client.embed.side_effect = lambda texts: [[0.1] * 1536 for _ in texts]
     mock_embed.return_value = mock_client
 
     # 1st topic: valid JSON
@@ -234,3 +235,93 @@ def test_report_persistence_details(data_dir, persona_name, setup_persona):
     assert saved_report["warnings"] == ["Warning A"]
     assert saved_report["stage_timings"]["summarize"] == 10.0
     assert saved_report["metadata"]["title"] == "Report Title"
+
+
+def _running_manifest(persona_name):
+    return IngestionJobManifest(
+        job_id="test-job",
+        persona_name=persona_name,
+        source_path="/tmp/book.txt",
+        source_fingerprint="abc",
+        status="running",
+        mode="ingest",
+        created_at="2023-01-01T00:00:00Z",
+        updated_at="2023-01-01T00:00:00Z",
+        metadata=BookMetadata(title="Title", authors=["Author"]),
+        targets=ExtractionTargets(topic_target=2, viewpoint_target=5),
+    )
+
+
+def test_rank_sections_for_topics_uses_cosine_order():
+    rankings = _rank_sections_for_topics(
+        [[1.0, 0.0], [0.0, 1.0]],
+        [[0.0, 2.0], [3.0, 0.1], [1.0, 1.0]],
+        top_k=2,
+    )
+    assert rankings == [[1, 2], [0, 2]]
+    assert _rank_sections_for_topics([[1.0, 0.0]], [], top_k=3) == [[]]
+
+
+@patch("asky.plugins.manual_persona_creator.book_ingestion.build_section_index")
+@patch("asky.plugins.manual_persona_creator.book_ingestion.get_llm_msg")
+def test_stage_summarize_sections_resumes_from_checkpoint(
+    mock_llm, mock_sections, data_dir, persona_name, setup_persona
+):
+    content = "A" * 10 + "B" * 10 + "C" * 10
+    mock_sections.return_value = {
+        "sections": [
+            {"id": "s1", "start_char": 0, "end_char": 10},
+            {"id": "s2", "start_char": 10, "end_char": 20},
+            {"id": "s3", "start_char": 20, "end_char": 30},
+        ]
+    }
+    job = BookIngestionJob(
+        data_dir=data_dir, persona_name=persona_name, job_id="test-job", max_concurrency=3
+    )
+    job.manifest = _running_manifest(persona_name)
+    job.job_paths.job_dir.mkdir(parents=True, exist_ok=True)
+
+    # Simulate a crash after the second section was summarized.
+    checkpoint = job.job_paths.job_dir / SECTION_SUMMARIES_CHECKPOINT_FILENAME
+    checkpoint.write_text(
+        json.dumps({"position": 2, "id": "s2", "start_char": 10, "end_char": 20, "summary": "cached"})
+        + "\n{torn",
+        encoding="utf-8",
+    )
+    mock_llm.side_effect = lambda model, msgs, **kw: {"content": f"sum:{msgs[1]['content'][0]}"}
+
+    summaries = job._stage_summarize_sections(content)
+
+    assert [s["id"] for s in summaries] == ["s1", "s2", "s3"]
+    assert [s["summary"] for s in summaries] == ["sum:A", "cached", "sum:C"]
+    assert mock_llm.call_count == 2
+    assert not checkpoint.exists()
+
+
+def test_run_checkpointed_keeps_in_flight_results_after_error(
+    data_dir, persona_name, setup_persona, tmp_path
+):
+    import threading
+    import time
+
+    job = BookIngestionJob(
+        data_dir=data_dir, persona_name=persona_name, job_id="test-job", max_concurrency=2
+    )
+    in_flight = threading.Event()
+
+    def worker(task):
+        if task["position"] == 0:
+            in_flight.wait(timeout=5)
+            raise RuntimeError("llm down")
+        in_flight.set()
+        time.sleep(0.05)
+        return {"position": task["position"], "summary": "ok"}
+
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    with pytest.raises(RuntimeError, match="llm down"):
+        job._run_checkpointed(
+            [{"position": 0}, {"position": 1}], worker, checkpoint, "position"
+        )
+
+    records = [json.loads(line) for line in checkpoint.read_text().splitlines()]
+    assert records == [{"position": 1, "summary": "ok"}]
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from asky.plugins.manual_persona_creator.knowledge_catalog import (
+    CATALOG_DB_FILENAME,
     ENTRIES_FILENAME,
     KNOWLEDGE_DIR_NAME,
     SOURCES_FILENAME,
@@ -207,8 +208,7 @@ def test_catalog_rebuild_is_deterministic(tmp_path: Path):
     catalog1 = read_catalog(persona_root)
     
     # Remove and rebuild
-    (persona_root / KNOWLEDGE_DIR_NAME / SOURCES_FILENAME).unlink()
-    (persona_root / KNOWLEDGE_DIR_NAME / ENTRIES_FILENAME).unlink()
+    (persona_root / KNOWLEDGE_DIR_NAME / CATALOG_DB_FILENAME).unlink()
     
     rebuild_catalog_from_legacy(persona_root)
     catalog2 = read_catalog(persona_root)
@@ -249,3 +249,135 @@ def test_schema_v3_export_carries_knowledge_catalog(tmp_path: Path):
         members = archive.namelist()
         assert f"{KNOWLEDGE_DIR_NAME}/{SOURCES_FILENAME}" in members
         assert f"{KNOWLEDGE_DIR_NAME}/{ENTRIES_FILENAME}" in members
+
+
+def _entry(entry_id, kind, source_id, text, topic=""):
+    from asky.plugins.manual_persona_creator.knowledge_types import (
+        PersonaKnowledgeEntry,
+    )
+
+    return PersonaKnowledgeEntry(
+        entry_id=entry_id,
+        entry_kind=kind,
+        source_id=source_id,
+        text=text,
+        metadata={"topic": topic},
+    )
+
+
+def _source(source_id):
+    from asky.plugins.manual_persona_creator.knowledge_types import (
+        PersonaSourceClass,
+        PersonaSourceRecord,
+        PersonaTrustClass,
+    )
+
+    return PersonaSourceRecord(
+        source_id=source_id,
+        source_class=PersonaSourceClass.SCRAPED_WEB,
+        trust_class=PersonaTrustClass.UNREVIEWED_WEB,
+        label=source_id,
+    )
+
+
+def test_sqlite_catalog_incremental_writes_and_queries(tmp_path: Path):
+    from asky.plugins.manual_persona_creator.knowledge_catalog import (
+        query_entries,
+        read_conflicts,
+        remove_source_knowledge,
+        replace_source_knowledge,
+        write_catalog,
+    )
+    from asky.plugins.manual_persona_creator.knowledge_types import PersonaEntryKind
+
+    persona_root = tmp_path / "p"
+    write_catalog(persona_root, [], [])
+    replace_source_knowledge(
+        persona_root,
+        _source("web:a"),
+        [
+            _entry("v1", PersonaEntryKind.VIEWPOINT, "web:a", "Freedom is action", "Politics"),
+            _entry("f1", PersonaEntryKind.PERSONA_FACT, "web:a", "Born in 1906", "life"),
+        ],
+        [{"topic": "birth_year", "source_id": "web:a"}],
+    )
+    replace_source_knowledge(
+        persona_root,
+        _source("web:b"),
+        [_entry("v2", PersonaEntryKind.VIEWPOINT, "web:b", "Thinking without a banister", "philosophy")],
+    )
+
+    viewpoints = query_entries(persona_root, entry_kind=PersonaEntryKind.VIEWPOINT)
+    assert [e.entry_id for e in viewpoints] == ["v1", "v2"]
+    assert [e.entry_id for e in query_entries(persona_root, topic="POLIT")] == ["v1"]
+    assert [e.entry_id for e in query_entries(persona_root, source_id="web:b")] == ["v2"]
+    assert [e.entry_id for e in query_entries(persona_root, text_query="action freedom")] == ["v1"]
+    assert query_entries(persona_root, text_query="banister", source_id="web:a") == []
+    assert read_conflicts(persona_root, topic="birth")[0]["source_id"] == "web:a"
+
+    # Re-projecting a source swaps only its rows
+    replace_source_knowledge(
+        persona_root,
+        _source("web:a"),
+        [_entry("v3", PersonaEntryKind.VIEWPOINT, "web:a", "Power needs plurality")],
+    )
+    catalog = read_catalog(persona_root)
+    assert [e.entry_id for e in catalog["entries"]] == ["v2", "v3"]
+    assert read_conflicts(persona_root) == []
+    assert query_entries(persona_root, text_query="freedom") == []
+
+    remove_source_knowledge(persona_root, "web:b")
+    catalog = read_catalog(persona_root)
+    assert [s.source_id for s in catalog["sources"]] == ["web:a"]
+    assert [e.entry_id for e in catalog["entries"]] == ["v3"]
+
+
+def test_json_catalog_is_migrated_and_exported(tmp_path: Path):
+    from dataclasses import asdict
+
+    from asky.plugins.manual_persona_creator.knowledge_catalog import (
+        CONFLICTS_FILENAME,
+        export_catalog_json,
+    )
+    from asky.plugins.manual_persona_creator.knowledge_types import PersonaEntryKind
+
+    persona_root = tmp_path / "p"
+    k_dir = persona_root / KNOWLEDGE_DIR_NAME
+    k_dir.mkdir(parents=True)
+    entries = [_entry("f1", PersonaEntryKind.PERSONA_FACT, "web:a", "Born in 1906")]
+    (k_dir / SOURCES_FILENAME).write_text(json.dumps([asdict(_source("web:a"))]))
+    (k_dir / ENTRIES_FILENAME).write_text(json.dumps([asdict(e) for e in entries]))
+    (k_dir / CONFLICTS_FILENAME).write_text(json.dumps([{"topic": "t", "source_id": "web:a"}]))
+
+    catalog = read_catalog(persona_root)
+
+    assert catalog["entries"] == entries
+    assert (k_dir / CATALOG_DB_FILENAME).exists()
+    assert not (k_dir / ENTRIES_FILENAME).exists()
+    # The pre-migration files are kept as backups, not deleted.
+    assert json.loads((k_dir / f"{ENTRIES_FILENAME}.migrated").read_text()) == [
+        asdict(e) for e in entries
+    ]
+    assert (k_dir / f"{SOURCES_FILENAME}.migrated").exists()
+
+    payloads = export_catalog_json(persona_root)
+    assert json.loads(payloads[ENTRIES_FILENAME]) == [asdict(e) for e in entries]
+    assert json.loads(payloads[SOURCES_FILENAME])[0]["source_id"] == "web:a"
+    assert json.loads(payloads[CONFLICTS_FILENAME]) == [{"topic": "t", "source_id": "web:a"}]
+
+
+def test_archive_catalog_json_is_removed_after_load(tmp_path: Path):
+    from dataclasses import asdict
+
+    from asky.plugins.manual_persona_creator.knowledge_catalog import load_catalog_json
+
+    persona_root = tmp_path / "p"
+    k_dir = persona_root / KNOWLEDGE_DIR_NAME
+    k_dir.mkdir(parents=True)
+    (k_dir / SOURCES_FILENAME).write_text(json.dumps([asdict(_source("web:a"))]))
+    (k_dir / ENTRIES_FILENAME).write_text(json.dumps([]))
+
+    assert load_catalog_json(persona_root, remove_json=True)
+
+    assert sorted(path.name for path in k_dir.iterdir()) == [CATALOG_DB_FILENAME]
+    assert [s.source_id for s in read_catalog(persona_root)["sources"]] == ["web:a"]
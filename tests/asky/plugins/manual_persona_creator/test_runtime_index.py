@@ -9,6 +9,14 @@ import pytest
 
 from asky.plugins.manual_persona_creator.knowledge_catalog import (
     rebuild_catalog_from_legacy,
+    write_catalog,
+)
+from asky.plugins.manual_persona_creator.knowledge_types import (
+    PersonaEntryKind,
+    PersonaKnowledgeEntry,
+    PersonaSourceClass,
+    PersonaSourceRecord,
+    PersonaTrustClass,
 )
 from asky.plugins.manual_persona_creator.runtime_index import (
     read_runtime_index,
@@ -130,3 +138,125 @@ def test_runtime_index_rebuild_is_deterministic(tmp_path: Path):
     
     assert index1[0]["vector"] == index2[0]["vector"]
     assert index1[0]["entry_id"] == index2[0]["entry_id"]
+
+
+class _CountingEmbeddingClient:
+    def __init__(self, model: str = "fake-model"):
+        self.model = model
+        self.embedded: list[str] = []
+
+    def embed(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class _BlankDroppingEmbeddingClient(_CountingEmbeddingClient):
+    def embed(self, texts):
+        return super().embed([text for text in texts if text.strip()])
+
+
+def _write_chunk_catalog(persona_root: Path, texts):
+    chunks = [
+        {"chunk_id": f"c{i}", "text": text, "source": "s.txt"}
+        for i, text in enumerate(texts)
+    ]
+    write_chunks(persona_root / CHUNKS_FILENAME, chunks)
+    rebuild_catalog_from_legacy(persona_root)
+
+
+def test_runtime_index_update_embeds_only_changed_texts(tmp_path: Path, monkeypatch):
+    persona_root = tmp_path / "test_persona"
+    persona_root.mkdir()
+    client = _CountingEmbeddingClient()
+    monkeypatch.setattr(
+        "asky.plugins.manual_persona_creator.runtime_index.get_embedding_client",
+        lambda: client,
+    )
+
+    _write_chunk_catalog(persona_root, ["alpha", "beta", "gamma"])
+    first = rebuild_runtime_index(persona_root)
+    assert first["embedded_entries"] == 3
+
+    client.embedded.clear()
+    _write_chunk_catalog(persona_root, ["alpha", "gamma", "delta"])
+    second = rebuild_runtime_index(persona_root)
+
+    assert client.embedded == ["delta"]
+    assert second == {"rebuilt": True, "indexed_entries": 3, "embedded_entries": 1}
+    texts = {record["text"] for record in read_runtime_index(persona_root)}
+    assert texts == {"alpha", "gamma", "delta"}
+
+
+def test_runtime_index_model_change_reembeds_everything(tmp_path: Path, monkeypatch):
+    persona_root = tmp_path / "test_persona"
+    persona_root.mkdir()
+    client = _CountingEmbeddingClient("model-a")
+    monkeypatch.setattr(
+        "asky.plugins.manual_persona_creator.runtime_index.get_embedding_client",
+        lambda: client,
+    )
+    _write_chunk_catalog(persona_root, ["alpha", "beta"])
+    rebuild_runtime_index(persona_root)
+
+    client.model = "model-b"
+    client.embedded.clear()
+    rebuild_runtime_index(persona_root)
+    assert sorted(client.embedded) == ["alpha", "beta"]
+    assert {r["embedding_model"] for r in read_runtime_index(persona_root)} == {
+        "model-b"
+    }
+
+    client.embedded.clear()
+    rebuild_runtime_index(persona_root, full=True)
+    assert sorted(client.embedded) == ["alpha", "beta"]
+
+
+def test_runtime_index_skips_blank_entries(tmp_path: Path, monkeypatch):
+    persona_root = tmp_path / "test_persona"
+    persona_root.mkdir()
+    client = _BlankDroppingEmbeddingClient()
+    monkeypatch.setattr(
+        "asky.plugins.manual_persona_creator.runtime_index.get_embedding_client",
+        lambda: client,
+    )
+    write_catalog(
+        persona_root,
+        [
+            PersonaSourceRecord(
+                source_id="manual",
+                source_class=PersonaSourceClass.MANUAL_SOURCE,
+                trust_class=PersonaTrustClass.USER_SUPPLIED_UNREVIEWED,
+                label="manual",
+            )
+        ],
+        [
+            PersonaKnowledgeEntry(
+                entry_id=f"chunk:c{i}",
+                entry_kind=PersonaEntryKind.RAW_CHUNK,
+                source_id="manual",
+                text=text,
+            )
+            for i, text in enumerate([" ", "hello"])
+        ],
+    )
+
+    result = rebuild_runtime_index(persona_root)
+
+    assert result == {"rebuilt": True, "indexed_entries": 1, "embedded_entries": 1}
+    index = read_runtime_index(persona_root)
+    assert [(r["text"], r["vector"]) for r in index] == [("hello", [5.0, 1.0])]
+
+
+def test_runtime_index_rejects_short_embedding_batches(tmp_path: Path, monkeypatch):
+    persona_root = tmp_path / "test_persona"
+    persona_root.mkdir()
+    client = _CountingEmbeddingClient()
+    client.embed = lambda texts: [[1.0, 1.0]]
+    monkeypatch.setattr(
+        "asky.plugins.manual_persona_creator.runtime_index.get_embedding_client",
+        lambda: client,
+    )
+    _write_chunk_catalog(persona_root, ["alpha", "beta"])
+
+    with pytest.raises(RuntimeError, match="1 vectors for 2 texts"):
+        rebuild_runtime_index(persona_root)
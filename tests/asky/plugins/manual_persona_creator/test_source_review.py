@@ -8,6 +8,7 @@ import pytest
 from asky.plugins.manual_persona_creator.knowledge_catalog import (
     KNOWLEDGE_DIR_NAME,
     read_catalog,
+    read_conflicts,
 )
 from asky.plugins.manual_persona_creator.knowledge_types import PersonaEntryKind
 from asky.plugins.manual_persona_creator.source_service import (
@@ -85,9 +86,7 @@ def test_approve_source_bundle_projection(tmp_path, monkeypatch):
     assert any(e.entry_kind == PersonaEntryKind.TIMELINE_EVENT and e.text == "Birth" for e in entries)
     
     # Verify conflict group projection
-    from asky.plugins.manual_persona_creator.knowledge_catalog import get_knowledge_paths
-    k_paths = get_knowledge_paths(persona_root)
-    projected_conflicts = json.loads(k_paths["conflicts"].read_text(encoding="utf-8"))
+    projected_conflicts = read_conflicts(persona_root)
     assert len(projected_conflicts) == 1
     assert projected_conflicts[0]["topic"] == "birth_year"
 
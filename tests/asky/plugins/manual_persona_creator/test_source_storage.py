@@ -7,6 +7,7 @@ import pytest
 
 from asky.plugins.manual_persona_creator.exporter import export_persona_package
 from asky.plugins.manual_persona_creator.knowledge_catalog import (
+    CATALOG_DB_FILENAME,
     CONFLICTS_FILENAME,
     KNOWLEDGE_DIR_NAME,
     get_knowledge_paths,
@@ -135,7 +136,9 @@ def test_source_bundle_round_trip(tmp_path, monkeypatch):
     
     assert new_paths.metadata_path.exists()
     assert new_paths.report_path.exists()
-    assert (new_persona_root / KNOWLEDGE_DIR_NAME / CONFLICTS_FILENAME).exists()
+    # Archived conflict JSON is loaded into the persona's SQLite catalog
+    assert (new_persona_root / KNOWLEDGE_DIR_NAME / CATALOG_DB_FILENAME).exists()
+    assert not (new_persona_root / KNOWLEDGE_DIR_NAME / CONFLICTS_FILENAME).exists()
     
     # Verify job exclusion
     assert not (new_persona_root / SOURCE_INGESTION_JOBS_DIR_NAME).exists()
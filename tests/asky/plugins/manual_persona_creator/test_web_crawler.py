@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import tomlkit
+
+from asky.plugins.manual_persona_creator.storage import (
+    create_persona,
+    get_persona_paths,
+    get_web_collection_paths,
+    get_web_page_paths,
+    read_web_frontier,
+    write_web_page_manifest,
+)
+from asky.plugins.manual_persona_creator.web_crawler import (
+    CollectionDedupeIndex,
+    HostPoliteness,
+)
+from asky.plugins.manual_persona_creator.web_job import WebCollectionJob
+from asky.plugins.manual_persona_creator.web_types import (
+    WebCollectionInputMode,
+    WebCollectionManifest,
+    WebCollectionMode,
+    WebCollectionStatus,
+    WebPageManifest,
+    WebPageStatus,
+)
+
+
+def _make_collection(tmp_path: Path, collection_id: str = "web_20260314120000_CRAWL"):
+    create_persona(
+        data_dir=tmp_path,
+        persona_name="crawler_persona",
+        description="Test description",
+        behavior_prompt="Test prompt",
+    )
+    paths = get_persona_paths(tmp_path, "crawler_persona")
+    c_paths = get_web_collection_paths(paths.root_dir, collection_id)
+    c_paths.collection_dir.mkdir(parents=True)
+    doc = tomlkit.document()
+    doc["status"] = WebCollectionStatus.COLLECTING.value
+    doc["collection_id"] = collection_id
+    doc["updated_at"] = ""
+    c_paths.manifest_path.write_text(tomlkit.dumps(doc), encoding="utf-8")
+    return c_paths
+
+
+def test_dedupe_index_loads_existing_manifests_once(tmp_path: Path):
+    c_paths = _make_collection(tmp_path)
+    p_paths = get_web_page_paths(c_paths.collection_dir, "page:abc")
+    p_paths.page_dir.mkdir(parents=True)
+    manifest = WebPageManifest(
+        page_id="page:abc",
+        status=WebPageStatus.REVIEW_READY,
+        requested_url="https://example.com/a",
+        final_url="https://example.com/a",
+        normalized_final_url="https://example.com/a",
+        title="A",
+        content_fingerprint="fp-a",
+        similarity_metadata={"embedding": [1.0, 0.0, 0.0]},
+    )
+    write_web_page_manifest(p_paths.manifest_path, dataclasses.asdict(manifest))
+
+    index = CollectionDedupeIndex.load(c_paths.collection_dir)
+
+    assert index.has_page("page:abc")
+    assert index.review_ready_count == 1
+    assert index.match_fingerprint("fp-a") == "page:abc"
+    assert "https://example.com/a" in index.processed_urls
+    match = index.find_near_duplicate("page:new", [0.99, 0.01, 0.0])
+    assert match is not None
+    assert match["matched_page_id"] == "page:abc"
+    assert index.find_near_duplicate("page:new", [0.0, 1.0, 0.0]) is None
+
+
+def test_dedupe_index_updates_incrementally():
+    index = CollectionDedupeIndex()
+    index.add_page(
+        page_id="page:one",
+        status=WebPageStatus.REVIEW_READY.value,
+        fingerprint="fp-1",
+        embedding=[0.0, 1.0],
+    )
+    index.add_page(
+        page_id="page:one",
+        status=WebPageStatus.REVIEW_READY.value,
+    )
+
+    assert index.review_ready_count == 1
+    assert index.find_near_duplicate("page:one", [0.0, 1.0]) is None
+    assert index.find_near_duplicate("page:two", [0.0, 1.0])["matched_page_id"] == "page:one"
+    # Mismatched dimensions are ignored instead of raising.
+    assert index.find_near_duplicate("page:two", [0.0, 1.0, 0.0]) is None
+
+
+def test_dedupe_index_grows_embedding_matrix_in_place():
+    index = CollectionDedupeIndex()
+    dims = 200
+    with patch("numpy.vstack", side_effect=AssertionError("re-stacked rows")):
+        for i in range(dims):
+            vector = [0.0] * dims
+            vector[i] = 1.0
+            index.add_page(page_id=f"page:{i}", status="", embedding=vector)
+            match = index.find_near_duplicate("page:new", vector)
+            assert match["matched_page_id"] == f"page:{i}"
+
+    assert index._embedding_matrix().shape == (dims, dims)
+    assert index._matrix.shape[0] >= dims
+
+
+def test_host_politeness_spaces_same_host_only():
+    now = [100.0]
+    sleeps = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    politeness = HostPoliteness(2.0, clock=lambda: now[0], sleep=fake_sleep)
+    politeness.wait("https://example.com/a")
+    politeness.wait("https://other.com/a")
+    politeness.wait("https://example.com/b")
+
+    assert sleeps == [2.0]
+
+
+def test_collection_fetches_pages_concurrently_and_checkpoints(tmp_path: Path):
+    c_paths = _make_collection(tmp_path)
+    seeds = [f"https://site{i}.com/page" for i in range(4)]
+    manifest = WebCollectionManifest(
+        collection_id=c_paths.collection_dir.name,
+        persona_name="crawler_persona",
+        mode=WebCollectionMode.BROAD_EXPAND,
+        input_mode=WebCollectionInputMode.SEED_URLS,
+        status=WebCollectionStatus.COLLECTING,
+        target_results=4,
+        seed_inputs=seeds,
+    )
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_fetch(url, **kwargs):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return {
+            "final_url": url,
+            "content": f"Unique content for {url}",
+            "title": url,
+            "links": [],
+        }
+
+    job = WebCollectionJob(
+        persona_name="crawler_persona",
+        persona_description="Test description",
+        paths=c_paths,
+        target_results=4,
+        mode=WebCollectionMode.BROAD_EXPAND,
+        max_workers=4,
+        per_host_delay_seconds=0,
+    )
+    with patch(
+        "asky.plugins.manual_persona_creator.web_job.fetch_url_document",
+        side_effect=fake_fetch,
+    ):
+        job.run(manifest)
+
+    assert active["peak"] > 1
+    pages = [p.name for p in (c_paths.collection_dir / "pages").iterdir()]
+    assert len([p for p in pages if p.startswith("page:")]) == 4
+    frontier = read_web_frontier(c_paths.frontier_path)
+    assert frontier["raw_unique_fetch_count"] == 4
+    assert frontier["queue"] == []
+
+
+def test_web_service_passes_crawl_limits_to_job(tmp_path: Path):
+    from asky.plugins.manual_persona_creator import web_service
+
+    create_persona(
+        data_dir=tmp_path,
+        persona_name="crawler_persona",
+        description="Test description",
+        behavior_prompt="Test prompt",
+    )
+    with patch.object(web_service, "WebCollectionJob") as job_cls:
+        web_service.start_seed_domain_collection(
+            data_dir=tmp_path,
+            persona_name="crawler_persona",
+            target_results=2,
+            urls=["https://example.com"],
+            max_workers=7,
+            per_host_delay_seconds=0,
+        )
+        web_service.start_seed_domain_collection(
+            data_dir=tmp_path,
+            persona_name="crawler_persona",
+            target_results=2,
+            urls=["https://example.com"],
+        )
+
+    configured, defaulted = job_cls.call_args_list
+    assert configured.kwargs["max_workers"] == 7
+    assert configured.kwargs["per_host_delay_seconds"] == 0.0
+    assert defaulted.kwargs["max_workers"] == web_service.DEFAULT_CRAWL_WORKERS
+    assert (
+        defaulted.kwargs["per_host_delay_seconds"]
+        == web_service.DEFAULT_PER_HOST_DELAY_SECONDS
+    )
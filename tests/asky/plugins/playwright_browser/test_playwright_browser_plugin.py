@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
 
+from asky.daemon.metrics import collect_daemon_metrics
 from asky.plugins.hook_types import FETCH_URL_OVERRIDE, FetchURLContext
 from asky.plugins.playwright_browser.plugin import PlaywrightBrowserPlugin
 
@@ -41,6 +42,10 @@ def test_plugin_activation(plugin_context):
         plugin._on_fetch_url_override,
         plugin_name=plugin_context.plugin_name,
     )
+    assert "playwright_page_pool" in collect_daemon_metrics()
+
+    plugin.deactivate()
+    assert "playwright_page_pool" not in collect_daemon_metrics()
 
 
 def test_intercept_filtering_match(plugin_context):
@@ -133,38 +138,6 @@ def test_result_dict_shape(plugin_context):
         assert res["links"][0]["href"] == "https://example.com/link"
 
 
-@patch("asky.plugins.playwright_browser.browser.time.sleep")
-@patch("asky.plugins.playwright_browser.browser.time.perf_counter")
-def test_same_site_delay_logic(mock_perf, mock_sleep, tmp_path):
-    from asky.plugins.playwright_browser.browser import PlaywrightBrowserManager
-
-    manager = PlaywrightBrowserManager(
-        data_dir=tmp_path,
-        same_site_min_delay_ms=2000,
-        same_site_max_delay_ms=2000,
-    )
-
-    # Mock playwright start
-    manager._playwright = MagicMock()
-    manager._browser = MagicMock()
-    manager._context = MagicMock()
-
-    # First call - no delay
-    mock_perf.return_value = 100.0
-    manager._apply_delay("https://example.com/1")
-    mock_sleep.assert_not_called()
-
-    # Second call to same domain, 0.5s later -> should sleep 1.5s
-    mock_perf.return_value = 100.5
-    manager._apply_delay("https://example.com/2")
-    mock_sleep.assert_called_once_with(1.5)
-
-    # Third call to different domain -> no sleep
-    mock_sleep.reset_mock()
-    manager._apply_delay("https://other.com")
-    mock_sleep.assert_not_called()
-
-
 def test_intercept_filtering_default_fallback(plugin_context):
     plugin = PlaywrightBrowserPlugin()
     plugin.activate(plugin_context)
@@ -205,20 +178,6 @@ def test_try_fetch_url_plugin_override_no_runtime():
         assert result is None
 
 
-def test_detect_challenge_url(tmp_path):
-    from asky.plugins.playwright_browser.browser import PlaywrightBrowserManager
-
-    manager = PlaywrightBrowserManager(data_dir=tmp_path)
-
-    mock_page = MagicMock()
-    mock_page.url = "https://example.com/cdn-cgi/challenge-platform/h/g/abc"
-
-    reason = manager._detect_challenge(mock_page, 200)
-    assert reason is not None
-    assert "Challenge URL pattern" in reason
-    assert "/cdn-cgi/challenge-platform/" in reason
-
-
 def test_open_login_session_daemon_guard(tmp_path):
     from asky.plugins.playwright_browser.browser import PlaywrightBrowserManager
 
@@ -227,26 +186,3 @@ def test_open_login_session_daemon_guard(tmp_path):
     with patch("asky.daemon.launch_context.is_interactive", return_value=False):
         with pytest.raises(RuntimeError, match="non-interactive context"):
             manager.open_login_session("https://example.com")
-
-
-def test_post_load_delay_usage(tmp_path):
-    from asky.plugins.playwright_browser.browser import PlaywrightBrowserManager
-
-    manager = PlaywrightBrowserManager(data_dir=tmp_path, post_load_delay_ms=5000)
-
-    # Mock playwright start
-    manager._playwright = MagicMock()
-    manager._browser = MagicMock()
-    manager._context = MagicMock()
-
-    mock_page = MagicMock()
-    manager._context.pages = []
-    manager._context.new_page.return_value = mock_page
-    mock_page.goto.return_value = MagicMock(status=200)
-    mock_page.content.return_value = "<html></html>"
-    mock_page.url = "https://example.com"
-
-    manager.fetch_page("https://example.com")
-
-    # Verify wait_for_timeout call used the configured value (not hardcoded 2000)
-    mock_page.wait_for_timeout.assert_called_with(5000)
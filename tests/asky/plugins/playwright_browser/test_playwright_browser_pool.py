@@ -0,0 +1,330 @@
+"""Tests for the Playwright browser manager page pool."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import http.server
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from asky.plugins.playwright_browser.browser import PlaywrightBrowserManager
+
+
+class _FakeLocator:
+    async def count(self):
+        return 0
+
+
+class _FakePage:
+    def __init__(self, context, signatures=None):
+        self._context = context
+        self._signatures = list(signatures or [])
+        self.url = "about:blank"
+        self.closed = False
+        self.evaluations = 0
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        stats = self._context.stats
+        stats["active"] += 1
+        stats["peak"] = max(stats["peak"], stats["active"])
+        try:
+            await asyncio.sleep(self._context.goto_delay)
+        finally:
+            stats["active"] -= 1
+        self.url = url
+        return SimpleNamespace(status=200)
+
+    async def evaluate(self, script):
+        self.evaluations += 1
+        if self._signatures:
+            return self._signatures.pop(0)
+        return [len(self.url), 1]
+
+    def locator(self, selector):
+        return _FakeLocator()
+
+    async def content(self):
+        return f"<html><body>{self.url}</body></html>"
+
+    async def title(self):
+        return ""
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        return None
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, goto_delay=0.05, signatures=None):
+        self.goto_delay = goto_delay
+        self.signatures = signatures
+        self.pages = []
+        self.stats = {"active": 0, "peak": 0}
+        self.route_handler = None
+        self.closed = False
+        self.created_pages = 0
+
+    async def new_page(self):
+        self.created_pages += 1
+        return _FakePage(self, self.signatures)
+
+    async def add_init_script(self, script):
+        return None
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    def __init__(self, context):
+        self.context = context
+        self.launch_kwargs = None
+        self.stopped = False
+        self.chromium = self
+
+    async def launch_persistent_context(self, user_data_dir, **kwargs):
+        self.launch_kwargs = kwargs
+        return self.context
+
+    async def stop(self):
+        self.stopped = True
+
+
+class _FakeFactory:
+    def __init__(self, context):
+        self.playwright = _FakePlaywright(context)
+
+    def __call__(self):
+        return self
+
+    async def start(self):
+        return self.playwright
+
+
+def _manager(tmp_path, context, **kwargs):
+    kwargs.setdefault("post_load_delay_ms", 0)
+    manager = PlaywrightBrowserManager(
+        data_dir=tmp_path,
+        playwright_factory=_FakeFactory(context),
+        **kwargs,
+    )
+    return manager
+
+
+def test_fetches_run_in_parallel_up_to_max_pages(tmp_path):
+    context = _FakeContext(goto_delay=0.1)
+    manager = _manager(tmp_path, context, max_pages=2)
+    urls = [f"https://site{index}.example/page" for index in range(5)]
+    try:
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(pool.map(manager.fetch_page, urls))
+    finally:
+        manager.close()
+
+    assert [final_url for _html, final_url in results] == urls
+    assert context.stats["peak"] == 2
+    assert context.created_pages == 2
+    snapshot = manager.snapshot()
+    assert snapshot["fetches"] == 5
+    assert snapshot["peak_in_flight"] == 2
+    assert snapshot["failures"] == 0
+    assert snapshot["idle_pages"] == 0  # closed with the browser
+    assert context.closed is True
+    assert manager.snapshot()["pages_open"] == 0
+
+
+def test_same_site_slots_are_reserved_in_call_order(tmp_path, monkeypatch):
+    import asky.plugins.playwright_browser.browser as browser_mod
+
+    manager = PlaywrightBrowserManager(
+        data_dir=tmp_path,
+        same_site_min_delay_ms=2000,
+        same_site_max_delay_ms=2000,
+    )
+    clock = {"now": 100.0}
+    monkeypatch.setattr(browser_mod.time, "perf_counter", lambda: clock["now"])
+
+    # First request to a site starts immediately.
+    assert manager._reserve_site_delay("https://example.com/1") == 0.0
+    # 0.5s later the next same-site request waits for the remaining 1.5s.
+    clock["now"] = 100.5
+    assert manager._reserve_site_delay("https://example.com/2") == pytest.approx(1.5)
+    # A concurrent third request queues behind the reserved slot.
+    assert manager._reserve_site_delay("https://example.com/3") == pytest.approx(3.5)
+    # Other sites are unaffected.
+    assert manager._reserve_site_delay("https://other.com") == 0.0
+
+
+def test_readiness_returns_once_content_is_stable(tmp_path):
+    context = _FakeContext(goto_delay=0, signatures=[[10, 2], [40, 5], [40, 5], [40, 5]])
+    manager = _manager(
+        tmp_path,
+        context,
+        post_load_delay_ms=5000,
+        ready_poll_interval_ms=10,
+        ready_stable_polls=2,
+    )
+    try:
+        manager.fetch_page("https://example.com")
+    finally:
+        manager.close()
+
+    snapshot = manager.snapshot()
+    assert snapshot["ready_timeouts"] == 0
+    assert snapshot["avg_ready_ms"] < 1000
+
+
+def test_readiness_wait_is_bounded_by_post_load_delay(tmp_path):
+    changing = [[index, index] for index in range(1000)]
+    context = _FakeContext(goto_delay=0, signatures=changing)
+    manager = _manager(
+        tmp_path, context, post_load_delay_ms=100, ready_poll_interval_ms=10
+    )
+    try:
+        manager.fetch_page("https://example.com")
+    finally:
+        manager.close()
+
+    snapshot = manager.snapshot()
+    assert snapshot["ready_timeouts"] == 1
+    assert 90 <= snapshot["avg_ready_ms"] < 1000
+
+
+def test_blocked_resource_types_are_aborted(tmp_path):
+    context = _FakeContext(goto_delay=0)
+    manager = _manager(tmp_path, context, block_resources=["image", "font", "bogus"])
+    try:
+        manager.fetch_page("https://example.com")
+        calls = []
+
+        def _route(resource_type):
+            route = SimpleNamespace(request=SimpleNamespace(resource_type=resource_type))
+
+            async def abort():
+                calls.append(("abort", resource_type))
+
+            async def continue_():
+                calls.append(("continue", resource_type))
+
+            route.abort = abort
+            route.continue_ = continue_
+            return route
+
+        for resource_type in ("image", "document", "font"):
+            manager._run(context.route_handler(_route(resource_type)))
+    finally:
+        manager.close()
+
+    assert calls == [
+        ("abort", "image"),
+        ("continue", "document"),
+        ("abort", "font"),
+    ]
+    assert manager.snapshot()["blocked_requests"] == 2
+
+
+def test_headless_flag_reaches_launch(tmp_path):
+    context = _FakeContext(goto_delay=0)
+    factory = _FakeFactory(context)
+    manager = PlaywrightBrowserManager(
+        data_dir=tmp_path,
+        post_load_delay_ms=0,
+        headless=True,
+        playwright_factory=factory,
+    )
+    try:
+        manager.fetch_page("https://example.com")
+    finally:
+        manager.close()
+    assert factory.playwright.launch_kwargs["headless"] is True
+    assert factory.playwright.stopped is True
+
+
+def test_browser_closes_after_fetch_when_not_kept_open(tmp_path):
+    context = _FakeContext(goto_delay=0)
+    manager = _manager(tmp_path, context, keep_browser_open=False)
+    try:
+        html, final_url = manager.fetch_page("https://example.com/a")
+        assert final_url == "https://example.com/a"
+        assert context.closed is True
+        assert manager.snapshot()["pages_open"] == 0
+    finally:
+        manager.close()
+
+
+def test_detect_challenge_url(tmp_path):
+    manager = PlaywrightBrowserManager(data_dir=tmp_path)
+    page = _FakePage(_FakeContext())
+    page.url = "https://example.com/cdn-cgi/challenge-platform/h/g/abc"
+
+    reason = asyncio.run(manager._detect_challenge(page, 200))
+    assert reason is not None
+    assert "/cdn-cgi/challenge-platform/" in reason
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        return None
+
+
+def _require_installed_chromium() -> None:
+    sync_api = pytest.importorskip("playwright.sync_api")
+    with sync_api.sync_playwright() as playwright:
+        executable = Path(playwright.chromium.executable_path)
+    if not executable.exists():
+        pytest.skip("Playwright chromium is not installed")
+
+
+def test_fetch_against_local_static_server(tmp_path):
+    _require_installed_chromium()
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    for index in range(3):
+        (site_dir / f"page{index}.html").write_text(
+            f"<html><head><title>Page {index}</title></head>"
+            f"<body><p>Static content {index}</p><img src='missing.png'></body></html>",
+            encoding="utf-8",
+        )
+    handler = functools.partial(_QuietHandler, directory=str(site_dir))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    manager = PlaywrightBrowserManager(
+        data_dir=tmp_path,
+        persist_session=False,
+        headless=True,
+        max_pages=3,
+        block_resources=["image"],
+        same_site_min_delay_ms=0,
+        same_site_max_delay_ms=0,
+        post_load_delay_ms=1000,
+    )
+    try:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(
+                pool.map(manager.fetch_page, [f"{base_url}/page{i}.html" for i in range(3)])
+            )
+    finally:
+        manager.close()
+        server.shutdown()
+
+    for index, (html, final_url) in enumerate(results):
+        assert f"Static content {index}" in html
+        assert final_url.endswith(f"/page{index}.html")
+    snapshot = manager.snapshot()
+    assert snapshot["fetches"] == 3
+    assert snapshot["blocked_requests"] >= 1
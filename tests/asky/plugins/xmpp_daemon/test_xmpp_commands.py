@@ -195,6 +195,8 @@ def test_execute_query_text_expands_aliases_before_model_call():
     )
     request = mock_client.run_turn.call_args.args[0]
     assert request.query_text == "expanded query"
+    config = mock_client_cls.call_args.args[0]
+    assert config.summarization_model_alias == "dummy-model"
 
 
 def test_execute_query_text_slash_only_lists_prompts():
@@ -0,0 +1,108 @@
+"""Tests for the warm shared query runtime used by the XMPP daemon."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from asky.plugins.xmpp_daemon import query_runtime as query_runtime_module
+from asky.plugins.xmpp_daemon.command_executor import CommandExecutor
+from asky.plugins.xmpp_daemon.query_runtime import DaemonQueryRuntime
+from tests.asky.plugins.xmpp_daemon.test_xmpp_commands import (
+    _FakeTranscriptManager,
+    _turn_result,
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_model_config_is_resolved_once_per_alias():
+    runtime = DaemonQueryRuntime()
+    models = {"fast": {"id": "fast-model", "parameters": {"temperature": 0.1}}}
+    with patch("asky.config.MODELS", models):
+        first = runtime.model_config("fast")
+        second = runtime.model_config("fast")
+        missing = runtime.model_config("unknown")
+
+    assert first is second
+    assert first == models["fast"]
+    assert first is not models["fast"]
+    assert missing is None
+    assert runtime.snapshot()["cached_model_configs"] == 1
+
+
+def test_verbose_console_is_shared():
+    runtime = DaemonQueryRuntime()
+    assert runtime.verbose_console() is runtime.verbose_console()
+
+
+def test_setup_timer_records_client_setup_and_first_turn():
+    clock = _FakeClock()
+    runtime = DaemonQueryRuntime(clock=clock)
+    events = []
+
+    timer = runtime.begin_query()
+    clock.now = 0.002
+    timer.client_ready()
+    callback = timer.wrap_event_callback(lambda name, payload: events.append(name))
+    clock.now = 0.050
+    callback("turn_start", {"turn": 1})
+    clock.now = 0.900
+    callback("turn_start", {"turn": 2})
+    callback("tool_start", {})
+
+    snapshot = runtime.snapshot()
+    assert snapshot["queries"] == 1
+    assert snapshot["client_setup_last_ms"] == 2.0
+    assert snapshot["first_turn_last_ms"] == 50.0
+    assert snapshot["first_turn_max_ms"] == 50.0
+    assert events == ["turn_start", "turn_start", "tool_start"]
+
+
+def test_warm_times_each_step_and_tolerates_failures(monkeypatch):
+    calls = []
+
+    def _broken():
+        calls.append("embedding_client")
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(
+        query_runtime_module,
+        "_warm_tool_registries",
+        lambda: calls.append("tool_registries"),
+    )
+    monkeypatch.setattr(query_runtime_module, "_warm_embedding_client", _broken)
+    monkeypatch.setattr(
+        query_runtime_module, "_warm_chroma_clients", lambda: calls.append("chroma")
+    )
+    runtime = DaemonQueryRuntime()
+    runtime.warm()
+
+    snapshot = runtime.snapshot()
+    assert calls == ["tool_registries", "embedding_client", "chroma"]
+    assert snapshot["warm_state"] == "warm"
+    assert set(snapshot["warmup_ms"]) == {
+        "tool_registries",
+        "embedding_client",
+        "chroma",
+    }
+
+
+def test_command_executor_reuses_runtime_model_config():
+    runtime = DaemonQueryRuntime()
+    executor = CommandExecutor(_FakeTranscriptManager(), query_runtime=runtime)
+    with patch(
+        "asky.plugins.xmpp_daemon.command_executor.AskyClient"
+    ) as mock_client_cls:
+        mock_client_cls.return_value.run_turn.return_value = _turn_result("ok")
+        executor.execute_query_text(jid="jid", query_text="hello")
+        executor.execute_query_text(jid="jid", query_text="again")
+
+    first, second = mock_client_cls.call_args_list
+    assert first.kwargs["model_config"] is second.kwargs["model_config"]
+    assert runtime.snapshot()["queries"] == 2
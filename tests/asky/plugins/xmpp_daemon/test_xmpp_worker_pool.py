@@ -0,0 +1,129 @@
+"""Tests for the bounded keyed worker pool used by the XMPP daemon."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from asky.daemon.metrics import (
+    collect_daemon_metrics,
+    register_metrics_provider,
+    unregister_metrics_provider,
+)
+from asky.plugins.xmpp_daemon.worker_pool import KeyedWorkerPool
+from asky.plugins.xmpp_daemon.xmpp_service import QUEUE_FULL_REPLY, XMPPService
+
+
+def _wait_for(predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_tasks_for_same_key_run_serially_in_order():
+    pool = KeyedWorkerPool(worker_count=4, max_queue_depth=50)
+    order: list[int] = []
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _make(index):
+        def _task():
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.002)
+            with lock:
+                active["now"] -= 1
+                order.append(index)
+
+        return _task
+
+    for index in range(20):
+        assert pool.submit("room@conference.example.com", _make(index))
+
+    assert _wait_for(lambda: len(order) == 20)
+    assert order == list(range(20))
+    assert active["peak"] == 1
+    pool.shutdown(wait=True, timeout=3)
+
+
+def test_keys_are_served_round_robin():
+    pool = KeyedWorkerPool(worker_count=1, max_queue_depth=50)
+    gate = threading.Event()
+    seen: list[str] = []
+
+    pool.submit("blocker", gate.wait)
+    for index in range(3):
+        pool.submit("busy", lambda: seen.append("busy"))
+    pool.submit("quiet", lambda: seen.append("quiet"))
+    gate.set()
+
+    assert _wait_for(lambda: len(seen) == 4)
+    # The quiet contact is not stuck behind the whole busy backlog.
+    assert seen.index("quiet") == 1
+    pool.shutdown(wait=True, timeout=3)
+
+
+def test_queue_depth_limit_rejects_and_counts():
+    pool = KeyedWorkerPool(worker_count=1, max_queue_depth=2)
+    gate = threading.Event()
+
+    assert pool.submit("a", gate.wait)
+    assert _wait_for(lambda: pool.snapshot()["busy_workers"] == 1)
+    assert pool.submit("a", lambda: None)
+    assert pool.submit("a", lambda: None)
+    assert pool.submit("a", lambda: None) is False
+    assert pool.submit("b", lambda: None)
+
+    snapshot = pool.snapshot()
+    assert snapshot["rejected"] == 1
+    assert snapshot["queue_depths"] == {"a": 2, "b": 1}
+    gate.set()
+    assert _wait_for(lambda: pool.snapshot()["completed"] == 4)
+    pool.shutdown(wait=True, timeout=3)
+
+
+def test_idle_keys_are_reaped():
+    pool = KeyedWorkerPool(worker_count=1, idle_ttl_seconds=0)
+    done = threading.Event()
+    pool.submit("someone@example.com", done.set)
+
+    assert done.wait(timeout=3)
+    assert _wait_for(lambda: pool.snapshot()["tracked_keys"] == 0)
+    pool.shutdown(wait=True, timeout=3)
+
+
+def test_service_replies_when_queue_is_full():
+    service = XMPPService.__new__(XMPPService)
+    service._worker_pool = KeyedWorkerPool(worker_count=1, max_queue_depth=1)
+    gate = threading.Event()
+    sent: list[tuple[str, str, str]] = []
+    service._send_chunked = lambda jid, text, message_type="chat": sent.append(
+        (jid, text, message_type)
+    )
+
+    service._enqueue_for_jid("room@conf", gate.wait)
+    assert _wait_for(lambda: service._worker_pool.snapshot()["busy_workers"] == 1)
+    service._enqueue_for_jid("room@conf", lambda: None)
+    service._enqueue_for_jid(
+        "room@conf", lambda: None, reply_target=("room@conf", "groupchat")
+    )
+
+    assert sent == [("room@conf", QUEUE_FULL_REPLY.format(depth=1), "groupchat")]
+    gate.set()
+    service._worker_pool.shutdown(wait=True, timeout=3)
+
+
+def test_metrics_registry_collects_provider_snapshots():
+    register_metrics_provider("test_pool", lambda: {"queued_tasks": 3})
+    register_metrics_provider("broken", lambda: 1 / 0)
+    try:
+        metrics = collect_daemon_metrics()
+        assert metrics["test_pool"] == {"queued_tasks": 3}
+        assert "error" in metrics["broken"]
+    finally:
+        unregister_metrics_provider("test_pool")
+        unregister_metrics_provider("broken")
@@ -0,0 +1,70 @@
+"""Tests for scheduled research cache maintenance."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from asky.research import cache_maintenance
+from asky.research.cache import ResearchCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    ResearchCache._instance = None
+    cache = ResearchCache(db_path=str(tmp_path / "maintenance.db"), ttl_hours=24)
+    yield cache
+    ResearchCache._instance = None
+
+
+def test_maintenance_is_throttled_by_interval(cache, monkeypatch):
+    monkeypatch.setattr(cache, "sweep_orphan_vectors", lambda: 0)
+    assert cache_maintenance.maintenance_due(cache, interval_seconds=60)
+    cache_maintenance.run_research_cache_maintenance(cache, max_bytes=0)
+    assert not cache_maintenance.maintenance_due(cache, interval_seconds=60)
+
+    cache.set_meta(cache_maintenance.LAST_MAINTENANCE_META_KEY, str(time.time() - 120))
+    assert cache_maintenance.maintenance_due(cache, interval_seconds=60)
+
+
+def test_cli_spawns_a_detached_pass_only_when_due(cache):
+    with patch.object(cache_maintenance.subprocess, "Popen") as popen:
+        assert cache_maintenance.spawn_research_cache_maintenance_if_due() is True
+        assert cache_maintenance.spawn_research_cache_maintenance_if_due() is False
+
+    popen.assert_called_once()
+    assert popen.call_args.args[0][1:] == ["-m", "asky.research.cache_maintenance"]
+    assert popen.call_args.kwargs["start_new_session"] is True
+    assert not cache_maintenance.maintenance_due(cache)
+
+
+def test_full_pass_continues_after_a_failing_step():
+    cache = MagicMock()
+    cache.cleanup_expired.side_effect = RuntimeError("locked")
+    cache.evict_to_budget.return_value = {
+        "evicted": 0,
+        "bytes_before": 1,
+        "bytes_after": 1,
+    }
+    cache.sweep_orphan_vectors.return_value = 3
+    cache.incremental_vacuum.return_value = 7
+
+    stats = cache_maintenance.run_research_cache_maintenance(cache, max_bytes=100)
+
+    assert stats["expired_removed"] == 0
+    assert stats["orphan_vectors_removed"] == 3
+    assert stats["pages_released"] == 7
+
+
+def test_register_maintenance_job_schedules_on_queue():
+    queue = MagicMock()
+
+    cache_maintenance.register_maintenance_job(queue)
+
+    name = cache_maintenance.RESEARCH_CACHE_MAINTENANCE_JOB
+    assert queue.register_handler.call_args.args[0] == name
+    queue.schedule_periodic.assert_called_once_with(
+        name,
+        cache_maintenance.maintenance_interval_seconds(),
+        initial_delay_seconds=cache_maintenance.DAEMON_INITIAL_DELAY_SECONDS,
+    )
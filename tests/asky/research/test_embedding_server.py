@@ -0,0 +1,217 @@
+"""Tests for the shared Unix-socket embedding server."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from asky.research import embedding_server
+from asky.research.embedding_server import EmbeddingServer, RemoteEmbeddingClient
+from asky.research.embeddings import EmbeddingClient
+
+
+class _FakeModelClient:
+    """Stands in for the server's in-process EmbeddingClient."""
+
+    def __init__(self, model="fake-model", delay=0.0):
+        self.model = model
+        self.normalize_embeddings = True
+        self.max_seq_length = 64
+        self.prompt_tokens = 0
+        self.use_server = True
+        self.delay = delay
+        self.calls = []
+
+    def is_available(self):
+        return True
+
+    def get_tokenizer(self):
+        return None
+
+    def embed_array(self, texts):
+        self.calls.append(list(texts))
+        if self.delay:
+            threading.Event().wait(self.delay)
+        self.prompt_tokens += 2 * len(texts)
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are length-limited, so avoid pytest's long tmp_path.
+    directory = tempfile.mkdtemp(prefix="asky-emb-", dir="/tmp")
+    yield Path(directory) / "embed.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_server(socket_path):
+    fake = _FakeModelClient()
+    server = EmbeddingServer(socket_path, client=fake, batch_window_ms=50)
+    assert server.start()
+    yield server, fake
+    server.stop()
+
+
+@pytest.fixture
+def fresh_client(socket_path):
+    EmbeddingClient._instance = None
+    client = EmbeddingClient(model="fake-model", normalize_embeddings=True)
+    client.use_server = True
+    client.server_autostart = False
+    client.server_socket = socket_path
+    yield client
+    EmbeddingClient._instance = None
+
+
+def test_remote_roundtrip_returns_float32_rows(running_server, socket_path):
+    server, fake = running_server
+    remote = RemoteEmbeddingClient(socket_path)
+
+    info = remote.info()
+    matrix, tokens = remote.embed_array(["ab", "abcd"], "fake-model", True)
+
+    assert info["model"] == "fake-model"
+    assert fake.use_server is False
+    assert matrix.dtype == np.float32
+    assert matrix.tolist() == [[2.0, 1.0], [4.0, 1.0]]
+    assert tokens == 4
+    assert server.snapshot()["requests"] == 1
+
+
+def test_concurrent_requests_share_one_batch(socket_path):
+    fake = _FakeModelClient(delay=0.05)
+    server = EmbeddingServer(socket_path, client=fake, batch_window_ms=200)
+    assert server.start()
+    results = {}
+    barrier = threading.Barrier(4)
+
+    def _request(index):
+        barrier.wait()
+        matrix, _ = RemoteEmbeddingClient(socket_path).embed_array(
+            ["x" * (index + 1)], "fake-model", True
+        )
+        results[index] = matrix[0, 0]
+
+    threads = [threading.Thread(target=_request, args=(i,)) for i in range(4)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+    finally:
+        server.stop()
+
+    assert results == {0: 1.0, 1: 2.0, 2: 3.0, 3: 4.0}
+    assert len(fake.calls) < 4
+    assert server.snapshot()["max_batch_requests"] > 1
+
+
+def test_embedding_client_uses_server_when_reachable(running_server, fresh_client):
+    _, fake = running_server
+
+    vectors = fresh_client.embed(["hello", "", "hi"])
+
+    assert vectors == [[5.0, 1.0], [2.0, 1.0]]
+    assert fake.calls == [["hello", "hi"]]
+    assert fresh_client._model is None
+    assert fresh_client.is_available() is True
+    assert fresh_client.max_seq_length == 64
+    assert fresh_client.get_usage_stats()["prompt_tokens"] == 4
+
+
+def test_embedding_client_falls_back_without_server(fresh_client, monkeypatch):
+    spawned = []
+    monkeypatch.setattr(
+        embedding_server, "spawn_server", lambda *args: spawned.append(args)
+    )
+    fresh_client.server_autostart = True
+    monkeypatch.setattr(
+        fresh_client,
+        "_embed_batch",
+        lambda texts: np.ones((len(texts), 2), dtype=np.float32),
+    )
+
+    assert fresh_client.embed(["a", "b"]) == [[1.0, 1.0], [1.0, 1.0]]
+    assert len(spawned) == 1
+    # The unreachable socket is not probed again until the retry delay passes.
+    fresh_client.embed(["c"])
+    assert len(spawned) == 1
+
+
+def test_embedding_client_ignores_server_with_other_model(
+    socket_path, fresh_client, monkeypatch
+):
+    fake = _FakeModelClient(model="other-model")
+    server = EmbeddingServer(socket_path, client=fake)
+    assert server.start()
+    monkeypatch.setattr(
+        fresh_client,
+        "_embed_batch",
+        lambda texts: np.zeros((len(texts), 2), dtype=np.float32),
+    )
+    try:
+        assert fresh_client.embed(["a"]) == [[0.0, 0.0]]
+    finally:
+        server.stop()
+    assert fake.calls == []
+    assert fresh_client.use_server is False
+
+
+def test_socket_is_owner_only_from_bind(socket_path, monkeypatch):
+    import os
+    import stat
+
+    monkeypatch.setattr(embedding_server.os, "chmod", lambda *_: None)
+    previous_umask = os.umask(0o022)
+    server = EmbeddingServer(socket_path, client=_FakeModelClient())
+    try:
+        assert server.start() is True
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(previous_umask)
+        server.stop()
+
+
+def test_second_server_does_not_steal_live_socket(running_server, socket_path):
+    assert EmbeddingServer(socket_path, client=_FakeModelClient()).start() is False
+    assert RemoteEmbeddingClient(socket_path).info()["ok"] is True
+
+
+def test_daemon_hosts_embedding_server_when_enabled(monkeypatch, socket_path):
+    from asky.daemon import service as daemon_service
+    from asky.daemon.metrics import collect_daemon_metrics
+    from asky.plugins.hooks import HookRegistry
+
+    class _Runtime:
+        hooks = HookRegistry()
+
+        def shutdown(self):
+            return None
+
+    fake = _FakeModelClient()
+    monkeypatch.setattr(daemon_service, "init_db", lambda: None)
+    monkeypatch.setattr("asky.config.RESEARCH_EMBEDDING_SERVER_ENABLED", True)
+    monkeypatch.setattr(
+        embedding_server,
+        "build_configured_server",
+        lambda idle_timeout_seconds: EmbeddingServer(socket_path, client=fake),
+    )
+
+    service = daemon_service.DaemonService(plugin_runtime=_Runtime())
+    spec = service.get_plugin_server("embedding_server")
+    assert spec is not None
+    spec.start()
+    try:
+        assert RemoteEmbeddingClient(socket_path).info()["model"] == "fake-model"
+        assert collect_daemon_metrics()["embedding_server"]["running"] is True
+    finally:
+        spec.stop()
+    assert "embedding_server" not in collect_daemon_metrics()
+    assert not socket_path.exists()
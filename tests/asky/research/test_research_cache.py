@@ -377,6 +377,95 @@ class TestResearchCache:
         assert stats["valid_entries"] == 2
         assert stats["expired_entries"] == 0
 
+    def _set_last_accessed(self, cache, url, when):
+        conn = sqlite3.connect(cache.db_path)
+        conn.execute(
+            "UPDATE research_cache SET last_accessed_at = ? WHERE url = ?",
+            (when.isoformat(), url),
+        )
+        conn.commit()
+        conn.close()
+
+    def _last_accessed(self, cache, url):
+        conn = sqlite3.connect(cache.db_path)
+        row = conn.execute(
+            "SELECT last_accessed_at FROM research_cache WHERE url = ?", (url,)
+        ).fetchone()
+        conn.close()
+        return row[0]
+
+    def test_get_cached_refreshes_stale_access_time(self, cache):
+        """Reads record access for LRU, but only once per touch interval."""
+        url = "http://lru.example.com"
+        cache.cache_url(url=url, content="c", title="t", links=[])
+        stale = datetime.now() - timedelta(hours=1)
+        self._set_last_accessed(cache, url, stale)
+
+        cache.get_cached(url)
+        refreshed = self._last_accessed(cache, url)
+        assert refreshed > stale.isoformat()
+
+        cache.get_cached(url)
+        assert self._last_accessed(cache, url) == refreshed
+
+    def test_evict_to_budget_removes_least_recently_used(self, cache):
+        """Eviction drops the oldest-accessed rows until the budget fits."""
+        now = datetime.now()
+        for index, url in enumerate(["http://a.com", "http://b.com", "http://c.com"]):
+            cache.cache_url(url=url, content=f"page {index}", title="t", links=[])
+            self._set_last_accessed(cache, url, now - timedelta(hours=3 - index))
+        total = cache.get_total_bytes()
+        assert total > 0
+
+        lock_held = []
+        with patch.object(
+            cache,
+            "_clear_chroma_vectors_bulk",
+            side_effect=lambda ids: lock_held.append(cache._db_lock.locked()),
+        ) as mock_clear_bulk:
+            result = cache.evict_to_budget(total - 1)
+
+        assert result["evicted"] == 1
+        assert result["bytes_after"] < total
+        mock_clear_bulk.assert_called_once()
+        assert lock_held == [False]
+        assert cache.get_entry("http://a.com") is None
+        assert cache.get_entry("http://b.com") is not None
+        assert cache.evict_to_budget(0)["evicted"] == 0
+
+    def test_entry_bytes_are_remeasured_after_chunk_writes(self, cache):
+        """Triggers mark a row unmeasured when its chunks change."""
+        cache_id = cache.cache_url(url="http://size.com", content="abc", title="t", links=[])
+        before = cache.get_total_bytes()
+        conn = sqlite3.connect(cache.db_path)
+        conn.execute(
+            "INSERT INTO content_chunks (cache_id, chunk_index, chunk_text, created_at) "
+            "VALUES (?, 0, 'chunk!', 'now')",
+            (cache_id,),
+        )
+        conn.commit()
+        assert conn.execute(
+            "SELECT entry_bytes FROM research_cache WHERE id = ?", (cache_id,)
+        ).fetchone()[0] is None
+        conn.close()
+
+        assert cache.get_total_bytes() == before + len("chunk!")
+
+    def test_cleanup_expired_respects_limit(self, cache):
+        """A limited cleanup pass removes at most `limit` expired rows."""
+        for url in ["http://old1.com", "http://old2.com"]:
+            cache.cache_url(url=url, content="c", title="t", links=[])
+        conn = sqlite3.connect(cache.db_path)
+        conn.execute(
+            "UPDATE research_cache SET expires_at = ?",
+            ((datetime.now() - timedelta(hours=1)).isoformat(),),
+        )
+        conn.commit()
+        conn.close()
+
+        assert cache.cleanup_expired(limit=1) == 1
+        assert cache.cleanup_expired() == 1
+
     def test_url_hash_consistency(self, cache):
         """Test that URL hashing is consistent."""
         url = "http://example.com/path?query=1"
@@ -577,3 +666,19 @@ class TestResearchFindings:
 
         finding = cache.get_finding(finding_id)
         assert finding["tags"] == []
+
+
+def test_cache_url_keeps_vectors_when_refetched_content_is_unchanged(tmp_path):
+    from asky.research.cache import ResearchCache
+
+    ResearchCache._instance = None
+    cache = ResearchCache(db_path=str(tmp_path / "research.db"), ttl_hours=24)
+    try:
+        with patch.object(cache, "_clear_stale_vectors") as clear:
+            cache.cache_url(url="http://a", content="same", title="", links=[], etag='"1"')
+            cache.cache_url(url="http://a", content="same", title="", links=[], etag='"2"')
+        clear.assert_called_once()
+        assert clear.call_args.kwargs["clear_chunks"] is False
+        assert cache.get_entry("http://a")["etag"] == '"2"'
+    finally:
+        ResearchCache._instance = None
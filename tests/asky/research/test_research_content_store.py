@@ -0,0 +1,182 @@
+"""Tests for compressed research cache storage."""
+
+import sqlite3
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from asky.research.content_store import (
+    COMPRESSION_MIN_CHARS,
+    decode_text,
+    encode_text,
+    locate_chunk_spans,
+)
+
+DOCUMENT = " ".join(f"Sentence number {i} about retrieval storage." for i in range(60))
+
+
+@pytest.fixture
+def stores(tmp_path):
+    from asky.research.cache import ResearchCache
+    from asky.research.vector_store import VectorStore
+
+    ResearchCache._instance = None
+    VectorStore._instance = None
+    db_path = str(tmp_path / "research.db")
+    cache = ResearchCache(db_path=db_path, ttl_hours=24)
+    client = MagicMock()
+    client.model = "test-model"
+    client.embed.side_effect = lambda texts: [[0.1, 0.2, 0.3] for _ in texts]
+    client.embed_array.side_effect = lambda texts: np.full(
+        (len(texts), 3), [0.1, 0.2, 0.3], dtype=np.float32
+    )
+    client.embed_single.return_value = [0.1, 0.2, 0.3]
+    store = VectorStore(
+        db_path=db_path,
+        embedding_client=client,
+        chroma_persist_directory=str(tmp_path / "chroma"),
+    )
+    store._chroma_disabled = True
+    yield cache, store
+    ResearchCache._instance = None
+    VectorStore._instance = None
+
+
+def test_encode_text_round_trips_and_keeps_short_text_plain():
+    assert encode_text("short") == "short"
+    encoded = encode_text(DOCUMENT)
+    assert isinstance(encoded, bytes)
+    assert len(encoded) < len(DOCUMENT)
+    assert decode_text(encoded) == DOCUMENT
+    assert decode_text(None) == ""
+
+
+def test_locate_chunk_spans_handles_overlap_and_misses():
+    document = "alpha beta gamma delta"
+    spans = locate_chunk_spans(document, ["alpha beta", "beta gamma", "missing"])
+    assert spans == [(0, 10), (6, 16), None]
+
+
+def test_cached_content_is_stored_compressed(stores):
+    cache, _store = stores
+    cache.cache_url(url="http://a", content=DOCUMENT, title="A", links=[])
+
+    conn = sqlite3.connect(cache.db_path)
+    stored_type = conn.execute("SELECT typeof(content) FROM research_cache").fetchone()[0]
+    conn.close()
+
+    assert stored_type == "blob"
+    assert cache.get_cached("http://a")["content"] == DOCUMENT
+
+
+def test_chunks_reference_parent_offsets_and_stay_searchable(stores):
+    cache, store = stores
+    cache_id = cache.cache_url(url="http://a", content=DOCUMENT, title="A", links=[])
+    chunks = [(0, DOCUMENT[:300]), (1, DOCUMENT[250:600]), (2, "x" * COMPRESSION_MIN_CHARS)]
+
+    assert store.store_chunk_embeddings(cache_id=cache_id, chunks=chunks) == 3
+
+    conn = sqlite3.connect(cache.db_path)
+    rows = conn.execute(
+        "SELECT chunk_index, chunk_text, char_start, char_end FROM content_chunks "
+        "ORDER BY chunk_index"
+    ).fetchall()
+    conn.close()
+    assert rows[0][1:] == ("", 0, 300)
+    assert rows[1][1:] == ("", 250, 600)
+    assert isinstance(rows[2][1], bytes) and rows[2][2] is None
+
+    results = store.search_chunks_hybrid(cache_id=cache_id, query="retrieval storage", top_k=3)
+    assert sorted(item["text"] for item in results) == sorted(text for _, text in chunks)
+    assert store._get_bm25_scores(cache_id=cache_id, query="sentence", limit=10)
+
+
+def test_content_change_removes_old_chunk_postings(stores):
+    cache, store = stores
+    cache_id = cache.cache_url(url="http://a", content=DOCUMENT, title="A", links=[])
+    store.store_chunk_embeddings(cache_id=cache_id, chunks=[(0, DOCUMENT[:200])])
+
+    cache.cache_url(url="http://a", content="unrelated zebra text", title="A", links=[])
+
+    conn = sqlite3.connect(cache.db_path)
+    matches = conn.execute(
+        "SELECT COUNT(*) FROM content_chunks_fts WHERE content_chunks_fts MATCH 'retrieval'"
+    ).fetchone()[0]
+    conn.close()
+    assert matches == 0
+
+
+def test_legacy_rows_migrate_and_compact(tmp_path):
+    from asky.research.cache import ResearchCache
+
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    now = datetime.now().isoformat()
+    conn.executescript(
+        """
+        CREATE TABLE research_cache (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE NOT NULL,
+            url_hash TEXT NOT NULL, content TEXT, title TEXT, summary TEXT,
+            summary_status TEXT DEFAULT 'pending', links_json TEXT,
+            fetch_timestamp TEXT NOT NULL, expires_at TEXT NOT NULL,
+            content_hash TEXT, created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+        );
+        CREATE TABLE content_chunks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, cache_id INTEGER NOT NULL,
+            chunk_index INTEGER NOT NULL, chunk_text TEXT NOT NULL, embedding BLOB,
+            embedding_model TEXT, created_at TEXT NOT NULL,
+            UNIQUE(cache_id, chunk_index)
+        );
+        CREATE VIRTUAL TABLE content_chunks_fts USING fts5(
+            chunk_text, content='content_chunks', content_rowid='id'
+        );
+        CREATE TRIGGER content_chunks_ai AFTER INSERT ON content_chunks BEGIN
+            INSERT INTO content_chunks_fts(rowid, chunk_text) VALUES (new.id, new.chunk_text);
+        END;
+        """
+    )
+    conn.execute(
+        "INSERT INTO research_cache (url, url_hash, content, title, fetch_timestamp, "
+        "expires_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        ("http://legacy", "h", DOCUMENT, "Legacy", now, "2999-01-01T00:00:00", now, now),
+    )
+    conn.execute(
+        "INSERT INTO content_chunks (cache_id, chunk_index, chunk_text, embedding, "
+        "embedding_model, created_at) VALUES (1, 0, ?, ?, 'm', ?)",
+        (DOCUMENT[100:400], b"\x00" * 12, now),
+    )
+    conn.commit()
+    conn.close()
+
+    ResearchCache._instance = None
+    try:
+        cache = ResearchCache(db_path=db_path, ttl_hours=24)
+        conn = sqlite3.connect(db_path)
+        fts_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'content_chunks_fts'"
+        ).fetchone()[0]
+        assert "content=''" in fts_sql
+        assert conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master "
+            "WHERE type = 'trigger' AND sql LIKE '%content_chunks_fts%'"
+        ).fetchone()[0] == 0
+        conn.close()
+        assert cache.get_cached_by_id(1)["content"] == DOCUMENT
+
+        stats = cache.compact()
+
+        assert stats["documents_compressed"] == 1
+        assert stats["chunks_offset"] == 1
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT typeof(content) FROM research_cache").fetchone()[0] == "blob"
+        assert conn.execute(
+            "SELECT chunk_text, char_start, char_end FROM content_chunks"
+        ).fetchone() == ("", 100, 400)
+        assert conn.execute(
+            "SELECT COUNT(*) FROM content_chunks_fts WHERE content_chunks_fts MATCH 'retrieval'"
+        ).fetchone()[0] == 1
+        conn.close()
+    finally:
+        ResearchCache._instance = None
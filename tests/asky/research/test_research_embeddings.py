@@ -122,9 +122,11 @@ class _LocalCacheOnlySentenceTransformer:
 class _TruncationAwareTokenizer:
     def __init__(self):
         self.last_kwargs = {}
+        self.encode_calls = 0
 
     def encode(self, text, **kwargs):
         self.last_kwargs = kwargs
+        self.encode_calls += 1
         words = [word for word in text.split() if word]
         if kwargs.get("truncation") and kwargs.get("max_length"):
             words = words[: kwargs["max_length"]]
@@ -221,6 +223,17 @@ class TestEmbeddingClient:
         assert len(result) == 1
         assert client.texts_embedded == 1
 
+    def test_embed_array_returns_float32_matrix(self, client):
+        """embed_array concatenates batches into one float32 array."""
+        import numpy as np
+
+        result = client.embed_array(["a", "b c", "", "d e f"])
+        assert result.dtype == np.float32
+        assert result.shape == (3, 3)
+        assert result[:, 0].tolist() == [1.0, 2.0, 3.0]
+        assert client.api_calls == 2
+        assert client.embed_array([]).shape == (0, 0)
+
     def test_embed_single_empty_raises(self, client):
         """Test that embedding empty string raises error."""
         with pytest.raises(ValueError):
@@ -307,8 +320,8 @@ class TestEmbeddingClient:
             ]
         EmbeddingClient._instance = None
 
-    def test_token_counting_uses_truncation_when_model_has_max_length(self):
-        """Token counting should truncate to model max length to avoid warnings."""
+    def test_token_counting_reuses_single_tokenization_pass(self):
+        """Truncation and usage counting share one encode per text."""
         from asky.research.embeddings import EmbeddingClient
 
         EmbeddingClient._instance = None
@@ -322,8 +335,8 @@ class TestEmbeddingClient:
             )
             _ = client.embed_single("one two three four five six")
             tokenizer = client.get_tokenizer()
-            assert tokenizer.last_kwargs.get("truncation") is True
-            assert tokenizer.last_kwargs.get("max_length") == 3
+            assert tokenizer.encode_calls == 1
+            # Usage counts the tokens actually sent after truncation.
             assert client.prompt_tokens == 3
         EmbeddingClient._instance = None
 
@@ -345,6 +358,135 @@ class TestEmbeddingClient:
             assert result == [3.0, 4.0, 5.0]
         EmbeddingClient._instance = None
 
+    def test_onnx_backend_passes_backend_and_keeps_model_tag(self):
+        """ONNX vectors match torch output, so the stored tag is unchanged."""
+        from asky.research.embeddings import EmbeddingClient
+
+        EmbeddingClient._instance = None
+        with patch(
+            "asky.research.embeddings.SentenceTransformer",
+            _FakeSentenceTransformer,
+        ), patch(
+            "asky.research.embeddings._missing_backend_module", return_value=None
+        ):
+            client = EmbeddingClient(
+                model="test-model", local_files_only=True, backend="onnx"
+            )
+            assert client.is_available() is True
+            assert client._model.kwargs["backend"] == "onnx"
+            assert client.model == "test-model"
+        EmbeddingClient._instance = None
+
+    def test_onnx_backend_falls_back_to_torch(self):
+        """A missing ONNX runtime degrades to the torch backend."""
+        from asky.research.embeddings import EmbeddingClient
+
+        class _NoOnnxSentenceTransformer(_FakeSentenceTransformer):
+            def __init__(self, model_name, device="cpu", **kwargs):
+                if kwargs.get("backend") == "onnx":
+                    raise ImportError("optimum is not installed")
+                super().__init__(model_name, device=device, **kwargs)
+
+        EmbeddingClient._instance = None
+        with patch(
+            "asky.research.embeddings.SentenceTransformer",
+            _NoOnnxSentenceTransformer,
+        ), patch(
+            "asky.research.embeddings._missing_backend_module", return_value=None
+        ):
+            client = EmbeddingClient(
+                model="test-model", local_files_only=True, backend="onnx"
+            )
+            assert client.embed_single("a b") == [2.0, 3.0, 4.0]
+            assert client.backend == "torch"
+        EmbeddingClient._instance = None
+
+    def test_int8_backend_quantizes_and_tags_vectors(self):
+        """int8 vectors get their own tag so they never mix with fp32 rows."""
+        from asky.research.embeddings import EmbeddingClient
+
+        quantized = []
+        EmbeddingClient._instance = None
+        with patch(
+            "asky.research.embeddings.SentenceTransformer",
+            _FakeSentenceTransformer,
+        ), patch(
+            "asky.research.embeddings._quantize_dynamic_int8",
+            side_effect=lambda model: quantized.append(model) or model,
+        ):
+            client = EmbeddingClient(
+                model="test-model",
+                device="cuda",
+                local_files_only=True,
+                backend="int8",
+            )
+            assert client.device == "cpu"
+            assert client.model == "test-model@int8"
+            assert client.is_available() is True
+            assert quantized == [client._model]
+            assert client.model_name == "test-model"
+        EmbeddingClient._instance = None
+
+    def test_missing_backend_package_settles_tag_before_load(self):
+        """A backend without its packages is dropped before `model` is read."""
+        from asky.research.embeddings import EmbeddingClient
+
+        EmbeddingClient._instance = None
+        with patch(
+            "asky.research.embeddings._missing_backend_module", return_value="torch"
+        ):
+            client = EmbeddingClient(model="test-model", backend="int8")
+        assert client.backend == "torch"
+        assert client.model == "test-model"
+        EmbeddingClient._instance = None
+
+    def test_int8_quantization_failure_switches_tag_on_load(self):
+        """A late quantization failure retags to what actually runs."""
+        from asky.research.embeddings import EmbeddingClient
+
+        EmbeddingClient._instance = None
+        with patch(
+            "asky.research.embeddings.SentenceTransformer",
+            _FakeSentenceTransformer,
+        ), patch(
+            "asky.research.embeddings._missing_backend_module", return_value=None
+        ), patch(
+            "asky.research.embeddings._quantize_dynamic_int8",
+            side_effect=RuntimeError("no quantized engine"),
+        ):
+            client = EmbeddingClient(
+                model="test-model", local_files_only=True, backend="int8"
+            )
+            assert client.model == "test-model@int8"
+            assert client.is_available() is True
+            assert client.model == "test-model"
+        EmbeddingClient._instance = None
+
+    def test_int8_quantization_runs_on_torch_model(self):
+        """The real quantizer swaps Linear layers and keeps outputs close."""
+        torch = pytest.importorskip("torch")
+        from asky.research.embeddings import _quantize_dynamic_int8
+
+        torch.manual_seed(0)
+        model = torch.nn.Sequential(torch.nn.Linear(32, 16), torch.nn.Tanh())
+        inputs = torch.randn(4, 32)
+        expected = model(inputs)
+
+        quantized = _quantize_dynamic_int8(model)
+
+        assert not isinstance(quantized[0], torch.nn.Linear)
+        assert ".quantized." in type(quantized[0]).__module__
+        assert torch.allclose(quantized(inputs), expected, atol=0.05)
+
+    def test_unknown_backend_uses_torch(self):
+        from asky.research.embeddings import EmbeddingClient
+
+        EmbeddingClient._instance = None
+        client = EmbeddingClient(model="test-model", backend="tpu")
+        assert client.backend == "torch"
+        assert client.model == "test-model"
+        EmbeddingClient._instance = None
+
 
 class TestEmbeddingSerialization:
     """Tests for embedding serialization utilities."""
@@ -382,6 +524,36 @@ class TestEmbeddingSerialization:
         for orig, rest in zip(original, restored):
             assert abs(orig - rest) < 0.0001
 
+    def test_serialized_bytes_match_legacy_struct_layout(self):
+        """Array serialization keeps the existing SQLite BLOB format."""
+        import struct
+
+        import numpy as np
+
+        from asky.research.embeddings import EmbeddingClient
+
+        values = [0.25, -1.5, 3.0]
+        legacy = struct.pack("3f", *values)
+        assert EmbeddingClient.serialize_embedding(values) == legacy
+        assert (
+            EmbeddingClient.serialize_embedding(np.asarray(values, dtype=np.float32))
+            == legacy
+        )
+
+    def test_deserialize_embedding_array_is_a_view(self):
+        """Reading a BLOB as an array does not copy the bytes."""
+        import numpy as np
+
+        from asky.research.embeddings import EmbeddingClient
+
+        data = EmbeddingClient.serialize_embedding([1.0, 2.0])
+        array = EmbeddingClient.deserialize_embedding_array(data)
+        assert array.dtype == np.float32
+        assert array.tolist() == [1.0, 2.0]
+        assert array.base is data
+        assert not array.flags.writeable
+        assert EmbeddingClient.deserialize_embedding_array(None).shape == (0,)
+
     def test_deserialize_empty_returns_empty(self):
         """Test that deserializing empty bytes returns empty list."""
         from asky.research.embeddings import EmbeddingClient
@@ -0,0 +1,115 @@
+"""Tests for single-pass tokenization in embeddings and chunking."""
+
+import pytest
+
+from asky.research.chunker import chunk_text
+from asky.research.tokenization import (
+    TokenizedText,
+    tokenize_batch,
+    truncate_to_tokens,
+)
+
+tokenizers = pytest.importorskip("tokenizers")
+transformers = pytest.importorskip("transformers")
+
+WORDS = (
+    "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu "
+    "Alpha Beta Gamma . ! ?"
+).split()
+
+
+class _CountingTokenizer:
+    """Wraps a fast tokenizer and counts tokenizer invocations."""
+
+    def __init__(self, inner, is_fast=True):
+        self._inner = inner
+        self.is_fast = is_fast
+        self.batch_calls = 0
+        self.encode_calls = 0
+
+    def __call__(self, texts, **kwargs):
+        self.batch_calls += 1
+        return self._inner(texts, **kwargs)
+
+    def encode(self, text, **kwargs):
+        self.encode_calls += 1
+        return self._inner.encode(text, **kwargs)
+
+    def decode(self, token_ids, **kwargs):
+        return self._inner.decode(token_ids, **kwargs)
+
+
+@pytest.fixture
+def fast_tokenizer():
+    vocab = {"[UNK]": 0}
+    for word in WORDS:
+        vocab.setdefault(word, len(vocab))
+    backend = tokenizers.Tokenizer(tokenizers.models.WordLevel(vocab, unk_token="[UNK]"))
+    backend.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    return transformers.PreTrainedTokenizerFast(
+        tokenizer_object=backend, unk_token="[UNK]"
+    )
+
+
+def test_tokenize_batch_uses_one_call_with_offsets(fast_tokenizer):
+    tokenizer = _CountingTokenizer(fast_tokenizer)
+    texts = ["alpha beta gamma", "delta  epsilon"]
+
+    encoded = tokenize_batch(tokenizer, texts)
+
+    assert tokenizer.batch_calls == 1
+    assert tokenizer.encode_calls == 0
+    assert [len(item) for item in encoded] == [3, 2]
+    assert encoded[1].offsets == [(0, 5), (7, 14)]
+
+
+def test_tokenize_batch_falls_back_to_encode_without_offsets(fast_tokenizer):
+    tokenizer = _CountingTokenizer(fast_tokenizer, is_fast=False)
+
+    encoded = tokenize_batch(tokenizer, ["alpha beta", "gamma"])
+
+    assert tokenizer.batch_calls == 0
+    assert tokenizer.encode_calls == 2
+    assert [item.offsets for item in encoded] == [None, None]
+
+
+def test_truncation_slices_original_text(fast_tokenizer):
+    text = "Alpha Beta Gamma delta"
+    (tokenized,) = tokenize_batch(fast_tokenizer, [text])
+
+    assert truncate_to_tokens(fast_tokenizer, text, tokenized, 2) == "Alpha Beta"
+    assert truncate_to_tokens(fast_tokenizer, text, tokenized, 10) is text
+    # Without offsets the ids are decoded instead.
+    no_offsets = TokenizedText(ids=tokenized.ids)
+    assert truncate_to_tokens(fast_tokenizer, text, no_offsets, 2) == "Alpha Beta"
+
+
+def test_chunker_tokenizes_document_once_and_matches_per_sentence_path(
+    fast_tokenizer, monkeypatch
+):
+    text = (
+        "alpha beta gamma. delta epsilon zeta! eta theta iota kappa. "
+        "lambda mu alpha? beta gamma delta epsilon zeta eta theta iota kappa lambda."
+    )
+    fast = _CountingTokenizer(fast_tokenizer)
+    slow = _CountingTokenizer(fast_tokenizer, is_fast=False)
+
+    monkeypatch.setattr(
+        "asky.research.chunker._get_embedding_tokenizer", lambda: (fast, 0)
+    )
+    fast_chunks = chunk_text(text, chunk_size=8, overlap=2)
+    monkeypatch.setattr(
+        "asky.research.chunker._get_embedding_tokenizer", lambda: (slow, 0)
+    )
+    slow_chunks = chunk_text(text, chunk_size=8, overlap=2)
+
+    assert fast.batch_calls == 1
+    assert fast.encode_calls == 0
+    # Same windows; the slow path decodes long-sentence parts, so spacing differs.
+    assert [(i, c.replace(" ", "")) for i, c in fast_chunks] == [
+        (i, c.replace(" ", "")) for i, c in slow_chunks
+    ]
+    # The long last sentence is split into windows sliced from the source text.
+    assert "beta gamma delta epsilon zeta eta theta iota" in [
+        chunk for _, chunk in fast_chunks
+    ]
@@ -3,6 +3,7 @@
 import sqlite3
 from unittest.mock import patch, MagicMock
 
+import numpy as np
 import pytest
 
 from asky.research.vector_store import cosine_similarity, VectorStore
@@ -82,6 +83,9 @@ class TestVectorStore:
         """Create a mock embedding client."""
         client = MagicMock()
         client.embed.return_value = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        client.embed_array.side_effect = lambda texts: np.asarray(
+            client.embed(texts), dtype=np.float32
+        )
         client.embed_single.return_value = [0.1, 0.2, 0.3]
         client.model = "test-model"
         return client
@@ -297,6 +301,24 @@ class TestVectorStore:
         assert add_kwargs["ids"] == ["chunk:1:0", "chunk:1:1"]
         assert add_kwargs["documents"] == ["Chunk A", "Chunk B"]
 
+    def test_sweep_orphan_cache_embeddings_deletes_missing_ids(self, vector_store):
+        """Vectors whose cache row is gone are deleted in one batched call."""
+        fake_collection = MagicMock()
+        fake_collection.get.return_value = {
+            "metadatas": [{"cache_id": 1}, {"cache_id": 2}, {"cache_id": 9}]
+        }
+        with patch.object(
+            vector_store,
+            "_get_chroma_collection",
+            return_value=fake_collection,
+        ):
+            removed = vector_store.sweep_orphan_cache_embeddings({1})
+
+        assert removed == 2
+        fake_collection.delete.assert_called_with(
+            where={"cache_id": {"$in": [2, 9]}}
+        )
+
     def test_search_chunks_prefers_chroma_results(self, vector_store):
         """Test that non-empty Chroma query results short-circuit SQLite fallback."""
         with patch.object(
@@ -480,6 +502,9 @@ class TestVectorStoreFindingsMethods:
         """Create a mock embedding client."""
         client = MagicMock()
         client.embed.return_value = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        client.embed_array.side_effect = lambda texts: np.asarray(
+            client.embed(texts), dtype=np.float32
+        )
         client.embed_single.return_value = [0.1, 0.2, 0.3]
         client.model = "test-model"
         return client
@@ -655,6 +680,26 @@ class TestVectorStoreFindingsMethods:
         scores = [score for _, score in results]
         assert scores == sorted(scores, reverse=True)
 
+    def test_search_findings_keeps_rows_from_previous_model(
+        self, vector_store_with_findings, mock_embedding_client
+    ):
+        """Findings embedded before a model switch stay searchable."""
+        vector_store_with_findings.store_finding_embedding(
+            finding_id=1,
+            finding_text="Machine learning is transforming healthcare",
+        )
+        assert len(vector_store_with_findings.search_findings(query="test")) == 1
+
+        mock_embedding_client.model = "test-model@int8"
+        vector_store_with_findings.store_finding_embedding(
+            finding_id=2,
+            finding_text="Climate change affects agriculture",
+        )
+
+        results = vector_store_with_findings.search_findings(query="test")
+
+        assert sorted(finding["id"] for finding, _ in results) == [1, 2]
+
     def test_has_finding_embedding_false(self, vector_store_with_findings):
         """Test has_finding_embedding returns False when no embedding."""
         assert not vector_store_with_findings.has_finding_embedding(1)
@@ -841,3 +841,103 @@ def test_shortlist_mixed_mode_includes_corpus_and_web(monkeypatch):
     source_types = {c["source_type"] for c in payload["candidates"]}
     assert "corpus" in source_types
     assert "search" in source_types
+
+
+def test_collect_candidates_runs_sub_queries_concurrently_and_counts_cache_hits():
+    import threading
+    import time
+
+    from asky.research.shortlist_collect import collect_candidates
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def search_executor(args):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        payload = {"results": [{"url": f"https://example.com/{args['q']}", "title": args["q"]}]}
+        if args["q"] == "q2":
+            payload["cache_hit"] = True
+        return payload
+
+    metrics = {"search_calls": 0, "search_results": 0}
+    candidates = collect_candidates(
+        seed_urls=[],
+        search_queries=["q1", "q2", "q3"],
+        search_executor=search_executor,
+        seed_link_extractor=lambda url: {"links": []},
+        warnings=[],
+        metrics=metrics,
+        seed_link_expansion_enabled=False,
+        seed_link_max_pages=0,
+        seed_links_per_page=0,
+        search_with_seed_urls=True,
+        search_result_count=6,
+        max_candidates=10,
+        max_title_chars=80,
+        normalize_source_url=lambda url: url,
+        extract_path_tokens=lambda path: path,
+        normalize_whitespace=lambda text: " ".join(text.split()),
+        is_http_url=lambda url: url.startswith("http"),
+        is_blocked_seed_link=lambda url: False,
+        elapsed_ms=lambda start: 0.0,
+        logger=MagicMock(),
+        search_max_concurrency=3,
+    )
+
+    assert active["peak"] > 1
+    assert [c.title for c in candidates] == ["q1", "q2", "q3"]
+    assert metrics["search_calls"] == 3
+    assert metrics["search_cache_hits"] == 1
+    assert metrics["search_cache_misses"] == 2
+
+
+def test_shortlist_fetches_candidates_concurrently_in_candidate_order(monkeypatch):
+    import threading
+    import time
+
+    from asky.research import source_shortlist as shortlist_mod
+    from asky.research.shortlist_types import CandidateRecord
+
+    monkeypatch.setattr(shortlist_mod, "SOURCE_SHORTLIST_MAX_FETCH_URLS", 4)
+    monkeypatch.setattr(shortlist_mod, "SOURCE_SHORTLIST_MIN_CONTENT_CHARS", 10)
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_fetch_executor(url: str) -> Dict[str, Any]:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return {"title": url, "text": f"Fetched body for {url} long enough."}
+
+    candidates = [
+        CandidateRecord(url=f"https://site{i}.example/doc", source_type="search")
+        for i in range(6)
+    ]
+    metrics: Dict[str, Any] = {
+        "fetch_calls": 0,
+        "fetch_success": 0,
+        "fetch_short_text_skips": 0,
+        "fetch_failures": 0,
+        "fetch_canonical_dedupe_skips": 0,
+    }
+    fetched = shortlist_mod._fetch_candidate_content(
+        candidates=candidates,
+        seed_urls=[],
+        fetch_executor=slow_fetch_executor,
+        warnings=[],
+        metrics=metrics,
+        fetch_max_concurrency=3,
+    )
+
+    assert [item.url for item in fetched] == [c.url for c in candidates[:4]]
+    assert active["peak"] == 3
+    assert metrics["fetch_calls"] == 4
+    assert metrics["fetch_success"] == 4
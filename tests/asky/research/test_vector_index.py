@@ -0,0 +1,177 @@
+"""Tests for the persistent NumPy vector index."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from asky.research import vector_index
+from asky.research.vector_index import VectorIndex
+
+TABLE = "research_findings"
+DIMS = 16
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "history.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        f"""CREATE TABLE {TABLE} (
+            id INTEGER PRIMARY KEY, session_id TEXT,
+            embedding BLOB, embedding_model TEXT)"""
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _insert(db_path, vectors, session_ids=None, model="m", start_id=1):
+    conn = sqlite3.connect(db_path)
+    for offset, vector in enumerate(vectors):
+        session_id = session_ids[offset] if session_ids else None
+        conn.execute(
+            f"INSERT INTO {TABLE} (id, session_id, embedding, embedding_model) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                start_id + offset,
+                session_id,
+                np.asarray(vector, dtype=np.float32).tobytes(),
+                model,
+            ),
+        )
+    conn.commit()
+    conn.close()
+
+
+def _brute_force(vectors, query, top_k):
+    matrix = np.asarray(vectors, dtype=np.float32)
+    matrix = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+    scores = matrix @ (query / np.linalg.norm(query))
+    return [int(i) + 1 for i in np.argsort(-scores)[:top_k]]
+
+
+def test_exact_search_matches_brute_force_and_filters_sessions(db_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(60, DIMS))
+    sessions = ["a" if i % 2 else "b" for i in range(60)]
+    _insert(db_path, vectors, sessions)
+    index = VectorIndex(db_path, TABLE, "m")
+
+    query = rng.normal(size=DIMS)
+    ranked = index.search(query, 5)
+
+    assert [row_id for row_id, _ in ranked] == _brute_force(vectors, query, 5)
+    assert ranked[0][1] >= ranked[-1][1]
+    in_session = index.search(query, 5, keys=["a"])
+    assert all(sessions[row_id - 1] == "a" for row_id, _ in in_session)
+    assert index.snapshot_path.exists()
+
+
+def test_ivf_search_finds_near_duplicates(db_path):
+    rng = np.random.default_rng(2)
+    centers = rng.normal(size=(20, DIMS)) * 5
+    vectors = np.repeat(centers, 50, axis=0) + rng.normal(size=(1000, DIMS)) * 0.3
+    _insert(db_path, vectors)
+    index = VectorIndex(db_path, TABLE, "m", exact_scan_rows=100, probe_lists=4)
+
+    hits = 0
+    for row in rng.choice(1000, size=50, replace=False):
+        ranked = index.search(vectors[row], 1)
+        hits += ranked[0][0] == row + 1
+    assert index._centroids is not None
+    assert hits >= 48
+
+
+def test_incremental_adds_reach_other_instances_without_rebuild(db_path, monkeypatch):
+    rng = np.random.default_rng(3)
+    _insert(db_path, rng.normal(size=(10, DIMS)))
+    writer = VectorIndex(db_path, TABLE, "m")
+    writer.search(rng.normal(size=DIMS), 1)  # builds the snapshot
+
+    new_vector = rng.normal(size=DIMS)
+    _insert(db_path, [new_vector], start_id=11)
+    writer.add(11, new_vector, "s1")
+
+    reader = VectorIndex(db_path, TABLE, "m")
+    monkeypatch.setattr(
+        reader, "_rebuild", lambda: pytest.fail("log replay should avoid a rebuild")
+    )
+    assert reader.search(new_vector, 1, keys=["s1"])[0][0] == 11
+
+    # The writer sees its own add, and removals hide rows immediately.
+    assert writer.search(new_vector, 1)[0][0] == 11
+    writer.remove([11])
+    assert all(row_id != 11 for row_id, _ in writer.search(new_vector, 3))
+
+
+def test_rebuilds_when_database_changed_behind_its_back(db_path):
+    rng = np.random.default_rng(4)
+    vectors = rng.normal(size=(5, DIMS))
+    _insert(db_path, vectors)
+    VectorIndex(db_path, TABLE, "m").search(vectors[0], 1)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"DELETE FROM {TABLE} WHERE id = 1")
+    conn.commit()
+    conn.close()
+
+    ranked = VectorIndex(db_path, TABLE, "m").search(vectors[0], 5)
+    assert 1 not in [row_id for row_id, _ in ranked]
+    assert len(ranked) == 4
+
+
+def test_model_tag_selects_rows_and_files(db_path):
+    rng = np.random.default_rng(5)
+    _insert(db_path, rng.normal(size=(3, DIMS)), model="old")
+
+    old = VectorIndex(db_path, TABLE, "old")
+    new = VectorIndex(db_path, TABLE, "new")
+
+    assert {row_id for row_id, _ in old.search(rng.normal(size=DIMS), 10)} == {1, 2, 3}
+    assert old.snapshot_path != new.snapshot_path
+
+
+def test_rows_under_another_model_tag_defer_to_caller(db_path):
+    rng = np.random.default_rng(7)
+    _insert(db_path, rng.normal(size=(3, DIMS)), model="old")
+    _insert(db_path, rng.normal(size=(2, DIMS)), model="new", start_id=4)
+    index = VectorIndex(db_path, TABLE, "new")
+
+    # Old rows are not in the index, so only a full scan can still find them.
+    assert index.search(rng.normal(size=DIMS), 10) is None
+    assert VectorIndex(db_path, TABLE, "new").search(rng.normal(size=DIMS), 10) is None
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"DELETE FROM {TABLE} WHERE embedding_model = 'old'")
+    conn.commit()
+    conn.close()
+
+    assert {row_id for row_id, _ in index.search(rng.normal(size=DIMS), 10)} == {4, 5}
+
+
+def test_dimension_mismatch_defers_to_caller(db_path):
+    _insert(db_path, [np.ones(DIMS)])
+    index = VectorIndex(db_path, TABLE, "m")
+    assert index.search(np.ones(DIMS + 1), 1) is None
+
+
+def test_log_is_compacted_into_snapshot(db_path, monkeypatch):
+    monkeypatch.setattr(vector_index, "COMPACT_LOG_RECORDS", 3)
+    rng = np.random.default_rng(6)
+    _insert(db_path, rng.normal(size=(2, DIMS)))
+    index = VectorIndex(db_path, TABLE, "m")
+    index.search(rng.normal(size=DIMS), 1)
+
+    extra = rng.normal(size=(3, DIMS))
+    _insert(db_path, extra, start_id=3)
+    for offset, vector in enumerate(extra):
+        index.add(3 + offset, vector)
+    assert index.log_path.stat().st_size > 0
+
+    index.search(extra[0], 1)
+    assert index.log_path.stat().st_size == 0
+    assert len(VectorIndex(db_path, TABLE, "m").search(extra[0], 10)) == 5
+
@@ -2,6 +2,7 @@ import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+from asky.archive_index import ArchiveIndex
 from asky.rendering import save_html_report, _create_html_content
 
 
@@ -69,11 +70,12 @@ def test_save_html_report():
             # Verify sidebar index
             index_path = archive_dir / "index.html"
             assert index_path.exists()
-            index_content = index_path.read_text()
-            assert "results/test_slug_20230101_120000.html" in index_content
-            assert "Test Slug Input" in index_content
-            assert '"session_name": "Test Session"' in index_content
-            assert '"prefix": "test slug input"' in index_content
+            assert "index_pages" in index_path.read_text()
+            page_content = (archive_dir / "index_pages" / "page_000000.js").read_text()
+            assert "results/test_slug_20230101_120000.html" in page_content
+            assert "Test Slug Input" in page_content
+            assert '"session_name": "Test Session"' in page_content
+            assert '"prefix": "test slug input"' in page_content
 
 
 def test_save_html_report_no_hint():
@@ -110,9 +112,8 @@ def test_save_html_report_no_hint():
             assert Path(path_str).name == expected_filename
 
             # Verify prefix in sidebar
-            index_path = archive_dir / "index.html"
-            index_content = index_path.read_text()
-            assert '"prefix": "test content"' in index_content
+            entries = ArchiveIndex(archive_dir).list_entries()
+            assert entries[0]["prefix"] == "test content"
 
 
 def test_sidebar_groups_and_sorting():
@@ -137,13 +138,7 @@ def test_sidebar_groups_and_sorting():
                 "slug_one_more_20230101_140000.html", "Title Three", "Session B"
             )
 
-            index_path = archive_dir / "index.html"
-
-            content = index_path.read_text()
-            marker_start = "/* ENTRIES_JSON_START */"
-            marker_end = "/* ENTRIES_JSON_END */"
-            json_str = content.split(marker_start)[1].split(marker_end)[0].strip()
-            entries = json.loads(json_str)
+            entries = ArchiveIndex(archive_dir).list_entries()
 
             assert len(entries) == 3
             # Most recent first
@@ -227,12 +222,7 @@ def test_save_html_report_session_deduplication():
             assert not Path(path_str1).exists()  # Old file should be deleted
             
             # Check sidebar entries
-            index_path = archive_dir / "index.html"
-            content = index_path.read_text()
-            marker_start = "/* ENTRIES_JSON_START */"
-            marker_end = "/* ENTRIES_JSON_END */"
-            json_str = content.split(marker_start)[1].split(marker_end)[0].strip()
-            entries = json.loads(json_str)
+            entries = ArchiveIndex(archive_dir).list_entries()
 
             assert len(entries) == 1
             assert entries[0]["session_id"] == 42
@@ -278,12 +268,7 @@ def test_save_html_report_deletes_all_superseded_session_snapshots():
             assert not (archive_dir / f2_name).exists()
 
             # Check sidebar entries
-            index_path = archive_dir / "index.html"
-            content = index_path.read_text()
-            marker_start = "/* ENTRIES_JSON_START */"
-            marker_end = "/* ENTRIES_JSON_END */"
-            json_str = content.split(marker_start)[1].split(marker_end)[0].strip()
-            new_entries = json.loads(json_str)
+            new_entries = ArchiveIndex(archive_dir).list_entries()
 
             # Should be exactly one entry for session 42, plus the other session's entry
             assert len(new_entries) == 2
@@ -314,13 +299,40 @@ def test_save_html_report_absorbs_converted_history():
             assert not Path(path_str1).exists()  # Single-turn report should be deleted
             
             # Check sidebar entries
-            index_path = archive_dir / "index.html"
-            content = index_path.read_text()
-            marker_start = "/* ENTRIES_JSON_START */"
-            marker_end = "/* ENTRIES_JSON_END */"
-            json_str = content.split(marker_start)[1].split(marker_end)[0].strip()
-            entries = json.loads(json_str)
+            entries = ArchiveIndex(archive_dir).list_entries()
 
             assert len(entries) == 1
             assert entries[0]["session_id"] == 42
             assert entries[0]["filename"] == f"results/{Path(path_str2).name}"
+
+
+def test_archive_index_rewrites_only_touched_pages(tmp_path: Path):
+    """Appends publish only the tail shard; superseding republishes the old shard."""
+    index = ArchiveIndex(tmp_path, page_size=2)
+    for i in range(5):
+        index.add_entry(
+            {"filename": f"results/r{i}.html", "title": f"R{i}", "session_id": 7 if i == 0 else None},
+        )
+    pages_dir = tmp_path / "index_pages"
+    assert sorted(p.name for p in pages_dir.glob("page_*.js")) == [
+        "page_000000.js",
+        "page_000001.js",
+        "page_000002.js",
+    ]
+    assert '"last_page": 2' in (pages_dir / "manifest.js").read_text()
+
+    first_page = pages_dir / "page_000000.js"
+    middle_page = pages_dir / "page_000001.js"
+    middle_mtime = middle_page.stat().st_mtime_ns
+
+    superseded = index.add_entry(
+        {"filename": "results/r5.html", "title": "R5", "session_id": 7}, session_id=7
+    )
+
+    assert superseded == ["results/r0.html"]
+    assert "r0.html" not in first_page.read_text()
+    assert middle_page.stat().st_mtime_ns == middle_mtime
+    assert [e["filename"] for e in index.list_entries(limit=2)] == [
+        "results/r5.html",
+        "results/r4.html",
+    ]
@@ -0,0 +1,41 @@
+import threading
+
+from asky import model_overrides
+from asky.model_overrides import model_overrides as override_models
+
+
+def test_overrides_apply_only_inside_block():
+    assert model_overrides.summarization_model("default") == "default"
+    with override_models(summarization_model="sum", interface_model="iface"):
+        assert model_overrides.summarization_model("default") == "sum"
+        assert model_overrides.interface_model("default") == "iface"
+        with override_models(summarization_model="inner"):
+            assert model_overrides.summarization_model("default") == "inner"
+            assert model_overrides.interface_model("default") == "iface"
+        assert model_overrides.summarization_model("default") == "sum"
+    assert model_overrides.summarization_model("default") == "default"
+    assert model_overrides.interface_model("default") == "default"
+
+
+def test_blank_override_keeps_default():
+    with override_models(summarization_model="  ", interface_model=None):
+        assert model_overrides.summarization_model("default") == "default"
+        assert model_overrides.interface_model("default") == "default"
+
+
+def test_concurrent_threads_do_not_share_overrides():
+    barrier = threading.Barrier(2)
+    seen = {}
+
+    def run(alias: str) -> None:
+        with override_models(summarization_model=alias):
+            barrier.wait(timeout=5)
+            seen[alias] = model_overrides.summarization_model("default")
+
+    threads = [threading.Thread(target=run, args=(alias,)) for alias in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert seen == {"a": "a", "b": "b"}
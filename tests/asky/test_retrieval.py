@@ -103,3 +103,250 @@ def test_format_portal_content_zone_sections():
     assert "[UK](https://example.com/uk)" in content
     assert "[Story](https://example.com/story)" in content
     assert "[About](https://example.com/about)" in content
+
+
+class _FakeResponse:
+    def __init__(self, status_code, text="", headers=None, url="https://example.com/a"):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = headers or {}
+        self.url = url
+
+    def raise_for_status(self):
+        return None
+
+
+@pytest.fixture
+def research_cache(tmp_path, monkeypatch):
+    from asky.research.cache import ResearchCache
+
+    ResearchCache._instance = None
+    cache = ResearchCache(db_path=str(tmp_path / "research.db"), ttl_hours=24)
+    monkeypatch.setattr("asky.retrieval._try_fetch_url_plugin_override", lambda **_: None)
+    yield cache
+    ResearchCache._instance = None
+
+
+def _expire(cache, cache_id):
+    import sqlite3
+
+    conn = sqlite3.connect(cache.db_path)
+    conn.execute(
+        "UPDATE research_cache SET expires_at = '2000-01-01T00:00:00' WHERE id = ?",
+        (cache_id,),
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_fetch_url_document_stores_validators_and_serves_fresh_rows(
+    research_cache, monkeypatch
+):
+    from asky.retrieval import fetch_url_document
+
+    calls = []
+
+    def fake_get(url, headers=None, timeout=None):
+        calls.append(headers)
+        return _FakeResponse(
+            200,
+            "<html><body><p>Hello cached world.</p></body></html>",
+            headers={"ETag": '"v1"', "Content-Type": "text/html"},
+        )
+
+    monkeypatch.setattr("asky.retrieval.requests.get", fake_get)
+
+    first = fetch_url_document("https://example.com/a", use_cache=True)
+    second = fetch_url_document("https://example.com/a", use_cache=True)
+
+    assert len(calls) == 1
+    assert first["cache_id"] == second["cache_id"]
+    assert second["source"] == "cache"
+    assert second["content"] == first["content"]
+    entry = research_cache.get_entry("https://example.com/a")
+    assert entry["etag"] == '"v1"'
+    assert entry["content_type"] == "text/html"
+
+
+def test_fetch_url_document_revalidates_stale_rows_with_304(research_cache, monkeypatch):
+    from asky.retrieval import fetch_url_document
+
+    cache_id = research_cache.cache_url(
+        url="https://example.com/a",
+        content="Cached body",
+        title="Cached",
+        links=[],
+        etag='"v1"',
+        last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+        output_format="markdown",
+    )
+    _expire(research_cache, cache_id)
+    sent_headers = {}
+
+    def fake_get(url, headers=None, timeout=None):
+        sent_headers.update(headers)
+        return _FakeResponse(304)
+
+    monkeypatch.setattr("asky.retrieval.requests.get", fake_get)
+    monkeypatch.setattr(
+        "asky.retrieval._extract_main_content",
+        lambda **_: pytest.fail("304 must not re-extract content"),
+    )
+
+    payload = fetch_url_document("https://example.com/a", use_cache=True)
+
+    assert sent_headers["If-None-Match"] == '"v1"'
+    assert sent_headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert payload["source"] == "cache_revalidated"
+    assert payload["content"] == "Cached body"
+    assert payload["cache_id"] == cache_id
+    assert research_cache.get_cached("https://example.com/a") is not None
+
+
+def test_fetch_url_document_without_cache_sends_no_validators(research_cache, monkeypatch):
+    from asky.retrieval import fetch_url_document
+
+    cache_id = research_cache.cache_url(
+        url="https://example.com/a", content="Cached", title="", links=[], etag='"v1"'
+    )
+    sent_headers = {}
+
+    def fake_get(url, headers=None, timeout=None):
+        sent_headers.update(headers)
+        return _FakeResponse(200, "<p>Fresh body text.</p>")
+
+    monkeypatch.setattr("asky.retrieval.requests.get", fake_get)
+
+    payload = fetch_url_document("https://example.com/a")
+
+    assert "If-None-Match" not in sent_headers
+    assert "cache_id" not in payload
+    assert research_cache.get_entry("https://example.com/a")["id"] == cache_id
+
+
+def test_fetch_url_document_cache_hits_follow_requested_shape(research_cache, monkeypatch):
+    from asky.retrieval import fetch_url_document
+
+    research_cache.cache_url(
+        url="https://example.com/a",
+        content="# Cached markdown",
+        title="Cached",
+        links=[{"text": "Next", "href": "https://example.com/next"}],
+        output_format="markdown",
+        page_type="portal",
+        published_date="2025-01-01",
+        links_included=True,
+    )
+    calls = []
+
+    def fake_get(url, headers=None, timeout=None):
+        calls.append(headers)
+        return _FakeResponse(200, "<p>Fresh plain body text.</p>")
+
+    monkeypatch.setattr("asky.retrieval.requests.get", fake_get)
+
+    hit = fetch_url_document("https://example.com/a", use_cache=True)
+    with_links = fetch_url_document(
+        "https://example.com/a", include_links=True, use_cache=True
+    )
+    assert calls == []
+    assert hit["links"] == []
+    assert hit["output_format"] == "markdown"
+    assert hit["page_type"] == "portal"
+    assert hit["date"] == "2025-01-01"
+    assert with_links["links"] == [{"text": "Next", "href": "https://example.com/next"}]
+
+    txt = fetch_url_document("https://example.com/a", output_format="txt", use_cache=True)
+    assert len(calls) == 1
+    assert "If-None-Match" not in calls[0]
+    assert txt["source"] != "cache"
+    assert txt["output_format"] == "txt"
+    assert research_cache.get_entry("https://example.com/a")["output_format"] == "txt"
+
+
+def test_fetch_url_document_refetches_rows_cached_without_links(research_cache, monkeypatch):
+    from asky.retrieval import fetch_url_document
+
+    research_cache.cache_url(
+        url="https://example.com/a",
+        content="Cached body",
+        title="",
+        links=[],
+        output_format="markdown",
+        links_included=False,
+    )
+    calls = []
+
+    def fake_get(url, headers=None, timeout=None):
+        calls.append(url)
+        return _FakeResponse(200, '<p>Body text.</p><a href="/next">Next</a>')
+
+    monkeypatch.setattr("asky.retrieval.requests.get", fake_get)
+
+    payload = fetch_url_document("https://example.com/a", include_links=True, use_cache=True)
+
+    assert calls == ["https://example.com/a"]
+    assert research_cache.get_entry("https://example.com/a")["links_included"] is True
+    assert payload["links"]
+
+
+def test_get_url_content_refetch_keeps_research_links(research_cache, monkeypatch):
+    import sqlite3
+
+    from asky.tools import fetch_single_url
+
+    links = [{"text": "Next", "href": "https://example.com/next"}]
+    cache_id = research_cache.cache_url(
+        url="https://example.com/a",
+        content="Research body",
+        title="",
+        links=links,
+        trigger_summarization=False,
+    )
+    conn = sqlite3.connect(research_cache.db_path)
+    conn.execute(
+        "INSERT INTO link_embeddings (cache_id, link_text, link_url, embedding, created_at) "
+        "VALUES (?, 'Next', 'https://example.com/next', x'00', '2025-01-01')",
+        (cache_id,),
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(
+        "asky.retrieval.requests.get",
+        lambda url, headers=None, timeout=None: _FakeResponse(200, "<p>Fresh body text.</p>"),
+    )
+
+    fetch_single_url("https://example.com/a")
+
+    assert research_cache.get_cached("https://example.com/a")["links"] == links
+    conn = sqlite3.connect(research_cache.db_path)
+    link_rows = conn.execute(
+        "SELECT COUNT(*) FROM link_embeddings WHERE cache_id = ?", (cache_id,)
+    ).fetchone()[0]
+    conn.close()
+    assert link_rows == 1
+
+
+def test_fetch_urls_in_order_runs_concurrently_and_keeps_order():
+    import threading
+    import time
+
+    from asky.retrieval import fetch_urls_in_order
+
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def fetch(url):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05 if url.endswith("a") else 0.01)
+        with lock:
+            active["now"] -= 1
+        return url.upper()
+
+    urls = ["https://x/a", "https://x/b", "https://x/c"]
+    assert fetch_urls_in_order(urls, fetch, max_workers=3) == [u.upper() for u in urls]
+    assert active["peak"] > 1
+    assert fetch_urls_in_order(urls, fetch, max_workers=1) == [u.upper() for u in urls]
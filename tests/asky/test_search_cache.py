@@ -0,0 +1,83 @@
+"""Tests for the persistent web search cache and provider pacing."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from asky.search_cache import ProviderRateLimiter, SearchResultCache
+
+
+def test_search_cache_normalizes_query_and_expires(tmp_path: Path):
+    now = [1000.0]
+    cache = SearchResultCache(
+        tmp_path / "search_cache.db", ttl_seconds=60, max_entries=10, clock=lambda: now[0]
+    )
+    cache.put("serper", "  Python   Asyncio ", 5, {"results": [{"url": "https://a"}]})
+
+    assert cache.get("SERPER", "python asyncio", 5) == {"results": [{"url": "https://a"}]}
+    assert cache.get("serper", "python asyncio", 6) is None
+    assert cache.get("tavily", "python asyncio", 5) is None
+
+    now[0] += 61
+    assert cache.get("serper", "python asyncio", 5) is None
+
+
+def test_search_cache_evicts_least_recently_used(tmp_path: Path):
+    now = [0.0]
+
+    def clock() -> float:
+        now[0] += 1
+        return now[0]
+
+    cache = SearchResultCache(
+        tmp_path / "search_cache.db", ttl_seconds=3600, max_entries=2, clock=clock
+    )
+    cache.put("searxng", "a", 5, {"results": [1]})
+    cache.put("searxng", "b", 5, {"results": [2]})
+    assert cache.get("searxng", "a", 5) is not None
+    cache.put("searxng", "c", 5, {"results": [3]})
+
+    assert cache.get("searxng", "b", 5) is None
+    assert cache.get("searxng", "a", 5) is not None
+    assert cache.get("searxng", "c", 5) is not None
+
+
+def test_provider_rate_limiter_reserves_spaced_slots():
+    sleeps = []
+    limiter = ProviderRateLimiter(2.0, clock=lambda: 10.0, sleep=sleeps.append)
+
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+
+    assert sleeps == [0.5, 1.0]
+
+
+@patch("asky.tools.SEARCH_PROVIDER", "serper")
+@patch("asky.tools._execute_serper_search")
+def test_execute_cached_web_search_skips_provider_on_hit(mock_serper):
+    from asky.tools import execute_cached_web_search
+
+    mock_serper.return_value = {"results": [{"url": "https://example.com"}]}
+
+    first, first_hit = execute_cached_web_search({"q": "Cache Me", "count": 3})
+    second, second_hit = execute_cached_web_search({"q": "cache  me", "count": 3})
+
+    assert (first_hit, second_hit) == (False, True)
+    assert second == first
+    assert mock_serper.call_count == 1
+
+
+@patch("asky.tools.SEARCH_PROVIDER", "serper")
+@patch("asky.tools._execute_serper_search")
+def test_execute_cached_web_search_does_not_cache_errors(mock_serper):
+    from asky.tools import execute_cached_web_search
+
+    mock_serper.return_value = {"error": "quota"}
+
+    execute_cached_web_search({"q": "broken", "count": 3})
+    _payload, hit = execute_cached_web_search({"q": "broken", "count": 3})
+
+    assert hit is False
+    assert mock_serper.call_count == 2
@@ -156,3 +156,41 @@ def test_negative_chunk_target_falls_back_to_input_limit(monkeypatch):
     resolved = summarization._resolve_hierarchical_chunk_target_chars()
 
     assert resolved == 2500
+
+
+def test_summarization_model_follows_request_override(monkeypatch):
+    """A scoped override picks the model without touching the global alias."""
+    from asky.model_overrides import model_overrides
+
+    monkeypatch.setattr(
+        summarization, "SUMMARIZATION_HIERARCHICAL_TRIGGER_CHARS", 10_000
+    )
+    monkeypatch.setattr(
+        summarization,
+        "MODELS",
+        {
+            "global": {"id": "global-id", "alias": "global"},
+            "profile": {"id": "profile-id", "alias": "profile"},
+        },
+    )
+    monkeypatch.setattr(summarization, "SUMMARIZATION_MODEL", "global")
+    seen = []
+
+    def fake_get_llm_msg(model_id, *_args, **_kwargs):
+        seen.append(model_id)
+        return {"content": "summary"}
+
+    def summarize():
+        summarization._summarize_content(
+            content="short text content",
+            prompt_template="Summarize.",
+            max_output_chars=120,
+            get_llm_msg_func=fake_get_llm_msg,
+        )
+
+    with model_overrides(summarization_model="profile"):
+        summarize()
+    summarize()
+
+    assert seen == ["profile-id", "global-id"]
+    assert summarization.SUMMARIZATION_MODEL == "global"
@@ -104,6 +104,34 @@ def test_execute_get_url_content_batch(mock_requests_get):
     assert len(result) == 2
 
 
+def test_execute_get_url_content_batch_fetches_concurrently_in_order():
+    import threading
+    import time
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_fetch(url, **_kwargs):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return {"error": None, "content": f"content of {url}"}
+
+    urls = [f"http://site{index}.com" for index in range(4)]
+    with (
+        patch("asky.tools.FETCH_MAX_CONCURRENCY", 2),
+        patch("asky.tools.fetch_url_document", side_effect=slow_fetch),
+    ):
+        result = execute_get_url_content({"urls": urls})
+
+    assert list(result) == urls
+    assert result["http://site3.com"] == "content of http://site3.com"
+    assert active["peak"] == 2
+
+
 def test_execute_get_url_content_rejects_local_targets(mock_requests_get):
     result = execute_get_url_content(
         {"urls": ["local:///tmp/file.txt", "/tmp/file.txt"]}
@@ -163,6 +191,80 @@ def test_execute_get_url_details_passes_trace_callback_to_retrieval(mock_request
     assert kwargs["trace_context"]["tool_name"] == "get_url_details"
 
 
+class _FakeHTTPResponse:
+    def __init__(self, status_code, text="", headers=None, url="https://example.com/a"):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = headers or {}
+        self.url = url
+
+    def raise_for_status(self):
+        return None
+
+
+@pytest.fixture
+def research_cache(tmp_path, monkeypatch):
+    from asky.research.cache import ResearchCache
+
+    ResearchCache._instance = None
+    cache = ResearchCache(db_path=str(tmp_path / "research.db"), ttl_hours=24)
+    monkeypatch.setattr("asky.retrieval._try_fetch_url_plugin_override", lambda **_: None)
+    yield cache
+    ResearchCache._instance = None
+
+
+def test_execute_get_url_content_serves_repeat_fetch_from_cache(
+    research_cache, monkeypatch
+):
+    calls = []
+
+    def fake_get(url, headers=None, timeout=None):
+        calls.append(url)
+        return _FakeHTTPResponse(200, "<html><body><p>Cached page body.</p></body></html>")
+
+    monkeypatch.setattr("asky.retrieval.requests.get", fake_get)
+
+    first = execute_get_url_content({"url": "https://example.com/a"})
+    second = execute_get_url_content({"url": "https://example.com/a"})
+
+    assert calls == ["https://example.com/a"]
+    assert "Cached page body." in first["https://example.com/a"]
+    assert second == first
+
+
+def test_execute_get_url_details_revalidates_stale_cache_row(research_cache, monkeypatch):
+    import sqlite3
+
+    responses = [
+        _FakeHTTPResponse(
+            200,
+            '<html><body><p>Linked page body.</p><a href="/next">Next</a></body></html>',
+            headers={"ETag": '"v1"'},
+        ),
+        _FakeHTTPResponse(304),
+    ]
+    sent_headers = []
+
+    def fake_get(url, headers=None, timeout=None):
+        sent_headers.append(dict(headers or {}))
+        return responses.pop(0)
+
+    monkeypatch.setattr("asky.retrieval.requests.get", fake_get)
+
+    first = execute_get_url_details({"url": "https://example.com/a"})
+    conn = sqlite3.connect(research_cache.db_path)
+    conn.execute("UPDATE research_cache SET expires_at = '2000-01-01T00:00:00'")
+    conn.commit()
+    conn.close()
+    second = execute_get_url_details({"url": "https://example.com/a"})
+
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert second["content"] == first["content"]
+    assert second["links"] == first["links"]
+
+
 def test_execute_get_url_details_rejects_local_target(mock_requests_get):
     result = execute_get_url_details({"url": "local:///tmp/file.txt"})
     assert "error" in result
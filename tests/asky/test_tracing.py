@@ -0,0 +1,188 @@
+"""Tests for span tracing and Chrome trace export."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from asky import tracing
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracing_state():
+    previous = tracing.install_process_recorder(None)
+    tracing.set_recent_trace_limit(tracing.DEFAULT_RECENT_TRACE_LIMIT)
+    yield
+    tracing.install_process_recorder(previous)
+
+
+def test_span_is_noop_without_recorder():
+    assert tracing.is_enabled() is False
+    with tracing.span("idle", "test") as active:
+        active.set(rows=3)
+    tracing.annotate(ignored=True)
+
+    @tracing.traced("decorated", category="test")
+    def _double(value):
+        return value * 2
+
+    assert _double(4) == 8
+    assert tracing.sqlite_connection_factory() is sqlite3.Connection
+
+
+def test_recording_collects_nested_spans_and_category_totals():
+    with tracing.recording(label="unit") as recorder:
+        with tracing.span("outer", "llm", model="m"):
+            with tracing.span("inner", "llm"):
+                tracing.annotate(tokens=12)
+            with tracing.span("tool.web_search", "tool"):
+                pass
+    assert tracing.is_enabled() is False
+
+    events = {event["name"]: event for event in recorder.events()}
+    assert set(events) == {"outer", "inner", "tool.web_search"}
+    assert events["outer"]["args"] == {"model": "m"}
+    assert events["inner"]["args"] == {"tokens": 12}
+    assert events["inner"]["ts"] >= events["outer"]["ts"]
+
+    summary = recorder.summary()
+    assert summary["label"] == "unit"
+    # The nested llm span must not be counted twice in the llm total.
+    assert summary["by_category_ms"]["llm"] == pytest.approx(
+        events["outer"]["dur"] / 1000.0, abs=0.01
+    )
+    assert set(summary["by_category_ms"]) == {"llm", "tool"}
+
+
+def test_span_records_exception_type():
+    with tracing.recording() as recorder:
+        with pytest.raises(ValueError):
+            with tracing.span("boom", "tool"):
+                raise ValueError("bad")
+    (event,) = recorder.events()
+    assert event["args"]["error"] == "ValueError"
+
+
+def test_bind_context_propagates_recorder_to_pool_threads():
+    def _work(index):
+        with tracing.span(f"job.{index}", "search"):
+            return threading.get_ident()
+
+    with tracing.recording() as recorder:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(tracing.bind_context(_work), range(4)))
+        # Unbound submissions do not see the context-local recorder.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(_work, 99).result()
+
+    names = sorted(event["name"] for event in recorder.events())
+    assert names == ["job.0", "job.1", "job.2", "job.3"]
+
+
+def test_process_recorder_is_visible_from_any_thread():
+    recorder = tracing.TraceRecorder(label="cli")
+    tracing.install_process_recorder(recorder)
+
+    def _background():
+        with tracing.span("bg", "embedding"):
+            pass
+
+    worker = threading.Thread(target=_background)
+    worker.start()
+    worker.join()
+    tracing.install_process_recorder(None)
+
+    (event,) = recorder.events()
+    assert event["tid"] == worker.ident
+
+
+def test_chrome_trace_export_and_write(tmp_path):
+    with tracing.recording(label="export") as recorder:
+        with tracing.span("turn", "turn"):
+            pass
+
+    path = recorder.write(tmp_path / "nested" / "trace.json")
+    payload = json.loads(path.read_text(encoding="utf-8"))
+
+    phases = [event["ph"] for event in payload["traceEvents"]]
+    assert phases[0] == "M"
+    assert "X" in phases
+    assert payload["displayTimeUnit"] == "ms"
+    assert payload["otherData"]["label"] == "export"
+    assert payload["otherData"]["events"] == 1
+
+
+def test_max_events_drops_but_keeps_totals():
+    recorder = tracing.TraceRecorder(max_events=2)
+    with tracing.recording(recorder):
+        for index in range(5):
+            with tracing.span(f"s{index}", "sqlite"):
+                pass
+    assert len(recorder.events()) == 2
+    assert recorder.dropped_events == 3
+    assert "sqlite" in recorder.summary()["by_category_ms"]
+
+
+def test_sqlite_factory_traces_statements(tmp_path):
+    with tracing.recording() as recorder:
+        conn = sqlite3.connect(
+            tmp_path / "db.sqlite", factory=tracing.sqlite_connection_factory()
+        )
+        conn.execute("CREATE TABLE items (value TEXT)")
+        cursor = conn.cursor()
+        cursor.executemany("INSERT INTO items VALUES (?)", [("a",), ("b",)])
+        conn.commit()
+        conn.close()
+
+    names = [event["name"] for event in recorder.events()]
+    assert names == ["sqlite.execute", "sqlite.executemany", "sqlite.commit"]
+    assert recorder.events()[0]["args"]["sql"] == "CREATE TABLE items (value TEXT)"
+
+
+def test_sqlite_connection_shortcuts_record_one_span_each(tmp_path):
+    with tracing.recording() as recorder:
+        conn = sqlite3.connect(
+            tmp_path / "db.sqlite", factory=tracing.sqlite_connection_factory()
+        )
+        conn.executescript("CREATE TABLE items (value TEXT);")
+        conn.executemany("INSERT INTO items VALUES (?)", [("a",), ("b",)])
+        rows = conn.execute("SELECT value FROM items ORDER BY value").fetchall()
+        conn.close()
+
+    assert rows == [("a",), ("b",)]
+    assert [event["name"] for event in recorder.events()] == [
+        "sqlite.executescript",
+        "sqlite.executemany",
+        "sqlite.execute",
+    ]
+
+
+def test_trace_collection_wraps_data_methods_only():
+    class _Collection:
+        name = "findings"
+
+        def query(self, **kwargs):
+            return kwargs
+
+    raw = _Collection()
+    assert tracing.trace_collection(raw, "findings") is raw
+
+    with tracing.recording() as recorder:
+        wrapped = tracing.trace_collection(raw, "findings")
+        assert wrapped.name == "findings"
+        assert wrapped.query(n_results=3) == {"n_results": 3}
+
+    (event,) = recorder.events()
+    assert event["name"] == "chroma.query"
+    assert event["args"] == {"collection": "findings"}
+
+
+def test_recent_traces_are_bounded_newest_first():
+    tracing.set_recent_trace_limit(2)
+    for label in ("a", "b", "c"):
+        tracing.remember_trace(tracing.TraceRecorder(label=label))
+    assert [trace.label for trace in tracing.recent_traces()] == ["c", "b"]
@@ -14,6 +14,7 @@ PUBLIC_TOP_LEVEL_FLAGS = {
     "-ps", "--print-session",
     "-p", "--prompts",
     "-v", "--verbose",
+    "--trace-out",
     "-o", "--open",
     "-cc", "--copy-clipboard",
     "-ss", "--sticky-session",
@@ -33,6 +34,7 @@ PUBLIC_TOP_LEVEL_FLAGS = {
     "--query-corpus",
     "--query-corpus-max-sources",
     "--query-corpus-max-chunks",
+    "--compact-corpus",
     "--summarize-section",
     "--section-source",
     "--section-id",
@@ -68,6 +70,7 @@ GROUPED_COMMANDS = {
     "memory clear",
     "corpus query",
     "corpus summarize",
+    "corpus compact",
     "prompts list",
 }
 
@@ -147,6 +150,7 @@ COVERAGE_OWNERSHIP = {
     "--turns": "test_cli_chat_controls_recorded.py",
     "-v": "test_cli_chat_controls_recorded.py",
     "--verbose": "test_cli_chat_controls_recorded.py",
+    "--trace-out": "test_cli_chat_controls_recorded.py",
     "-o": "test_cli_chat_controls_recorded.py",
     "--open": "test_cli_chat_controls_recorded.py",
     "-cc": "test_cli_chat_controls_recorded.py",
@@ -218,6 +222,8 @@ COVERAGE_OWNERSHIP = {
     "--section-max-chunks": "test_cli_research_local_recorded.py",
     "corpus query": "test_cli_research_local_recorded.py",
     "corpus summarize": "test_cli_research_local_recorded.py",
+    "--compact-corpus": "test_cli_research_local_recorded.py",
+    "corpus compact": "test_cli_research_local_recorded.py",
 
     "--list-memories": "test_cli_memory_surface_recorded.py",
     "--delete-memory": "test_cli_memory_surface_recorded.py",
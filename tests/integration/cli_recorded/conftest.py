@@ -486,7 +486,12 @@ def recorded_cli_environment(
     def _fake_embed_single(self, text):
         return [0.0] * 8
 
+    def _fake_embed_array(self, texts):
+        rows = _fake_embed(self, texts)
+        return embeddings_mod.np.asarray(rows, dtype=embeddings_mod.EMBEDDING_DTYPE)
+
     monkeypatch.setattr(embeddings_mod.EmbeddingClient, "embed", _fake_embed)
+    monkeypatch.setattr(embeddings_mod.EmbeddingClient, "embed_array", _fake_embed_array)
     monkeypatch.setattr(
         embeddings_mod.EmbeddingClient, "embed_single", _fake_embed_single
     )
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from unittest.mock import patch
 
@@ -134,6 +136,18 @@ def test_chat_control_verbose():
     assert "main model" in normalize_cli_output(result_vv.stdout).lower()
 
 
+def test_chat_control_trace_out(tmp_path):
+    """Test --trace-out writes a Chrome trace document."""
+    trace_path = tmp_path / "trace.json"
+    result = run_cli_inprocess(["--trace-out", str(trace_path), "-off", "all", "--shortlist", "off", "Just say apple."])
+    assert result.exit_code == 0
+    assert "trace written to" in normalize_cli_output(result.stderr).lower()
+    payload = json.loads(trace_path.read_text(encoding="utf-8"))
+    span_names = {event["name"] for event in payload["traceEvents"] if event["ph"] == "X"}
+    assert {"turn", "llm.request"} <= span_names
+    assert payload["otherData"]["by_category_ms"]["llm"] > 0
+
+
 def test_chat_control_completion_script():
     """Test --completion-script flag."""
     result = run_cli_inprocess(["--completion-script", "bash"])
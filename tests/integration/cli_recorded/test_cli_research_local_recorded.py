@@ -177,3 +177,16 @@ def test_corpus_summarize_exhaustive(local_research_corpus):
     result_grouped = run_cli_inprocess(["corpus", "summarize", "--section-source", "alpha_overview.md"])
     assert result_grouped.exit_code == 0
 
+
+
+def test_corpus_compact_reports_storage_stats(local_research_corpus):
+    """Grouped `corpus compact` and --compact-corpus should both compact the cache."""
+    run_cli_inprocess(["-r", str(local_research_corpus), "Warm up."])
+
+    result = run_cli_inprocess(["corpus", "compact"])
+    assert result.exit_code == 0
+    assert "corpus compacted" in normalize_cli_output(result.stdout).lower()
+
+    result2 = run_cli_inprocess(["--compact-corpus"])
+    assert result2.exit_code == 0
+    assert "reclaimed" in normalize_cli_output(result2.stdout).lower()
@@ -0,0 +1,105 @@
+"""Offline benchmark lane fixtures: sandboxed home, fixture server, JSON results.
+
+Results are written once per session to `$ASKY_BENCHMARK_OUTPUT` or
+`temp/benchmarks/<commit>_<timestamp>.json`; compare two result files with
+`scripts/compare_benchmarks.py`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from tests.performance.benchmarks.helpers import (
+    BENCHMARK_OUTPUT_ENV,
+    BenchmarkRecorder,
+    FixtureServer,
+    default_output_path,
+    fake_embedding,
+    write_benchmark_config,
+)
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if "tests/performance/benchmarks/" in str(item.fspath).replace("\\", "/"):
+            item.add_marker(pytest.mark.benchmark)
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder():
+    recorder = BenchmarkRecorder()
+    yield recorder
+    if not recorder.results:
+        return
+    raw_path = os.environ.get(BENCHMARK_OUTPUT_ENV, "").strip()
+    output_path = Path(raw_path).expanduser() if raw_path else default_output_path()
+    recorder.write(output_path)
+    print(f"\nBenchmark results written to {output_path}")
+
+
+@pytest.fixture(scope="session")
+def fixture_server():
+    server = FixtureServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=1.0)
+
+
+@pytest.fixture
+def benchmark_home(
+    request: pytest.FixtureRequest,
+    test_home_root: Path,
+    fixture_server: FixtureServer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Path:
+    """Fresh sandbox home wired to the fixture server, with runtime modules reloaded."""
+    from tests.integration.cli_recorded.helpers import (
+        _reload_runtime_modules,
+        _reset_stateful_runtime,
+    )
+
+    digest = hashlib.sha1(request.node.nodeid.encode("utf-8")).hexdigest()[:12]
+    home = test_home_root / f"benchmark-{digest}"
+    if home.exists():
+        shutil.rmtree(home)
+    config_dir = home / ".config" / "asky"
+    write_benchmark_config(config_dir, fixture_server)
+
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("ASKY_HOME", str(config_dir))
+    monkeypatch.setenv("ASKY_DB_PATH", str(home / "history.db"))
+    monkeypatch.setattr("pathlib.Path.home", lambda: home)
+
+    import asky.research.chunker as chunker_mod
+    import asky.research.embeddings as embeddings_mod
+
+    def _embed(self, texts):
+        return [fake_embedding(text) for text in texts]
+
+    def _embed_array(self, texts):
+        return embeddings_mod.np.asarray(
+            _embed(self, texts), dtype=embeddings_mod.EMBEDDING_DTYPE
+        )
+
+    monkeypatch.setattr(embeddings_mod.EmbeddingClient, "embed", _embed)
+    monkeypatch.setattr(embeddings_mod.EmbeddingClient, "embed_array", _embed_array)
+    monkeypatch.setattr(
+        embeddings_mod.EmbeddingClient, "embed_single", lambda self, text: fake_embedding(text)
+    )
+    monkeypatch.setattr(embeddings_mod.EmbeddingClient, "is_available", lambda self: True)
+    monkeypatch.setattr(chunker_mod, "_get_embedding_tokenizer", lambda: (None, 0))
+
+    _reset_stateful_runtime()
+    modules = _reload_runtime_modules()
+    modules["asky.storage"].init_db()
+    yield home
+    _reset_stateful_runtime()
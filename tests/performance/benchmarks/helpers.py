@@ -0,0 +1,309 @@
+"""Shared helpers for the offline benchmark lane.
+
+LLM responses are replayed from JSON cassettes in `cassettes/` by a local
+OpenAI-compatible endpoint; SearXNG search results and web pages come from
+the same server. Nothing leaves the machine, so timings reflect asky itself.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+CASSETTE_DIR = Path(__file__).resolve().parent / "cassettes"
+RESEARCH_FIXTURE_ROOT = PROJECT_ROOT / "tests" / "fixtures" / "research_corpus"
+WEB_PAGE_SOURCE_DIR = RESEARCH_FIXTURE_ROOT / "subject_awareness_v1"
+BENCHMARK_OUTPUT_ENV = "ASKY_BENCHMARK_OUTPUT"
+DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "temp" / "benchmarks"
+RESULT_SCHEMA_VERSION = 1
+FAKE_EMBEDDING_DIM = 384
+FAKE_MODEL_ALIAS = "gf"
+
+
+def fake_embedding(text: str, dim: int = FAKE_EMBEDDING_DIM) -> List[float]:
+    """Deterministic unit vector derived from the text's token hashes."""
+    vector = [0.0] * dim
+    for token in str(text).lower().split():
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+        index = int.from_bytes(digest[:4], "little") % dim
+        vector[index] += 1.0 if digest[4] & 1 else -1.0
+    norm = sum(value * value for value in vector) ** 0.5 or 1.0
+    return [value / norm for value in vector]
+
+
+def _git_metadata() -> Dict[str, Any]:
+    def _git(*args: str) -> str:
+        try:
+            return subprocess.check_output(
+                ["git", *args], cwd=PROJECT_ROOT, text=True, stderr=subprocess.DEVNULL
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+class BenchmarkRecorder:
+    """Collects timing samples and writes them as one JSON document."""
+
+    def __init__(self) -> None:
+        self.results: List[Dict[str, Any]] = []
+
+    def measure(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        *,
+        repeat: int = 5,
+        warmup: int = 1,
+        setup: Optional[Callable[[], None]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Time `fn` `repeat` times after `warmup` runs; `setup` runs untimed before each."""
+        result = None
+        for _ in range(warmup):
+            if setup is not None:
+                setup()
+            result = fn()
+        samples_ms: List[float] = []
+        for _ in range(max(1, repeat)):
+            if setup is not None:
+                setup()
+            started = time.perf_counter()
+            result = fn()
+            samples_ms.append((time.perf_counter() - started) * 1000.0)
+        self.record(name, samples_ms, params=params)
+        return result
+
+    def record(
+        self,
+        name: str,
+        samples_ms: List[float],
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        ordered = sorted(samples_ms)
+        entry: Dict[str, Any] = {
+            "name": name,
+            "params": dict(params or {}),
+            "samples_ms": [round(sample, 3) for sample in samples_ms],
+            "median_ms": statistics.median(ordered),
+            "mean_ms": statistics.fmean(ordered),
+            "min_ms": ordered[0],
+            "max_ms": ordered[-1],
+        }
+        if extra:
+            entry["extra"] = extra
+        self.results.append(entry)
+
+    def write(self, path: Path) -> None:
+        payload = {
+            "schema_version": RESULT_SCHEMA_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git": _git_metadata(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "results": self.results,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def default_output_path() -> Path:
+    commit = _git_metadata()["commit"][:12] or "nogit"
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    return DEFAULT_OUTPUT_DIR / f"{commit}_{stamp}.json"
+
+
+def load_cassette(name: str) -> Dict[str, Any]:
+    return json.loads((CASSETTE_DIR / f"{name}.json").read_text(encoding="utf-8"))
+
+
+def _substitute(value: Any, base_url: str) -> Any:
+    if isinstance(value, str):
+        return value.replace("{base_url}", base_url)
+    if isinstance(value, list):
+        return [_substitute(item, base_url) for item in value]
+    if isinstance(value, dict):
+        return {key: _substitute(item, base_url) for key, item in value.items()}
+    return value
+
+
+def _render_page(source: Path) -> str:
+    paragraphs = [
+        block.strip()
+        for block in source.read_text(encoding="utf-8").split("\n\n")
+        if block.strip()
+    ]
+    body = "\n".join(f"<p>{html.escape(block)}</p>" for block in paragraphs)
+    title = html.escape(source.stem.replace("_", " ").title())
+    return (
+        f"<html><head><title>{title}</title></head>"
+        f"<body><article><h1>{title}</h1>\n{body}</article></body></html>"
+    )
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    server: "FixtureServer"
+
+    def log_message(self, fmt, *args):
+        return
+
+    def _send(self, status: int, body: str, content_type: str) -> None:
+        encoded = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def do_GET(self):
+        parsed = urlsplit(self.path)
+        self.server.log_request_path("GET", parsed.path)
+        if parsed.path == "/search":
+            query = parse_qs(parsed.query).get("q", [""])[0]
+            self._send(200, json.dumps(self.server.search_payload(query)), "application/json")
+            return
+        if parsed.path.startswith("/pages/"):
+            page = self.server.pages.get(parsed.path[len("/pages/") :])
+            if page is not None:
+                self._send(200, page, "text/html; charset=utf-8")
+                return
+        self._send(404, "not found", "text/plain")
+
+    def do_POST(self):
+        parsed = urlsplit(self.path)
+        self.server.log_request_path("POST", parsed.path)
+        if parsed.path != "/v1/chat/completions":
+            self._send(404, "not found", "text/plain")
+            return
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length).decode("utf-8") or "{}")
+        message = self.server.chat_reply(payload)
+        response = {
+            "id": "chatcmpl-benchmark",
+            "object": "chat.completion",
+            "created": 1704110400,
+            "model": payload.get("model", "fake-model"),
+            "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+        }
+        self._send(200, json.dumps(response), "application/json")
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """Local stand-in for the LLM provider, SearXNG and the fetched web pages."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _FixtureHandler)
+        host, port = self.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+        self.llm_url = f"{self.base_url}/v1/chat/completions"
+        self.pages: Dict[str, str] = {
+            source.stem: _render_page(source)
+            for source in sorted(WEB_PAGE_SOURCE_DIR.iterdir())
+            if source.suffix in {".md", ".txt"}
+        }
+        self.requests: List[tuple] = []
+        self._lock = threading.Lock()
+        self._cassette: Dict[str, Any] = {}
+
+    def use_cassette(self, name: str) -> None:
+        with self._lock:
+            self._cassette = _substitute(load_cassette(name), self.base_url)
+            self.requests.clear()
+
+    def log_request_path(self, method: str, path: str) -> None:
+        with self._lock:
+            self.requests.append((method, path))
+
+    def search_payload(self, query: str) -> Dict[str, Any]:
+        results = self._cassette.get("search_results") or [
+            {"title": slug.replace("_", " "), "url": f"{self.base_url}/pages/{slug}", "content": ""}
+            for slug in self.pages
+        ]
+        return {"query": query, "results": results}
+
+    def chat_reply(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the message of the first cassette rule matching the request."""
+        messages = payload.get("messages") or []
+        has_tools = bool(payload.get("tools"))
+        tool_messages = sum(1 for item in messages if item.get("role") == "tool")
+        last_user = next(
+            (str(item.get("content") or "") for item in reversed(messages) if item.get("role") == "user"),
+            "",
+        ).lower()
+        for rule in self._cassette.get("chat", []):
+            match = rule.get("match", {})
+            if "tools" in match and bool(match["tools"]) != has_tools:
+                continue
+            if "tool_messages" in match and int(match["tool_messages"]) != tool_messages:
+                continue
+            if "user_contains" in match and str(match["user_contains"]).lower() not in last_user:
+                continue
+            return dict(rule["message"])
+        return {"role": "assistant", "content": "ok"}
+
+
+def write_benchmark_config(config_dir: Path, server: FixtureServer) -> None:
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / "general.toml").write_text(
+        "[general]\n"
+        f'default_model = "{FAKE_MODEL_ALIAS}"\n'
+        f'summarization_model = "{FAKE_MODEL_ALIAS}"\n'
+        'interface_model = ""\n'
+        f'searxng_url = "{server.base_url}"\n'
+        'search_provider = "searxng"\n'
+        "\n"
+        "[limits]\n"
+        "max_retries = 1\n"
+        "initial_backoff = 0\n"
+        "\n"
+        "[search_cache]\n"
+        "enabled = false\n",
+        encoding="utf-8",
+    )
+    (config_dir / "models.toml").write_text(
+        f"[models.{FAKE_MODEL_ALIAS}]\n"
+        'id = "fake/benchmark"\n'
+        'api = "fixture"\n'
+        "context_size = 32000\n",
+        encoding="utf-8",
+    )
+    (config_dir / "api.toml").write_text(
+        "[api.fixture]\n"
+        f'url = "{server.llm_url}"\n'
+        'api_key = "fake-key"\n',
+        encoding="utf-8",
+    )
+    (config_dir / "research.toml").write_text(
+        "[research]\n"
+        "enabled = true\n"
+        f'local_document_roots = ["{RESEARCH_FIXTURE_ROOT}"]\n'
+        "allow_absolute_paths_outside_roots = true\n"
+        "\n"
+        "[research.chromadb]\n"
+        f'persist_directory = "{config_dir / "chromadb"}"\n',
+        encoding="utf-8",
+    )
+    for name in ("prompts.toml", "user.toml", "memory.toml", "xmpp.toml", "plugins.toml"):
+        (config_dir / name).write_text("", encoding="utf-8")
@@ -0,0 +1,49 @@
+"""Local corpus ingestion benchmarks over tests/fixtures/research_corpus."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.performance.benchmarks.helpers import RESEARCH_FIXTURE_ROOT, WEB_PAGE_SOURCE_DIR
+
+pytestmark = pytest.mark.benchmark
+
+INGESTION_REPEAT = 3
+CORPUS_TARGETS = {
+    "subject_awareness_v1": [WEB_PAGE_SOURCE_DIR],
+    "udhr_pdf": [RESEARCH_FIXTURE_ROOT / "UDHR.pdf"],
+    "sqlite_epub": [RESEARCH_FIXTURE_ROOT / "sqlite-documentation.epub"],
+}
+
+
+def _fresh_research_store() -> None:
+    """Drop cached sources so every sample ingests from scratch."""
+    from asky.research.cache import ResearchCache
+
+    conn = ResearchCache()._get_conn()
+    try:
+        conn.execute("DELETE FROM content_chunks")
+        conn.execute("DELETE FROM research_cache")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("corpus", sorted(CORPUS_TARGETS))
+def test_local_corpus_ingestion(corpus, benchmark_home, benchmark_recorder):
+    from asky.cli.local_ingestion_flow import preload_local_research_sources
+
+    targets = [str(path) for path in CORPUS_TARGETS[corpus]]
+    payload = benchmark_recorder.measure(
+        "ingestion.local_corpus",
+        lambda: preload_local_research_sources(
+            "benchmark ingestion", explicit_targets=targets
+        ),
+        repeat=INGESTION_REPEAT,
+        setup=_fresh_research_store,
+        params={"corpus": corpus},
+    )
+
+    assert payload["warnings"] == []
+    assert payload["stats"]["processed_documents"] > 0
+    assert payload["stats"]["indexed_chunks"] > 0
@@ -0,0 +1,104 @@
+"""History and session listing benchmarks against a large seeded database."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+SEEDED_SESSIONS = 5_000
+SEEDED_TURNS = 50_000
+LIST_LIMIT = 50
+LISTING_REPEAT = 10
+SEED_START = datetime(2025, 1, 1)
+
+
+def _seed_history(db_path) -> None:
+    """Insert sessions and user/assistant message pairs directly via SQL."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executemany(
+            "INSERT INTO sessions (name, model, created_at, last_used_at) VALUES (?, ?, ?, ?)",
+            (
+                (
+                    f"bench-session-{index}",
+                    "gf",
+                    (SEED_START + timedelta(minutes=index)).isoformat(),
+                    (SEED_START + timedelta(minutes=index + 1)).isoformat(),
+                )
+                for index in range(SEEDED_SESSIONS)
+            ),
+        )
+        rows = []
+        for turn in range(SEEDED_TURNS):
+            stamp = (SEED_START + timedelta(seconds=turn * 30)).isoformat()
+            session_id = (turn % SEEDED_SESSIONS) + 1 if turn % 2 else None
+            rows.append(
+                (stamp, session_id, "user", f"Benchmark question {turn} about latency budgets", None, "gf", 12)
+            )
+            rows.append(
+                (stamp, session_id, "assistant", f"Benchmark answer {turn}. " * 20, f"Answer {turn}", "gf", 80)
+            )
+        conn.executemany(
+            "INSERT INTO messages (timestamp, session_id, role, content, summary, model, token_count) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _quiet(fn):
+    def _run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+
+    return _run
+
+
+def test_history_listing_on_large_db(benchmark_home, benchmark_recorder):
+    from asky import storage
+    from asky.cli.history import show_history_command
+    from asky.cli.sessions import show_session_history_command
+    from asky.config import DB_PATH
+
+    _seed_history(DB_PATH)
+    params = {
+        "messages": SEEDED_TURNS * 2,
+        "sessions": SEEDED_SESSIONS,
+        "limit": LIST_LIMIT,
+    }
+
+    history = benchmark_recorder.measure(
+        "history.get_history",
+        lambda: storage.get_history(LIST_LIMIT),
+        repeat=LISTING_REPEAT,
+        params=params,
+    )
+    sessions = benchmark_recorder.measure(
+        "history.list_sessions",
+        lambda: storage.list_sessions(LIST_LIMIT),
+        repeat=LISTING_REPEAT,
+        params=params,
+    )
+    benchmark_recorder.measure(
+        "history.cli_history_table",
+        _quiet(lambda: show_history_command(LIST_LIMIT)),
+        repeat=LISTING_REPEAT,
+        params=params,
+    )
+    benchmark_recorder.measure(
+        "history.cli_session_table",
+        _quiet(lambda: show_session_history_command(LIST_LIMIT)),
+        repeat=LISTING_REPEAT,
+        params=params,
+    )
+
+    assert len(history) == LIST_LIMIT
+    assert len(sessions) == LIST_LIMIT
@@ -0,0 +1,92 @@
+"""Research turn benchmarks: web shortlist + tool loop, and local corpus preload."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.performance.benchmarks.helpers import FAKE_MODEL_ALIAS, WEB_PAGE_SOURCE_DIR
+
+pytestmark = pytest.mark.benchmark
+
+TURN_REPEAT = 3
+WEB_QUERY = "What is the Alpha objective for latency?"
+LOCAL_QUERY = "What does the Alpha objective say about latency?"
+EXPECTED_ANSWER_FRAGMENT = "p95 response latency"
+
+
+def _client():
+    from asky.api import AskyClient, AskyConfig
+
+    return AskyClient(AskyConfig(model_alias=FAKE_MODEL_ALIAS, research_mode=True))
+
+
+def test_research_turn_web_shortlist_and_tool_loop(
+    benchmark_home, fixture_server, benchmark_recorder
+):
+    from asky.api import AskyTurnRequest
+
+    fixture_server.use_cassette("research_turn")
+    client = _client()
+    request = AskyTurnRequest(
+        query_text=WEB_QUERY,
+        shortlist_override="on",
+        save_history=False,
+    )
+    shortlist_ms = []
+
+    def _turn():
+        result = client.run_turn(request)
+        shortlist_ms.append(result.preload.shortlist_elapsed_ms)
+        return result
+
+    result = benchmark_recorder.measure(
+        "research_turn.web", _turn, repeat=TURN_REPEAT, params={"shortlist": "on"}
+    )
+
+    assert EXPECTED_ANSWER_FRAGMENT in result.final_answer
+    assert result.preload.shortlist_enabled is True
+    paths = {path for _method, path in fixture_server.requests}
+    assert "/search" in paths
+    assert "/pages/alpha_overview" in paths
+    benchmark_recorder.record(
+        "research_turn.web.shortlist",
+        shortlist_ms[-TURN_REPEAT:], params={"shortlist": "on"}
+    )
+
+
+def test_research_turn_local_corpus_preload(
+    benchmark_home, fixture_server, benchmark_recorder
+):
+    from asky.api import AskyTurnRequest
+
+    fixture_server.use_cassette("research_turn")
+    client = _client()
+    request = AskyTurnRequest(
+        query_text=LOCAL_QUERY,
+        local_corpus_paths=[str(WEB_PAGE_SOURCE_DIR)],
+        save_history=False,
+    )
+    local_ms = []
+
+    def _turn():
+        result = client.run_turn(request)
+        local_ms.append(result.preload.local_elapsed_ms)
+        return result
+
+    result = benchmark_recorder.measure(
+        "research_turn.local",
+        _turn,
+        repeat=TURN_REPEAT,
+        params={"corpus": "subject_awareness_v1"},
+    )
+
+    assert EXPECTED_ANSWER_FRAGMENT in result.final_answer
+    stats = result.preload.local_payload["stats"]
+    assert stats["processed_documents"] > 0
+    assert not any(path == "/search" for _method, path in fixture_server.requests)
+    benchmark_recorder.record(
+        "research_turn.local.preload",
+        local_ms[-TURN_REPEAT:],
+        params={"corpus": "subject_awareness_v1"},
+        extra={"indexed_chunks": stats["indexed_chunks"]},
+    )
@@ -0,0 +1,82 @@
+"""Chunk retrieval benchmarks at increasing corpus sizes (SQLite vector path)."""
+
+from __future__ import annotations
+
+import os
+import random
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+VECTOR_SIZES_ENV = "ASKY_BENCHMARK_VECTOR_SIZES"
+DEFAULT_VECTOR_SIZES = (1_000, 10_000, 100_000)
+SEARCH_REPEAT = 5
+SEARCH_TOP_K = 10
+SEARCH_QUERY = "latency objective incident budget"
+VOCABULARY = (
+    "alpha beta latency objective incident budget vendor risk release "
+    "appendix rollout cache index shard retry timeout throughput owner "
+    "milestone review queue schema migration metric baseline target"
+).split()
+WORDS_PER_CHUNK = 40
+
+
+def _vector_sizes() -> list[int]:
+    raw = os.environ.get(VECTOR_SIZES_ENV, "").strip()
+    if not raw:
+        return list(DEFAULT_VECTOR_SIZES)
+    return [int(part) for part in raw.split(",") if part.strip()]
+
+
+def _seed_chunks(chunk_count: int) -> int:
+    """Cache one synthetic source with `chunk_count` embedded chunks."""
+    from asky.research.cache import ResearchCache
+    from asky.research.vector_store import get_vector_store
+
+    rng = random.Random(chunk_count)
+    chunks = [
+        (index, " ".join(rng.choices(VOCABULARY, k=WORDS_PER_CHUNK)))
+        for index in range(chunk_count)
+    ]
+    cache_id = ResearchCache().cache_url(
+        url=f"https://bench.invalid/chunks/{chunk_count}",
+        content="\n\n".join(text for _index, text in chunks),
+        title=f"Synthetic corpus ({chunk_count} chunks)",
+        links=[],
+        trigger_summarization=False,
+    )
+    store = get_vector_store()
+    # Chroma timings depend on its own index; this lane measures the SQLite scan.
+    store._chroma_disabled = True
+    stored = store.store_chunk_embeddings(cache_id, chunks)
+    assert stored == chunk_count
+    return cache_id
+
+
+@pytest.mark.parametrize("chunk_count", _vector_sizes())
+def test_chunk_search(chunk_count, benchmark_home, benchmark_recorder):
+    from asky.research.vector_store import get_vector_store
+
+    cache_id = _seed_chunks(chunk_count)
+    store = get_vector_store()
+    query_embedding = store.embedding_client.embed_single(SEARCH_QUERY)
+    params = {"chunks": chunk_count, "top_k": SEARCH_TOP_K}
+
+    dense = benchmark_recorder.measure(
+        "vector_search.dense",
+        lambda: store._search_chunks_with_sqlite(
+            cache_id, query_embedding, SEARCH_TOP_K
+        ),
+        repeat=SEARCH_REPEAT,
+        params=params,
+    )
+    hybrid = benchmark_recorder.measure(
+        "vector_search.hybrid",
+        lambda: store.search_chunks_hybrid(cache_id, SEARCH_QUERY, top_k=SEARCH_TOP_K),
+        repeat=SEARCH_REPEAT,
+        params=params,
+    )
+
+    assert len(dense) == SEARCH_TOP_K
+    assert len(hybrid) == SEARCH_TOP_K
@@ -0,0 +1,58 @@
+"""XMPP daemon command-path benchmarks through the real router and executor."""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+COMMAND_REPEAT = 5
+BENCH_JID = "bench@example.com/resource"
+COMMAND_BODIES = {
+    "history": "--history 5",
+    "session_new": "/session new",
+    "query": "Summarize the latency objective in one sentence.",
+}
+
+
+def _build_router():
+    # The daemon modules bind config values at import; reload them against the
+    # sandbox config written by `benchmark_home`.
+    executor_mod = importlib.reload(
+        importlib.import_module("asky.plugins.xmpp_daemon.command_executor")
+    )
+    router_mod = importlib.reload(importlib.import_module("asky.plugins.xmpp_daemon.router"))
+    from asky.daemon.interface_planner import InterfacePlanner
+    from asky.plugins.xmpp_daemon.transcript_manager import TranscriptManager
+
+    transcript_manager = TranscriptManager()
+    return router_mod.DaemonRouter(
+        transcript_manager=transcript_manager,
+        command_executor=executor_mod.CommandExecutor(transcript_manager),
+        interface_planner=InterfacePlanner("", system_prompt=""),
+        voice_transcriber=None,
+        image_transcriber=None,
+        allowed_jids=[BENCH_JID],
+    )
+
+
+@pytest.mark.parametrize("command", sorted(COMMAND_BODIES))
+def test_xmpp_text_message(command, benchmark_home, fixture_server, benchmark_recorder):
+    fixture_server.use_cassette("xmpp_commands")
+    router = _build_router()
+    body = COMMAND_BODIES[command]
+
+    response = benchmark_recorder.measure(
+        "xmpp.handle_text_message",
+        lambda: router.handle_text_message(jid=BENCH_JID, message_type="chat", body=body),
+        repeat=COMMAND_REPEAT,
+        params={"command": command},
+    )
+
+    assert response
+    assert not response.startswith("Error")
+    if command == "query":
+        assert "p95 response latency" in response
+        assert ("POST", "/v1/chat/completions") in fixture_server.requests
@@ -0,0 +1,74 @@
+"""Tests for the benchmark result comparison script."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+def _repo_root() -> Path:
+    for candidate in Path(__file__).resolve().parents:
+        if (candidate / "pyproject.toml").exists():
+            return candidate
+    raise RuntimeError("Unable to locate repository root")
+
+
+def _write_results(path: Path, medians: dict[tuple[str, str], float]) -> Path:
+    results = []
+    for (name, size), median in medians.items():
+        results.append(
+            {
+                "name": name,
+                "params": {"chunks": size} if size else {},
+                "median_ms": median,
+            }
+        )
+    path.write_text(json.dumps({"schema_version": 1, "results": results}), encoding="utf-8")
+    return path
+
+
+def _run(base: Path, head: Path, *extra: str) -> subprocess.CompletedProcess[str]:
+    script_path = _repo_root() / "scripts" / "compare_benchmarks.py"
+    return subprocess.run(
+        [sys.executable, str(script_path), str(base), str(head), *extra],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_compare_benchmarks_flags_median_regression(tmp_path: Path) -> None:
+    base = _write_results(
+        tmp_path / "base.json",
+        {("vector_search.dense", "1000"): 100.0, ("history.get_history", ""): 10.0},
+    )
+    head = _write_results(
+        tmp_path / "head.json",
+        {("vector_search.dense", "1000"): 130.0, ("history.get_history", ""): 10.5},
+    )
+
+    completed = _run(base, head, "--threshold", "20")
+
+    assert completed.returncode == 1
+    assert "vector_search.dense[chunks=1000]" in completed.stdout
+    regression_lines = [
+        line for line in completed.stdout.splitlines() if "REGRESSION" in line
+    ]
+    assert len(regression_lines) == 1
+    assert "+30.0%" in regression_lines[0]
+
+
+def test_compare_benchmarks_ignores_noise_and_new_entries(tmp_path: Path) -> None:
+    base = _write_results(tmp_path / "base.json", {("xmpp.handle_text_message", ""): 0.2})
+    head = _write_results(
+        tmp_path / "head.json",
+        {("xmpp.handle_text_message", ""): 0.4, ("research_turn.web", ""): 90.0},
+    )
+
+    completed = _run(base, head)
+
+    assert completed.returncode == 0
+    assert "research_turn.web" in completed.stdout
+    assert "REGRESSION" not in completed.stdout